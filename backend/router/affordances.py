@@ -6,12 +6,20 @@ This module computes the applicable tool list at runtime by:
 2. Always including escape hatches (narrate_only, ask_clarifying)
 3. Computing enriched argument hints for each candidate tool
 4. Providing context-aware suggestions to reduce hallucination
+
+Facts shared by the enrichment and confidence steps (actor, zone, visible
+actors, lowercased text) are computed once per call in an AffordanceContext,
+and per-tool timings are recorded for profiling. Tool preconditions and
+suggest_args keep the catalog's (state, utterance) signature, which the
+Validator calls too.
 """
 
+import time
+from functools import cached_property
 from typing import List, Dict, Any, Optional, Union, cast
 from dataclasses import dataclass
 
-from .game_state import GameState, Utterance, PC, NPC
+from .game_state import GameState, Utterance, PC, NPC, Zone
 from .tool_catalog import TOOL_CATALOG, Tool, get_tool_by_id
 
 
@@ -25,11 +33,91 @@ class ToolCandidate:
     confidence: float = 1.0  # How confident we are this tool applies
 
 
+class AffordanceContext:
+    """
+    Per-turn facts shared across tool evaluation.
+
+    Built once per get_candidates call so argument enrichment and confidence
+    scoring don't each re-fetch the actor, rescan visible actors or re-lowercase the
+    utterance. Derived facts are computed lazily and cached on first use.
+    """
+
+    def __init__(self, state: GameState, utterance: Utterance):
+        self.state = state
+        self.utterance = utterance
+        self.text = utterance.text
+        self.text_lower = utterance.text.lower()
+
+    @cached_property
+    def actor(self) -> Optional[Union[PC, NPC]]:
+        """The current actor, if it is a PC or NPC."""
+        state = self.state
+        if not state.current_actor:
+            return None
+        actor = state.entities.get(state.current_actor)
+        if actor is None or actor.type not in ("pc", "npc"):
+            return None
+        return cast(Union[PC, NPC], actor)
+
+    @cached_property
+    def zone(self) -> Optional[Zone]:
+        """The zone the current actor is in."""
+        return self.state.zones.get(self.actor.current_zone) if self.actor else None
+
+    @cached_property
+    def visible_actor_ids(self) -> List[str]:
+        """IDs from the actor's visible_actors list."""
+        return list(self.actor.visible_actors) if self.actor else []
+
+    @cached_property
+    def visible_actors(self) -> Dict[str, Union[PC, NPC]]:
+        """Visible PCs/NPCs that exist in state, keyed by ID in visibility order."""
+        entities = self.state.entities
+        return {
+            actor_id: cast(Union[PC, NPC], entities[actor_id])
+            for actor_id in self.visible_actor_ids
+            if actor_id in entities and entities[actor_id].type in ("pc", "npc")
+        }
+
+    def mentions_any(self, *phrases: str) -> bool:
+        """Substring check of phrases against the lowercased utterance."""
+        text_lower = self.text_lower
+        return any(phrase in text_lower for phrase in phrases)
+
+
+@dataclass
+class ToolTiming:
+    """Accumulated evaluation cost for one tool, in seconds."""
+
+    calls: int = 0
+    precond: float = 0.0
+    suggest: float = 0.0
+    enrich: float = 0.0
+    confidence: float = 0.0
+
+    @property
+    def total(self) -> float:
+        return self.precond + self.suggest + self.enrich + self.confidence
+
+    def to_dict(self) -> Dict[str, float]:
+        calls = max(self.calls, 1)
+        return {
+            "calls": self.calls,
+            "precond_ms_avg": self.precond * 1000 / calls,
+            "suggest_ms_avg": self.suggest * 1000 / calls,
+            "enrich_ms_avg": self.enrich * 1000 / calls,
+            "confidence_ms_avg": self.confidence * 1000 / calls,
+            "total_ms": self.total * 1000,
+        }
+
+
 class AffordanceFilter:
     """Computes applicable tools at runtime with enriched argument hints."""
 
-    def __init__(self):
+    def __init__(self, collect_timings: bool = True):
         self.escape_hatch_ids = {"narrate_only", "ask_clarifying"}
+        self.collect_timings = collect_timings
+        self.tool_timings: Dict[str, ToolTiming] = {}
 
     def get_candidates(
         self, state: GameState, utterance: Utterance
@@ -41,11 +129,20 @@ class AffordanceFilter:
             List of ToolCandidate objects, always including escape hatches.
         """
         candidates = []
+        ctx = AffordanceContext(state, utterance)
+        clock = time.perf_counter if self.collect_timings else None
 
         for tool in TOOL_CATALOG:
+            timing = None
+            if clock:
+                timing = self.tool_timings.setdefault(tool.id, ToolTiming())
+                timing.calls += 1
             try:
                 # Check if tool precondition is satisfied
+                started = clock() if clock else 0.0
                 is_applicable = tool.precond(state, utterance)
+                if timing:
+                    timing.precond += clock() - started
 
                 # Always include escape hatches regardless of preconditions
                 if tool.id in self.escape_hatch_ids:
@@ -53,17 +150,24 @@ class AffordanceFilter:
 
                 if is_applicable:
                     # Get base argument suggestions
+                    started = clock() if clock else 0.0
                     args_hint = {}
                     if tool.suggest_args:
                         args_hint = tool.suggest_args(state, utterance)
+                    if timing:
+                        timing.suggest += clock() - started
 
                     # Enrich arguments with context-aware hints
-                    enriched_args = self._enrich_arguments(
-                        tool, args_hint, state, utterance
-                    )
+                    started = clock() if clock else 0.0
+                    enriched_args = self._enrich_arguments(tool, args_hint, ctx)
+                    if timing:
+                        timing.enrich += clock() - started
 
                     # Calculate confidence based on how well the tool matches
-                    confidence = self._calculate_confidence(tool, state, utterance)
+                    started = clock() if clock else 0.0
+                    confidence = self._calculate_confidence(tool, ctx)
+                    if timing:
+                        timing.confidence += clock() - started
 
                     candidate = ToolCandidate(
                         id=tool.id,
@@ -83,36 +187,52 @@ class AffordanceFilter:
 
         return candidates
 
+    def get_timing_stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Per-tool evaluation cost accumulated across get_candidates calls.
+
+        Returns:
+            Mapping of tool ID to average precondition/suggest/enrich/confidence
+            time in milliseconds, most expensive tools first
+        """
+        ordered = sorted(
+            self.tool_timings.items(), key=lambda item: item[1].total, reverse=True
+        )
+        return {tool_id: timing.to_dict() for tool_id, timing in ordered}
+
+    def reset_timings(self) -> None:
+        """Clear accumulated per-tool timings."""
+        self.tool_timings.clear()
+
     def _enrich_arguments(
         self,
         tool: Tool,
         base_args: Dict[str, Any],
-        state: GameState,
-        utterance: Utterance,
+        ctx: AffordanceContext,
     ) -> Dict[str, Any]:
         """Enrich base arguments with context-aware hints."""
         enriched = base_args.copy()
 
         # Tool-specific enrichment
         if tool.id == "ask_roll":
-            enriched = self._enrich_ask_roll_args(enriched, state, utterance)
+            enriched = self._enrich_ask_roll_args(enriched, ctx)
         elif tool.id == "move":
-            enriched = self._enrich_move_args(enriched, state, utterance)
+            enriched = self._enrich_move_args(enriched, ctx)
         elif tool.id == "attack":
-            enriched = self._enrich_attack_args(enriched, state, utterance)
+            enriched = self._enrich_attack_args(enriched, ctx)
         elif tool.id == "talk":
-            enriched = self._enrich_talk_args(enriched, state, utterance)
+            enriched = self._enrich_talk_args(enriched, ctx)
         elif tool.id == "get_info":
-            enriched = self._enrich_get_info_args(enriched, state, utterance)
+            enriched = self._enrich_get_info_args(enriched, ctx)
         elif tool.id == "narrate_only":
-            enriched = self._enrich_narrate_only_args(enriched, state, utterance)
+            enriched = self._enrich_narrate_only_args(enriched, ctx)
         elif tool.id == "ask_clarifying":
-            enriched = self._enrich_clarifying_args(enriched, state, utterance)
+            enriched = self._enrich_clarifying_args(enriched, ctx)
 
         return enriched
 
     def _enrich_ask_roll_args(
-        self, args: Dict[str, Any], state: GameState, utterance: Utterance
+        self, args: Dict[str, Any], ctx: AffordanceContext
     ) -> Dict[str, Any]:
         """Enrich ask_roll arguments with context-aware DC hints."""
         enriched = args.copy()
@@ -122,10 +242,7 @@ class AffordanceFilter:
             base_dc = enriched["dc_hint"]
 
             # Adjust DC based on context
-            current_actor = (
-                state.actors.get(state.current_actor) if state.current_actor else None
-            )
-            if current_actor:
+            if ctx.actor:
                 # If targeting a guard, check if they might be sleepy/distracted
                 target_id = enriched.get("target")
                 if target_id and "guard" in str(target_id).lower():
@@ -135,7 +252,7 @@ class AffordanceFilter:
                         enriched["dc_reason"] = "sleepy guard"
 
                 # Zone-specific adjustments
-                current_zone = state.zones.get(current_actor.current_zone)
+                current_zone = ctx.zone
                 if current_zone and "courtyard" in current_zone.id.lower():
                     # Open areas might be harder for stealth
                     if enriched.get("action") == "sneak":
@@ -145,23 +262,22 @@ class AffordanceFilter:
         return enriched
 
     def _enrich_move_args(
-        self, args: Dict[str, Any], state: GameState, utterance: Utterance
+        self, args: Dict[str, Any], ctx: AffordanceContext
     ) -> Dict[str, Any]:
         """Enrich move arguments with movement context."""
         enriched = args.copy()
 
         # Add movement method hints
-        text_lower = utterance.text.lower()
-        if any(word in text_lower for word in ["sneak", "quietly", "stealth"]):
+        if ctx.mentions_any("sneak", "quietly", "stealth"):
             enriched["movement_style"] = "stealth"
-        elif any(word in text_lower for word in ["run", "quickly", "fast"]):
+        elif ctx.mentions_any("run", "quickly", "fast"):
             enriched["movement_style"] = "fast"
         else:
             enriched["movement_style"] = "normal"
 
         # Add zone description for context
         if "to" in enriched:
-            target_zone = state.zones.get(enriched["to"])
+            target_zone = ctx.state.zones.get(enriched["to"])
             if target_zone:
                 enriched["zone_name"] = target_zone.name
                 enriched["zone_desc"] = target_zone.description
@@ -169,23 +285,22 @@ class AffordanceFilter:
         return enriched
 
     def _enrich_attack_args(
-        self, args: Dict[str, Any], state: GameState, utterance: Utterance
+        self, args: Dict[str, Any], ctx: AffordanceContext
     ) -> Dict[str, Any]:
         """Enrich attack arguments with combat context."""
         enriched = args.copy()
 
         # Suggest weapon based on utterance
-        text_lower = utterance.text.lower()
-        if "sword" in text_lower:
+        if ctx.mentions_any("sword"):
             enriched["weapon"] = "sword"
-        elif "bow" in text_lower or "arrow" in text_lower:
+        elif ctx.mentions_any("bow", "arrow"):
             enriched["weapon"] = "bow"
-        elif "dagger" in text_lower:
+        elif ctx.mentions_any("dagger"):
             enriched["weapon"] = "dagger"
 
         # Add target information
         if "target" in enriched:
-            target_actor = state.actors.get(enriched["target"])
+            target_actor = _get_actor(ctx, enriched["target"])
             if target_actor:
                 enriched["target_name"] = target_actor.name
                 enriched["target_zone"] = target_actor.current_zone
@@ -193,17 +308,18 @@ class AffordanceFilter:
         return enriched
 
     def _enrich_talk_args(
-        self, args: Dict[str, Any], state: GameState, utterance: Utterance
+        self, args: Dict[str, Any], ctx: AffordanceContext
     ) -> Dict[str, Any]:
         """Enrich talk arguments with social context."""
         enriched = args.copy()
 
         # Extract potential message from utterance
-        text = utterance.text
+        text = ctx.text
+        text_lower = ctx.text_lower
         quote_patterns = ['"', "'", "say ", "tell ", "ask "]
 
         for pattern in quote_patterns:
-            if pattern in text.lower():
+            if pattern in text_lower:
                 # Try to extract the message part
                 if pattern in ['"', "'"]:
                     parts = text.split(pattern)
@@ -211,7 +327,7 @@ class AffordanceFilter:
                         enriched["message"] = parts[1]
                 else:
                     # For "say X", "tell X", etc.
-                    idx = text.lower().find(pattern)
+                    idx = text_lower.find(pattern)
                     if idx >= 0:
                         message_part = text[idx + len(pattern) :].strip()
                         enriched["message"] = message_part
@@ -219,7 +335,7 @@ class AffordanceFilter:
 
         # Add target relationship context
         if "target" in enriched:
-            target_actor = state.actors.get(enriched["target"])
+            target_actor = _get_actor(ctx, enriched["target"])
             if target_actor:
                 enriched["target_name"] = target_actor.name
                 if "guard" in target_actor.name.lower():
@@ -230,12 +346,12 @@ class AffordanceFilter:
         return enriched
 
     def _enrich_get_info_args(
-        self, args: Dict[str, Any], state: GameState, utterance: Utterance
+        self, args: Dict[str, Any], ctx: AffordanceContext
     ) -> Dict[str, Any]:
         """Enrich get_info arguments with topic and target detection."""
         enriched = args.copy()
 
-        text_lower = utterance.text.lower()
+        text_lower = ctx.text_lower
 
         # Topic detection from utterance keywords
         topic_keywords = {
@@ -261,36 +377,29 @@ class AffordanceFilter:
         enriched["topic"] = best_topic
 
         # Target detection - look for entity mentions
-        if state.current_actor:
-            current_actor = state.actors.get(state.current_actor)
-            if current_actor and hasattr(current_actor, "visible_actors"):
-                # Check if utterance mentions any visible actors
-                for actor_id in current_actor.visible_actors:
-                    actor = state.actors.get(actor_id)
-                    if actor and hasattr(actor, "name"):
-                        if (
-                            actor.name.lower() in text_lower
-                            or actor_id.lower() in text_lower
-                        ):
-                            enriched["target"] = actor_id
-                            break
+        if ctx.state.current_actor:
+            if ctx.actor:
+                # Check if utterance mentions any visible actors via the name index
+                mentions = ctx.state.get_name_index().find_mentions(
+                    ctx.text, kind="entity", candidates=list(ctx.visible_actors)
+                )
+                if mentions:
+                    enriched["target"] = mentions[0].id
 
             # Check for self-reference (only if no target detected yet)
-            if "target" not in enriched and any(
-                word in text_lower for word in ["my", "me", "i", "myself"]
-            ):
-                enriched["target"] = state.current_actor
+            if "target" not in enriched and ctx.mentions_any("my", "me", "i", "myself"):
+                enriched["target"] = ctx.state.current_actor
 
         # Detail level detection
-        if any(word in text_lower for word in ["full", "detailed", "complete", "all"]):
+        if ctx.mentions_any("full", "detailed", "complete", "all"):
             enriched["detail_level"] = "full"
-        elif any(word in text_lower for word in ["brief", "quick", "summary"]):
+        elif ctx.mentions_any("brief", "quick", "summary"):
             enriched["detail_level"] = "brief"
 
         return enriched
 
     def _enrich_narrate_only_args(
-        self, args: Dict[str, Any], state: GameState, utterance: Utterance
+        self, args: Dict[str, Any], ctx: AffordanceContext
     ) -> Dict[str, Any]:
         """Enrich narrate_only arguments with context-aware topic refinement."""
         enriched = args.copy()
@@ -301,58 +410,39 @@ class AffordanceFilter:
         # Context-aware topic refinement
         if current_topic == "look around":
             # Check if there are specific things to focus on
-            current_actor = (
-                state.actors.get(state.current_actor) if state.current_actor else None
-            )
-            if (
-                current_actor
-                and hasattr(current_actor, "visible_actors")
-                and current_actor.visible_actors
-            ):
-                # If only one visible entity, might want to zoom in
-                if len(current_actor.visible_actors) == 1:
-                    entity_id = current_actor.visible_actors[0]
-                    entity = state.actors.get(entity_id)
-                    if (
-                        entity
-                        and hasattr(entity, "name")
-                        and isinstance(entity.name, str)
-                    ):
-                        # Check if utterance mentions this entity specifically
-                        if entity.name.lower() in utterance.text.lower():
-                            enriched["topic"] = (
-                                f"zoom_in:{entity_id}"  # Add contextual hints for better narration
-                            )
-        if state.scene:
-            scene_tags = getattr(state.scene, "tags", {})
+            visible_ids = ctx.visible_actor_ids
+            # If only one visible entity, might want to zoom in
+            if len(visible_ids) == 1:
+                entity_id = visible_ids[0]
+                entity = ctx.visible_actors.get(entity_id)
+                if entity and isinstance(entity.name, str):
+                    # Check if utterance mentions this entity specifically
+                    if entity.name.lower() in ctx.text_lower:
+                        enriched["topic"] = (
+                            f"zoom_in:{entity_id}"  # Add contextual hints for better narration
+                        )
+        if ctx.state.scene:
+            scene_tags = getattr(ctx.state.scene, "tags", {})
             enriched["scene_context"] = scene_tags
 
         return enriched
 
     def _enrich_clarifying_args(
-        self, args: Dict[str, Any], state: GameState, utterance: Utterance
+        self, args: Dict[str, Any], ctx: AffordanceContext
     ) -> Dict[str, Any]:
         """Enrich ask_clarifying arguments with context-specific questions."""
         enriched = args.copy()
 
         # Generate context-appropriate clarifying questions
-        text_lower = utterance.text.lower()
-        current_actor = (
-            state.actors.get(state.current_actor) if state.current_actor else None
-        )
-
-        if current_actor:
-            visible_actors = []
-            if hasattr(current_actor, "visible_actors"):
-                pc_or_npc = cast(Union[PC, NPC], current_actor)
-                visible_actors = pc_or_npc.visible_actors
-            current_zone = state.zones.get(current_actor.current_zone)
+        if ctx.actor:
+            visible_ids = ctx.visible_actor_ids
+            current_zone = ctx.zone
 
             # Ambiguous action clarification
-            if any(word in text_lower for word in ["it", "that", "thing", "there"]):
-                if visible_actors:
+            if ctx.mentions_any("it", "that", "thing", "there"):
+                if visible_ids:
                     enriched["question"] = (
-                        f"Do you mean the {state.actors[visible_actors[0]].name}?"
+                        f"Do you mean the {ctx.visible_actors[visible_ids[0]].name}?"
                     )
                 elif current_zone:
                     enriched["question"] = (
@@ -360,11 +450,11 @@ class AffordanceFilter:
                     )
 
             # Movement ambiguity
-            elif any(word in text_lower for word in ["go", "move"]) and current_zone:
+            elif ctx.mentions_any("go", "move") and current_zone:
                 # Safely resolve adjacent zone names, filtering out any that don't exist
                 adjacent_names = []
                 for z_id in current_zone.adjacent_zones:
-                    zone = state.zones.get(z_id)
+                    zone = ctx.state.zones.get(z_id)
                     if zone is not None:
                         adjacent_names.append(zone.name)
 
@@ -374,20 +464,15 @@ class AffordanceFilter:
                     )
 
             # Action method ambiguity
-            elif (
-                any(word in text_lower for word in ["attack", "approach"])
-                and visible_actors
-            ):
-                target_name = state.actors[visible_actors[0]].name
+            elif ctx.mentions_any("attack", "approach") and visible_ids:
+                target_name = ctx.visible_actors[visible_ids[0]].name
                 enriched["question"] = (
                     f"How do you want to approach the {target_name}? Stealthily, directly, or diplomatically?"
                 )
 
         return enriched
 
-    def _calculate_confidence(
-        self, tool: Tool, state: GameState, utterance: Utterance
-    ) -> float:
+    def _calculate_confidence(self, tool: Tool, ctx: AffordanceContext) -> float:
         """Calculate confidence score for how well this tool matches the context."""
         base_confidence = 0.5
 
@@ -396,7 +481,7 @@ class AffordanceFilter:
             return 0.3
 
         # Boost confidence based on keyword matching
-        text_lower = utterance.text.lower()
+        text_lower = ctx.text_lower
 
         confidence_boosters = {
             "ask_roll": ["roll", "check", "try", "attempt", "sneak", "persuade"],
@@ -416,6 +501,16 @@ class AffordanceFilter:
         return min(1.0, base_confidence)
 
 
+def _get_actor(ctx: AffordanceContext, actor_id: Any) -> Optional[Union[PC, NPC]]:
+    """Look up a PC/NPC by ID, preferring the already-resolved visible set."""
+    if actor_id in ctx.visible_actors:
+        return ctx.visible_actors[actor_id]
+    entity = ctx.state.entities.get(actor_id)
+    if entity is not None and entity.type in ("pc", "npc"):
+        return cast(Union[PC, NPC], entity)
+    return None
+
+
 # Global instance for easy access
 affordance_filter = AffordanceFilter()
 
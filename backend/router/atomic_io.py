@@ -0,0 +1,56 @@
+"""
+Atomic IO - Crash-safe file replacement shared by the storage modules.
+
+Saves, binary snapshots, region shards, snapshot store objects and effect
+log indexes are all written the same way: the bytes go to a temp file in the
+target's directory, which is fsynced and swapped into place with os.replace,
+and the directory is then fsynced so the rename itself survives a power
+loss. A crash at any point leaves either the old file or the new one, never
+a mix.
+"""
+
+import os
+import tempfile
+from pathlib import Path
+from typing import Union
+
+
+def atomic_write(path: Union[str, Path], payload: bytes) -> None:
+    """
+    Replace a file's contents atomically and durably.
+
+    Args:
+        path: File to write (its directory must exist)
+        payload: Complete new contents
+    """
+    path = Path(path)
+    fd, temp_name = tempfile.mkstemp(
+        prefix=f".{path.name}.", suffix=".tmp", dir=path.parent
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_name, path)
+    except BaseException:
+        try:
+            os.unlink(temp_name)
+        except OSError:
+            pass
+        raise
+    fsync_directory(path.parent)
+
+
+def fsync_directory(directory: Union[str, Path]) -> None:
+    """Persist renames and unlinks in a directory (no-op where unsupported)."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
@@ -5,7 +5,6 @@ This module implements automatic reveal hooks that trigger when actors enter zon
 making exploration feel more alive and reducing manual bookkeeping.
 """
 
-import importlib
 from typing import Dict, Set, List, Optional, Any, Tuple
 from .game_state import GameState, PC, NPC
 from .visibility import can_player_see
@@ -95,16 +94,15 @@ def _check_discovery_eligibility(
     if observer_id in target.meta.known_by:
         return False
 
-    # Check visibility rules using temporary state
-    # Create temp state with observer in the target zone
-    temp_state = state.model_copy(deep=True)
-
-    # Update observer to be in the target zone for visibility check
-    if hasattr(temp_state.entities[observer_id], "current_zone"):
-        temp_observer = temp_state.entities[observer_id].model_copy(
-            update={"current_zone": check_zone}
-        )
-        temp_state.entities[observer_id] = temp_observer
+    # Check visibility rules with the observer moved into the target zone.
+    # A shallow copy with its own entities dict is enough: only the observer
+    # differs, so the rest of the world is shared rather than duplicated.
+    temp_state = state
+    observer = state.entities[observer_id]
+    if hasattr(observer, "current_zone"):
+        entities = dict(state.entities)
+        entities[observer_id] = observer.model_copy(update={"current_zone": check_zone})
+        temp_state = state.model_copy(update={"entities": entities})
 
     target_entity = temp_state.entities[target_id]
     return can_player_see(observer_id, target_entity, temp_state)
@@ -322,24 +320,12 @@ def _publish_discovery_events(
     events_published = []
 
     try:
-        # Use deferred import to avoid circular dependencies
-        try:
-            events_module = importlib.import_module("router.events")
-        except ImportError:
-            try:
-                events_module = importlib.import_module("backend.router.events")
-            except ImportError:
-                # Event bus not available, skip publishing
-                return events_published
-
-        event_bus = events_module.event_bus
-
         # Publish individual discovery events
         for entity_id in discovered_entities:
             entity = state.entities.get(entity_id)
             if entity:
                 event_name = f"entity.discovered"
-                event_bus.publish(
+                state.publish(
                     event_name,
                     {
                         "discoverer": discoverer_id,
@@ -354,7 +340,7 @@ def _publish_discovery_events(
         # Publish bulk discovery event
         if discovered_entities:
             event_name = "zone.entities_discovered"
-            event_bus.publish(
+            state.publish(
                 event_name,
                 {
                     "discoverer": discoverer_id,
@@ -408,27 +394,17 @@ def trigger_exploration_events(
 
     # Publish zone entry event
     try:
-        try:
-            events_module = importlib.import_module("router.events")
-        except ImportError:
-            try:
-                events_module = importlib.import_module("backend.router.events")
-            except ImportError:
-                events_module = None
-
-        if events_module:
-            event_bus = events_module.event_bus
-            event_bus.publish(
-                "zone.entered",
-                {
-                    "actor": explorer_id,
-                    "from_zone": from_zone,
-                    "to_zone": to_zone,
-                    "discovered_count": len(reveal_results["discovered"]),
-                    "mutual_discoveries": len(mutual_discoveries),
-                    "timestamp": state.scene.round,
-                },
-            )
+        state.publish(
+            "zone.entered",
+            {
+                "actor": explorer_id,
+                "from_zone": from_zone,
+                "to_zone": to_zone,
+                "discovered_count": len(reveal_results["discovered"]),
+                "mutual_discoveries": len(mutual_discoveries),
+                "timestamp": state.scene.round,
+            },
+        )
     except Exception:
         # Event publishing is optional
         pass
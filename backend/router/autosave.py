@@ -0,0 +1,318 @@
+"""
+Autosave Service - Background, coalescing game state saves.
+
+Saving from the turn loop (PersistenceManager.save_game_state or
+runtime/main.py save_world) blocks the turn on serialization and disk I/O.
+AutosaveService splits a save in two:
+
+1. At turn end the caller takes a snapshot: a detached save-format dict
+   (model_dump output shares nothing mutable with the live GameState), so
+   later turns can't tear it.
+2. A single worker thread hands snapshots to a writer callable.
+
+Snapshots for the same target that arrive while an earlier one is still
+waiting are coalesced, so only the newest is written. When the disk falls
+behind (an unsaved snapshot is older than max_lag while a write is in
+flight), request_save blocks until the writer catches up, or up to
+block_timeout. Save completion, failures and backpressure are published on
+the event bus with the save lag (time from the first unsaved request to the
+durable write).
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional, TYPE_CHECKING
+
+from .events import EventBus, EventTypes, event_bus as global_event_bus
+
+if TYPE_CHECKING:
+    from .game_state import GameState
+    from .persistence import PersistenceManager
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SaveSnapshot:
+    """A detached copy of the game state waiting to be written."""
+
+    seq: int
+    target: str
+    data: Any
+    taken_at: float = field(default_factory=time.monotonic)
+    # When the oldest request this snapshot supersedes was made
+    pending_since: float = field(default_factory=time.monotonic)
+    coalesced: int = 0
+
+    def to_game_state(self) -> "GameState":
+        """Rebuild a GameState from the snapshot (trusted, no validation)."""
+        from .binary_format import build_state
+
+        return build_state(self.data)
+
+
+def default_snapshot(state: "GameState") -> Dict[str, Any]:
+    """Full GM save format, including runtime data such as known_by."""
+    return state.to_save_format(include_runtime_data=True)
+
+
+class AutosaveService:
+    """Single-worker background saver with per-target coalescing."""
+
+    def __init__(
+        self,
+        writer: Callable[[SaveSnapshot], None],
+        snapshot_fn: Callable[["GameState"], Any] = default_snapshot,
+        coalesce_window: float = 0.0,
+        max_lag: float = 5.0,
+        block_timeout: Optional[float] = 30.0,
+        bus: Optional[EventBus] = None,
+        name: str = "autosave",
+    ):
+        """
+        Start the autosave worker.
+
+        Args:
+            writer: Called on the worker thread with each snapshot to write
+            snapshot_fn: Turns a GameState into detached save data (runs on
+                the calling thread, so it must be consistent and cheap)
+            coalesce_window: Seconds to wait after a request for newer ones
+                before writing
+            max_lag: Seconds an unsaved snapshot may wait behind an
+                in-flight write before request_save applies backpressure
+            block_timeout: Longest request_save blocks under backpressure
+                (None = until the writer catches up)
+            bus: Event bus for autosave events (default: global bus)
+            name: Worker thread name
+        """
+        self.writer = writer
+        self.snapshot_fn = snapshot_fn
+        self.coalesce_window = coalesce_window
+        self.max_lag = max_lag
+        self.block_timeout = block_timeout
+        self.bus = bus or global_event_bus
+
+        self._cond = threading.Condition()
+        self._pending: Dict[str, SaveSnapshot] = {}
+        self._in_flight: Optional[SaveSnapshot] = None
+        self._seq = 0
+        self._closing = False
+        self._flushing = 0
+
+        self.stats: Dict[str, Any] = {
+            "requested": 0,
+            "written": 0,
+            "coalesced": 0,
+            "failed": 0,
+            "backpressure_waits": 0,
+            "last_lag": None,
+            "max_lag": 0.0,
+            "last_error": None,
+        }
+
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    @classmethod
+    def for_persistence(
+        cls,
+        manager: "PersistenceManager",
+        save_name: str,
+        **save_kwargs: Any,
+    ) -> "AutosaveService":
+        """
+        Autosave into a PersistenceManager save slot.
+
+        Extra keyword arguments not accepted by the service are passed to
+        save_game_state (e.g. incremental=True). The turn loop exports the
+        save views once (PersistenceManager.snapshot_save) and the worker
+        writes them as they are, without rebuilding a GameState.
+        """
+        service_args = {
+            key: save_kwargs.pop(key)
+            for key in list(save_kwargs)
+            if key in ("coalesce_window", "max_lag", "block_timeout", "bus", "name")
+        }
+        view_args = {
+            key: save_kwargs[key]
+            for key in ("save_public", "save_gm", "save_session", "region_shards")
+            if key in save_kwargs
+        }
+
+        def snapshot(state: "GameState") -> Dict[str, Any]:
+            return manager.snapshot_save(state, **view_args)
+
+        def write(snapshot: SaveSnapshot) -> None:
+            manager.save_snapshot(snapshot.data, save_name, **save_kwargs)
+
+        return cls(write, snapshot_fn=snapshot, **service_args)
+
+    # ------------------------------------------------------------------
+    # Caller side
+    # ------------------------------------------------------------------
+
+    def request_save(self, state: "GameState", target: str = "default") -> int:
+        """
+        Snapshot the state and queue it for writing.
+
+        Args:
+            state: Game state to save (only read during this call)
+            target: Save destination; requests for the same target coalesce
+
+        Returns:
+            Sequence number of the queued snapshot
+
+        Raises:
+            RuntimeError: If the service has been closed
+        """
+        data = self.snapshot_fn(state)
+
+        with self._cond:
+            if self._closing:
+                raise RuntimeError("AutosaveService is closed")
+
+            self._apply_backpressure(target)
+
+            self._seq += 1
+            snapshot = SaveSnapshot(self._seq, target, data)
+            previous = self._pending.get(target)
+            if previous is not None:
+                snapshot.pending_since = previous.pending_since
+                snapshot.coalesced = previous.coalesced + 1
+                self.stats["coalesced"] += 1
+            self._pending[target] = snapshot
+            self.stats["requested"] += 1
+            self._cond.notify_all()
+            return snapshot.seq
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Write everything queued now, skipping the coalesce window.
+
+        Returns:
+            True if all snapshots were written (or failed) before the timeout
+        """
+        with self._cond:
+            self._flushing += 1
+            self._cond.notify_all()
+            try:
+                return self._cond.wait_for(
+                    lambda: not self._pending and self._in_flight is None, timeout
+                )
+            finally:
+                self._flushing -= 1
+
+    def close(self, timeout: Optional[float] = None) -> bool:
+        """Flush queued snapshots and stop the worker."""
+        flushed = self.flush(timeout)
+        with self._cond:
+            self._closing = True
+            self._cond.notify_all()
+        self._thread.join(timeout)
+        return flushed
+
+    def pending_count(self) -> int:
+        with self._cond:
+            return len(self._pending) + (self._in_flight is not None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._cond:
+            return dict(self.stats, pending=len(self._pending))
+
+    def _apply_backpressure(self, target: str) -> None:
+        """Block (lock held) while an old snapshot waits behind a slow write."""
+        previous = self._pending.get(target)
+        if (
+            previous is None
+            or self._in_flight is None
+            or time.monotonic() - previous.pending_since < self.max_lag
+        ):
+            return
+
+        lag = time.monotonic() - previous.pending_since
+        self.stats["backpressure_waits"] += 1
+        self._publish(
+            EventTypes.AUTOSAVE_BACKPRESSURE,
+            {"target": target, "lag": lag, "in_flight": self._in_flight.target},
+        )
+        self._cond.wait_for(lambda: target not in self._pending, self.block_timeout)
+
+    # ------------------------------------------------------------------
+    # Worker side
+    # ------------------------------------------------------------------
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                snapshot = self._next_snapshot()
+                if snapshot is None:
+                    return
+                self._in_flight = snapshot
+
+            started = time.monotonic()
+            error: Optional[BaseException] = None
+            try:
+                self.writer(snapshot)
+            except Exception as e:
+                error = e
+                logger.error(f"Autosave to '{snapshot.target}' failed: {e}")
+            finished = time.monotonic()
+
+            event: Dict[str, Any] = {
+                "target": snapshot.target,
+                "seq": snapshot.seq,
+                "lag": finished - snapshot.pending_since,
+                "duration": finished - started,
+                "coalesced": snapshot.coalesced,
+            }
+            with self._cond:
+                self._in_flight = None
+                if error is None:
+                    self.stats["written"] += 1
+                    self.stats["last_lag"] = event["lag"]
+                    self.stats["max_lag"] = max(self.stats["max_lag"], event["lag"])
+                else:
+                    self.stats["failed"] += 1
+                    self.stats["last_error"] = str(error)
+                self._cond.notify_all()
+
+            if error is None:
+                self._publish(EventTypes.AUTOSAVE_COMPLETED, event)
+            else:
+                event["error"] = str(error)
+                self._publish(EventTypes.AUTOSAVE_FAILED, event)
+
+    def _next_snapshot(self) -> Optional[SaveSnapshot]:
+        """Wait (lock held) for the oldest pending snapshot that is due."""
+        while True:
+            if not self._pending:
+                if self._closing:
+                    return None
+                self._cond.wait()
+                continue
+
+            oldest = min(self._pending.values(), key=lambda s: s.pending_since)
+            # Debounce on the newest request, but never hold a save past max_lag
+            due = min(
+                oldest.taken_at + self.coalesce_window,
+                oldest.pending_since + self.max_lag,
+            )
+            remaining = due - time.monotonic()
+            if remaining > 0 and not self._flushing and not self._closing:
+                self._cond.wait(remaining)
+                continue
+            return self._pending.pop(oldest.target)
+
+    def _publish(self, event_type: str, event_data: Dict[str, Any]) -> None:
+        try:
+            self.bus.publish(event_type, event_data)
+        except Exception as e:
+            logger.warning(f"Autosave event '{event_type}' not delivered: {e}")
+
+    def __enter__(self) -> "AutosaveService":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
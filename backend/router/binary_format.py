@@ -0,0 +1,375 @@
+"""
+Binary Format - Fast binary serialization for GameState saves.
+
+JSON remains the interchange format, but large worlds are slow to save and
+load through json plus full pydantic validation. This module stores the
+same save-format dictionary in a compact binary container:
+
+    magic (6 bytes) | schema version (u16) | codec (u8) | sha256 (32 bytes)
+    | payload length (u64) | payload
+
+The payload is encoded with msgpack when it is installed, otherwise as
+compact UTF-8 JSON (still skipping validation on load). marshal is not used:
+its format changes between Python versions and unmarshalling damaged or
+foreign data can crash the interpreter, so files written with the early
+marshal codec are rejected. The loader verifies the header and checksum
+first. Once the payload is trusted, it builds PC/NPC/ObjectEntity/ItemEntity,
+Zone, Clock and Scene objects with model_construct and skips validation.
+Only load files this engine wrote.
+"""
+
+import collections.abc
+import copy
+import hashlib
+import json
+import struct
+import types
+import typing
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, FrozenSet, Optional, Tuple, Type, Union
+
+from pydantic import BaseModel
+
+from .atomic_io import atomic_write
+from .game_state import (
+    GameState,
+    PC,
+    NPC,
+    ObjectEntity,
+    ItemEntity,
+    Zone,
+    Clock,
+    Scene,
+)
+
+try:
+    import msgpack  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None
+
+
+MAGIC = b"AIDDGS"
+BINARY_SCHEMA_VERSION = 1
+BINARY_SUFFIX = ".gsb"
+
+CODEC_MSGPACK = 1
+# Retired: never written, rejected on load
+CODEC_MARSHAL = 2
+CODEC_JSON = 3
+CODEC_NAMES = {CODEC_MSGPACK: "msgpack", CODEC_MARSHAL: "marshal", CODEC_JSON: "json"}
+
+_HEADER = struct.Struct(">6sHB32sQ")
+
+ENTITY_TYPES: Dict[str, Type[BaseModel]] = {
+    "pc": PC,
+    "npc": NPC,
+    "object": ObjectEntity,
+    "item": ItemEntity,
+}
+
+
+class BinaryFormatError(Exception):
+    """Raised when a binary save is malformed, corrupted or unsupported."""
+
+    pass
+
+
+def available_codec() -> int:
+    """Preferred codec for new files: msgpack if installed, else JSON."""
+    return CODEC_MSGPACK if msgpack is not None else CODEC_JSON
+
+
+def is_binary_save(source: Union[bytes, str, Path]) -> bool:
+    """Check the magic bytes of a blob or file."""
+    if isinstance(source, (str, Path)):
+        try:
+            with open(source, "rb") as f:
+                source = f.read(len(MAGIC))
+        except OSError:
+            return False
+    return source[: len(MAGIC)] == MAGIC
+
+
+# =============================================================================
+# Encoding
+# =============================================================================
+
+
+def dumps(data: Dict[str, Any], codec: Optional[int] = None) -> bytes:
+    """
+    Encode a JSON-safe dictionary into the binary container.
+
+    Args:
+        data: Save data (e.g. GameState.to_save_format() or a save file dict)
+        codec: CODEC_MSGPACK or CODEC_JSON (default: best available)
+    """
+    codec = codec or available_codec()
+    if codec == CODEC_MSGPACK:
+        if msgpack is None:
+            raise BinaryFormatError("msgpack codec requires the 'msgpack' package")
+        payload = msgpack.packb(data, use_bin_type=True)
+    elif codec == CODEC_JSON:
+        payload = json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode(
+            "utf-8"
+        )
+    else:
+        raise BinaryFormatError(f"Unknown codec: {codec}")
+
+    digest = hashlib.sha256(payload).digest()
+    return _HEADER.pack(MAGIC, BINARY_SCHEMA_VERSION, codec, digest, len(payload)) + payload
+
+
+def loads(blob: bytes) -> Dict[str, Any]:
+    """
+    Verify and decode a binary container back into a dictionary.
+
+    Raises:
+        BinaryFormatError: Bad magic, newer schema, truncation or checksum
+            mismatch
+    """
+    if len(blob) < _HEADER.size:
+        raise BinaryFormatError("Binary save is truncated (incomplete header)")
+
+    magic, version, codec, digest, length = _HEADER.unpack_from(blob)
+    if magic != MAGIC:
+        raise BinaryFormatError("Not a binary game state save")
+    if version > BINARY_SCHEMA_VERSION:
+        raise BinaryFormatError(
+            f"Binary save schema v{version} is newer than supported "
+            f"v{BINARY_SCHEMA_VERSION}"
+        )
+
+    payload = blob[_HEADER.size :]
+    if len(payload) != length:
+        raise BinaryFormatError(
+            f"Binary save is truncated: expected {length} bytes, found {len(payload)}"
+        )
+    if hashlib.sha256(payload).digest() != digest:
+        raise BinaryFormatError("Binary save failed checksum")
+
+    if codec == CODEC_MSGPACK:
+        if msgpack is None:
+            raise BinaryFormatError("Reading this save requires the 'msgpack' package")
+        return msgpack.unpackb(payload, raw=False, strict_map_key=False)
+    if codec == CODEC_JSON:
+        try:
+            return json.loads(payload)
+        except ValueError as e:
+            raise BinaryFormatError(f"Binary save payload is not valid JSON: {e}") from e
+    if codec == CODEC_MARSHAL:
+        raise BinaryFormatError(
+            "Binary save uses the retired marshal codec; load the JSON save instead"
+        )
+    raise BinaryFormatError(f"Unknown codec: {codec}")
+
+
+# =============================================================================
+# Trusted construction
+# =============================================================================
+
+
+# GameState fields outside the save format, written by save_state()
+TURN_FIELDS = ("current_actor", "pending_action", "turn_flags")
+
+
+def build_state(data: Dict[str, Any]) -> GameState:
+    """
+    Build a GameState from trusted save-format data without validation.
+
+    Mirrors PersistenceManager._reconstruct_game_state (redaction artifacts
+    such as is_visible are dropped, unknown entity types fall back to NPC)
+    but uses model_construct throughout.
+    """
+    entities = {}
+    for eid, entity_data in data.get("entities", {}).items():
+        entity_cls = ENTITY_TYPES.get(entity_data.get("type"), NPC)
+        entities[eid] = construct(entity_cls, entity_data)
+
+    zones = {
+        zid: construct(Zone, zone_data) for zid, zone_data in data.get("zones", {}).items()
+    }
+
+    # As in GameState validation, a clock dict becomes a Clock only if it has
+    # every required Clock field; legacy clocks (max/min keys) stay dicts
+    clock_fields = _plan_for(Clock).required
+    clocks: Dict[str, Any] = {}
+    for cid, clock_data in data.get("clocks", {}).items():
+        if isinstance(clock_data, dict) and clock_fields <= clock_data.keys():
+            clocks[cid] = construct(Clock, clock_data)
+        elif isinstance(clock_data, dict):
+            clocks[cid] = clock_data  # Legacy format
+
+    scene = construct(Scene, data.get("scene", {"id": "default_scene"}))
+    turn = {name: data[name] for name in TURN_FIELDS if name in data}
+
+    return GameState.model_construct(
+        entities=entities, zones=zones, clocks=clocks, scene=scene, **turn
+    )
+
+
+def construct(model_cls: Type[BaseModel], data: Dict[str, Any]) -> BaseModel:
+    """
+    Recursively model_construct a model (and nested models) from a dict.
+
+    Raises:
+        BinaryFormatError: If a required field is missing
+    """
+    plan = _plan_for(model_cls)
+    values = {}
+    missing = False
+    for name, converter in plan.converters.items():
+        if name in data:
+            value = data[name]
+            values[name] = value if converter is None else converter(value)
+        else:
+            if name in plan.required:
+                raise BinaryFormatError(
+                    f"{model_cls.__name__} data is missing required field {name!r}"
+                )
+            missing = True
+            default, factory = plan.defaults[name]
+            values[name] = factory() if factory is not None else copy.copy(default)
+    fields_set = set(data).intersection(values) if missing else set(values)
+
+    if not plan.fast:
+        return model_cls.model_construct(fields_set, **values)
+
+    # Equivalent to model_construct for fully populated models without private
+    # attributes, minus its per-field default resolution overhead
+    obj = model_cls.__new__(model_cls)
+    object.__setattr__(obj, "__dict__", values)
+    object.__setattr__(obj, "__pydantic_fields_set__", fields_set)
+    object.__setattr__(obj, "__pydantic_extra__", None)
+    object.__setattr__(obj, "__pydantic_private__", None)
+    if plan.post_init:
+        obj.model_post_init(None)
+    return obj
+
+
+@dataclass
+class _ModelPlan:
+    """Cached per-model construction plan."""
+
+    converters: Dict[str, Optional[Callable[[Any], Any]]]  # None = as-is
+    defaults: Dict[str, Tuple[Any, Optional[Callable[[], Any]]]]
+    required: FrozenSet[str]
+    fast: bool
+    post_init: bool
+
+
+_plan_cache: Dict[type, _ModelPlan] = {}
+
+
+def _plan_for(model_cls: Type[BaseModel]) -> _ModelPlan:
+    """Field converters and defaults derived from a model's annotations."""
+    plan = _plan_cache.get(model_cls)
+    if plan is None:
+        fields = model_cls.model_fields
+        plan = _ModelPlan(
+            converters={
+                name: _optional_converter(field.annotation)
+                for name, field in fields.items()
+            },
+            defaults={
+                name: (field.default, field.default_factory)
+                for name, field in fields.items()
+            },
+            required=frozenset(
+                name for name, field in fields.items() if field.is_required()
+            ),
+            fast=not model_cls.__private_attributes__
+            and model_cls.model_config.get("extra") != "allow",
+            post_init=bool(model_cls.__pydantic_post_init__),
+        )
+        _plan_cache[model_cls] = plan
+    return plan
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _optional_converter(annotation: Any) -> Optional[Callable[[Any], Any]]:
+    converter = _converter_for(annotation)
+    return None if converter is _identity else converter
+
+
+def _converter_for(annotation: Any) -> Callable[[Any], Any]:
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+
+    if origin is typing.Annotated:
+        return _converter_for(args[0])
+
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return lambda value: (
+            construct(annotation, value) if isinstance(value, dict) else value
+        )
+
+    if origin is Union or origin is types.UnionType:
+        models = [
+            arg for arg in args if isinstance(arg, type) and issubclass(arg, BaseModel)
+        ]
+        if len(models) == 1:
+            return _converter_for(models[0])
+        return _identity
+
+    if origin in (list, tuple):
+        item = _converter_for(args[0]) if args else _identity
+        if item is _identity:
+            return lambda value: list(value) if value is not None else value
+        return lambda value: [item(v) for v in value] if value is not None else value
+
+    if origin in (set, frozenset):
+        return lambda value: set(value) if value is not None else value
+
+    if isinstance(annotation, type) and issubclass(annotation, collections.abc.Set):
+        # Custom set types such as Meta.known_by's KnownBy
+        return lambda value: annotation(value) if value is not None else value
+
+    if origin is dict and len(args) == 2:
+        item = _converter_for(args[1])
+        if item is not _identity:
+            return lambda value: (
+                {k: item(v) for k, v in value.items()} if value is not None else value
+            )
+
+    return _identity
+
+
+# =============================================================================
+# Files
+# =============================================================================
+
+
+def save_state(
+    state: GameState, path: Union[str, Path], codec: Optional[int] = None
+) -> None:
+    """
+    Atomically write a GameState to a binary file: its save format plus the
+    turn fields (current actor, pending action, turn flags) that the save
+    format leaves out, so load_state() gives back the same state.
+    """
+    data = state.to_save_format(include_runtime_data=True)
+    for name in TURN_FIELDS:
+        data[name] = getattr(state, name)
+    write_file(path, data, codec)
+
+
+def load_state(path: Union[str, Path]) -> GameState:
+    """Load a GameState written by save_state()."""
+    return build_state(read_file(path))
+
+
+def write_file(
+    path: Union[str, Path], data: Dict[str, Any], codec: Optional[int] = None
+) -> None:
+    """Atomically write a dictionary to a binary file (temp + fsync + replace)."""
+    atomic_write(path, dumps(data, codec))
+
+
+def read_file(path: Union[str, Path]) -> Dict[str, Any]:
+    """Read and verify a binary file."""
+    with open(path, "rb") as f:
+        return loads(f.read())
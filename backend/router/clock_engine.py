@@ -0,0 +1,392 @@
+"""
+Clock Engine - Indexed clock updates with tick subscriptions and triggers.
+
+GameState.clocks holds Clock objects or legacy dicts, and every clock
+effect handler used to branch on both. A ClockEngine attached to a state
+migrates the legacy dicts to Clock objects once, so its update path only
+handles one type, and adds:
+
+- threshold triggers: effects fired when a clock rises to or past a value,
+  kept per clock in a list sorted by threshold, so an update only looks at
+  the thresholds it actually crossed
+- fill triggers: effects fired when a clock reaches its maximum
+- tick subscriptions: callbacks told about every change (per clock or all)
+- batched updates: advance_many() applies many deltas in one pass, then
+  notifies subscribers and applies every fired effect in one apply_effects
+  call
+
+Once attached (ClockEngine(state)), the "clock" effect handler and the
+validator's clock effects go through the engine, so triggers fire however
+a clock is advanced. States without an engine keep the old behaviour.
+"""
+
+import copy
+import itertools
+import logging
+from bisect import bisect_right, insort
+from dataclasses import dataclass, field, replace
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+from models.meta import Meta
+
+from .game_state import Clock, GameState
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_CLOCK_MAX = 10
+
+
+@dataclass
+class ClockTrigger:
+    """Effects to apply when a clock crosses a threshold (None = its maximum)."""
+
+    id: str
+    clock_id: str
+    threshold: Optional[int]
+    effects: List[Dict[str, Any]]
+    once: bool = True
+    fired: int = 0
+
+
+@dataclass
+class ClockTick:
+    """One clock change, as reported to subscribers and returned by advance."""
+
+    clock_id: str
+    old_value: int
+    new_value: int
+    source: Optional[str] = None
+    filled: bool = False  # Reached its maximum with this change
+    triggers: List[ClockTrigger] = field(default_factory=list)
+
+
+def migrate_legacy_clock(clock_id: str, data: Dict[str, Any]) -> Clock:
+    """Build a Clock from a legacy dict clock (max/min or maximum/minimum keys)."""
+    meta = data.get("meta")
+    if isinstance(meta, Meta):
+        meta = meta.model_copy(deep=True)
+    elif isinstance(meta, dict):
+        meta = Meta.from_export(meta)
+    else:
+        meta = Meta()
+    return Clock(
+        id=clock_id,
+        name=data.get("name") or clock_id,
+        value=data.get("value", 0),
+        maximum=data.get("max", data.get("maximum", DEFAULT_CLOCK_MAX)),
+        minimum=data.get("min", data.get("minimum", 0)),
+        source=data.get("source"),
+        created_turn=data.get("created_turn"),
+        last_modified_turn=data.get("last_modified_turn"),
+        last_modified_by=data.get("last_modified_by"),
+        filled_this_turn=bool(data.get("filled_this_turn", False)),
+        filled_by=data.get("filled_by"),
+        meta=meta,
+    )
+
+
+def migrate_legacy_clocks(state: GameState) -> int:
+    """
+    Replace every legacy dict clock in state.clocks with a Clock.
+
+    Returns:
+        Number of clocks migrated
+    """
+    migrated = 0
+    for clock_id, clock in list(state.clocks.items()):
+        if isinstance(clock, dict):
+            state.clocks[clock_id] = migrate_legacy_clock(clock_id, clock)
+            migrated += 1
+    return migrated
+
+
+class ClockEngine:
+    """Clock subsystem for one GameState."""
+
+    def __init__(self, state: GameState, migrate: bool = True):
+        """
+        Attach an engine to a state (replacing any previous one).
+
+        Args:
+            state: The game state whose clocks to manage
+            migrate: Convert legacy dict clocks to Clock objects now
+        """
+        self.state = state
+        # clock_id -> [(threshold, seq, trigger)] sorted by threshold
+        self._thresholds: Dict[str, List[Tuple[int, int, ClockTrigger]]] = {}
+        self._fill_triggers: Dict[str, List[ClockTrigger]] = {}
+        self._triggers: Dict[str, ClockTrigger] = {}
+        # clock_id (None = every clock) -> callbacks
+        self._subscribers: Dict[Optional[str], List[Callable[[ClockTick], None]]] = {}
+        self._sequence = itertools.count()
+
+        if migrate:
+            migrate_legacy_clocks(state)
+        state._clock_engine = self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "ClockEngine":
+        """
+        Copies (e.g. of a GameState via model_copy(deep=True)) share the
+        subscriber callbacks but get their own triggers. The copy stays on
+        the original state until GameState.__deepcopy__ rebinds it.
+        """
+        clone = ClockEngine.__new__(ClockEngine)
+        clone.state = memo.get(id(self.state), self.state)
+        triggers = {
+            trigger_id: replace(trigger, effects=copy.deepcopy(trigger.effects, memo))
+            for trigger_id, trigger in self._triggers.items()
+        }
+        clone._triggers = triggers
+        clone._thresholds = {
+            clock_id: [(threshold, seq, triggers[trigger.id]) for threshold, seq, trigger in entries]
+            for clock_id, entries in self._thresholds.items()
+        }
+        clone._fill_triggers = {
+            clock_id: [triggers[trigger.id] for trigger in entries]
+            for clock_id, entries in self._fill_triggers.items()
+        }
+        clone._subscribers = {
+            clock_id: list(callbacks) for clock_id, callbacks in self._subscribers.items()
+        }
+        clone._sequence = itertools.count(next(self._sequence))
+        return clone
+
+    # ------------------------------------------------------------------
+    # Clocks
+    # ------------------------------------------------------------------
+
+    def get(self, clock_id: str) -> Optional[Clock]:
+        """The Clock for an ID, migrating it if it is still a legacy dict."""
+        clock = self.state.clocks.get(clock_id)
+        if isinstance(clock, dict):
+            clock = migrate_legacy_clock(clock_id, clock)
+            self.state.clocks[clock_id] = clock
+        return clock
+
+    def create(
+        self,
+        clock_id: str,
+        maximum: int = DEFAULT_CLOCK_MAX,
+        minimum: int = 0,
+        source: Optional[str] = None,
+        name: Optional[str] = None,
+    ) -> Clock:
+        """Create (or replace) a clock at its minimum value."""
+        clock = Clock(
+            id=clock_id,
+            name=name or clock_id,
+            value=minimum,
+            maximum=maximum,
+            minimum=minimum,
+            source=source,
+            created_turn=self.state.scene.round,
+            last_modified_turn=self.state.scene.round,
+            last_modified_by=source,
+        )
+        self.state.clocks[clock_id] = clock
+        return clock
+
+    # ------------------------------------------------------------------
+    # Triggers and subscriptions
+    # ------------------------------------------------------------------
+
+    def on_threshold(
+        self,
+        clock_id: str,
+        threshold: int,
+        effects: List[Dict[str, Any]],
+        once: bool = True,
+    ) -> str:
+        """
+        Apply effects when a clock rises from below threshold to threshold or more.
+
+        Args:
+            clock_id: Clock to watch
+            threshold: Value to cross
+            effects: Effect atoms to apply (as for effects.apply_effects)
+            once: Remove the trigger after it fires
+
+        Returns:
+            Trigger ID (for remove_trigger)
+        """
+        trigger = self._new_trigger(clock_id, threshold, effects, once)
+        insort(
+            self._thresholds.setdefault(clock_id, []),
+            (threshold, next(self._sequence), trigger),
+            key=lambda entry: (entry[0], entry[1]),
+        )
+        return trigger.id
+
+    def on_fill(
+        self, clock_id: str, effects: List[Dict[str, Any]], once: bool = True
+    ) -> str:
+        """Apply effects when a clock reaches its maximum. Returns the trigger ID."""
+        trigger = self._new_trigger(clock_id, None, effects, once)
+        self._fill_triggers.setdefault(clock_id, []).append(trigger)
+        return trigger.id
+
+    def remove_trigger(self, trigger_id: str) -> bool:
+        """Remove a trigger. Returns True if it was registered."""
+        trigger = self._triggers.pop(trigger_id, None)
+        if trigger is None:
+            return False
+        if trigger.threshold is None:
+            self._fill_triggers[trigger.clock_id].remove(trigger)
+        else:
+            entries = self._thresholds[trigger.clock_id]
+            entries[:] = [entry for entry in entries if entry[2] is not trigger]
+        return True
+
+    def subscribe(
+        self, callback: Callable[[ClockTick], None], clock_id: Optional[str] = None
+    ) -> None:
+        """Call callback(tick) for every change of clock_id (None = any clock)."""
+        self._subscribers.setdefault(clock_id, []).append(callback)
+
+    def unsubscribe(
+        self, callback: Callable[[ClockTick], None], clock_id: Optional[str] = None
+    ) -> bool:
+        callbacks = self._subscribers.get(clock_id, [])
+        if callback in callbacks:
+            callbacks.remove(callback)
+            return True
+        return False
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+
+    def advance(
+        self,
+        clock_id: str,
+        delta: int,
+        source: Optional[str] = None,
+        maximum: Optional[int] = None,
+    ) -> ClockTick:
+        """
+        Add delta to one clock (created if missing), clamped to its range.
+
+        Args:
+            clock_id: Clock to change
+            delta: Amount to add (negative to wind back)
+            source: Who or what changed it
+            maximum: New maximum to set first (also used when creating)
+
+        Returns:
+            The resulting ClockTick
+        """
+        return self.advance_many({clock_id: delta}, source, {clock_id: maximum})[0]
+
+    def advance_many(
+        self,
+        deltas: Mapping[str, int],
+        source: Optional[str] = None,
+        maximums: Optional[Mapping[str, Optional[int]]] = None,
+    ) -> List[ClockTick]:
+        """
+        Apply many clock deltas as one batch (e.g. every clock's per-round tick).
+
+        All clocks are updated first; then subscribers are notified and the
+        effects of every trigger crossed are applied, in one apply_effects call.
+
+        Returns:
+            One ClockTick per clock, in the order of deltas
+        """
+        current_round = self.state.scene.round
+        ticks = []
+        fired_effects: List[Dict[str, Any]] = []
+
+        for clock_id, delta in deltas.items():
+            maximum = maximums.get(clock_id) if maximums else None
+            clock = self.get(clock_id)
+            if clock is None:
+                clock = self.create(
+                    clock_id,
+                    maximum=maximum if maximum is not None else DEFAULT_CLOCK_MAX,
+                    source=source,
+                )
+            was_filled = clock.value >= clock.maximum
+            if maximum is not None:
+                clock.maximum = maximum
+
+            old_value = clock.value
+            new_value = max(clock.minimum, min(clock.maximum, old_value + delta))
+            clock.value = new_value
+            clock.last_modified_turn = current_round
+            clock.last_modified_by = source
+
+            is_filled = new_value >= clock.maximum
+            if is_filled and not was_filled:
+                clock.filled_this_turn = True
+                clock.filled_by = source
+            elif was_filled and not is_filled:
+                clock.filled_this_turn = False
+                clock.filled_by = None
+
+            tick = ClockTick(
+                clock_id,
+                old_value,
+                new_value,
+                source,
+                filled=is_filled and not was_filled,
+            )
+            if new_value > old_value:
+                tick.triggers = self._crossed(clock_id, old_value, new_value)
+            if tick.filled:
+                tick.triggers.extend(self._fill_triggers.get(clock_id, ()))
+            for trigger in tick.triggers:
+                trigger.fired += 1
+                fired_effects.extend(trigger.effects)
+                if trigger.once:
+                    self.remove_trigger(trigger.id)
+            ticks.append(tick)
+
+        for tick in ticks:
+            self._notify(tick)
+        if fired_effects:
+            from .effects import apply_effects
+
+            apply_effects(self.state, fired_effects)
+        return ticks
+
+    def apply_effect(self, e: Dict[str, Any]) -> ClockTick:
+        """Apply a "clock" effect atom ({"id", "delta", "max"?, "source"?})."""
+        return self.advance(e["id"], e["delta"], e.get("source", "unknown"), e.get("max"))
+
+    def _new_trigger(
+        self,
+        clock_id: str,
+        threshold: Optional[int],
+        effects: List[Dict[str, Any]],
+        once: bool,
+    ) -> ClockTrigger:
+        trigger = ClockTrigger(
+            id=f"{clock_id}#{next(self._sequence)}",
+            clock_id=clock_id,
+            threshold=threshold,
+            effects=list(effects),
+            once=once,
+        )
+        self._triggers[trigger.id] = trigger
+        return trigger
+
+    def _crossed(self, clock_id: str, old_value: int, new_value: int) -> List[ClockTrigger]:
+        """Threshold triggers with old_value < threshold <= new_value."""
+        entries = self._thresholds.get(clock_id)
+        if not entries:
+            return []
+        key = lambda entry: entry[0]  # noqa: E731
+        start = bisect_right(entries, old_value, key=key)
+        end = bisect_right(entries, new_value, key=key)
+        return [entry[2] for entry in entries[start:end]]
+
+    def _notify(self, tick: ClockTick) -> None:
+        callbacks = self._subscribers.get(tick.clock_id, []) + self._subscribers.get(
+            None, []
+        )
+        for callback in callbacks:
+            try:
+                callback(tick)
+            except Exception as e:
+                logger.error(f"Clock subscriber failed for {tick.clock_id}: {e}")
@@ -0,0 +1,254 @@
+"""
+Effect Log - Bounded in-memory effect log with an on-disk archive.
+
+Scene.last_effect_log used to grow for the whole session, and it is part of
+every scene dump and save. The scene now keeps only the newest
+EFFECT_LOG_CAPACITY entries. Appends are amortized O(1): the list may grow to
+twice the capacity, then the oldest half is evicted in one batch. Evicted
+entries are spilled to an EffectLogArchive when one is attached (otherwise
+they are dropped and counted).
+
+The archive is append-only JSONL segments (segment_000001.jsonl, ...) rotated
+every segment_size entries. index.json summarizes each segment (rounds,
+actors and effect types), so queries by round, actor or effect type only
+open the segments that can match. Segment lines are fsynced before the index
+is updated; entries written after the last index update (a crash in between)
+are re-summarized from the segment files when the archive is reopened.
+
+Each save should have its own archive directory: entries from an abandoned
+game would otherwise show up in the next game's queries (see clear()).
+"""
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+
+from pydantic import BaseModel
+
+from .atomic_io import atomic_write
+
+logger = logging.getLogger(__name__)
+
+
+EFFECT_LOG_CAPACITY = 100
+INDEX_FILENAME = "index.json"
+
+
+def entry_to_dict(entry: Any) -> Dict[str, Any]:
+    """Effect log entries may be EffectLogEntry models or plain dicts."""
+    if isinstance(entry, BaseModel):
+        return entry.model_dump(mode="json")
+    return entry
+
+
+def entry_matches(
+    entry: Dict[str, Any],
+    round_applied: Optional[int] = None,
+    actor: Optional[str] = None,
+    effect_type: Optional[str] = None,
+    since_round: Optional[int] = None,
+    until_round: Optional[int] = None,
+) -> bool:
+    """Whether a (dict) log entry passes the query filters."""
+    entry_round = entry.get("round_applied")
+    if round_applied is not None and entry_round != round_applied:
+        return False
+    if since_round is not None and (entry_round is None or entry_round < since_round):
+        return False
+    if until_round is not None and (entry_round is None or entry_round > until_round):
+        return False
+    if actor is not None and entry.get("actor") != actor:
+        return False
+    if effect_type is not None and (entry.get("effect") or {}).get("type") != effect_type:
+        return False
+    return True
+
+
+class EffectLogArchive:
+    """Append-only, segmented on-disk store for evicted effect log entries."""
+
+    def __init__(self, directory: Union[str, Path], segment_size: int = 1000):
+        """
+        Open (or create) an archive.
+
+        Args:
+            directory: Directory holding segments and index.json
+            segment_size: Entries per segment before rotating
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.segment_size = segment_size
+
+        index_path = self.directory / INDEX_FILENAME
+        if index_path.exists():
+            self.segments: List[Dict[str, Any]] = json.loads(
+                index_path.read_text(encoding="utf-8")
+            )["segments"]
+        else:
+            self.segments = []
+        self._recover_unindexed()
+
+    @property
+    def total_entries(self) -> int:
+        return sum(segment["count"] for segment in self.segments)
+
+    def append(self, entries: Iterable[Any]) -> int:
+        """
+        Append entries (oldest first) to the current segment, rotating as needed.
+
+        Returns:
+            Number of entries written
+        """
+        written = 0
+        batch = [entry_to_dict(entry) for entry in entries]
+        while batch:
+            segment = self._current_segment()
+            room = self.segment_size - segment["count"]
+            chunk, batch = batch[:room], batch[room:]
+
+            with open(self.directory / segment["file"], "a", encoding="utf-8") as f:
+                for entry in chunk:
+                    f.write(json.dumps(entry, default=str, separators=(",", ":")) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+
+            # The index only learns about lines that are on disk
+            if not self.segments or self.segments[-1] is not segment:
+                self.segments.append(segment)
+            for entry in chunk:
+                self._summarize(segment, entry)
+            segment["count"] += len(chunk)
+            written += len(chunk)
+
+        if written:
+            self._save_index()
+        return written
+
+    def query(
+        self,
+        round_applied: Optional[int] = None,
+        actor: Optional[str] = None,
+        effect_type: Optional[str] = None,
+        since_round: Optional[int] = None,
+        until_round: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield archived entries (oldest first) matching the filters."""
+        for segment in self.segments:
+            if not self._segment_may_match(
+                segment, round_applied, actor, effect_type, since_round, until_round
+            ):
+                continue
+            with open(self.directory / segment["file"], "r", encoding="utf-8") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    entry = json.loads(line)
+                    if entry_matches(
+                        entry, round_applied, actor, effect_type, since_round, until_round
+                    ):
+                        yield entry
+
+    def clear(self) -> None:
+        """Delete every archived entry (e.g. when a new game reuses the directory)."""
+        for path in self.directory.glob("segment_*.jsonl"):
+            path.unlink()
+        self.segments = []
+        self._save_index()
+
+    def _current_segment(self) -> Dict[str, Any]:
+        """The segment to append to; a new one is only indexed once written."""
+        if self.segments and self.segments[-1]["count"] < self.segment_size:
+            return self.segments[-1]
+        return self._new_segment(len(self.segments) + 1)
+
+    @staticmethod
+    def _new_segment(number: int) -> Dict[str, Any]:
+        return {
+            "file": f"segment_{number:06d}.jsonl",
+            "count": 0,
+            "min_round": None,
+            "max_round": None,
+            "actors": [],
+            "effect_types": [],
+        }
+
+    def _recover_unindexed(self) -> None:
+        """Index lines a crash left in segment files after the last index save."""
+        recovered = 0
+        tail = self.segments[-1] if self.segments else None
+        candidates = [tail] if tail is not None else []
+        number = len(self.segments) + 1
+        while (self.directory / self._new_segment(number)["file"]).exists():
+            candidates.append(self._new_segment(number))
+            number += 1
+
+        for segment in candidates:
+            path = self.directory / segment["file"]
+            if not path.exists():
+                continue
+            with open(path, "r", encoding="utf-8") as f:
+                lines = [line for line in f.read().split("\n") if line.strip()]
+            for index in range(segment["count"], len(lines)):
+                try:
+                    entry = json.loads(lines[index])
+                except json.JSONDecodeError:
+                    # Torn line of an interrupted append: cut it off so the
+                    # next append starts on a line of its own
+                    payload = "".join(line + "\n" for line in lines[:index])
+                    atomic_write(path, payload.encode("utf-8"))
+                    break
+                self._summarize(segment, entry)
+                segment["count"] += 1
+                recovered += 1
+            if segment is not tail and segment["count"]:
+                self.segments.append(segment)
+
+        if recovered:
+            logger.warning(f"Recovered {recovered} unindexed effect log entries in {self.directory}")
+            self._save_index()
+
+    @staticmethod
+    def _summarize(segment: Dict[str, Any], entry: Dict[str, Any]) -> None:
+        entry_round = entry.get("round_applied")
+        if entry_round is not None:
+            if segment["min_round"] is None or entry_round < segment["min_round"]:
+                segment["min_round"] = entry_round
+            if segment["max_round"] is None or entry_round > segment["max_round"]:
+                segment["max_round"] = entry_round
+        actor = entry.get("actor")
+        if actor is not None and actor not in segment["actors"]:
+            segment["actors"].append(actor)
+        effect_type = (entry.get("effect") or {}).get("type")
+        if effect_type is not None and effect_type not in segment["effect_types"]:
+            segment["effect_types"].append(effect_type)
+
+    @staticmethod
+    def _segment_may_match(
+        segment: Dict[str, Any],
+        round_applied: Optional[int],
+        actor: Optional[str],
+        effect_type: Optional[str],
+        since_round: Optional[int],
+        until_round: Optional[int],
+    ) -> bool:
+        if actor is not None and actor not in segment["actors"]:
+            return False
+        if effect_type is not None and effect_type not in segment["effect_types"]:
+            return False
+        low, high = segment["min_round"], segment["max_round"]
+        if low is None:
+            # No entry in this segment has a round
+            return round_applied is None and since_round is None and until_round is None
+        if round_applied is not None and not low <= round_applied <= high:
+            return False
+        if since_round is not None and high < since_round:
+            return False
+        if until_round is not None and low > until_round:
+            return False
+        return True
+
+    def _save_index(self) -> None:
+        payload = json.dumps({"segments": self.segments}).encode("utf-8")
+        atomic_write(self.directory / INDEX_FILENAME, payload)
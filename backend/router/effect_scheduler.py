@@ -0,0 +1,210 @@
+"""
+Effect Scheduler - Priority queue for timed PendingEffects.
+
+Scene.pending_effects used to be scanned and rebuilt every round. The
+scheduler keeps that same list ordered by trigger_round (FIFO among equal
+rounds), so:
+
+- scheduling is a binary search plus one list insert
+- the effects due this round are a prefix of the list, found by binary
+  search and removed with one slice deletion
+- rounds with nothing due cost O(log n), whatever the queue size
+
+The list itself stays the storage and the serialized format (a plain list of
+PendingEffect), so saves, snapshots and rollbacks are unchanged. Code that
+appends to, removes from or replaces the list directly is still supported:
+the scheduler notices the change (length, or a different first or last
+entry) and restores the order with a (stable) sort. Changing trigger_round
+of an effect in the middle of the queue goes unnoticed; call reorder()
+after such edits.
+
+Effects whose PendingEffect.condition fails when due stay at the front of
+the queue and are checked again on later rounds, up to their expires_round
+(default: MAX_CONDITION_WAIT rounds after trigger_round). Effects still
+held back after that are dropped, so a condition that never comes true does
+not keep an effect queued forever.
+"""
+
+import logging
+from bisect import bisect_right
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .game_state import PendingEffect
+
+logger = logging.getLogger(__name__)
+
+
+# Rounds a conditional effect may wait past its trigger_round by default
+MAX_CONDITION_WAIT = 20
+
+
+def trigger_round_of(pending: Any) -> int:
+    """Trigger round of a PendingEffect (or its dict form)."""
+    if isinstance(pending, dict):
+        return pending.get("trigger_round", 0)
+    return pending.trigger_round
+
+
+def _effect_id_of(pending: Any) -> Optional[str]:
+    if isinstance(pending, dict):
+        return pending.get("id")
+    return pending.id
+
+
+def expiry_round_of(pending: Any) -> int:
+    """Last round a PendingEffect (or its dict form) may be held back by its condition."""
+    if isinstance(pending, dict):
+        expires_round = pending.get("expires_round")
+    else:
+        expires_round = pending.expires_round
+    if expires_round is None:
+        return trigger_round_of(pending) + MAX_CONDITION_WAIT
+    return expires_round
+
+
+class EffectScheduler:
+    """Chronologically ordered view over a list of pending effects."""
+
+    def __init__(self, effects: Optional[List[PendingEffect]] = None):
+        """
+        Args:
+            effects: List to schedule into (typically Scene.pending_effects);
+                it is reordered in place if needed
+        """
+        self.effects: List[Any] = effects if effects is not None else []
+        self._known_length = -1
+        self._known_ends: Tuple[Any, ...] = ()
+        self._ensure_order()
+
+    def __len__(self) -> int:
+        return len(self.effects)
+
+    def schedule(self, pending: PendingEffect) -> None:
+        """Insert an effect after all effects with the same or earlier round."""
+        self._ensure_order()
+        index = bisect_right(
+            self.effects, pending.trigger_round, key=trigger_round_of
+        )
+        self.effects.insert(index, pending)
+        self._remember()
+
+    def cancel(self, effect_id: str) -> bool:
+        """
+        Remove a scheduled effect by ID.
+
+        Returns:
+            True if the effect was found and removed
+        """
+        for index, pending in enumerate(self.effects):
+            if _effect_id_of(pending) == effect_id:
+                del self.effects[index]
+                self._remember()
+                return True
+        return False
+
+    def next_round(self) -> Optional[int]:
+        """Earliest trigger round in the queue, or None if it is empty."""
+        self._ensure_order()
+        return trigger_round_of(self.effects[0]) if self.effects else None
+
+    def pop_due(
+        self,
+        current_round: int,
+        condition_check: Optional[Callable[[PendingEffect], bool]] = None,
+    ) -> List[PendingEffect]:
+        """
+        Remove and return the effects due by current_round, in order.
+
+        Args:
+            current_round: The current game round
+            condition_check: Called for due effects that have a condition;
+                effects it rejects stay queued and are re-checked next time,
+                or dropped once current_round is past their expiry round
+
+        Returns:
+            Effects with trigger_round <= current_round (and passing conditions)
+        """
+        self._ensure_order()
+        due_count = bisect_right(self.effects, current_round, key=trigger_round_of)
+        if not due_count:
+            return []
+
+        due = self.effects[:due_count]
+        if condition_check is None:
+            del self.effects[:due_count]
+            self._remember()
+            return due
+
+        ready, deferred = [], []
+        for pending in due:
+            condition = (
+                pending.get("condition")
+                if isinstance(pending, dict)
+                else pending.condition
+            )
+            if not condition or condition_check(pending):
+                ready.append(pending)
+            elif current_round <= expiry_round_of(pending):
+                deferred.append(pending)
+            else:
+                logger.info(
+                    f"Dropped pending effect {_effect_id_of(pending)}: "
+                    f"condition {condition!r} still unmet in round {current_round}"
+                )
+        # Deferred effects keep their place (and order) at the front
+        self.effects[:due_count] = deferred
+        self._remember()
+        return ready
+
+    def to_list(self) -> List[Dict[str, Any]]:
+        """Queue contents in trigger order, as PendingEffect dicts."""
+        self._ensure_order()
+        return [
+            pending if isinstance(pending, dict) else pending.model_dump()
+            for pending in self.effects
+        ]
+
+    @classmethod
+    def from_list(cls, data: List[Any]) -> "EffectScheduler":
+        """Build a scheduler from PendingEffect dicts or models."""
+        return cls(
+            [
+                PendingEffect.model_validate(item) if isinstance(item, dict) else item
+                for item in data
+            ]
+        )
+
+    def reorder(self) -> None:
+        """Restore trigger order after editing queued effects in place."""
+        self.effects.sort(key=trigger_round_of)
+        self._remember()
+
+    def _ends(self) -> Tuple[Any, ...]:
+        """First and last entries (and their rounds), to spot direct edits cheaply."""
+        if not self.effects:
+            return ()
+        first, last = self.effects[0], self.effects[-1]
+        return (first, trigger_round_of(first), last, trigger_round_of(last))
+
+    def _remember(self) -> None:
+        self._known_length = len(self.effects)
+        self._known_ends = self._ends()
+
+    def _ensure_order(self) -> None:
+        """Re-sort if the list was changed behind the scheduler's back."""
+        length = len(self.effects)
+        ends = self._ends()
+        known_length, known_ends = self._known_length, self._known_ends
+        if length == known_length and ends == known_ends:
+            return
+        start = 0
+        if 0 < known_length < length and ends[:2] == known_ends[:2]:
+            # Appended effects usually arrive in order; only check the new tail
+            previous_last = self.effects[known_length - 1]
+            if (previous_last, trigger_round_of(previous_last)) == known_ends[2:]:
+                start = known_length - 1
+        rounds = [trigger_round_of(p) for p in self.effects[start:]]
+        if any(a > b for a, b in zip(rounds, rounds[1:])):
+            self.effects.sort(key=trigger_round_of)
+        self._remember()
+
@@ -96,6 +96,11 @@ def apply_clock(state: GameState, e: Dict[str, Any]) -> None:
     Enhanced format supports:
     {"type":"clock","id":"npc.guard.persuade","delta":1,"max":3,"source":"pc.arin"}
     """
+    if state.clock_engine is not None:
+        # Engine-managed clocks (Clock objects, triggers and subscriptions)
+        state.clock_engine.apply_effect(e)
+        return
+
     clock_id = e["id"]
     delta = e["delta"]
     source = e.get("source", "unknown")
@@ -276,22 +281,23 @@ def apply_mark(state: GameState, e: Dict[str, Any]) -> None:
 
 def _update_visibility(state: GameState) -> None:
     """Update visibility between all actors based on current positions."""
-    # Get all living entities (PC and NPC)
-    living_entities = {
-        k: v for k, v in state.entities.items() if v.type in ("pc", "npc")
-    }
+    # Group living entities (PC and NPC) by zone, keeping entity order, so
+    # each actor only compares against its own zone
+    by_zone: Dict[str, List[str]] = {}
+    living_ids = []
+    for entity_id, entity in state.entities.items():
+        if entity.type in ("pc", "npc"):
+            living_ids.append(entity_id)
+            by_zone.setdefault(entity.current_zone, []).append(entity_id)
 
     # Update visibility for each living entity
-    for entity_id, entity in living_entities.items():
-        visible_actors = []
-
-        # Find other entities in the same zone
-        for other_id, other_entity in living_entities.items():
-            if (
-                entity_id != other_id
-                and entity.current_zone == other_entity.current_zone
-            ):
-                visible_actors.append(other_id)
+    for entity_id in living_ids:
+        entity = state.entities[entity_id]
+        visible_actors = [
+            other_id
+            for other_id in by_zone[entity.current_zone]
+            if other_id != entity_id
+        ]
 
         # Update visibility using Pydantic's copy mechanism
         updated_entity = entity.model_copy(update={"visible_actors": visible_actors})
@@ -381,6 +387,9 @@ def apply_tag(state: GameState, e: Dict[str, Any]) -> None:
         # Update entity using Pydantic's copy mechanism
         updated_entity = entity.model_copy(update={"tags": current_tags})
         state.entities[target_id] = updated_entity
+        if current_tags.get("aliases") != entity.tags.get("aliases"):
+            # Keep the name index in step with the new aliases
+            state.invalidate_cache(target_id)
 
 
 @effect("noise")
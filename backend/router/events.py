@@ -5,22 +5,102 @@ Provides a lightweight pub/sub mechanism for notifying systems
 about meta changes, zone transitions, and other game events.
 """
 
-from typing import Dict, List, Callable, Any, Optional
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Dict, Callable, Any, Deque, List, Literal, Optional, Tuple
 from threading import Lock
 from datetime import datetime, timezone
 
+logger = logging.getLogger(__name__)
+
+
+OverflowPolicy = Literal["drop_newest", "drop_oldest", "block"]
+
+
+@dataclass(eq=False)
+class _Subscription:
+    """A handler plus its delivery mode and latency stats."""
+
+    handler: Callable[..., None]
+    batch: bool = False
+    # Listener style: handler(**payload) instead of handler(payload)
+    kwargs: bool = False
+    calls: int = 0
+    events: int = 0
+    errors: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "batch": self.batch,
+            "calls": self.calls,
+            "events": self.events,
+            "errors": self.errors,
+            "total_seconds": self.total_seconds,
+            "max_seconds": self.max_seconds,
+            "avg_seconds": self.total_seconds / self.calls if self.calls else 0.0,
+        }
+
+
+@dataclass
+class _Dispatcher:
+    """Bounded queue state for queued (thread or asyncio) delivery."""
+
+    mode: Literal["thread", "asyncio"]
+    capacity: int
+    max_batch: int
+    overflow: OverflowPolicy
+    queue: Deque[Tuple[str, Tuple[_Subscription, ...], Dict[str, Any]]] = field(
+        default_factory=deque
+    )
+    cond: threading.Condition = field(default_factory=threading.Condition)
+    stopping: bool = False
+    thread: Optional[threading.Thread] = None
+    loop: Optional[asyncio.AbstractEventLoop] = None
+    wakeup: Optional[asyncio.Event] = None
+    task: Optional["asyncio.Task[None]"] = None
+
 
 class EventBus:
     """
     Thread-safe event bus for game state notifications.
+
+    Subscriber lists are immutable tuples replaced on every (un)subscribe
+    (copy-on-write), so publish reads them without taking the lock. Publishing
+    an event type nobody listens to returns before copying the payload or
+    formatting a timestamp.
+
+    By default handlers run inline in publish. start_dispatcher() (worker
+    thread) or start_async_dispatcher() (asyncio task) instead put events on a
+    bounded queue, so slow subscribers don't stall the publisher. Handlers
+    subscribed with batch=True receive a list of events per call. flush()
+    delivers everything queued, on the calling thread.
     """
 
     def __init__(self):
-        self._subscribers: Dict[str, List[Callable[[Dict[str, Any]], None]]] = {}
+        self._subscribers: Dict[str, Tuple[_Subscription, ...]] = {}
         self._lock = Lock()
+        self._dispatcher: Optional[_Dispatcher] = None
+        # Serializes delivery so queued events keep their publish order
+        self._delivery_lock = threading.RLock()
+        self._counters = {
+            "published": 0,
+            "delivered": 0,
+            "dropped": 0,
+            "handler_errors": 0,
+            "max_queue_depth": 0,
+        }
 
     def subscribe(
-        self, event_type: str, handler: Callable[[Dict[str, Any]], None]
+        self,
+        event_type: str,
+        handler: Callable[..., None],
+        batch: bool = False,
     ) -> None:
         """
         Subscribe a handler to an event type.
@@ -28,17 +108,19 @@ class EventBus:
         Args:
             event_type: The type of event to listen for
             handler: Function to call when event is published
+            batch: Deliver a list of events per call (with a queued
+                dispatcher, everything drained in one pass; inline, one
+                event per list)
         """
         with self._lock:
-            if event_type not in self._subscribers:
-                self._subscribers[event_type] = []
+            subscriptions = self._subscribers.get(event_type, ())
             # Prevent duplicate subscriptions
-            if handler not in self._subscribers[event_type]:
-                self._subscribers[event_type].append(handler)
+            if all(sub.handler != handler for sub in subscriptions):
+                self._subscribers[event_type] = subscriptions + (
+                    _Subscription(handler, batch),
+                )
 
-    def unsubscribe(
-        self, event_type: str, handler: Callable[[Dict[str, Any]], None]
-    ) -> bool:
+    def unsubscribe(self, event_type: str, handler: Callable[..., None]) -> bool:
         """
         Unsubscribe a handler from an event type.
 
@@ -50,14 +132,50 @@ class EventBus:
             True if handler was found and removed, False otherwise
         """
         with self._lock:
-            if event_type in self._subscribers:
-                try:
-                    self._subscribers[event_type].remove(handler)
+            subscriptions = self._subscribers.get(event_type, ())
+            remaining = tuple(sub for sub in subscriptions if sub.handler != handler)
+            if len(remaining) == len(subscriptions):
+                return False
+            if remaining:
+                self._subscribers[event_type] = remaining
+            else:
+                del self._subscribers[event_type]
+            return True
+
+    def add_listener(self, event_type: str, listener: Callable[..., None]) -> None:
+        """
+        Register a keyword-style listener, called as listener(**payload).
+
+        Used by GameState.register_event_listener; emit() payloads carry
+        event_type, world and the event's own keyword arguments.
+        """
+        with self._lock:
+            self._subscribers[event_type] = self._subscribers.get(event_type, ()) + (
+                _Subscription(listener, kwargs=True),
+            )
+
+    def remove_listener(self, event_type: str, listener: Callable[..., None]) -> bool:
+        """Remove one registration of a keyword-style listener."""
+        with self._lock:
+            subscriptions = self._subscribers.get(event_type, ())
+            for index, sub in enumerate(subscriptions):
+                if sub.kwargs and sub.handler == listener:
+                    remaining = subscriptions[:index] + subscriptions[index + 1 :]
+                    if remaining:
+                        self._subscribers[event_type] = remaining
+                    else:
+                        del self._subscribers[event_type]
                     return True
-                except ValueError:
-                    pass
         return False
 
+    def listeners(self, event_type: str) -> List[Callable[..., None]]:
+        """Keyword-style listeners registered for an event type."""
+        return [sub.handler for sub in self._subscribers.get(event_type, ()) if sub.kwargs]
+
+    def has_subscribers(self, event_type: str) -> bool:
+        """Lock-free check, so publishers can skip building payloads."""
+        return bool(self._subscribers.get(event_type))
+
     def publish(self, event_type: str, event_data: Dict[str, Any]) -> None:
         """
         Publish an event to all subscribers.
@@ -66,22 +184,307 @@ class EventBus:
             event_type: The type of event being published
             event_data: The event data to send to handlers
         """
+        # Snapshot of the current subscribers (replaced, never mutated)
+        subscriptions = self._subscribers.get(event_type)
+        if not subscriptions:
+            return
+
         # Add timestamp to all events
         event_data = event_data.copy()
         event_data["timestamp"] = datetime.now(timezone.utc).isoformat()
         event_data["event_type"] = event_type
+        self._route(event_type, subscriptions, event_data)
 
-        # Get current subscribers (thread-safe)
-        with self._lock:
-            handlers = self._subscribers.get(event_type, []).copy()
+    def publish_lazy(
+        self, event_type: str, build_data: Callable[[], Dict[str, Any]]
+    ) -> None:
+        """
+        Publish an event whose payload is only built if someone subscribes.
 
-        # Call handlers outside the lock to prevent deadlock
-        for handler in handlers:
-            try:
-                handler(event_data)
-            except Exception as e:
-                # Log error but continue with other handlers
-                print(f"Error in event handler for {event_type}: {e}")
+        Args:
+            event_type: The type of event being published
+            build_data: Returns the event data (called at most once)
+        """
+        subscriptions = self._subscribers.get(event_type)
+        if not subscriptions:
+            return
+
+        event_data = dict(build_data())
+        event_data["timestamp"] = datetime.now(timezone.utc).isoformat()
+        event_data["event_type"] = event_type
+        self._route(event_type, subscriptions, event_data)
+
+    def emit(self, event_type: str, **event_data: Any) -> None:
+        """
+        Publish keyword event data as-is (no copy or timestamp).
+
+        Keyword-style listeners get listener(event_type=..., **event_data);
+        dict-style subscribers get the same data as one dict.
+        """
+        subscriptions = self._subscribers.get(event_type)
+        if not subscriptions:
+            return
+        event_data["event_type"] = event_type
+        self._route(event_type, subscriptions, event_data)
+
+    def _route(
+        self,
+        event_type: str,
+        subscriptions: Tuple[_Subscription, ...],
+        event_data: Dict[str, Any],
+    ) -> None:
+        self._counters["published"] += 1
+        dispatcher = self._dispatcher
+        if dispatcher is None:
+            self._deliver([(event_type, subscriptions, event_data)])
+        else:
+            self._enqueue(dispatcher, (event_type, subscriptions, event_data))
+
+    # ------------------------------------------------------------------
+    # Queued delivery
+    # ------------------------------------------------------------------
+
+    def start_dispatcher(
+        self,
+        max_queue: int = 10000,
+        max_batch: int = 256,
+        overflow: OverflowPolicy = "drop_newest",
+    ) -> None:
+        """
+        Deliver events from a bounded queue on a worker thread.
+
+        Args:
+            max_queue: Queue capacity
+            max_batch: Events delivered per drain pass
+            overflow: When full, drop the new event, drop the oldest queued
+                event, or block the publisher until there is room (don't
+                block if handlers publish, the worker would wait on itself)
+        """
+        dispatcher = self._install_dispatcher("thread", max_queue, max_batch, overflow)
+        dispatcher.thread = threading.Thread(
+            target=self._run_worker, args=(dispatcher,), name="event-bus", daemon=True
+        )
+        dispatcher.thread.start()
+
+    def start_async_dispatcher(
+        self,
+        max_queue: int = 10000,
+        max_batch: int = 256,
+        overflow: Literal["drop_newest", "drop_oldest"] = "drop_newest",
+    ) -> "asyncio.Task[None]":
+        """
+        Deliver events from a bounded queue in an asyncio task on the running
+        loop (handlers run on the loop thread). Must be called from a coroutine.
+
+        Returns:
+            The draining task
+        """
+        if overflow == "block":
+            raise ValueError("The asyncio dispatcher cannot block publishers")
+        loop = asyncio.get_running_loop()
+        dispatcher = self._install_dispatcher("asyncio", max_queue, max_batch, overflow)
+        dispatcher.loop = loop
+        dispatcher.wakeup = asyncio.Event()
+        dispatcher.task = loop.create_task(self._run_async(dispatcher))
+        return dispatcher.task
+
+    def stop_dispatcher(self, flush: bool = True) -> None:
+        """
+        Return to inline delivery.
+
+        Args:
+            flush: Deliver queued events first (otherwise they are dropped)
+        """
+        dispatcher = self._dispatcher
+        if dispatcher is None:
+            return
+        self._dispatcher = None
+
+        with dispatcher.cond:
+            dispatcher.stopping = True
+            dispatcher.cond.notify_all()
+        if dispatcher.wakeup is not None and dispatcher.loop is not None:
+            dispatcher.loop.call_soon_threadsafe(dispatcher.wakeup.set)
+        worker = dispatcher.thread
+        if worker is not None and worker is not threading.current_thread():
+            worker.join()
+
+        if flush:
+            self._drain(dispatcher, until_empty=True)
+        else:
+            with dispatcher.cond:
+                self._counters["dropped"] += len(dispatcher.queue)
+                dispatcher.queue.clear()
+
+    def flush(self) -> int:
+        """
+        Synchronously deliver every queued event on the calling thread.
+
+        Returns:
+            Number of events delivered
+        """
+        dispatcher = self._dispatcher
+        if dispatcher is None:
+            return 0
+        return self._drain(dispatcher, until_empty=True)
+
+    def _install_dispatcher(
+        self,
+        mode: Literal["thread", "asyncio"],
+        max_queue: int,
+        max_batch: int,
+        overflow: OverflowPolicy,
+    ) -> _Dispatcher:
+        if self._dispatcher is not None:
+            raise RuntimeError("Event dispatcher already running")
+        if max_queue < 1 or max_batch < 1:
+            raise ValueError("max_queue and max_batch must be positive")
+        dispatcher = _Dispatcher(mode, max_queue, max_batch, overflow)
+        self._dispatcher = dispatcher
+        return dispatcher
+
+    def _enqueue(
+        self,
+        dispatcher: _Dispatcher,
+        item: Tuple[str, Tuple[_Subscription, ...], Dict[str, Any]],
+    ) -> None:
+        with dispatcher.cond:
+            if len(dispatcher.queue) >= dispatcher.capacity:
+                if dispatcher.overflow == "drop_newest":
+                    self._counters["dropped"] += 1
+                    return
+                if dispatcher.overflow == "drop_oldest":
+                    dispatcher.queue.popleft()
+                    self._counters["dropped"] += 1
+                else:
+                    dispatcher.cond.wait_for(
+                        lambda: len(dispatcher.queue) < dispatcher.capacity
+                        or dispatcher.stopping
+                    )
+            dispatcher.queue.append(item)
+            depth = len(dispatcher.queue)
+            if depth > self._counters["max_queue_depth"]:
+                self._counters["max_queue_depth"] = depth
+            dispatcher.cond.notify_all()
+
+        if dispatcher.wakeup is not None and dispatcher.loop is not None:
+            dispatcher.loop.call_soon_threadsafe(dispatcher.wakeup.set)
+
+    def _drain(self, dispatcher: _Dispatcher, until_empty: bool = False) -> int:
+        """Deliver up to max_batch queued events (or all of them)."""
+        delivered = 0
+        while True:
+            with self._delivery_lock:
+                with dispatcher.cond:
+                    count = min(len(dispatcher.queue), dispatcher.max_batch)
+                    chunk = [dispatcher.queue.popleft() for _ in range(count)]
+                    # Wake publishers blocked on a full queue
+                    dispatcher.cond.notify_all()
+                if not chunk:
+                    return delivered
+                self._deliver(chunk)
+            delivered += len(chunk)
+            if not until_empty:
+                return delivered
+
+    def _run_worker(self, dispatcher: _Dispatcher) -> None:
+        while True:
+            with dispatcher.cond:
+                dispatcher.cond.wait_for(
+                    lambda: dispatcher.queue or dispatcher.stopping
+                )
+                if dispatcher.stopping:
+                    return
+            self._drain(dispatcher)
+
+    async def _run_async(self, dispatcher: _Dispatcher) -> None:
+        assert dispatcher.wakeup is not None
+        while not dispatcher.stopping:
+            await dispatcher.wakeup.wait()
+            dispatcher.wakeup.clear()
+            while self._drain(dispatcher):
+                # Let other tasks run between batches
+                await asyncio.sleep(0)
+
+    # ------------------------------------------------------------------
+    # Handler invocation
+    # ------------------------------------------------------------------
+
+    def _deliver(
+        self, chunk: List[Tuple[str, Tuple[_Subscription, ...], Dict[str, Any]]]
+    ) -> None:
+        """Call per-event handlers in order, then each batch handler once."""
+        batches: Dict[_Subscription, List[Dict[str, Any]]] = {}
+        for event_type, subscriptions, event_data in chunk:
+            for sub in subscriptions:
+                if sub.batch:
+                    batches.setdefault(sub, []).append(event_data)
+                else:
+                    self._call(sub, event_type, event_data, 1)
+            self._counters["delivered"] += 1
+
+        for sub, events in batches.items():
+            self._call(sub, events[0]["event_type"], events, len(events))
+
+    def _call(
+        self, sub: _Subscription, event_type: str, payload: Any, count: int
+    ) -> None:
+        started = time.perf_counter()
+        try:
+            if sub.kwargs:
+                if sub.batch:
+                    for event in payload:
+                        sub.handler(**event)
+                else:
+                    sub.handler(**payload)
+            else:
+                sub.handler(payload)
+        except Exception as e:
+            # Log error but continue with other handlers
+            sub.errors += 1
+            self._counters["handler_errors"] += 1
+            logger.error(f"Error in event handler for {event_type}: {e}")
+        elapsed = time.perf_counter() - started
+        sub.calls += 1
+        sub.events += count
+        sub.total_seconds += elapsed
+        if elapsed > sub.max_seconds:
+            sub.max_seconds = elapsed
+
+    # ------------------------------------------------------------------
+    # Introspection
+    # ------------------------------------------------------------------
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Delivery metrics: queue depth, drop and error counts, and per-handler
+        latency keyed by "event_type:handler_name".
+        """
+        dispatcher = self._dispatcher
+        metrics: Dict[str, Any] = dict(self._counters)
+        metrics["mode"] = dispatcher.mode if dispatcher else "sync"
+        metrics["queue_depth"] = len(dispatcher.queue) if dispatcher else 0
+        metrics["queue_capacity"] = dispatcher.capacity if dispatcher else 0
+        metrics["handlers"] = {
+            f"{event_type}:{_handler_name(sub.handler)}": sub.stats()
+            for event_type, subscriptions in self._subscribers.items()
+            for sub in subscriptions
+        }
+        return metrics
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "EventBus":
+        """
+        Copies (e.g. of a GameState via model_copy(deep=True)) share the
+        handlers but get their own locks, queue and stats.
+        """
+        clone = EventBus()
+        clone._subscribers = {
+            event_type: tuple(
+                _Subscription(sub.handler, sub.batch, sub.kwargs) for sub in subscriptions
+            )
+            for event_type, subscriptions in self._subscribers.items()
+        }
+        return clone
 
     def clear_subscribers(self, event_type: Optional[str] = None) -> None:
         """
@@ -94,7 +497,7 @@ class EventBus:
             if event_type:
                 self._subscribers.pop(event_type, None)
             else:
-                self._subscribers.clear()
+                self._subscribers = {}
 
     def get_subscriber_count(self, event_type: str) -> int:
         """
@@ -106,8 +509,11 @@ class EventBus:
         Returns:
             Number of subscribers
         """
-        with self._lock:
-            return len(self._subscribers.get(event_type, []))
+        return len(self._subscribers.get(event_type, ()))
+
+
+def _handler_name(handler: Callable[..., None]) -> str:
+    return getattr(handler, "__qualname__", None) or repr(handler)
 
 
 # Global event bus instance
@@ -125,18 +531,37 @@ def publish(event_type: str, event_data: Dict[str, Any]) -> None:
     event_bus.publish(event_type, event_data)
 
 
-def subscribe(event_type: str, handler: Callable[[Dict[str, Any]], None]) -> None:
+def publish_lazy(event_type: str, build_data: Callable[[], Dict[str, Any]]) -> None:
+    """
+    Convenience function to publish a lazily built event on the global bus.
+
+    Args:
+        event_type: The type of event being published
+        build_data: Returns the event data, only called if someone subscribes
+    """
+    event_bus.publish_lazy(event_type, build_data)
+
+
+def has_subscribers(event_type: str) -> bool:
+    """Whether anyone listens for event_type on the global event bus."""
+    return event_bus.has_subscribers(event_type)
+
+
+def subscribe(
+    event_type: str, handler: Callable[..., None], batch: bool = False
+) -> None:
     """
     Convenience function to subscribe to events on the global event bus.
 
     Args:
         event_type: The type of event to listen for
         handler: Function to call when event is published
+        batch: Receive a list of events per call
     """
-    event_bus.subscribe(event_type, handler)
+    event_bus.subscribe(event_type, handler, batch)
 
 
-def unsubscribe(event_type: str, handler: Callable[[Dict[str, Any]], None]) -> bool:
+def unsubscribe(event_type: str, handler: Callable[..., None]) -> bool:
     """
     Convenience function to unsubscribe from events on the global event bus.
 
@@ -161,3 +586,6 @@ class EventTypes:
     ENTITY_DESTROYED = "entity.destroyed"
     VISIBILITY_CHANGED = "visibility.changed"
     CACHE_INVALIDATED = "cache.invalidated"
+    AUTOSAVE_COMPLETED = "autosave.completed"
+    AUTOSAVE_FAILED = "autosave.failed"
+    AUTOSAVE_BACKPRESSURE = "autosave.backpressure"
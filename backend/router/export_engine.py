@@ -0,0 +1,277 @@
+"""
+Export Engine - Single-pass multi-view export of GameState.
+
+Saving a game writes three views of the world: public (player-redacted), GM
+(save format) and session. Producing them through to_public_format,
+to_save_format and to_session_format walks every zone, entity and clock three
+times, model_dumping each object and re-running redaction every time.
+
+export_views() visits each object once. It dumps the object once without its
+meta, then builds every requested view from that shared dump. Only the
+Meta.export policy and the redaction decision differ between views. The output
+is equal to the per-view GameState methods.
+
+Views share nested containers from the base dumps, so treat the result as
+read-only (it is meant to be serialized).
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Literal, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .game_state import GameState
+
+
+ViewName = Literal["public", "gm", "session"]
+ExportMode = Literal["full", "public", "minimal", "save", "session"]
+
+VIEW_NAMES = ("public", "gm", "session")
+
+
+@dataclass(frozen=True)
+class ViewSpec:
+    """Export policy for one view (mirrors the export_state arguments)."""
+
+    mode: ExportMode
+    include_known_by: Optional[bool]
+    redact: bool = False
+    role: Literal["player", "narrator", "gm"] = "gm"
+    pov_id: Optional[str] = None
+
+
+def build_view_specs(
+    views: Iterable[ViewName] = VIEW_NAMES,
+    include_runtime_data: bool = True,
+    public_role: Literal["player", "narrator", "gm"] = "player",
+    public_pov_id: Optional[str] = None,
+) -> Dict[str, ViewSpec]:
+    """
+    Map view names to the policies used by the per-view GameState methods.
+
+    - public: to_public_format(pov_id=public_pov_id, role=public_role)
+    - gm: to_save_format(include_runtime_data=include_runtime_data)
+    - session: to_session_format()
+    """
+    specs = {}
+    for view in views:
+        if view == "public":
+            specs[view] = ViewSpec(
+                mode="public",
+                include_known_by=False,
+                redact=True,
+                role=public_role,
+                pov_id=public_pov_id,
+            )
+        elif view == "gm":
+            specs[view] = ViewSpec(mode="save", include_known_by=include_runtime_data)
+        elif view == "session":
+            specs[view] = ViewSpec(mode="session", include_known_by=None)
+        else:
+            raise ValueError(f"Unknown export view: {view}")
+    return specs
+
+
+def export_views(
+    state: "GameState",
+    views: Iterable[ViewName] = VIEW_NAMES,
+    include_runtime_data: bool = True,
+    public_role: Literal["player", "narrator", "gm"] = "player",
+    public_pov_id: Optional[str] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Export several views of a GameState in one traversal.
+
+    Args:
+        state: Game state to export
+        views: Which views to produce ("public", "gm", "session")
+        include_runtime_data: known_by inclusion for the GM view
+        public_role: Redaction role for the public view
+        public_pov_id: Point of view for the public view
+
+    Returns:
+        Dictionary mapping view name to exported state
+    """
+    specs = build_view_specs(views, include_runtime_data, public_role, public_pov_id)
+    return _ViewExporter(state, specs).run()
+
+
+class _ViewExporter:
+    """Walks a GameState once and fills one output dict per view."""
+
+    def __init__(self, state: "GameState", specs: Dict[str, ViewSpec]):
+        self.state = state
+        self.specs = specs
+        self.output: Dict[str, Dict[str, Any]] = {
+            name: {"scene": None, "zones": {}, "entities": {}, "clocks": {}}
+            for name in specs
+        }
+        # Lazily computed redaction context, shared by all redacted views
+        self._entity_povs: Dict[Optional[str], Optional[str]] = {}
+        self._zone_members: Dict[Optional[str], Dict[str, List[str]]] = {}
+
+    def run(self) -> Dict[str, Dict[str, Any]]:
+        self._export_scene()
+        self._export_zones()
+        self._export_entities()
+        self._export_clocks()
+        return self.output
+
+    # ------------------------------------------------------------------
+    # Per-collection passes
+    # ------------------------------------------------------------------
+
+    def _export_scene(self) -> None:
+        scene = self.state.scene
+        has_meta = hasattr(scene, "meta") and scene.meta
+        base = scene.model_dump(exclude={"meta"}) if has_meta else scene.model_dump()
+        for name, spec in self.specs.items():
+            scene_data = dict(base)
+            if has_meta:
+                scene_data["meta"] = scene.meta.export(spec.mode, spec.include_known_by)
+            self.output[name]["scene"] = scene_data
+
+    def _export_zones(self) -> None:
+        for zid, zone in self.state.zones.items():
+            base = zone.model_dump(exclude={"meta", "exits"})
+            for key in ("tags", "discovered_by"):
+                if isinstance(base.get(key), (set, list)):
+                    base[key] = sorted(base[key])
+            exit_bases = [exit.model_dump(exclude={"meta"}) for exit in zone.exits]
+            exits_by_mode: Dict[str, List[Dict[str, Any]]] = {}
+
+            def exits_for(mode: str) -> List[Dict[str, Any]]:
+                if mode not in exits_by_mode:
+                    exits_by_mode[mode] = [
+                        {**exit_base, "meta": exit.meta.export(mode=mode)}
+                        for exit_base, exit in zip(exit_bases, zone.exits)
+                    ]
+                return exits_by_mode[mode]
+
+            for name, spec in self.specs.items():
+                meta = zone.meta.export(spec.mode, spec.include_known_by)
+                if not spec.redact:
+                    zone_data = {**base, "exits": exits_for(spec.mode), "meta": meta}
+                elif spec.role == "gm":
+                    zone_data = {
+                        **base,
+                        "exits": exits_for("full"),
+                        "meta": meta,
+                        "is_visible": True,
+                    }
+                elif zone.meta.visibility == "gm_only" or (
+                    zone.meta.visibility == "hidden"
+                    and spec.pov_id not in zone.meta.known_by
+                ):
+                    zone_data = _hidden_zone(zid)
+                else:
+                    zone_data = {
+                        **base,
+                        "exits": exits_for("public"),
+                        "meta": meta,
+                        "entities": list(self._members(spec.pov_id).get(zid, ())),
+                        "is_visible": True,
+                    }
+                self.output[name]["zones"][zid] = zone_data
+
+    def _export_entities(self) -> None:
+        from .visibility import can_player_see
+
+        for eid, entity in self.state.entities.items():
+            base = entity.model_dump(exclude={"meta"})
+            for name, spec in self.specs.items():
+                meta = entity.meta.export(spec.mode, spec.include_known_by)
+                if not spec.redact:
+                    self.output[name]["entities"][eid] = {**base, "meta": meta}
+                    continue
+
+                # Public exports drop entities the POV can't see
+                if spec.role != "gm" and not can_player_see(
+                    self._entity_pov(spec.pov_id), entity, self.state
+                ):
+                    continue
+                self.output[name]["entities"][eid] = {
+                    **base,
+                    "meta": meta,
+                    "is_visible": True,
+                }
+
+    def _export_clocks(self) -> None:
+        from .game_state import Clock
+
+        for cid, clock in self.state.clocks.items():
+            if not isinstance(clock, Clock):
+                # Legacy format - preserve as-is
+                for name in self.specs:
+                    self.output[name]["clocks"][cid] = (
+                        clock.copy() if isinstance(clock, dict) else clock
+                    )
+                continue
+
+            base = clock.model_dump(exclude={"meta"})
+            for name, spec in self.specs.items():
+                meta = clock.meta.export(spec.mode, spec.include_known_by)
+                if spec.redact and (
+                    clock.meta.visibility == "gm_only"
+                    or (
+                        clock.meta.visibility == "hidden"
+                        and spec.pov_id not in clock.meta.known_by
+                    )
+                ):
+                    clock_data = _hidden_clock(clock.id)
+                elif spec.redact:
+                    clock_data = {**base, "meta": meta, "is_visible": True}
+                else:
+                    clock_data = {**base, "meta": meta}
+                self.output[name]["clocks"][cid] = clock_data
+
+    # ------------------------------------------------------------------
+    # Redaction context
+    # ------------------------------------------------------------------
+
+    def _entity_pov(self, pov_id: Optional[str]) -> Optional[str]:
+        """Public exports without a POV use the first PC (or first entity)."""
+        if pov_id not in self._entity_povs:
+            effective = pov_id
+            if pov_id is None:
+                entities = self.state.entities
+                effective = next(
+                    (e_id for e_id, e in entities.items() if getattr(e, "type", None) == "pc"),
+                    next(iter(entities), None),
+                )
+            self._entity_povs[pov_id] = effective
+        return self._entity_povs[pov_id]
+
+    def _members(self, pov_id: Optional[str]) -> Dict[str, List[str]]:
+        """Entity IDs visible to pov_id, grouped by zone (built once per POV)."""
+        if pov_id not in self._zone_members:
+            from .visibility import can_player_see
+
+            members: Dict[str, List[str]] = {}
+            for eid, entity in self.state.entities.items():
+                zone_id = getattr(entity, "current_zone", None)
+                if zone_id is not None and can_player_see(pov_id, entity, self.state):
+                    members.setdefault(zone_id, []).append(eid)
+            self._zone_members[pov_id] = members
+        return self._zone_members[pov_id]
+
+
+def _hidden_zone(zone_id: str) -> Dict[str, Any]:
+    return {
+        "id": zone_id,
+        "name": "Unknown Area",
+        "description": "You cannot see this area.",
+        "adjacent_zones": [],
+        "blocked_exits": [],
+        "entities": [],
+        "is_visible": False,
+    }
+
+
+def _hidden_clock(clock_id: str) -> Dict[str, Any]:
+    return {
+        "id": clock_id,
+        "name": "Unknown Progress",
+        "value": None,
+        "maximum": None,
+        "is_visible": False,
+    }
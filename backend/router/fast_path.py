@@ -0,0 +1,249 @@
+"""
+Fast Path Planner - Deterministic pre-planner for unambiguous commands.
+
+A large share of player turns are simple, unambiguous commands: "look
+around", "go to the main hall", "attack" when there is exactly one hostile in
+sight. These don't need an LLM to pick a tool or fill arguments; the keyword
+heuristics already in the codebase are enough:
+
+- ACTIONABLE_VERB_GROUPS (behind Utterance.has_actionable_verb) classifies verbs
+- detect_talk_intent (the suggest_talk_args ontology) spots social intent
+- is_likely_compound (behind Planner._is_likely_compound) rejects multi-step input
+
+The fast path only answers when exactly one rule matches with high
+confidence. Everything else returns None so the caller falls back to the
+StagedPlanner. Stats record what fraction of turns never touched an LLM.
+"""
+
+import logging
+import re
+from dataclasses import dataclass, asdict
+from typing import Dict, Any, List, Optional, Set
+
+from .game_state import GameState, Utterance, ACTIONABLE_VERB_GROUPS
+from .planner import is_likely_compound
+from .staged_planner import StagedPlanResult
+from .tool_catalog import (
+    detect_talk_intent,
+    move_precond,
+    attack_precond,
+    suggest_move_args,
+    suggest_attack_args,
+)
+
+logger = logging.getLogger(__name__)
+
+
+_WORD_RE = re.compile(r"[a-z]+")
+
+# Words that can go with an attack verb without naming who to attack
+_ATTACK_FILLER = frozenset(
+    {
+        "i", "me", "we", "us", "let", "lets", "s", "go", "again", "now",
+        "the", "a", "an", "at", "on", "it", "him", "her", "them", "that",
+        "this", "one", "enemy", "foe", "hostile",
+    }
+)
+
+# Bare observation commands, optionally prefixed with "I"
+_LOOK_RE = re.compile(
+    r"^(?:i\s+)?(?:look|glance|peer)(?:\s+(?:around|about|round))?"
+    r"(?:\s+(?:the\s+)?(?:room|area|place))?$"
+)
+
+
+@dataclass
+class FastPathStats:
+    """Counters for fast path usage across turns."""
+
+    turns: int = 0
+    fast_path_turns: int = 0
+
+    @property
+    def llm_turns(self) -> int:
+        return self.turns - self.fast_path_turns
+
+    @property
+    def fast_path_ratio(self) -> float:
+        """Fraction of turns served without any LLM call."""
+        return self.fast_path_turns / self.turns if self.turns else 0.0
+
+    def to_dict(self) -> Dict[str, float]:
+        data = asdict(self)
+        data["llm_turns"] = self.llm_turns
+        data["fast_path_ratio"] = self.fast_path_ratio
+        return data
+
+
+class FastPathPlanner:
+    """Rule-based planner that resolves unambiguous commands without an LLM."""
+
+    def __init__(self, min_confidence: float = 0.85):
+        """
+        Initialize the fast path planner.
+
+        Args:
+            min_confidence: Plans below this confidence are discarded so the
+                caller falls back to the LLM planner
+        """
+        self.min_confidence = min_confidence
+        self.stats = FastPathStats()
+
+    def plan(self, state: GameState, utterance: Utterance) -> Optional[StagedPlanResult]:
+        """
+        Try to resolve an utterance to tool calls deterministically.
+
+        Args:
+            state: Current game state
+            utterance: Player input
+
+        Returns:
+            A StagedPlanResult when a rule matched with enough confidence,
+            otherwise None
+        """
+        # suggest_*_args read state.current_actor, so only plan for that actor
+        if not utterance.actor_id or utterance.actor_id != state.current_actor:
+            return None
+        if utterance.actor_id not in state.entities:
+            return None
+
+        text_lower = " ".join(utterance.text.lower().split()).strip(" .!?")
+        if not text_lower or is_likely_compound(text_lower):
+            return None
+
+        # Social phrasing needs the LLM to pick intent, target and topic
+        if detect_talk_intent(text_lower) is not None:
+            return None
+
+        words = set(_WORD_RE.findall(text_lower))
+        verb_groups = {
+            group for group, verbs in ACTIONABLE_VERB_GROUPS.items() if words & verbs
+        }
+
+        result = None
+        if _LOOK_RE.match(text_lower):
+            result = self._plan_look(utterance)
+        elif verb_groups == {"move"}:
+            result = self._plan_move(state, utterance, text_lower, words)
+        elif verb_groups == {"attack"}:
+            result = self._plan_attack(state, utterance, words)
+
+        if result is None or result.confidence < self.min_confidence:
+            return None
+        return result
+
+    def record_turn(self, served_by_fast_path: bool) -> None:
+        """Record whether a turn was planned without calling an LLM."""
+        self.stats.turns += 1
+        if served_by_fast_path:
+            self.stats.fast_path_turns += 1
+
+    def get_stats(self) -> Dict[str, float]:
+        """Return fast path usage metrics as a plain dict."""
+        return self.stats.to_dict()
+
+    def _plan_look(self, utterance: Utterance) -> StagedPlanResult:
+        """'look around' and friends map straight to narrate_only."""
+        return self._result(
+            "narrate_only",
+            {"actor": utterance.actor_id, "topic": "look around"},
+            confidence=0.95,
+            rule="look_around",
+        )
+
+    def _plan_move(
+        self,
+        state: GameState,
+        utterance: Utterance,
+        text_lower: str,
+        words: Set[str],
+    ) -> Optional[StagedPlanResult]:
+        """Move to exactly one named adjacent zone."""
+        if not move_precond(state, utterance):
+            return None
+
+        actor = state.entities[utterance.actor_id]
+        current_zone = state.zones.get(actor.current_zone)
+        if not current_zone:
+            return None
+
+        mentioned = [
+            zone_id
+            for zone_id in current_zone.adjacent_zones
+            if zone_id in state.zones
+            and (
+                _mentions(text_lower, state.zones[zone_id].name)
+                or _mentions(text_lower, zone_id)
+            )
+        ]
+        if len(mentioned) != 1:
+            return None
+
+        args = suggest_move_args(state, utterance)
+        if args.get("to") != mentioned[0]:
+            # The substring scan in suggest_move_args picked something else
+            return None
+
+        # Sneaking is contested and usually needs a roll; leave it to the LLM
+        if args.get("method") == "sneak":
+            return None
+
+        return self._result("move", args, confidence=0.9, rule="move_named_zone")
+
+    def _plan_attack(
+        self, state: GameState, utterance: Utterance, words: Set[str]
+    ) -> Optional[StagedPlanResult]:
+        """Attack the one visible hostile, if the text names it or nobody at all."""
+        if not attack_precond(state, utterance):
+            return None
+
+        actor = state.entities[utterance.actor_id]
+        hostiles = []
+        others = []
+        for actor_id in getattr(actor, "visible_actors", []):
+            target = state.entities.get(actor_id)
+            if not target or target.type not in ("pc", "npc"):
+                continue
+            if target.type != actor.type and target.hp.current > 0:
+                hostiles.append(target)
+            else:
+                others.append(target)
+
+        if len(hostiles) != 1:
+            return None
+
+        # Anything besides the verb and filler must name the hostile:
+        # "attack the merchant" or "attack the dragon" (not here) go to the LLM
+        named = words - ACTIONABLE_VERB_GROUPS["attack"] - _ATTACK_FILLER
+        other_words = set().union(*(_name_words(other) for other in others))
+        if named & other_words or named - _name_words(hostiles[0]):
+            return None
+
+        args = suggest_attack_args(state, utterance)
+        if args.get("target") != hostiles[0].id:
+            return None
+
+        return self._result("attack", args, confidence=0.9, rule="attack_only_hostile")
+
+    @staticmethod
+    def _result(
+        tool_id: str, args: Dict[str, Any], confidence: float, rule: str
+    ) -> StagedPlanResult:
+        return StagedPlanResult(
+            tool_calls=[{"tool": tool_id, "args": args}],
+            confidence=confidence,
+            debug_info={"fast_path_rule": rule},
+        )
+
+
+def _name_words(entity: Any) -> Set[str]:
+    """Lowercased words of an entity's name and ID ("npc.old_guard" -> npc, old, guard)."""
+    return set(_WORD_RE.findall(f"{entity.name} {entity.id}".lower()))
+
+
+def _mentions(text_lower: str, name: str) -> bool:
+    """Word-boundary check for a name or ID inside lowercased text."""
+    name = name.lower().strip()
+    if not name:
+        return False
+    return re.search(rf"(?<![a-z0-9_]){re.escape(name)}(?![a-z0-9_])", text_lower) is not None
@@ -2,6 +2,7 @@
 Core data structures for the AI D&D game state and utterances.
 """
 
+import logging
 import re
 import sys
 import os
@@ -16,6 +17,8 @@ from typing import (
     cast,
     Tuple,
     Callable,
+    FrozenSet,
+    Sequence,
 )
 from pydantic import BaseModel, ConfigDict, Field, model_validator, PrivateAttr
 from enum import Enum
@@ -25,7 +28,7 @@ _project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".
 if _project_root not in sys.path:
     sys.path.insert(0, _project_root)
 
-from models.meta import Meta
+from models.meta import Meta, loaded_events_module
 from models.space import Zone as ZoneModel, Exit
 
 
@@ -69,13 +72,14 @@ class PendingEffect(BaseModel):
     """
     Timed or conditional effect waiting to be applied.
 
-    Represents an effect scheduled for future execution. Forms part of a FIFO queue
-    where effects are added via append() and processed in chronological order.
+    Represents an effect scheduled for future execution. Scene.pending_effects
+    is a priority queue ordered by trigger_round (FIFO among equal rounds),
+    maintained by EffectScheduler (see effect_scheduler.py).
 
     Queue Operations:
-    - Add: pending_effects.append(new_effect)
-    - Process: Iterate through list, apply triggered effects, rebuild list without them
-    - The list should maintain chronological order (earliest trigger_round first)
+    - Add: scene.add_pending_effect(new_effect)
+    - Process: scene.process_pending_effects(round) pops only the due prefix
+    - Cancel: scene.cancel_pending_effect(effect_id)
     """
 
     # The effect to apply when triggered
@@ -94,6 +98,9 @@ class PendingEffect(BaseModel):
 
     # Optional metadata
     condition: Optional[str] = None  # Additional condition to check before applying
+    # Last round a condition may hold it back; still unmet after that, it is
+    # dropped (None = trigger_round + effect_scheduler.MAX_CONDITION_WAIT)
+    expires_round: Optional[int] = None
     source: Optional[str] = None  # What caused this effect to be scheduled
     meta: Dict[str, Any] = Field(default_factory=dict)  # Additional metadata
 
@@ -218,6 +225,7 @@ class Clock(BaseModel):
     last_modified_turn: Optional[int] = None
     last_modified_by: Optional[str] = None
     filled_this_turn: bool = False
+    filled_by: Optional[str] = None
     meta: Meta = Field(default_factory=Meta)
 
 
@@ -344,8 +352,26 @@ class Scene(BaseModel):
     """Scene tracking for turn order and environmental conditions."""
 
     id: str = "default_scene"
-    turn_order: List[str] = Field(default_factory=list)
+    turn_order: List[str] = Field(
+        default_factory=list,
+        description="Actor IDs in turn order, highest initiative first. "
+        "Managed by turn_scheduler (see turn_scheduler.py).",
+    )
     turn_index: int = 0
+    turn_held: bool = Field(
+        default=False,
+        description="The acting actor left the order: the actor at turn_index is up "
+        "next, so the next advance does not skip them",
+    )
+    initiative: Dict[str, int] = Field(default_factory=dict)
+    delayed_actors: Dict[str, int] = Field(
+        default_factory=dict,
+        description="Actors holding their turn, with the initiative they left at",
+    )
+    readied_actions: Dict[str, str] = Field(
+        default_factory=dict,
+        description="Readied action triggers by actor; they lapse at the actor's next turn",
+    )
     round: int = 1
     base_dc: int = 12
     tags: Dict[str, str] = Field(
@@ -362,53 +388,86 @@ class Scene(BaseModel):
     last_effect_log: List[EffectLogEntry] = Field(
         default_factory=list,
         description="Structured log of recently applied effects for replay/undo functionality. "
-        "Contains complete audit trail with before/after state, dice rolls, and execution details.",
+        "Contains complete audit trail with before/after state, dice rolls, and execution details. "
+        "Bounded: add_effect_log(s) keeps the newest entries and spills older ones to the "
+        "attached EffectLogArchive (see effect_log.py).",
     )
     last_diff_summary: Optional[str] = (
         None  # Human-readable audit trail of last changes
     )
     pending_effects: List[PendingEffect] = Field(
         default_factory=list,
-        description="FIFO queue of timed/conditional effects awaiting execution. "
-        "Effects are appended to the end and processed in chronological order. "
-        "Use .append() to add new effects and rebuild the list to remove triggered ones. "
-        "Maintains chronological ordering by trigger_round.",
+        description="Queue of timed/conditional effects awaiting execution, ordered by "
+        "trigger_round (FIFO among equal rounds). Use add_pending_effect() and "
+        "process_pending_effects(); direct appends are re-sorted on next use.",
     )
     meta: Meta = Field(default_factory=Meta)
 
+    _effect_log_archive: Optional[Any] = PrivateAttr(default=None)
+    _effect_log_dropped: int = PrivateAttr(default=0)
+    _effect_scheduler: Optional[Any] = PrivateAttr(default=None)
+    _turn_scheduler: Optional[Any] = PrivateAttr(default=None)
+
+    @property
+    def turn_scheduler(self) -> Any:
+        """TurnScheduler over turn_order (rebound if the list is replaced)."""
+        scheduler = self._turn_scheduler
+        if (
+            scheduler is None
+            or scheduler.scene is not self
+            or scheduler.order is not self.turn_order
+        ):
+            from .turn_scheduler import TurnScheduler
+
+            scheduler = TurnScheduler(self)
+            self._turn_scheduler = scheduler
+        return scheduler
+
+    @property
+    def effect_scheduler(self) -> Any:
+        """EffectScheduler over pending_effects (rebound if the list is replaced)."""
+        scheduler = self._effect_scheduler
+        if scheduler is None or scheduler.effects is not self.pending_effects:
+            from .effect_scheduler import EffectScheduler
+
+            scheduler = EffectScheduler(self.pending_effects)
+            self._effect_scheduler = scheduler
+        return scheduler
+
     def add_pending_effect(self, pending_effect: PendingEffect) -> None:
         """
-        Add a pending effect to the FIFO queue.
+        Schedule a pending effect.
 
-        Effects are appended to the end to maintain chronological order.
-        The queue should be processed by trigger_round to ensure proper timing.
+        It is placed after every effect with the same or an earlier
+        trigger_round, so effects due in the same round run in FIFO order.
         """
-        self.pending_effects.append(pending_effect)
+        self.effect_scheduler.schedule(pending_effect)
 
-    def process_pending_effects(self, current_round: int) -> List[PendingEffect]:
+    def process_pending_effects(
+        self,
+        current_round: int,
+        condition_check: Optional[Callable[[PendingEffect], bool]] = None,
+    ) -> List[PendingEffect]:
         """
         Remove and return all pending effects that should trigger this round.
 
-        This maintains FIFO semantics by processing effects in the order they were added,
-        but only returns those whose trigger_round <= current_round.
+        Only the due prefix of the queue is touched. Effects are returned in
+        trigger order (FIFO among equal rounds).
 
         Args:
             current_round: The current game round
+            condition_check: Optional check for effects with a condition;
+                rejected effects stay queued for the next round, until
+                their expires_round has passed
 
         Returns:
             List of effects to process (trigger_round <= current_round)
         """
-        triggered = []
-        remaining = []
+        return self.effect_scheduler.pop_due(current_round, condition_check)
 
-        for effect in self.pending_effects:
-            if effect.trigger_round <= current_round:
-                triggered.append(effect)
-            else:
-                remaining.append(effect)
-
-        self.pending_effects = remaining
-        return triggered
+    def cancel_pending_effect(self, effect_id: str) -> bool:
+        """Cancel a scheduled effect by ID. Returns True if it was queued."""
+        return self.effect_scheduler.cancel(effect_id)
 
     def add_effect_log(self, log_entry: EffectLogEntry) -> None:
         """
@@ -416,7 +475,72 @@ class Scene(BaseModel):
 
         Maintains a record of all applied effects for replay/undo functionality.
         """
-        self.last_effect_log.append(log_entry)
+        self.add_effect_logs([log_entry])
+
+    def add_effect_logs(self, log_entries: Sequence[Any]) -> None:
+        """
+        Add effect log entries (EffectLogEntry or dicts), oldest first.
+
+        The in-memory log holds up to 2x EFFECT_LOG_CAPACITY entries. Past
+        that, the oldest entries beyond EFFECT_LOG_CAPACITY are moved to the
+        archive in one batch; without an archive they are dropped, with a
+        warning.
+        """
+        from .effect_log import EFFECT_LOG_CAPACITY
+
+        self.last_effect_log.extend(log_entries)
+        if len(self.last_effect_log) > 2 * EFFECT_LOG_CAPACITY:
+            overflow = len(self.last_effect_log) - EFFECT_LOG_CAPACITY
+            evicted = self.last_effect_log[:overflow]
+            del self.last_effect_log[:overflow]
+            if self._effect_log_archive is not None:
+                self._effect_log_archive.append(evicted)
+            else:
+                self._effect_log_dropped += len(evicted)
+                logging.getLogger(__name__).warning(
+                    f"Dropped {len(evicted)} effect log entries "
+                    f"({self._effect_log_dropped} so far): no archive attached"
+                )
+
+    def attach_effect_log_archive(self, archive: Any) -> None:
+        """Spill evicted effect log entries to an EffectLogArchive."""
+        self._effect_log_archive = archive
+
+    @property
+    def effect_log_archive(self) -> Optional[Any]:
+        return self._effect_log_archive
+
+    def query_effect_log(
+        self,
+        round_applied: Optional[int] = None,
+        actor: Optional[str] = None,
+        effect_type: Optional[str] = None,
+        since_round: Optional[int] = None,
+        until_round: Optional[int] = None,
+        include_archived: bool = True,
+    ) -> List[Dict[str, Any]]:
+        """
+        Effect log entries (as dicts, oldest first) matching the filters.
+
+        Args:
+            round_applied: Exact round
+            actor: Entity that caused the effect
+            effect_type: Effect type (e.g. "hp", "position")
+            since_round: Earliest round (inclusive)
+            until_round: Latest round (inclusive)
+            include_archived: Also search the attached archive
+        """
+        from .effect_log import entry_matches, entry_to_dict
+
+        filters = (round_applied, actor, effect_type, since_round, until_round)
+        results = []
+        if include_archived and self._effect_log_archive is not None:
+            results.extend(self._effect_log_archive.query(*filters))
+        for entry in self.last_effect_log:
+            entry_data = entry_to_dict(entry)
+            if entry_matches(entry_data, *filters):
+                results.append(entry_data)
+        return results
 
 
 class GameState(BaseModel):
@@ -436,9 +560,43 @@ class GameState(BaseModel):
     _redaction_cache: Dict[Tuple[Optional[str], str], Dict[str, Any]] = PrivateAttr(
         default_factory=dict
     )
+    # Meta.version of the entity each cached view was built from
+    _redaction_versions: Dict[Tuple[Optional[str], str], int] = PrivateAttr(
+        default_factory=dict
+    )
+
+    # Per-state event bus for zone graph and other dynamic changes (created
+    # on first subscription, so states nobody listens to never build one)
+    _event_bus: Optional[Any] = PrivateAttr(default=None)
+
+    # Key of this world in process-wide events (see publish)
+    _session_id: Optional[str] = PrivateAttr(default=None)
+    # Whether publish() also fans out to the process-wide bus
+    _global_events: bool = PrivateAttr(default=True)
+
+    # Name/alias index for resolving player text to IDs (built lazily)
+    _name_index: Optional[Any] = PrivateAttr(default=None)
+    # Set when names may have changed behind the index's back (full resync)
+    _name_index_dirty: bool = PrivateAttr(default=True)
+    # (len(entities), len(zones)) when the index was last brought up to date
+    _name_index_sizes: Tuple[int, int] = PrivateAttr(default=(-1, -1))
+    # Optional embedding function for semantic name lookups
+    _name_embedder: Optional[Callable[[str], Any]] = PrivateAttr(default=None)
+
+    # ClockEngine attached by ClockEngine(state); None means plain clock updates
+    _clock_engine: Optional[Any] = PrivateAttr(default=None)
+
+    @property
+    def clock_engine(self) -> Optional[Any]:
+        """The attached ClockEngine (see clock_engine.py), if any."""
+        return self._clock_engine
 
-    # Event system for zone graph and other dynamic changes
-    _event_listeners: Dict[str, List[Callable]] = PrivateAttr(default_factory=dict)
+    def __deepcopy__(self, memo: Optional[Dict[int, Any]] = None) -> "GameState":
+        clone = super().__deepcopy__(memo)
+        # The copied engine must advance the copy's clocks, not this state's
+        if clone._clock_engine is not None:
+            clone._clock_engine.state = clone
+        return clone
 
     # Backward compatibility property
     @property
@@ -568,11 +726,16 @@ class GameState(BaseModel):
             Cached redacted view of the entity
         """
         key = (pov_id, eid)
-        if key not in self._redaction_cache:
+        entity = self.entities.get(eid)
+        version = entity.meta.version if entity else -1
+        if (
+            key not in self._redaction_cache
+            or self._redaction_versions.get(key) != version
+        ):
+            # Not cached, or the entity was touched without invalidating us
             # Import here to avoid circular imports
             from .visibility import redact_entity
 
-            entity = self.entities.get(eid)
             if entity:
                 self._redaction_cache[key] = redact_entity(pov_id, entity, self)
             else:
@@ -583,54 +746,188 @@ class GameState(BaseModel):
                     "is_visible": False,
                     "name": "Not Found",
                 }
+            self._redaction_versions[key] = version
 
         return self._redaction_cache[key]
 
+    def get_name_index(self):
+        """
+        Get the name/alias index for this state.
+
+        The index is built on first use and then kept up to date by
+        add_entity, rename_entity, remove_entity, add_zone, remove_zone and
+        invalidate_cache(eid), so reading it does not rescan the world. A
+        full resync happens only after invalidate_cache() or when entities or
+        zones were added or deleted directly in the dicts.
+
+        Returns:
+            NameIndex over entity and zone names, aliases and IDs
+        """
+        # Import here to avoid circular imports
+        from .name_index import NameIndex
+
+        if self._name_index is None:
+            self._name_index = NameIndex(embedder=self._name_embedder)
+            self._name_index_dirty = True
+        sizes = (len(self.entities), len(self.zones))
+        if self._name_index_dirty or sizes != self._name_index_sizes:
+            self._name_index.sync(self)
+            self._name_index_dirty = False
+            self._name_index_sizes = sizes
+        return self._name_index
+
+    def set_name_embedder(self, embedder: Optional[Callable[[str], Any]]) -> None:
+        """
+        Use a local embedding function for semantic name lookups.
+
+        The name index is rebuilt on next use so every name gets a vector.
+
+        Args:
+            embedder: Function from text to a vector, or None for lexical only
+        """
+        self._name_embedder = embedder
+        self._name_index = None
+
+    def add_entity(self, entity: Entity) -> None:
+        """Add (or replace) an entity, updating the name index."""
+        in_sync = self._name_index_in_sync()
+        self.entities[entity.id] = entity
+        self.invalidate_cache(entity.id)
+        self._reindex_name("entity", entity.id, in_sync)
+
+    def rename_entity(
+        self, eid: str, name: str, aliases: Optional[List[str]] = None
+    ) -> None:
+        """
+        Change an entity's display name (and optionally its aliases).
+
+        Raises:
+            KeyError: If the entity does not exist
+        """
+        entity = self.entities[eid]
+        update: Dict[str, Any] = {"name": name}
+        if aliases is not None:
+            update["tags"] = {**entity.tags, "aliases": list(aliases)}
+        self.entities[eid] = entity.model_copy(update=update)
+        self.invalidate_cache(eid)
+
+    def remove_entity(self, eid: str) -> Optional[Entity]:
+        """Remove an entity, updating the name index. Returns it, or None if absent."""
+        in_sync = self._name_index_in_sync()
+        entity = self.entities.pop(eid, None)
+        if entity is not None:
+            self.invalidate_cache(eid)
+            self._reindex_name("entity", eid, in_sync)
+        return entity
+
+    def add_zone(self, zone: Zone) -> None:
+        """Add (or replace) a zone, updating the name index."""
+        in_sync = self._name_index_in_sync()
+        self.zones[zone.id] = zone
+        self._reindex_name("zone", zone.id, in_sync)
+
+    def remove_zone(self, zid: str) -> Optional[Zone]:
+        """Remove a zone, updating the name index. Returns it, or None if absent."""
+        in_sync = self._name_index_in_sync()
+        zone = self.zones.pop(zid, None)
+        if zone is not None:
+            self._reindex_name("zone", zid, in_sync)
+        return zone
+
+    def _name_index_in_sync(self) -> bool:
+        """True if the built name index reflects the current dicts."""
+        return (
+            self._name_index is not None
+            and not self._name_index_dirty
+            and self._name_index_sizes == (len(self.entities), len(self.zones))
+        )
+
+    def _reindex_name(
+        self, kind: Literal["entity", "zone"], record_id: str, in_sync: bool = True
+    ) -> None:
+        """Update one record of the name index after its entity or zone changed."""
+        index = self._name_index
+        if index is None:
+            return
+        if kind == "entity":
+            from .name_index import entity_aliases
+
+            entity = self.entities.get(record_id)
+            if entity is None:
+                index.remove("entity", record_id)
+            else:
+                index.upsert("entity", record_id, entity.name, entity_aliases(entity))
+        else:
+            zone = self.zones.get(record_id)
+            if zone is None:
+                index.remove("zone", record_id)
+            else:
+                index.upsert("zone", record_id, zone.name)
+        if in_sync:
+            # The index was complete before this change, and still is
+            self._name_index_sizes = (len(self.entities), len(self.zones))
+
+    def resolve_name(
+        self,
+        text: str,
+        kind: Optional[Literal["entity", "zone"]] = None,
+        candidates: Optional[List[str]] = None,
+        min_score: float = 0.5,
+    ) -> Optional[str]:
+        """
+        Resolve a name, alias or ID to a single entity/zone ID.
+
+        Args:
+            text: Name as written by the player or planner (e.g. "the guard")
+            kind: Restrict to "entity" or "zone"
+            candidates: Restrict to these IDs (e.g. visible actors)
+            min_score: Minimum fuzzy match score to accept
+
+        Returns:
+            The matching ID, or None if nothing matches or the match is ambiguous
+        """
+        return self.get_name_index().resolve(
+            text, kind=kind, candidates=candidates, min_score=min_score
+        )
+
     def invalidate_cache(self, eid: Optional[str] = None) -> None:
         """
         Invalidate redaction cache entries.
 
+        Also tells the name index about name or alias changes: a single
+        entity is re-indexed, a full clear makes the next read resync.
+
         Args:
             eid: If provided, only invalidate cache for this entity.
                  If None, clear the entire cache.
         """
         if eid:
+            # The entity's name or aliases may have changed
+            self._reindex_name("entity", eid, in_sync=False)
             # Remove all cache entries for this entity
             self._redaction_cache = {
                 k: v for k, v in self._redaction_cache.items() if k[1] != eid
             }
+            self._redaction_versions = {
+                k: v for k, v in self._redaction_versions.items() if k[1] != eid
+            }
         else:
             # Clear entire cache
+            self._name_index_dirty = True
             self._redaction_cache.clear()
+            self._redaction_versions.clear()
 
-        # Publish cache invalidation event using deferred import
+        # Publish cache invalidation event (skipped when nobody listens)
         try:
-            import importlib
-
-            # Try import paths in order of preference (tests use router.events via path modification)
-            events_module = None
-            for module_path in ["router.events", "backend.router.events"]:
-                try:
-                    events_module = importlib.import_module(module_path)
-                    break
-                except ImportError:
-                    continue
-
-            if (
-                events_module
-                and hasattr(events_module, "publish")
-                and hasattr(events_module, "EventTypes")
-            ):
-                events_module.publish(
-                    events_module.EventTypes.CACHE_INVALIDATED,
-                    {
-                        "entity_id": eid,
-                        "cache_size_before": len(self._redaction_cache),
-                        "full_clear": eid is None,
-                    },
-                )
-
-        except (ImportError, AttributeError, Exception):
+            self.publish(
+                "cache.invalidated",
+                lambda: {
+                    "entity_id": eid,
+                    "cache_size_before": len(self._redaction_cache),
+                    "full_clear": eid is None,
+                },
+            )
+        except Exception:
             # Event system not available or failed, continue silently
             pass
 
@@ -865,6 +1162,29 @@ class GameState(BaseModel):
         """
         return self.export_state(mode="minimal", role="gm", include_known_by=False)
 
+    def export_views(
+        self,
+        views: Sequence[Literal["public", "gm", "session"]] = ("public", "gm", "session"),
+        include_runtime_data: bool = True,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Export several views in a single traversal of the world.
+
+        Equivalent to calling to_public_format(), to_save_format() and
+        to_session_format() separately, but each object is dumped once and
+        shared between views. Treat the result as read-only.
+
+        Args:
+            views: Which views to produce
+            include_runtime_data: known_by inclusion for the GM view
+
+        Returns:
+            Dictionary mapping view name to exported state
+        """
+        from .export_engine import export_views
+
+        return export_views(self, views, include_runtime_data=include_runtime_data)
+
     def _redact_legacy_clock(
         self, pov_id: Optional[str], clock_id: str, clock_data: Dict[str, Any]
     ) -> Dict[str, Any]:
@@ -896,6 +1216,21 @@ class GameState(BaseModel):
     # Event System for Dynamic Zone Changes
     # =============================================================================
 
+    @property
+    def event_bus(self) -> Any:
+        """
+        This state's own EventBus, created on first access.
+
+        Events published here only reach listeners of this state, so two
+        states in one process (tests, replays, previews) don't see each
+        other's events.
+        """
+        if self._event_bus is None:
+            from .events import EventBus
+
+            self._event_bus = EventBus()
+        return self._event_bus
+
     def register_event_listener(self, event_type: str, listener: Callable) -> None:
         """
         Register an event listener for a specific event type.
@@ -904,9 +1239,7 @@ class GameState(BaseModel):
             event_type: Type of event to listen for (e.g., "zone_graph.exit_blocked")
             listener: Function to call when event occurs
         """
-        if event_type not in self._event_listeners:
-            self._event_listeners[event_type] = []
-        self._event_listeners[event_type].append(listener)
+        self.event_bus.add_listener(event_type, listener)
 
     def unregister_event_listener(self, event_type: str, listener: Callable) -> bool:
         """
@@ -919,31 +1252,77 @@ class GameState(BaseModel):
         Returns:
             True if listener was found and removed
         """
-        if event_type in self._event_listeners:
-            try:
-                self._event_listeners[event_type].remove(listener)
-                return True
-            except ValueError:
-                pass
-        return False
+        if self._event_bus is None:
+            return False
+        return self._event_bus.remove_listener(event_type, listener)
 
     def emit(self, event_type: str, **event_data) -> None:
         """
-        Emit an event to all registered listeners.
+        Emit an event to this state's listeners.
+
+        Listeners are called as listener(event_type=..., world=self, **event_data).
+        Costs one attribute check when nothing is registered.
 
         Args:
             event_type: Type of event being emitted
             **event_data: Event-specific data to pass to listeners
         """
-        if event_type in self._event_listeners:
-            # Iterate over a snapshot to prevent modifications during dispatch from disrupting delivery
-            for listener in list(self._event_listeners[event_type]):
-                try:
-                    listener(event_type=event_type, world=self, **event_data)
-                except Exception as e:
-                    # Log error but don't break event processing
-                    # In a real system you'd use proper logging here
-                    print(f"Error in event listener for {event_type}: {e}")
+        if self._event_bus is None:
+            return
+        self._event_bus.emit(event_type, world=self, **event_data)
+
+    def publish(
+        self,
+        event_type: str,
+        data: Union[Dict[str, Any], Callable[[], Dict[str, Any]]],
+    ) -> None:
+        """
+        Publish an event to this state's bus and to the process-wide bus.
+
+        Subscribers of this state's bus get the payload plus "world". The
+        process-wide bus (router.events.event_bus) is kept for global
+        observers such as logging and metrics; they get the payload plus
+        "session_id", so events from several worlds in one process can be
+        told apart. set_global_events(False) keeps a state's events local
+        (e.g. scratch copies and previews). The payload may be a callable,
+        which is only called if one of the buses has subscribers.
+
+        Args:
+            event_type: Type of event being published
+            data: Event data, or a function returning it
+        """
+        events_module = (
+            loaded_events_module() if self._global_events else None
+        )
+        global_bus = events_module.event_bus if events_module is not None else None
+        local_bus = self._event_bus
+        local_wanted = local_bus is not None and local_bus.has_subscribers(event_type)
+        global_wanted = global_bus is not None and global_bus.has_subscribers(event_type)
+        if not (local_wanted or global_wanted):
+            return
+
+        payload = data() if callable(data) else data
+        if local_wanted:
+            local_bus.publish(event_type, {**payload, "world": self})
+        if global_wanted:
+            global_bus.publish(event_type, {**payload, "session_id": self.session_id})
+
+    @property
+    def session_id(self) -> str:
+        """Identifies this world in process-wide events (random unless set)."""
+        if self._session_id is None:
+            import uuid
+
+            self._session_id = uuid.uuid4().hex
+        return self._session_id
+
+    def set_session_id(self, session_id: str) -> None:
+        """Use a stable ID (e.g. the save name) for this world's global events."""
+        self._session_id = session_id
+
+    def set_global_events(self, enabled: bool) -> None:
+        """Turn fan-out of publish() to the process-wide bus on or off."""
+        self._global_events = enabled
 
     def get_event_listeners(self, event_type: str) -> List[Callable]:
         """
@@ -955,7 +1334,9 @@ class GameState(BaseModel):
         Returns:
             List of listener functions
         """
-        return self._event_listeners.get(event_type, [])
+        if self._event_bus is None:
+            return []
+        return self._event_bus.listeners(event_type)
 
 
 def is_clock_visible_to(
@@ -981,6 +1362,19 @@ def is_clock_visible_to(
     return True
 
 
+# Actionable verbs grouped by the kind of action they usually signal.
+# Shared by Utterance.has_actionable_verb and the rule-based fast path.
+ACTIONABLE_VERB_GROUPS: Dict[str, FrozenSet[str]] = {
+    "move": frozenset({"move", "go", "walk", "run", "sneak", "travel"}),
+    "attack": frozenset({"attack", "hit", "strike", "fight", "combat"}),
+    "talk": frozenset({"talk", "speak", "say", "tell", "ask", "whisper"}),
+    "use": frozenset({"use", "cast", "drink", "activate", "throw"}),
+    "look": frozenset({"look", "examine", "search", "investigate"}),
+}
+
+ACTIONABLE_VERBS: FrozenSet[str] = frozenset().union(*ACTIONABLE_VERB_GROUPS.values())
+
+
 class Utterance(BaseModel):
     """Player input with basic analysis."""
 
@@ -991,35 +1385,8 @@ class Utterance(BaseModel):
 
     def has_actionable_verb(self) -> bool:
         """Check if utterance contains actionable verbs like move, attack, talk, etc."""
-        action_verbs = {
-            "move",
-            "go",
-            "walk",
-            "run",
-            "sneak",
-            "travel",
-            "attack",
-            "hit",
-            "strike",
-            "fight",
-            "combat",
-            "talk",
-            "speak",
-            "say",
-            "tell",
-            "ask",
-            "whisper",
-            "use",
-            "cast",
-            "drink",
-            "activate",
-            "throw",
-            "look",
-            "examine",
-            "search",
-            "investigate",
-        }
-        return any(verb in self.text.lower() for verb in action_verbs)
+        text_lower = self.text.lower()
+        return any(verb in text_lower for verb in ACTIONABLE_VERBS)
 
 
 def is_visible_to(entity: BaseEntity, scene: Optional[Scene] = None) -> bool:
@@ -0,0 +1,243 @@
+"""
+Intent Cache - Persistent memoization for Stage 1 intent parsing.
+
+The staged planner's intent parser maps a player utterance to a list of tool
+names without looking at world state, so its output depends only on the
+utterance text, the model and the intent prompt. That makes it safe to cache:
+players repeat "look around", "attack the goblin" and "go north" constantly,
+and every repeat would otherwise be a full LLM round trip.
+
+Entries are keyed on (normalized utterance, model, prompt version) so that
+changing the model or editing the prompt naturally invalidates old results.
+The in-memory layer is an LRU with a TTL; an optional SQLite file keeps
+entries across sessions.
+"""
+
+import hashlib
+import json
+import logging
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, asdict
+from typing import Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_EDGE_PUNCTUATION = " \t\n\"'.!?,;:"
+
+
+@dataclass
+class IntentCacheStats:
+    """Hit/miss counters for an IntentCache."""
+
+    hits: int = 0
+    misses: int = 0
+    expired: int = 0
+    evictions: int = 0
+    writes: int = 0
+    disk_hits: int = 0
+
+    @property
+    def lookups(self) -> int:
+        return self.hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered from the cache (0.0 when unused)."""
+        return self.hits / self.lookups if self.lookups else 0.0
+
+    def to_dict(self) -> Dict[str, float]:
+        data = asdict(self)
+        data["lookups"] = self.lookups
+        data["hit_rate"] = self.hit_rate
+        return data
+
+
+class IntentCache:
+    """LRU + TTL cache for intent parser results with optional SQLite backing."""
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl_seconds: Optional[float] = 7 * 24 * 3600,
+        db_path: Optional[str] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of entries held in memory
+            ttl_seconds: Entry lifetime in seconds (None disables expiry)
+            db_path: Optional SQLite file for persistence across sessions
+            clock: Time source, injectable for tests
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.db_path = db_path
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[List[str], float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = IntentCacheStats()
+        self._conn: Optional[sqlite3.Connection] = None
+
+        if db_path:
+            self._conn = sqlite3.connect(db_path, check_same_thread=False)
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS intent_cache (
+                    key TEXT PRIMARY KEY,
+                    tools TEXT NOT NULL,
+                    created_at REAL NOT NULL
+                )
+                """
+            )
+            self._conn.commit()
+
+    @staticmethod
+    def normalize_utterance(text: str) -> str:
+        """
+        Normalize an utterance so trivially different phrasings share a key.
+
+        Lowercases, collapses whitespace and strips surrounding quotes and
+        punctuation. Word order and wording are preserved, since those can
+        change the parsed intent.
+        """
+        text = _WHITESPACE_RE.sub(" ", text.lower())
+        return text.strip(_EDGE_PUNCTUATION)
+
+    @staticmethod
+    def prompt_version(prompt: str) -> str:
+        """Derive a short, stable version tag from the intent prompt text."""
+        return hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:12]
+
+    def make_key(self, text: str, model: str, prompt_version: str) -> str:
+        """Build the cache key for an utterance/model/prompt combination."""
+        return f"{model}|{prompt_version}|{self.normalize_utterance(text)}"
+
+    def get(self, text: str, model: str, prompt_version: str) -> Optional[List[str]]:
+        """
+        Look up cached tool names for an utterance.
+
+        Returns:
+            A copy of the cached tool name list, or None on a miss
+        """
+        key = self.make_key(text, model, prompt_version)
+        now = self._clock()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                tools, created_at = entry
+                if self._is_expired(created_at, now):
+                    del self._entries[key]
+                    self._delete_from_disk(key)
+                    self._stats.expired += 1
+                else:
+                    self._entries.move_to_end(key)
+                    self._stats.hits += 1
+                    return list(tools)
+
+            disk_entry = self._load_from_disk(key)
+            if disk_entry is not None:
+                tools, created_at = disk_entry
+                if self._is_expired(created_at, now):
+                    self._delete_from_disk(key)
+                    self._stats.expired += 1
+                else:
+                    self._store_in_memory(key, tools, created_at)
+                    self._stats.hits += 1
+                    self._stats.disk_hits += 1
+                    return list(tools)
+
+            self._stats.misses += 1
+            return None
+
+    def put(
+        self, text: str, model: str, prompt_version: str, tool_names: List[str]
+    ) -> None:
+        """Store parsed tool names for an utterance."""
+        key = self.make_key(text, model, prompt_version)
+        created_at = self._clock()
+        tools = list(tool_names)
+
+        with self._lock:
+            self._store_in_memory(key, tools, created_at)
+            self._stats.writes += 1
+            if self._conn is not None:
+                try:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO intent_cache (key, tools, created_at) "
+                        "VALUES (?, ?, ?)",
+                        (key, json.dumps(tools), created_at),
+                    )
+                    self._conn.commit()
+                except sqlite3.Error as e:
+                    logger.warning(f"Failed to persist intent cache entry: {e}")
+
+    def clear(self) -> None:
+        """Remove all entries from memory and disk and reset statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._stats = IntentCacheStats()
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM intent_cache")
+                self._conn.commit()
+
+    def get_stats(self) -> Dict[str, float]:
+        """Return hit-rate metrics as a plain dict."""
+        with self._lock:
+            stats = self._stats.to_dict()
+            stats["size"] = len(self._entries)
+            return stats
+
+    def close(self) -> None:
+        """Close the SQLite connection, if any."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _is_expired(self, created_at: float, now: float) -> bool:
+        return self.ttl_seconds is not None and now - created_at > self.ttl_seconds
+
+    def _store_in_memory(self, key: str, tools: List[str], created_at: float) -> None:
+        self._entries[key] = (tools, created_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._stats.evictions += 1
+
+    def _load_from_disk(self, key: str) -> Optional[Tuple[List[str], float]]:
+        if self._conn is None:
+            return None
+        try:
+            row = self._conn.execute(
+                "SELECT tools, created_at FROM intent_cache WHERE key = ?", (key,)
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to read intent cache entry: {e}")
+            return None
+        if row is None:
+            return None
+        return json.loads(row[0]), row[1]
+
+    def _delete_from_disk(self, key: str) -> None:
+        if self._conn is None:
+            return
+        try:
+            self._conn.execute("DELETE FROM intent_cache WHERE key = ?", (key,))
+            self._conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to delete intent cache entry: {e}")
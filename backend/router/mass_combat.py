@@ -0,0 +1,287 @@
+"""
+Mass Combat - Resolve many attacks in one call.
+
+Validator._execute_attack resolves one attacker against one target: it
+starts a fresh random generator, re-parses the dice expressions and builds
+a full ToolResult with narration hint each time. A skirmish with dozens of
+NPCs would pay that cost for every swing. resolve_mass_combat() resolves a
+whole exchange at once, using the same rules:
+
+    d20 + effective_style x domain die vs dc
+    crit_success (natural 20 or margin >= 5) / success / partial (margin >= -3,
+    half damage) / fail, crits add 1d6, a target's mark adds +1 style once
+
+- one random.Random seeded from the call's seed hands each attack its own
+  substream (a SplitMix64 sequence, far cheaper to start than seeding a
+  random.Random per attack), so an attack's rolls depend only on the seed
+  and its position
+- damage expressions are parsed once per distinct expression
+- damage is summed per target: one hp effect per target (plus any mark
+  removals), applied in a single apply_effects call
+- the result is one summary ToolResult for narration
+
+Attacks in a batch are simultaneous: a creature downed in the batch still
+gets its own attacks in it. Invalid attacks (unknown, downed or unseen
+combatants) are skipped and reported in facts["skipped"].
+"""
+
+import logging
+import random
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .game_state import GameState
+from .validator import ToolResult
+
+logger = logging.getLogger(__name__)
+
+
+OUTCOMES = ("crit_success", "success", "partial", "fail")
+
+
+@dataclass
+class MassAttack:
+    """One attack in a batch (same options as the attack tool)."""
+
+    attacker: str
+    target: str
+    style: int = 1
+    domain: str = "d6"
+    dc: int = 12
+    adv_style_delta: int = 0
+    damage_expr: str = "1d6"
+    weapon: str = "basic_melee"
+    consume_mark: bool = True
+
+
+_MASK64 = (1 << 64) - 1
+
+
+class _Substream:
+    """SplitMix64 dice roller for one attack."""
+
+    __slots__ = ("_state",)
+
+    def __init__(self, seed: int):
+        self._state = seed
+
+    def roll(self, sides: int) -> int:
+        """Roll 1..sides."""
+        self._state = z = (self._state + 0x9E3779B97F4A7C15) & _MASK64
+        z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+        z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK64
+        return 1 + (((z ^ (z >> 31)) * sides) >> 64)
+
+
+@lru_cache(maxsize=256)
+def parse_damage_expr(damage_expr: str) -> Tuple[int, int, int]:
+    """
+    Parse "XdY" or "XdY+Z" into (count, size, bonus).
+
+    Unparseable expressions fall back to 1d6, as in Validator._roll_damage.
+    """
+    try:
+        if "+" in damage_expr:
+            dice_part, bonus_part = damage_expr.split("+", 1)
+            bonus = int(bonus_part.strip())
+        else:
+            dice_part, bonus = damage_expr.strip(), 0
+        if "d" not in dice_part:
+            raise ValueError(f"Invalid damage expression: {damage_expr}")
+        count_str, size_str = dice_part.split("d", 1)
+        return int(count_str.strip()), int(size_str.strip()), bonus
+    except (ValueError, IndexError):
+        return 1, 6, 0
+
+
+@lru_cache(maxsize=32)
+def _domain_size(domain: str) -> Optional[int]:
+    if domain.startswith("d") and domain[1:].isdigit():
+        return int(domain[1:])
+    return None
+
+
+def _skip_reason(state: GameState, attack: MassAttack) -> Optional[str]:
+    attacker = state.entities.get(attack.attacker)
+    target = state.entities.get(attack.target)
+    if attacker is None:
+        return "attacker not found"
+    if target is None:
+        return "target not found"
+    if target.type not in ("pc", "npc"):
+        return "target not attackable"
+    if attacker.type in ("pc", "npc"):
+        if attacker.hp.current <= 0:
+            return "attacker is down"
+        if attack.target not in attacker.visible_actors:
+            return "target not visible"
+    if _domain_size(attack.domain) is None:
+        return f"invalid domain {attack.domain}"
+    return None
+
+
+def resolve_mass_combat(
+    state: GameState,
+    attacks: Sequence[MassAttack],
+    seed: int,
+    apply: bool = False,
+    detail: bool = False,
+) -> ToolResult:
+    """
+    Resolve a batch of attacks as one simultaneous exchange.
+
+    Args:
+        state: Current game state (only changed if apply is True)
+        attacks: Attacks to resolve, in order (the first attack on a marked
+            target consumes the mark)
+        seed: Seed for the whole batch
+        apply: Apply the aggregated effects to state
+        detail: Include every attack's rolls in facts["attacks"]
+
+    Returns:
+        A single "mass_attack" ToolResult with aggregated effects
+    """
+    rng = random.Random(seed)
+    damage_by_target: Dict[str, int] = {}
+    attackers_by_target: Dict[str, List[str]] = {}
+    marks_consumed: List[Tuple[str, str]] = []
+    marked_done = set()
+    outcomes: Counter = Counter()
+    skipped: List[Dict[str, str]] = []
+    rows: List[Dict[str, Any]] = []
+
+    for index, attack in enumerate(attacks):
+        # Drawn for every attack, skipped or not, so substreams stay aligned
+        substream = rng.getrandbits(64)
+        reason = _skip_reason(state, attack)
+        if reason is not None:
+            skipped.append(
+                {"attacker": attack.attacker, "target": attack.target, "reason": reason}
+            )
+            continue
+        roll = _Substream(substream).roll
+
+        target = state.entities[attack.target]
+        effective_style = max(0, min(3, attack.style + attack.adv_style_delta))
+        mark_consumed = (
+            attack.consume_mark
+            and attack.target not in marked_done
+            and getattr(target, "style_bonus", 0) > 0
+        )
+        if mark_consumed:
+            effective_style = min(3, effective_style + 1)
+            marked_done.add(attack.target)
+            marks_consumed.append((attack.target, attack.attacker))
+
+        domain_size = _domain_size(attack.domain)
+        d20 = roll(20)
+        style_sum = sum(roll(domain_size) for _ in range(effective_style))
+        margin = d20 + style_sum - attack.dc
+        if d20 == 20 or margin >= 5:
+            outcome = "crit_success"
+        elif margin >= 0:
+            outcome = "success"
+        elif margin >= -3:
+            outcome = "partial"
+        else:
+            outcome = "fail"
+        outcomes[outcome] += 1
+
+        damage = 0
+        if outcome != "fail":
+            count, size, bonus = parse_damage_expr(attack.damage_expr)
+            damage = sum(roll(size) for _ in range(count)) + bonus
+            if outcome == "crit_success":
+                damage += roll(6)
+            if outcome == "partial":
+                damage //= 2
+        if damage > 0:
+            damage_by_target[attack.target] = damage_by_target.get(attack.target, 0) + damage
+            attackers_by_target.setdefault(attack.target, []).append(attack.attacker)
+
+        if detail:
+            rows.append(
+                {
+                    "index": index,
+                    "attacker": attack.attacker,
+                    "target": attack.target,
+                    "d20": d20,
+                    "total": d20 + style_sum,
+                    "margin": margin,
+                    "outcome": outcome,
+                    "damage": damage,
+                    "mark_consumed": mark_consumed,
+                }
+            )
+
+    effects: List[Dict[str, Any]] = []
+    for target_id, damage in damage_by_target.items():
+        attackers = attackers_by_target[target_id]
+        effects.append(
+            {
+                "type": "hp",
+                "target": target_id,
+                "delta": -damage,
+                "source": attackers[0] if len(set(attackers)) == 1 else "mass_combat",
+                "cause": "attack",
+            }
+        )
+    for target_id, attacker_id in marks_consumed:
+        effects.append(
+            {
+                "type": "mark",
+                "target": target_id,
+                "remove": True,
+                "source": attacker_id,
+                "cause": "attack",
+            }
+        )
+
+    downed = sorted(
+        target_id
+        for target_id, damage in damage_by_target.items()
+        if state.entities[target_id].hp.current - damage <= 0
+    )
+    resolved = sum(outcomes.values())
+    total_damage = sum(damage_by_target.values())
+
+    if apply and effects:
+        from .effects import apply_effects
+
+        apply_effects(state, effects)
+
+    facts: Dict[str, Any] = {
+        "resolved": resolved,
+        "outcomes": {outcome: outcomes[outcome] for outcome in OUTCOMES},
+        "damage_by_target": damage_by_target,
+        "total_damage": total_damage,
+        "downed": downed,
+        "skipped": skipped,
+    }
+    if detail:
+        facts["attacks"] = rows
+    heaviest = sorted(damage_by_target, key=lambda t: (-damage_by_target[t], t))[:5]
+    summary = (
+        f"{resolved} attacks: {outcomes['crit_success'] + outcomes['success']} hit, "
+        f"{outcomes['partial']} graze, {outcomes['fail']} miss, {total_damage} damage"
+    )
+    if downed:
+        summary += f"; {len(downed)} fall"
+
+    return ToolResult(
+        ok=resolved > 0 or not attacks,
+        tool_id="mass_attack",
+        args={"attacks": len(attacks), "seed": seed},
+        facts=facts,
+        effects=effects,
+        narration_hint={
+            "summary": summary,
+            "outcome": "battle",
+            "tone_tags": ["violent", "chaotic"]
+            + (["critical"] if outcomes["crit_success"] else []),
+            "salient_entities": downed[:5] or heaviest,
+        },
+        error_message=None if resolved or not attacks else "No valid attacks in batch",
+    )
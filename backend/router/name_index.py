@@ -0,0 +1,396 @@
+"""
+Name Index - Fast resolution of player-facing names to entity and zone IDs.
+
+Player text refers to things by name ("the guard", "main hall"), while tools
+need IDs. Resolving those mentions by lowercasing and substring-checking every
+entity on every call gets slow as a campaign grows and is error-prone (e.g.
+"hall" matching "Hallway Guard"). This module maintains:
+
+- a token inverted index for phrase mentions inside free text
+- a character trigram index for fuzzy lookups of a single name
+- optional local embedding vectors for semantic lookups
+
+The index is owned by GameState (see GameState.get_name_index), which updates
+single records as entities and zones are added, renamed or removed.
+sync() re-indexes only records whose names changed; GameState runs it only
+after a full cache invalidation or a direct edit of the entity/zone dicts.
+"""
+
+import math
+import re
+from dataclasses import dataclass
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TYPE_CHECKING,
+)
+
+if TYPE_CHECKING:
+    from .game_state import GameState
+
+
+NameKind = Literal["entity", "zone"]
+RecordKey = Tuple[str, str]  # (kind, id)
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# Articles and fillers that shouldn't affect matching ("the guard" == "guard")
+STOPWORDS = frozenset({"the", "a", "an", "of", "to", "at", "in", "on", "my"})
+
+# Scale applied to embedding cosine similarity when scoring lookups
+SEMANTIC_WEIGHT = 0.9
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase and split text into index tokens, dropping stopwords."""
+    return [t for t in _TOKEN_RE.findall(text.lower()) if t not in STOPWORDS]
+
+
+def trigrams(text: str) -> Set[str]:
+    """Character trigrams of a normalized string, padded at word edges."""
+    normalized = " ".join(tokenize(text))
+    if not normalized:
+        return set()
+    padded = f"  {normalized} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+@dataclass
+class NameMatch:
+    """A resolved name reference."""
+
+    id: str
+    kind: NameKind
+    name: str  # canonical display name
+    matched: str  # the name/alias/id form that matched
+    score: float
+
+
+@dataclass
+class _Record:
+    kind: NameKind
+    id: str
+    name: str
+    forms: Tuple[str, ...]  # name, aliases and id, in that order
+    form_tokens: Tuple[Tuple[str, ...], ...]
+
+
+class NameIndex:
+    """Inverted token/trigram index over entity and zone names."""
+
+    def __init__(self, embedder: Optional[Callable[[str], Sequence[float]]] = None):
+        """
+        Initialize an empty index.
+
+        Args:
+            embedder: Optional local embedding function. When provided, each
+                record's name is embedded once on insert and lookup() blends
+                cosine similarity into its scores.
+        """
+        self.embedder = embedder
+        self._records: Dict[RecordKey, _Record] = {}
+        self._tokens: Dict[str, Set[RecordKey]] = {}
+        self._trigrams: Dict[str, Set[RecordKey]] = {}
+        self._vectors: Dict[RecordKey, Sequence[float]] = {}
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __contains__(self, key: RecordKey) -> bool:
+        return key in self._records
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def upsert(
+        self,
+        kind: NameKind,
+        record_id: str,
+        name: str,
+        aliases: Iterable[str] = (),
+    ) -> None:
+        """Add a record, or re-index it if its name or aliases changed."""
+        forms = _unique([name, *aliases, record_id])
+        key = (kind, record_id)
+        existing = self._records.get(key)
+        if existing is not None:
+            if existing.forms == forms:
+                return
+            self._unindex(existing)
+
+        record = _Record(
+            kind=kind,
+            id=record_id,
+            name=name,
+            forms=forms,
+            form_tokens=tuple(tuple(tokenize(form)) for form in forms),
+        )
+        self._records[key] = record
+
+        for tokens in record.form_tokens:
+            for token in tokens:
+                self._tokens.setdefault(token, set()).add(key)
+        for form in forms:
+            for gram in trigrams(form):
+                self._trigrams.setdefault(gram, set()).add(key)
+        if self.embedder is not None:
+            self._vectors[key] = self.embedder(name)
+
+    def remove(self, kind: NameKind, record_id: str) -> None:
+        """Drop a record from the index (no-op if absent)."""
+        record = self._records.pop((kind, record_id), None)
+        if record is not None:
+            self._unindex(record)
+
+    def sync(self, state: "GameState") -> int:
+        """
+        Bring the index in line with a GameState.
+
+        Only records whose name or aliases changed are re-indexed, and records
+        for deleted entities/zones are removed.
+
+        Returns:
+            Number of records added, updated or removed
+        """
+        changes = 0
+        seen: Set[RecordKey] = set()
+
+        for entity_id, entity in state.entities.items():
+            seen.add(("entity", entity_id))
+            changes += self._sync_record(
+                "entity", entity_id, entity.name, entity_aliases(entity)
+            )
+        for zone_id, zone in state.zones.items():
+            seen.add(("zone", zone_id))
+            changes += self._sync_record("zone", zone_id, zone.name, ())
+
+        for key in [key for key in self._records if key not in seen]:
+            self.remove(*key)
+            changes += 1
+
+        return changes
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def find_mentions(
+        self,
+        text: str,
+        kind: Optional[NameKind] = None,
+        candidates: Optional[Iterable[str]] = None,
+    ) -> List[NameMatch]:
+        """
+        Find every indexed name mentioned as a phrase inside free text.
+
+        Args:
+            text: Player text to scan
+            kind: Restrict to "entity" or "zone" records
+            candidates: Restrict to these IDs (e.g. visible actors, exits)
+
+        Returns:
+            Matches ordered by score (longer, more specific mentions first)
+        """
+        text_tokens = tokenize(text)
+        if not text_tokens:
+            return []
+
+        allowed = set(candidates) if candidates is not None else None
+        keys: Set[RecordKey] = set()
+        for token in set(text_tokens):
+            keys.update(self._tokens.get(token, ()))
+
+        matches = []
+        for key in keys:
+            record = self._records[key]
+            if not self._accepts(record, kind, allowed):
+                continue
+            best: Optional[Tuple[int, str]] = None
+            for form, tokens in zip(record.forms, record.form_tokens):
+                if tokens and _contains_phrase(text_tokens, tokens):
+                    if best is None or len(tokens) > best[0]:
+                        best = (len(tokens), form)
+            if best is not None:
+                name_len = max(len(record.form_tokens[0]), 1)
+                score = min(1.0, best[0] / name_len)
+                matches.append(
+                    NameMatch(record.id, record.kind, record.name, best[1], score)
+                )
+
+        matches.sort(key=lambda m: (-m.score, -len(m.matched), m.id))
+        return matches
+
+    def lookup(
+        self,
+        query: str,
+        kind: Optional[NameKind] = None,
+        candidates: Optional[Iterable[str]] = None,
+        limit: int = 5,
+        min_score: float = 0.3,
+    ) -> List[NameMatch]:
+        """
+        Fuzzy lookup of a single name, ID or alias.
+
+        Exact (normalized) matches score 1.0. Otherwise candidates come from
+        the trigram index and are scored by trigram Jaccard similarity. When
+        an embedder is configured, discounted cosine similarity is used if it
+        beats the lexical score.
+        """
+        allowed = set(candidates) if candidates is not None else None
+        query_norm = " ".join(tokenize(query))
+        query_grams = trigrams(query)
+        if not query_norm and not query_grams:
+            return []
+
+        keys: Set[RecordKey] = set()
+        for gram in query_grams:
+            keys.update(self._trigrams.get(gram, ()))
+
+        query_vector = None
+        if self.embedder is not None:
+            query_vector = self.embedder(query)
+            # Semantic matches may share no trigrams with the query
+            keys.update(self._vectors)
+
+        matches = []
+        for key in keys:
+            record = self._records[key]
+            if not self._accepts(record, kind, allowed):
+                continue
+
+            best_score = 0.0
+            best_form = record.name
+            for form, tokens in zip(record.forms, record.form_tokens):
+                if " ".join(tokens) == query_norm or form.lower() == query.lower():
+                    best_score, best_form = 1.0, form
+                    break
+                score = _jaccard(query_grams, trigrams(form))
+                if score > best_score:
+                    best_score, best_form = score, form
+
+            if query_vector is not None and best_score < 1.0:
+                # Discount semantic similarity so it never ties an exact match
+                semantic = _cosine(query_vector, self._vectors.get(key, ()))
+                best_score = max(best_score, SEMANTIC_WEIGHT * semantic)
+
+            if best_score >= min_score:
+                matches.append(
+                    NameMatch(record.id, record.kind, record.name, best_form, best_score)
+                )
+
+        matches.sort(key=lambda m: (-m.score, m.id))
+        return matches[:limit]
+
+    def resolve(
+        self,
+        query: str,
+        kind: Optional[NameKind] = None,
+        candidates: Optional[Iterable[str]] = None,
+        min_score: float = 0.5,
+    ) -> Optional[str]:
+        """
+        Resolve a name to a single ID, or None if missing or ambiguous.
+
+        An exact ID always wins. Otherwise the best lookup() match is returned
+        only if it clears min_score and isn't tied with another record.
+        """
+        allowed = set(candidates) if candidates is not None else None
+        for record_kind in ("entity", "zone"):
+            record = self._records.get((record_kind, query))
+            if record and self._accepts(record, kind, allowed):
+                return record.id
+
+        matches = self.lookup(query, kind, allowed, limit=2, min_score=min_score)
+        if not matches:
+            return None
+        if len(matches) > 1 and matches[1].score == matches[0].score:
+            return None
+        return matches[0].id
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _sync_record(
+        self, kind: NameKind, record_id: str, name: str, aliases: Sequence[str]
+    ) -> int:
+        record = self._records.get((kind, record_id))
+        if record is not None and record.forms == _unique([name, *aliases, record_id]):
+            return 0
+        self.upsert(kind, record_id, name, aliases)
+        return 1
+
+    def _unindex(self, record: _Record) -> None:
+        key = (record.kind, record.id)
+        for tokens in record.form_tokens:
+            for token in tokens:
+                _discard(self._tokens, token, key)
+        for form in record.forms:
+            for gram in trigrams(form):
+                _discard(self._trigrams, gram, key)
+        self._vectors.pop(key, None)
+
+    @staticmethod
+    def _accepts(
+        record: _Record, kind: Optional[NameKind], allowed: Optional[Set[str]]
+    ) -> bool:
+        if kind is not None and record.kind != kind:
+            return False
+        return allowed is None or record.id in allowed
+
+
+def entity_aliases(entity) -> Tuple[str, ...]:
+    """Aliases declared in an entity's tags (tags["aliases"] as str or list)."""
+    aliases = entity.tags.get("aliases") if isinstance(entity.tags, dict) else None
+    if not aliases:
+        return ()
+    if isinstance(aliases, str):
+        return (aliases,)
+    return tuple(str(alias) for alias in aliases)
+
+
+def _unique(forms: Iterable[str]) -> Tuple[str, ...]:
+    seen = []
+    for form in forms:
+        if form and form not in seen:
+            seen.append(form)
+    return tuple(seen)
+
+
+def _discard(index: Dict[str, Set[RecordKey]], token: str, key: RecordKey) -> None:
+    postings = index.get(token)
+    if postings is not None:
+        postings.discard(key)
+        if not postings:
+            del index[token]
+
+
+def _contains_phrase(haystack: List[str], needle: Tuple[str, ...]) -> bool:
+    n = len(needle)
+    first = needle[0]
+    for i in range(len(haystack) - n + 1):
+        if haystack[i] == first and tuple(haystack[i : i + n]) == needle:
+            return True
+    return False
+
+
+def _jaccard(a: Set[str], b: Set[str]) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def _cosine(a: Sequence[float], b: Sequence[float]) -> float:
+    if not a or not b or len(a) != len(b):
+        return 0.0
+    dot = sum(x * y for x, y in zip(a, b))
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    return dot / norm if norm else 0.0
@@ -0,0 +1,337 @@
+"""
+NPC Simulation - Deterministic off-screen turns for NPCs.
+
+Only the current actor's utterance drives process_turn, and running every
+other NPC through the LLM planner would be far too slow. The simulator gives
+off-screen NPCs (those outside every PC's zone) a turn each round without
+any LLM calls:
+
+1. Each NPC scores the actions it could take (attack a hostile, talk to
+   someone, walk towards its goal or the next patrol stop, or wait) using
+   weights from its tags, and picks the best one.
+2. The action goes through the Validator's schema and precondition checks
+   (with the NPC as current actor) and its tool executor (move, attack,
+   talk), so the same rules apply as for player turns, and its effects are
+   applied straight away.
+3. Position changes skip the per-move visibility refresh; visibility is
+   recomputed once for the whole batch. Meanwhile NPCs only attack or talk
+   to actors still in their own zone. Auto-reveal is skipped too (nobody is
+   watching), except for NPCs walking into an on-screen zone.
+
+Behaviour comes from NPC tags, all optional:
+    goal_zone: zone to walk to          patrol: list of zones to cycle through
+    hostile_to: IDs or types ("pc")     aggression / sociability / wanderlust:
+                                        utility weights (0..1)
+
+Paths are found with zone_graph.find_shortest_path and cached per
+(from, to) pair until the zone graph changes. Runs are deterministic for a
+given seed: NPCs act in ID order and each gets its own derived seed.
+
+Benchmark: python benchmarks/npc_simulation.py
+"""
+
+import logging
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, TYPE_CHECKING
+
+from .effects import _update_visibility, apply_effects
+from .game_state import GameState, NPC, Utterance
+from .zone_graph import find_shortest_path, get_zone_graph_events
+
+if TYPE_CHECKING:
+    from .validator import Validator
+
+logger = logging.getLogger(__name__)
+
+
+# Utility of doing nothing; an action must beat this to be taken
+IDLE_UTILITY = 0.1
+
+
+@dataclass
+class NPCProfile:
+    """Behaviour settings read from an NPC's tags."""
+
+    goal_zone: Optional[str] = None
+    patrol: List[str] = field(default_factory=list)
+    hostile_to: Set[str] = field(default_factory=set)
+    aggression: float = 0.5
+    sociability: float = 0.3
+    wanderlust: float = 0.2
+
+    @classmethod
+    def from_tags(cls, tags: Dict[str, Any]) -> "NPCProfile":
+        hostile_to = tags.get("hostile_to", ())
+        if isinstance(hostile_to, str):
+            hostile_to = [hostile_to]
+        return cls(
+            goal_zone=tags.get("goal_zone"),
+            patrol=list(tags.get("patrol", ())),
+            hostile_to=set(hostile_to),
+            aggression=float(tags.get("aggression", 0.5)),
+            sociability=float(tags.get("sociability", 0.3)),
+            wanderlust=float(tags.get("wanderlust", 0.2)),
+        )
+
+
+@dataclass
+class SimulationTick:
+    """What happened in one simulated round."""
+
+    round: int
+    npcs: int = 0
+    actions: Counter = field(default_factory=Counter)
+    failed: int = 0
+    seconds: float = 0.0
+
+    @property
+    def npc_turns_per_second(self) -> float:
+        return self.npcs / self.seconds if self.seconds > 0 else 0.0
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "round": self.round,
+            "npcs": self.npcs,
+            "actions": dict(self.actions),
+            "failed": self.failed,
+            "seconds": round(self.seconds, 4),
+            "npc_turns_per_second": round(self.npc_turns_per_second, 1),
+        }
+
+
+class NPCSimulator:
+    """Runs off-screen NPC turns for one GameState."""
+
+    def __init__(
+        self,
+        state: GameState,
+        validator: Optional["Validator"] = None,
+        seed: int = 0,
+    ):
+        """
+        Args:
+            state: World to simulate (mutated in place)
+            validator: Validator whose executors run the actions (default: new)
+            seed: Base seed; each NPC turn derives its own from it
+        """
+        if validator is None:
+            from .validator import Validator
+
+            validator = Validator()
+        self.state = state
+        self.validator = validator
+        self.seed = seed
+        self._paths: Dict[Tuple[str, str], Optional[List[str]]] = {}
+        self._patrol_index: Dict[str, int] = {}
+        self._rounds_run = 0
+
+        # Cached paths go stale when exits change
+        for event_type in get_zone_graph_events():
+            state.register_event_listener(event_type, self._clear_paths)
+
+    def off_screen_npcs(self, on_screen_zones: Optional[Iterable[str]] = None) -> List[str]:
+        """
+        IDs of living NPCs outside the on-screen zones, in ID order.
+
+        Args:
+            on_screen_zones: Zones being played (default: zones holding a PC)
+        """
+        on_screen = self._on_screen(on_screen_zones)
+        return sorted(
+            entity_id
+            for entity_id, entity in self.state.entities.items()
+            if entity.type == "npc"
+            and entity.hp.current > 0
+            and entity.current_zone not in on_screen
+            and entity_id != self.state.current_actor
+        )
+
+    def run_round(self, on_screen_zones: Optional[Iterable[str]] = None) -> SimulationTick:
+        """Give every off-screen NPC one turn."""
+        started = time.perf_counter()
+        state = self.state
+        tick = SimulationTick(round=state.scene.round)
+        self._rounds_run += 1
+
+        on_screen = self._on_screen(on_screen_zones)
+        npc_ids = self.off_screen_npcs(on_screen)
+        if npc_ids:
+            # One visibility pass for the batch instead of one per move
+            _update_visibility(state)
+        moved = False
+
+        for index, npc_id in enumerate(npc_ids):
+            npc = state.entities.get(npc_id)
+            if npc is None or npc.hp.current <= 0:
+                continue
+            tick.npcs += 1
+
+            tool_id, args = self.choose_action(npc)
+            if tool_id is None:
+                tick.actions["wait"] += 1
+                continue
+
+            seed = (self.seed * 1_000_003 + self._rounds_run * 10_007 + index) % 2**31
+            result = self._execute(npc_id, tool_id, args, seed)
+            if not result.ok:
+                tick.failed += 1
+                continue
+            tick.actions[tool_id] += 1
+
+            try:
+                moved = self._apply(result.effects, on_screen) or moved
+            except Exception as e:
+                tick.failed += 1
+                logger.warning(f"Off-screen {tool_id} by {npc_id} failed: {e}")
+
+        if moved:
+            _update_visibility(state)
+        if tick.npcs:
+            state.invalidate_cache()
+            state.publish("npc.simulated", lambda: tick.summary())
+        tick.seconds = time.perf_counter() - started
+        return tick
+
+    def choose_action(self, npc: NPC) -> Tuple[Optional[str], Dict[str, Any]]:
+        """
+        Pick the highest-utility action for an NPC.
+
+        Returns:
+            (tool_id, args), or (None, {}) to wait
+        """
+        profile = NPCProfile.from_tags(npc.tags)
+        best: Tuple[float, Optional[str], Dict[str, Any]] = (IDLE_UTILITY, None, {})
+
+        hostile = self._pick_hostile(npc, profile)
+        if hostile is not None:
+            target_hp = self.state.entities[hostile].hp
+            # Wounded targets are more tempting
+            utility = profile.aggression * (2 - target_hp.current / max(target_hp.max, 1))
+            if npc.has_weapon and utility > best[0]:
+                best = (utility, "attack", {"actor": npc.id, "target": hostile})
+
+        partner = next(self._present(npc), None)
+        if hostile is None and partner is not None and profile.sociability > best[0]:
+            best = (
+                profile.sociability,
+                "talk",
+                {"actor": npc.id, "target": partner, "intent": "charm"},
+            )
+
+        destination = self._destination(npc, profile)
+        if destination is not None and hostile is None:
+            next_zone = self.next_step(npc.current_zone, destination)
+            # Having somewhere to be outweighs idle chatter
+            utility = profile.wanderlust + (0.5 if profile.goal_zone or profile.patrol else 0.0)
+            if next_zone is not None and utility > best[0]:
+                best = (utility, "move", {"actor": npc.id, "to": next_zone})
+
+        return best[1], best[2]
+
+    def next_step(self, from_zone: str, to_zone: str) -> Optional[str]:
+        """First zone on the shortest path, or None if unreachable or there."""
+        key = (from_zone, to_zone)
+        if key not in self._paths:
+            self._paths[key] = find_shortest_path(from_zone, to_zone, self.state)
+        path = self._paths[key]
+        return path[1] if path and len(path) > 1 else None
+
+    def _pick_hostile(self, npc: NPC, profile: NPCProfile) -> Optional[str]:
+        if not profile.hostile_to:
+            return None
+        for other_id in self._present(npc):
+            other = self.state.entities[other_id]
+            if other.hp.current > 0 and (
+                other_id in profile.hostile_to or other.type in profile.hostile_to
+            ):
+                return other_id
+        return None
+
+    def _present(self, npc: NPC) -> Iterable[str]:
+        """
+        Visible actors still in the NPC's zone.
+
+        visible_actors is only recomputed after the batch, so it may list
+        actors who have walked off (or miss ones who arrived) this round.
+        """
+        for other_id in npc.visible_actors:
+            other = self.state.entities.get(other_id)
+            if (
+                other is not None
+                and other.type in ("pc", "npc")
+                and other.current_zone == npc.current_zone
+            ):
+                yield other_id
+
+    def _destination(self, npc: NPC, profile: NPCProfile) -> Optional[str]:
+        if profile.goal_zone and profile.goal_zone != npc.current_zone:
+            return profile.goal_zone
+        if profile.patrol:
+            index = self._patrol_index.get(npc.id, 0) % len(profile.patrol)
+            if profile.patrol[index] == npc.current_zone:
+                index = (index + 1) % len(profile.patrol)
+                self._patrol_index[npc.id] = index
+            return profile.patrol[index]
+        return None
+
+    def _on_screen(self, on_screen_zones: Optional[Iterable[str]]) -> Set[str]:
+        if on_screen_zones is None:
+            return {
+                entity.current_zone
+                for entity in self.state.entities.values()
+                if entity.type == "pc"
+            }
+        return set(on_screen_zones)
+
+    def _execute(self, npc_id: str, tool_id: str, args: Dict[str, Any], seed: int):
+        """Validate and execute one NPC action, with the NPC as current actor."""
+        state = self.state
+        utterance = Utterance(text="", actor_id=npc_id)
+        current_actor = state.current_actor
+        state.current_actor = npc_id
+        try:
+            sanitized_args, error = self.validator.validate_call(
+                tool_id, args, state, utterance
+            )
+            if error is not None:
+                return error
+            return self.validator._execute_tool(
+                tool_id, sanitized_args, state, utterance, seed
+            )
+        finally:
+            state.current_actor = current_actor
+
+    def _apply(self, effects: List[Dict[str, Any]], on_screen: Set[str]) -> bool:
+        """Apply effects; positions are set directly. Returns True if anyone moved."""
+        moved = False
+        others = []
+        for effect in effects:
+            if effect.get("type") == "position":
+                entity = self.state.entities.get(effect["target"])
+                to_zone = effect["to"]
+                if entity is not None and to_zone in self.state.zones:
+                    from_zone = entity.current_zone
+                    entity.current_zone = to_zone
+                    moved = True
+                    if to_zone in on_screen and from_zone != to_zone:
+                        self._reveal_arrival(entity.id, from_zone, to_zone)
+            else:
+                others.append(effect)
+        if others:
+            apply_effects(self.state, others)
+        return moved
+
+    def _reveal_arrival(self, npc_id: str, from_zone: str, to_zone: str) -> None:
+        """Auto-reveal for an NPC walking into a zone that is being played."""
+        from .auto_reveal import trigger_exploration_events
+
+        try:
+            trigger_exploration_events(self.state, npc_id, from_zone, to_zone)
+        except Exception as e:
+            # As in effects.apply_position, movement stands even if reveal fails
+            logger.warning(f"Auto-reveal failed for {npc_id} entering {to_zone}: {e}")
+
+    def _clear_paths(self, **event: Any) -> None:
+        self._paths.clear()
@@ -67,13 +67,21 @@ class OutcomeResolver:
                 except Exception as e:
                     logger.error(f"Failed to load outcome table {filename}: {e}")
 
-    def resolve_outcome(self, result: ToolResult, state: GameState) -> ToolResult:
+    def resolve_outcome(
+        self,
+        result: ToolResult,
+        state: GameState,
+        rng: Optional[random.Random] = None,
+    ) -> ToolResult:
         """
         Enrich a ToolResult with consequences and secondary effects.
 
         Args:
             result: The raw tool result from execution
             state: Current game state for context
+            rng: Random source for picking between variants (the turn's
+                RNGContext stream); a fresh OS-seeded generator if omitted,
+                never the global random module
 
         Returns:
             Enhanced ToolResult with consequences added
@@ -99,7 +107,9 @@ class OutcomeResolver:
             return result
 
         # Look up consequences
-        consequence = self._lookup_consequence(domain, outcome, result, state)
+        if rng is None:
+            rng = random.Random()
+        consequence = self._lookup_consequence(domain, outcome, result, state, rng)
 
         if not consequence:
             logger.debug(f"No consequence found for {domain}.{outcome}")
@@ -151,9 +161,14 @@ class OutcomeResolver:
         return None
 
     def _lookup_consequence(
-        self, domain: str, outcome: str, result: ToolResult, state: GameState
+        self,
+        domain: str,
+        outcome: str,
+        result: ToolResult,
+        state: GameState,
+        rng: random.Random,
     ) -> Optional[OutcomeConsequence]:
-        """Look up consequence from outcome tables."""
+        """Look up consequence from outcome tables, picking variants with rng."""
 
         if domain not in self.outcome_tables:
             logger.debug(f"Domain {domain} not found in tables")
@@ -181,7 +196,7 @@ class OutcomeResolver:
             if not outcome_data:  # Defensive check for empty list
                 logger.warning(f"Empty outcome list for {domain_key}.{outcome}")
                 return None
-            chosen = random.choice(outcome_data)
+            chosen = rng.choice(outcome_data)
         else:
             chosen = outcome_data
 
@@ -257,7 +272,9 @@ def get_resolver() -> OutcomeResolver:
     return _resolver_instance
 
 
-def resolve_outcome(result: ToolResult, state: GameState) -> ToolResult:
+def resolve_outcome(
+    result: ToolResult, state: GameState, rng: Optional[random.Random] = None
+) -> ToolResult:
     """Convenience function to resolve outcomes using the global resolver."""
     resolver = get_resolver()
-    return resolver.resolve_outcome(result, state)
+    return resolver.resolve_outcome(result, state, rng)
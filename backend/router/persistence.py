@@ -4,12 +4,35 @@ Persistence Layer Integration for AID&D game state management.
 Provides multi-file persistence with separate public.json and gm.json files
 for different visibility levels, utilizing the Meta Serialization Policy
 for appropriate data inclusion/exclusion.
+
+Incremental saves append only what changed since the previous save to a
+per-file delta log ({file_type}.delta.jsonl). Loading replays the base
+snapshot plus its deltas, and the log is periodically compacted back into a
+full snapshot.
+
+Every file is written atomically: serialized compactly to a temp file in the
+same directory, optionally compressed (gzip, or zstd when the zstandard
+package is installed), fsynced and swapped into place with os.replace. The
+SHA-256 and size of each save file are recorded in manifest.json so loads
+can reject truncated or damaged files before parsing them. The manifest is
+written last: a file newer than the manifest that fails its checksum (a crash
+between the two writes) is parsed and validated instead of rejected.
+
+With binary_snapshots enabled, full GM snapshots are also written as a
+checksummed binary file (gm.gsb, see binary_format) that loads without JSON
+parsing or validation. JSON stays the interchange format: binary files are
+never exported and are dropped as soon as they go stale.
 """
 
+import gzip
+import hashlib
 import json
+import logging
 import os
+import sqlite3
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Any, Optional, Literal, Union, List
+from typing import Dict, Any, Optional, Literal, Union, List, Tuple
 from datetime import datetime, timezone
 
 from backend.router.game_state import (
@@ -22,9 +45,67 @@ from backend.router.game_state import (
     Scene,
     Clock,
 )
+from backend.router import binary_format, region_store
+from backend.router.atomic_io import atomic_write
+from backend.router.save_catalog import SaveCatalog, CATALOG_FILENAME, describe_files
 from models.meta import Meta
 
 
+logger = logging.getLogger(__name__)
+
+# Keyed collections inside game_state that deltas track per item
+DELTA_SECTIONS = ("entities", "zones", "clocks")
+
+DELTA_LOG_SUFFIX = ".delta.jsonl"
+
+Compression = Literal["gzip", "zstd"]
+
+# Magic bytes used to detect compressed save files on read
+_GZIP_MAGIC = b"\x1f\x8b"
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+def _fingerprint(value: Any) -> str:
+    """Stable content hash of a JSON-safe value."""
+    encoded = json.dumps(
+        value, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+    ).encode("utf-8")
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+@dataclass
+class _Checkpoint:
+    """Fingerprints of the last saved version of one save file."""
+
+    sections: Dict[str, Dict[str, str]] = field(default_factory=dict)
+    scene: Dict[str, str] = field(default_factory=dict)
+    top: Dict[str, str] = field(default_factory=dict)
+    delta_count: int = 0
+
+    @classmethod
+    def from_data(cls, data: Dict[str, Any], delta_count: int = 0) -> "_Checkpoint":
+        game_state = data.get("game_state", {})
+        return cls(
+            sections={
+                section: {
+                    item_id: _fingerprint(item)
+                    for item_id, item in game_state.get(section, {}).items()
+                }
+                for section in DELTA_SECTIONS
+            },
+            scene={
+                key: _fingerprint(value)
+                for key, value in game_state.get("scene", {}).items()
+            },
+            top={
+                key: _fingerprint(value)
+                for key, value in data.items()
+                if key != "game_state"
+            },
+            delta_count=delta_count,
+        )
+
+
 class PersistenceError(Exception):
     """Base exception for persistence operations."""
 
@@ -48,15 +129,53 @@ class PersistenceManager:
     - backup files: Automatic backups for safety
     """
 
-    def __init__(self, base_path: Union[str, Path] = "saves"):
+    def __init__(
+        self,
+        base_path: Union[str, Path] = "saves",
+        compact_every: int = 50,
+        compression: Optional[Compression] = None,
+        binary_snapshots: bool = False,
+        use_catalog: bool = True,
+        catalog_path: Optional[Union[str, Path]] = None,
+    ):
         """
         Initialize persistence manager.
 
         Args:
             base_path: Base directory for save files
+            compact_every: Number of incremental deltas after which the next
+                incremental save rewrites a full snapshot instead
+            compression: Compress save files with "gzip" or "zstd" (requires
+                the zstandard package). Compressed files keep their .json
+                names and are detected on read.
+            binary_snapshots: Also write full GM snapshots in the binary
+                format and prefer them when loading
+            use_catalog: Keep a SQLite catalog of saves and backups so
+                list_saves doesn't scan directories
+            catalog_path: Catalog location (default: base_path/catalog.sqlite)
         """
+        if compression == "zstd":
+            _require_zstd()
+        elif compression not in (None, "gzip"):
+            raise PersistenceError(f"Unsupported compression: {compression}")
+
         self.base_path = Path(base_path)
         self.base_path.mkdir(parents=True, exist_ok=True)
+        self.compact_every = compact_every
+        self.compression = compression
+        self.binary_snapshots = binary_snapshots
+        # Backups created by the save in progress, recorded in the catalog
+        self._new_backups: List[Dict[str, Any]] = []
+
+        self.catalog: Optional[SaveCatalog] = None
+        if use_catalog:
+            self.catalog = SaveCatalog(catalog_path or self.base_path / CATALOG_FILENAME)
+            if not self.catalog.is_initialized():
+                self.catalog.rebuild(self.base_path)
+        # Checksums of files written by this manager, keyed by path
+        self._digests: Dict[str, Dict[str, Any]] = {}
+        # (save_name, file_type) -> fingerprints of the last saved content
+        self._checkpoints: Dict[Tuple[str, str], _Checkpoint] = {}
 
     def save_game_state(
         self,
@@ -67,6 +186,8 @@ class PersistenceManager:
         save_session: bool = False,
         create_backup: bool = True,
         metadata: Optional[Dict[str, Any]] = None,
+        incremental: bool = False,
+        region_shards: bool = False,
     ) -> Dict[str, str]:
         """
         Save game state to appropriate files based on configuration.
@@ -77,17 +198,104 @@ class PersistenceManager:
             save_public: Whether to save public.json file
             save_gm: Whether to save gm.json file
             save_session: Whether to save session.json file
-            create_backup: Whether to create backup copies
+            create_backup: Whether to create backup copies (full snapshots only)
             metadata: Optional metadata to include in save
+            incremental: Append only changed entities, zones, clocks and scene
+                fields to each file's delta log instead of rewriting it. Falls
+                back to a full snapshot when no base exists or the log is due
+                for compaction.
+            region_shards: Also write the GM view as per-region shards for
+                load_lazy() (only changed shards are rewritten). Saving
+                without it removes stale shards.
 
         Returns:
             Dictionary mapping file types to saved file paths
         """
+        try:
+            snapshot = self.snapshot_save(
+                game_state, save_public, save_gm, save_session, region_shards
+            )
+        except Exception as e:
+            raise PersistenceError(f"Failed to save game state: {str(e)}") from e
+        return self.save_snapshot(
+            snapshot,
+            save_name,
+            save_public=save_public,
+            save_gm=save_gm,
+            save_session=save_session,
+            create_backup=create_backup,
+            metadata=metadata,
+            incremental=incremental,
+            region_shards=region_shards,
+        )
+
+    def snapshot_save(
+        self,
+        game_state: GameState,
+        save_public: bool = True,
+        save_gm: bool = True,
+        save_session: bool = False,
+        region_shards: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Export what a save needs, detached from the live state.
+
+        The export is the expensive, state-reading half of save_game_state;
+        save_snapshot() writes it later (e.g. on an autosave thread) without
+        touching the GameState again.
+
+        Returns:
+            {"views": exported views, "stats": entity/zone/clock counts}
+        """
+        # A lazily loaded state must be complete before it is exported, or
+        # unloaded regions would be dropped from the save
+        region_store.ensure_loaded(game_state)
+
+        # Export every requested view in a single pass over the world
+        requested = [
+            view
+            for view, enabled in (
+                ("public", save_public),
+                ("gm", save_gm),
+                ("session", save_session),
+            )
+            if enabled or (view == "gm" and region_shards)
+        ]
+        return {
+            "views": game_state.export_views(requested, include_runtime_data=True),
+            "stats": {
+                "entities": len(game_state.entities),
+                "zones": len(game_state.zones),
+                "clocks": len(game_state.clocks),
+            },
+        }
+
+    def save_snapshot(
+        self,
+        snapshot: Dict[str, Any],
+        save_name: str,
+        save_public: bool = True,
+        save_gm: bool = True,
+        save_session: bool = False,
+        create_backup: bool = True,
+        metadata: Optional[Dict[str, Any]] = None,
+        incremental: bool = False,
+        region_shards: bool = False,
+    ) -> Dict[str, str]:
+        """
+        Write a snapshot_save() export; arguments as for save_game_state.
+
+        Returns:
+            Dictionary mapping file types to saved file paths
+        """
+        views = snapshot["views"]
+        stats = snapshot["stats"]
         save_dir = self.base_path / save_name
         save_dir.mkdir(parents=True, exist_ok=True)
 
         saved_files = {}
         timestamp = datetime.now(timezone.utc).isoformat()
+        self._new_backups = []
 
         # Create metadata for save
         save_metadata = {
@@ -99,43 +307,50 @@ class PersistenceManager:
         }
 
         try:
-            # Save public file (public-safe data)
+            # Save public file (public-safe data, player role for strict filtering)
             if save_public:
                 public_data = {
                     "metadata": save_metadata,
-                    "game_state": game_state.to_public_format(
-                        role="player"
-                    ),  # Player role for strict filtering
+                    "game_state": views["public"],
                 }
-                public_path = save_dir / "public.json"
-                self._write_json_file(public_path, public_data, create_backup)
-                saved_files["public"] = str(public_path)
+                saved_files["public"] = self._save_view(
+                    save_dir, "public", public_data, create_backup, incremental
+                )
 
             # Save GM file (complete data)
             if save_gm:
                 gm_data = {
                     "metadata": save_metadata,
-                    "game_state": game_state.to_save_format(include_runtime_data=True),
+                    "game_state": views["gm"],
                 }
-                gm_path = save_dir / "gm.json"
-                self._write_json_file(gm_path, gm_data, create_backup)
-                saved_files["gm"] = str(gm_path)
+                saved_files["gm"] = self._save_view(
+                    save_dir, "gm", gm_data, create_backup, incremental
+                )
 
             # Save session file (runtime data)
             if save_session:
                 session_data = {
                     "metadata": save_metadata,
-                    "game_state": game_state.to_session_format(),
+                    "game_state": views["session"],
                     "session_info": {
                         "last_updated": timestamp,
-                        "entity_count": len(game_state.entities),
-                        "zone_count": len(game_state.zones),
-                        "clock_count": len(game_state.clocks),
+                        "entity_count": stats["entities"],
+                        "zone_count": stats["zones"],
+                        "clock_count": stats["clocks"],
                     },
                 }
-                session_path = save_dir / "session.json"
-                self._write_json_file(session_path, session_data, create_backup)
-                saved_files["session"] = str(session_path)
+                saved_files["session"] = self._save_view(
+                    save_dir, "session", session_data, create_backup, incremental
+                )
+
+            regions_dir = save_dir / region_store.REGIONS_DIRNAME
+            if region_shards:
+                region_store.write_region_shards(views["gm"], save_dir)
+                saved_files["regions"] = str(regions_dir)
+            elif regions_dir.exists():
+                import shutil
+
+                shutil.rmtree(regions_dir)
 
             # Save manifest file
             manifest = {
@@ -143,16 +358,53 @@ class PersistenceManager:
                 "created": timestamp,
                 "files": list(saved_files.keys()),
                 "metadata": save_metadata,
+                "deltas": {
+                    file_type: self._checkpoints[(str(save_dir), file_type)].delta_count
+                    for file_type in saved_files
+                    if (str(save_dir), file_type) in self._checkpoints
+                },
+                "checksums": {
+                    file_type: self._file_digest(Path(path))
+                    for file_type, path in saved_files.items()
+                    if file_type != "regions"
+                },
             }
             manifest_path = save_dir / "manifest.json"
-            self._write_json_file(manifest_path, manifest, create_backup=False)
+            # The manifest stays plain JSON so list_saves can read it cheaply
+            self._write_json_file(
+                manifest_path, manifest, create_backup=False, compression=None
+            )
             saved_files["manifest"] = str(manifest_path)
 
-            return saved_files
-
         except Exception as e:
             raise PersistenceError(f"Failed to save game state: {str(e)}") from e
 
+        self._catalog_save(save_name, save_dir, manifest, stats)
+        return saved_files
+
+    def _catalog_save(
+        self,
+        save_name: str,
+        save_dir: Path,
+        manifest: Dict[str, Any],
+        stats: Dict[str, int],
+    ) -> None:
+        """Record a completed save in the catalog (files are already safe)."""
+        if self.catalog is None:
+            return
+        file_info, total_size = describe_files(save_dir, manifest.get("files", []))
+        try:
+            self.catalog.record_save(
+                save_name,
+                manifest,
+                file_info,
+                total_size,
+                stats=stats,
+                backups=self._new_backups,
+            )
+        except sqlite3.Error as e:
+            logger.warning(f"Save catalog update failed for '{save_name}': {e}")
+
     def load_game_state(
         self,
         save_name: str,
@@ -190,9 +442,27 @@ class PersistenceManager:
                 f"Available: {available_files}"
             )
 
+        binary_path = file_path.with_suffix(binary_format.BINARY_SUFFIX)
+        if binary_path.exists():
+            try:
+                data = binary_format.read_file(binary_path)
+                if validate_data:
+                    self._validate_save_data(data)
+                return binary_format.build_state(data["game_state"])
+            except (OSError, binary_format.BinaryFormatError, SaveFileCorrupted) as e:
+                logger.warning(f"Ignoring binary snapshot {binary_path}: {e}")
+
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            raw = file_path.read_bytes()
+            try:
+                self._verify_checksum(save_dir, file_type, raw)
+            except SaveFileCorrupted as e:
+                data = self._parse_unlisted_save(save_dir, file_path, raw, e)
+            else:
+                data = json.loads(self._decompress(raw))
+
+            # Replay incremental saves on top of the base snapshot
+            data, _ = self._replay_delta_log(data, self._delta_log_path(file_path))
 
             if validate_data:
                 self._validate_save_data(data)
@@ -213,13 +483,129 @@ class PersistenceManager:
         except Exception as e:
             raise PersistenceError(f"Failed to load game state: {str(e)}") from e
 
-    def list_saves(self) -> List[Dict[str, Any]]:
+    def load_lazy(
+        self,
+        save_name: str,
+        zone_id: Optional[str] = None,
+        regions: Optional[List[str]] = None,
+        neighbors: int = 1,
+    ) -> GameState:
+        """
+        Load only part of a region-sharded save.
+
+        The returned GameState starts with the scene, clocks and the requested
+        regions (plus neighbours). Zones and entities in other regions are
+        loaded the first time they are looked up by ID.
+
+        Args:
+            save_name: Name of a save written with region_shards=True
+            zone_id: Load the region containing this zone
+            regions: Regions to load explicitly
+            neighbors: Region hops around the requested regions to preload
+
+        Raises:
+            PersistenceError: If the save has no region shards or the zone or
+                regions are unknown
+            SaveFileCorrupted: If the index or a shard is damaged
+        """
+        save_dir = self.base_path / save_name
+        if not (save_dir / region_store.REGIONS_DIRNAME).exists():
+            raise PersistenceError(f"Save '{save_name}' has no region shards")
+        try:
+            loader = region_store.RegionLoader(save_dir)
+        except region_store.RegionStoreError as e:
+            raise SaveFileCorrupted(str(e)) from e
+
+        if zone_id is not None and loader.region_of_zone(zone_id) is None:
+            raise PersistenceError(f"Zone '{zone_id}' not found in save '{save_name}'")
+        unknown = [region for region in regions or [] if region not in loader.regions]
+        if unknown:
+            raise PersistenceError(f"Unknown regions in save '{save_name}': {unknown}")
+
+        try:
+            return loader.load(regions=regions, zone_id=zone_id, neighbors=neighbors)
+        except region_store.RegionStoreError as e:
+            raise SaveFileCorrupted(str(e)) from e
+
+    def list_saves(
+        self,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        sort_by: str = "created",
+        descending: bool = True,
+    ) -> List[Dict[str, Any]]:
         """
-        List all available saves with metadata.
+        List available saves with metadata.
+
+        Served from the save catalog when enabled, otherwise by scanning the
+        save directory.
+
+        Args:
+            limit: Maximum number of saves to return (None = all)
+            offset: Number of saves to skip (for paging)
+            sort_by: "created", "first_saved", "name", "size" or "entities"
+                (catalog only; directory scans sort by "created" or "name")
+            descending: Sort direction (default newest first)
 
         Returns:
             List of save information dictionaries
         """
+        if self.catalog is not None:
+            return self.catalog.list_saves(limit, offset, sort_by, descending)
+
+        saves = self._scan_saves()
+        key = "name" if sort_by == "name" else "created"
+        saves.sort(key=lambda x: x.get(key) or "", reverse=descending)
+        end = offset + limit if limit is not None else None
+        return saves[offset:end]
+
+    def rebuild_catalog(self) -> int:
+        """
+        Re-index every save on disk (e.g. after copying saves in manually).
+
+        Returns:
+            Number of saves indexed
+        """
+        if self.catalog is None:
+            raise PersistenceError("Save catalog is disabled")
+        return self.catalog.rebuild(self.base_path)
+
+    def prune_backups(
+        self,
+        keep: int = 5,
+        save_name: Optional[str] = None,
+        older_than: Optional[str] = None,
+    ) -> int:
+        """
+        Delete old backup files, keeping the newest `keep` per save file.
+
+        Args:
+            keep: Backups to keep per (save, file type)
+            save_name: Restrict pruning to one save
+            older_than: Only delete backups created before this ISO timestamp
+
+        Returns:
+            Number of backup files deleted
+        """
+        if self.catalog is None:
+            raise PersistenceError("prune_backups requires the save catalog")
+
+        pruned = []
+        for backup in self.catalog.backups_to_prune(keep, save_name, older_than):
+            try:
+                Path(backup["path"]).unlink()
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"Could not delete backup {backup['path']}: {e}")
+                continue
+            pruned.append(backup["path"])
+
+        self.catalog.remove_backups(pruned)
+        return len(pruned)
+
+    def _scan_saves(self) -> List[Dict[str, Any]]:
+        """Build save listings by reading every manifest on disk."""
         saves = []
 
         for save_dir in self.base_path.iterdir():
@@ -235,16 +621,7 @@ class PersistenceManager:
                     manifest = json.load(f)
 
                 # Add file size information
-                file_info = {}
-                for file_type in manifest.get("files", []):
-                    file_path = save_dir / f"{file_type}.json"
-                    if file_path.exists():
-                        file_info[file_type] = {
-                            "size": file_path.stat().st_size,
-                            "modified": datetime.fromtimestamp(
-                                file_path.stat().st_mtime, tz=timezone.utc
-                            ).isoformat(),
-                        }
+                file_info, _ = describe_files(save_dir, manifest.get("files", []))
 
                 save_info = {
                     "name": manifest.get("save_name", save_dir.name),
@@ -260,8 +637,6 @@ class PersistenceManager:
                 # Skip corrupted manifest files
                 continue
 
-        # Sort by creation date (newest first)
-        saves.sort(key=lambda x: x.get("created", ""), reverse=True)
         return saves
 
     def delete_save(self, save_name: str, confirm: bool = False) -> bool:
@@ -290,12 +665,15 @@ class PersistenceManager:
             import shutil
 
             shutil.rmtree(save_dir)
-            return True
         except Exception as e:
             raise PersistenceError(
                 f"Failed to delete save '{save_name}': {str(e)}"
             ) from e
 
+        if self.catalog is not None:
+            self.catalog.remove_save(save_name)
+        return True
+
     def export_save(
         self,
         save_name: str,
@@ -335,54 +713,379 @@ class PersistenceManager:
                 )  # Ensure parent directory exists
 
                 with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zipf:
-                    for file_path in save_dir.glob("*.json"):
-                        if file_types is None or file_path.stem in file_types:
-                            zipf.write(file_path, file_path.name)
+                    for file_path in self._export_files(save_dir, file_types):
+                        zipf.write(file_path, file_path.name)
 
-                return str(zip_path)
+                exported = str(zip_path)
             else:
                 import shutil
 
                 export_path.mkdir(parents=True, exist_ok=True)
 
-                for file_path in save_dir.glob("*.json"):
-                    if file_types is None or file_path.stem in file_types:
-                        shutil.copy2(file_path, export_path / file_path.name)
+                for file_path in self._export_files(save_dir, file_types):
+                    shutil.copy2(file_path, export_path / file_path.name)
 
-                return str(export_path)
+                exported = str(export_path)
 
         except Exception as e:
             raise PersistenceError(
                 f"Failed to export save '{save_name}': {str(e)}"
             ) from e
 
+        if self.catalog is not None:
+            try:
+                self.catalog.record_export(save_name, exported, file_types)
+            except sqlite3.Error as e:
+                logger.warning(f"Save catalog export record failed: {e}")
+        return exported
+
+    def _export_files(
+        self, save_dir: Path, file_types: Optional[List[str]]
+    ) -> List[Path]:
+        """Save files to include in an export, delta logs included."""
+        files = []
+        for file_path in sorted(save_dir.glob("*.json")):
+            if file_types is None or file_path.stem in file_types:
+                files.append(file_path)
+        for log_path in sorted(save_dir.glob(f"*{DELTA_LOG_SUFFIX}")):
+            file_type = log_path.name[: -len(DELTA_LOG_SUFFIX)]
+            if file_types is None or file_type in file_types:
+                files.append(log_path)
+        return files
+
+    # =========================================================================
+    # Incremental (delta log) saves
+    # =========================================================================
+
+    @staticmethod
+    def _delta_log_path(file_path: Path) -> Path:
+        return file_path.with_name(f"{file_path.stem}{DELTA_LOG_SUFFIX}")
+
+    def _save_view(
+        self,
+        save_dir: Path,
+        file_type: str,
+        data: Dict[str, Any],
+        create_backup: bool,
+        incremental: bool,
+    ) -> str:
+        """
+        Persist one save file, either as an appended delta or a full snapshot.
+
+        Returns:
+            Path of the base snapshot file
+        """
+        file_path = save_dir / f"{file_type}.json"
+        log_path = self._delta_log_path(file_path)
+        binary_path = file_path.with_suffix(binary_format.BINARY_SUFFIX)
+        key = (str(save_dir), file_type)
+
+        # Any binary snapshot is stale once this save lands
+        if binary_path.exists():
+            binary_path.unlink()
+
+        if incremental and file_path.exists():
+            checkpoint = self._checkpoints.get(key) or self._load_checkpoint(
+                file_path, log_path
+            )
+            if checkpoint is not None and checkpoint.delta_count < self.compact_every:
+                delta, new_checkpoint = self._compute_delta(checkpoint, data)
+                self._append_delta(log_path, delta)
+                self._checkpoints[key] = new_checkpoint
+                return str(file_path)
+
+        # Full snapshot: first save, non-incremental save or compaction
+        self._write_json_file(file_path, data, create_backup)
+        if log_path.exists():
+            log_path.unlink()
+        if self.binary_snapshots and file_type == "gm":
+            binary_format.write_file(binary_path, data)
+        self._checkpoints[key] = _Checkpoint.from_data(data)
+        return str(file_path)
+
+    def _load_checkpoint(
+        self, file_path: Path, log_path: Path
+    ) -> Optional[_Checkpoint]:
+        """Rebuild fingerprints from disk (e.g. after a restart)."""
+        try:
+            data = json.loads(self._decompress(file_path.read_bytes()))
+            data, delta_count = self._replay_delta_log(data, log_path)
+        except (OSError, ValueError, PersistenceError) as e:
+            logger.warning(f"Cannot resume delta log for {file_path}: {e}")
+            return None
+        return _Checkpoint.from_data(data, delta_count)
+
+    def _compute_delta(
+        self, checkpoint: _Checkpoint, data: Dict[str, Any]
+    ) -> Tuple[Dict[str, Any], _Checkpoint]:
+        """Diff new save data against the last checkpoint."""
+        current = _Checkpoint.from_data(data, checkpoint.delta_count + 1)
+        game_state = data.get("game_state", {})
+
+        delta: Dict[str, Any] = {
+            "seq": current.delta_count,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        }
+
+        for section in DELTA_SECTIONS:
+            old = checkpoint.sections.get(section, {})
+            new = current.sections.get(section, {})
+            changed = {
+                item_id: game_state[section][item_id]
+                for item_id, fp in new.items()
+                if old.get(item_id) != fp
+            }
+            removed = [item_id for item_id in old if item_id not in new]
+            if changed:
+                delta.setdefault("set", {})[section] = changed
+            if removed:
+                delta.setdefault("removed", {})[section] = removed
+
+        scene = game_state.get("scene", {})
+        scene_changes = {
+            key: scene[key]
+            for key, fp in current.scene.items()
+            if checkpoint.scene.get(key) != fp
+        }
+        if scene_changes:
+            delta["scene"] = scene_changes
+        scene_removed = [key for key in checkpoint.scene if key not in current.scene]
+        if scene_removed:
+            delta["scene_removed"] = scene_removed
+
+        top_changes = {
+            key: data[key] for key, fp in current.top.items() if checkpoint.top.get(key) != fp
+        }
+        if top_changes:
+            delta["top"] = top_changes
+
+        return delta, current
+
+    @staticmethod
+    def _append_delta(log_path: Path, delta: Dict[str, Any]) -> None:
+        """
+        Append one delta record and flush it to disk.
+
+        A torn final record (crash during an earlier append) is cut off
+        first. Replay skips it either way, but a record appended after it
+        would share its line and fail to parse.
+        """
+        line = json.dumps(delta, separators=(",", ":"), ensure_ascii=False)
+        with open(log_path, "r+b" if log_path.exists() else "wb") as f:
+            end = f.seek(0, os.SEEK_END)
+            if end:
+                f.seek(end - 1)
+                if f.read(1) != b"\n":
+                    f.seek(0)
+                    keep = f.read().rfind(b"\n") + 1
+                    logger.warning(
+                        f"Truncating torn final delta in {log_path} "
+                        f"({end - keep} bytes)"
+                    )
+                    f.truncate(keep)
+                    end = keep
+            f.seek(end)
+            f.write((line + "\n").encode("utf-8"))
+            f.flush()
+            os.fsync(f.fileno())
+
+    @staticmethod
+    def _apply_delta(data: Dict[str, Any], delta: Dict[str, Any]) -> None:
+        """Apply one delta record to loaded save data in place."""
+        game_state = data.setdefault("game_state", {})
+        for section, items in delta.get("set", {}).items():
+            game_state.setdefault(section, {}).update(items)
+        for section, item_ids in delta.get("removed", {}).items():
+            existing = game_state.get(section, {})
+            for item_id in item_ids:
+                existing.pop(item_id, None)
+        if "scene" in delta:
+            game_state.setdefault("scene", {}).update(delta["scene"])
+        for key in delta.get("scene_removed", ()):
+            game_state.get("scene", {}).pop(key, None)
+        data.update(delta.get("top", {}))
+
+    def _replay_delta_log(
+        self, data: Dict[str, Any], log_path: Path
+    ) -> Tuple[Dict[str, Any], int]:
+        """
+        Replay a delta log on top of base snapshot data.
+
+        A torn final line (crash during append) is ignored; corruption
+        anywhere else raises SaveFileCorrupted.
+
+        Returns:
+            The updated data and the number of deltas applied
+        """
+        if not log_path.exists():
+            return data, 0
+
+        with open(log_path, "r", encoding="utf-8") as f:
+            lines = f.read().split("\n")
+
+        applied = 0
+        for index, line in enumerate(lines):
+            if not line.strip():
+                continue
+            try:
+                delta = json.loads(line)
+            except json.JSONDecodeError as e:
+                if all(not rest.strip() for rest in lines[index + 1 :]):
+                    logger.warning(f"Ignoring torn final delta in {log_path}")
+                    break
+                raise SaveFileCorrupted(
+                    f"Delta log '{log_path}' is corrupted at line {index + 1}: {e}"
+                ) from e
+            self._apply_delta(data, delta)
+            applied += 1
+
+        return data, applied
+
     def _write_json_file(
-        self, file_path: Path, data: Dict[str, Any], create_backup: bool = True
-    ) -> None:
+        self,
+        file_path: Path,
+        data: Dict[str, Any],
+        create_backup: bool = True,
+        compression: Union[Compression, None, Literal["default"]] = "default",
+    ) -> Dict[str, Any]:
         """
-        Write JSON data to file with optional backup.
+        Atomically write JSON data to file with optional backup.
+
+        The data is serialized with compact separators to a temp file in the
+        same directory, optionally compressed, fsynced and then swapped in
+        with os.replace, so a crash never leaves a half-written save. The
+        previous file stays in place until the swap; backups hard-link it
+        (or copy it if linking fails).
 
         Args:
             file_path: Path to write to
             data: Data to write
             create_backup: Whether to create backup of existing file
+            compression: Override the manager's compression for this file
+
+        Returns:
+            Checksum info ({"sha256", "size"}) of the written bytes
         """
-        # Create backup if file exists and backup requested
+        if compression == "default":
+            compression = self.compression
+
+        payload = json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode(
+            "utf-8"
+        )
+        payload = _compress(payload, compression)
+
         if create_backup and file_path.exists():
             backup_path = file_path.with_suffix(
                 f".bak.{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
             )
             try:
-                file_path.rename(backup_path)
+                os.link(file_path, backup_path)
             except OSError:
-                # Fallback for cross-filesystem rename failures
+                # Existing backup name or no hard link support
                 import shutil
 
-                shutil.move(str(file_path), str(backup_path))
+                shutil.copy2(file_path, backup_path)
+            previous_digest = self._file_digest(file_path)
+        else:
+            backup_path = None
+
+        atomic_write(file_path, payload)
+
+        digest = {"sha256": hashlib.sha256(payload).hexdigest(), "size": len(payload)}
+        self._digests[str(file_path)] = digest
+
+        if backup_path is not None:
+            self._new_backups.append(
+                {
+                    "file_type": file_path.stem,
+                    "path": str(backup_path),
+                    "created": datetime.now(timezone.utc).isoformat(),
+                    "size": previous_digest["size"],
+                    "source_sha256": previous_digest["sha256"],
+                    "replaced_by_sha256": digest["sha256"],
+                }
+            )
+        return digest
+
+    def _file_digest(self, file_path: Path) -> Dict[str, Any]:
+        """Checksum info for a save file, reusing the one recorded on write."""
+        digest = self._digests.get(str(file_path))
+        if digest is None:
+            payload = file_path.read_bytes()
+            digest = {
+                "sha256": hashlib.sha256(payload).hexdigest(),
+                "size": len(payload),
+            }
+            self._digests[str(file_path)] = digest
+        return digest
 
-        # Write new file
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+    def _verify_checksum(self, save_dir: Path, file_type: str, raw: bytes) -> None:
+        """
+        Check raw file bytes against the manifest before parsing.
+
+        Saves written before checksums were recorded are accepted as-is.
+
+        Raises:
+            SaveFileCorrupted: If the size or SHA-256 doesn't match
+        """
+        manifest_path = save_dir / "manifest.json"
+        if not manifest_path.exists():
+            return
+        try:
+            with open(manifest_path, "r", encoding="utf-8") as f:
+                expected = json.load(f).get("checksums", {}).get(file_type)
+        except (OSError, ValueError):
+            return
+        if not expected:
+            return
+
+        if len(raw) != expected.get("size"):
+            raise SaveFileCorrupted(
+                f"Save file '{file_type}' is truncated or damaged: "
+                f"expected {expected.get('size')} bytes, found {len(raw)}"
+            )
+        if hashlib.sha256(raw).hexdigest() != expected.get("sha256"):
+            raise SaveFileCorrupted(f"Save file '{file_type}' failed checksum")
+
+    def _parse_unlisted_save(
+        self, save_dir: Path, file_path: Path, raw: bytes, error: SaveFileCorrupted
+    ) -> Dict[str, Any]:
+        """
+        Parse a save file that doesn't match the manifest, if it is newer.
+
+        Save files are replaced before manifest.json is rewritten, so a crash
+        in between leaves an intact file the manifest doesn't describe yet.
+        Such a file is accepted if it parses and validates. A file no newer
+        than the manifest (or one that doesn't parse) is rejected with the
+        checksum error.
+        """
+        try:
+            manifest_mtime = (save_dir / "manifest.json").stat().st_mtime_ns
+            if file_path.stat().st_mtime_ns <= manifest_mtime:
+                raise error
+            data = json.loads(self._decompress(raw))
+            self._validate_save_data(data)
+        except (OSError, ValueError, SaveFileCorrupted):
+            raise error from None
+        logger.warning(
+            f"{file_path} is newer than its manifest (interrupted save?); "
+            "accepted after validation"
+        )
+        return data
+
+    @staticmethod
+    def _decompress(raw: bytes) -> bytes:
+        """Undo gzip/zstd compression, detected by magic bytes."""
+        try:
+            if raw.startswith(_GZIP_MAGIC):
+                return gzip.decompress(raw)
+            if raw.startswith(_ZSTD_MAGIC):
+                return _require_zstd().ZstdDecompressor().decompress(raw)
+        except PersistenceError:
+            raise
+        except Exception as e:
+            raise SaveFileCorrupted(f"Compressed save data is damaged: {e}") from e
+        return raw
 
     def _validate_save_data(self, data: Dict[str, Any]) -> None:
         """
@@ -484,3 +1187,24 @@ class PersistenceManager:
         scene = Scene(**clean_scene_data)
 
         return GameState(entities=entities, zones=zones, clocks=clocks, scene=scene)
+
+
+def _require_zstd():
+    """Import zstandard or raise a PersistenceError explaining how to get it."""
+    try:
+        import zstandard
+    except ImportError as e:
+        raise PersistenceError(
+            "zstd compression requires the 'zstandard' package"
+        ) from e
+    return zstandard
+
+
+def _compress(payload: bytes, compression: Optional[Compression]) -> bytes:
+    if compression == "gzip":
+        # mtime=0 keeps output (and its checksum) deterministic
+        return gzip.compress(payload, compresslevel=6, mtime=0)
+    if compression == "zstd":
+        return _require_zstd().ZstdCompressor(level=3).compress(payload)
+    return payload
+
@@ -32,6 +32,34 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+# Only include the compound connectors that are actually used
+COMPOUND_CONNECTORS = (" and ", " then ", " after ", " before ")
+
+COMPOUND_ACTION_VERBS = (
+    "look",
+    "move",
+    "go",
+    "attack",
+    "drink",
+    "use",
+    "cast",
+    "talk",
+    "say",
+)
+
+
+def is_likely_compound(text: str) -> bool:
+    """Quick heuristic check if text might contain compound actions."""
+    text_lower = text.lower()
+
+    # Count potential action verbs
+    action_count = sum(1 for verb in COMPOUND_ACTION_VERBS if verb in text_lower)
+
+    # If multiple action verbs or explicit connecting words
+    has_connectors = any(connector in text_lower for connector in COMPOUND_CONNECTORS)
+    return action_count > 1 or has_connectors
+
+
 @dataclass
 class PlannerResult:
     """Result from the Planner."""
@@ -245,37 +273,7 @@ Required JSON format:
 
     def _is_likely_compound(self, text: str) -> bool:
         """Quick heuristic check if text might contain compound actions."""
-        text_lower = text.lower()
-        # Only include the compound connectors that are actually used
-        compound_indicators = [
-            " and ",
-            " then ",
-            " after ",
-            " before ",
-        ]
-
-        # Count potential action verbs
-        action_count = 0
-        action_verbs = [
-            "look",
-            "move",
-            "go",
-            "attack",
-            "drink",
-            "use",
-            "cast",
-            "talk",
-            "say",
-        ]
-        for verb in action_verbs:
-            if verb in text_lower:
-                action_count += 1
-
-        # If multiple action verbs or explicit connecting words
-        has_connectors = any(
-            indicator in text_lower for indicator in compound_indicators
-        )
-        return action_count > 1 or has_connectors
+        return is_likely_compound(text)
 
     def _parse_compound_command(
         self, utterance: Utterance, debug: bool = False
@@ -0,0 +1,397 @@
+"""
+Region Store - Region-sharded saves with lazy, partial loading.
+
+A monolithic save has to be parsed and rebuilt in full before play can resume,
+even if the party only ever touches one corner of the world. This module
+splits the GM save view into one shard per region:
+
+    regions/index.json   region -> shard file, zones, entities, neighbours
+    regions/core.gsb     scene, clocks and entities that are not in any zone
+    regions/NNNN.gsb     zones and entities of one region
+
+A zone belongs to its Zone.region, or forms a region of its own when that is
+unset. An entity belongs to the region of its current_zone. Shards use the
+checksummed binary container from binary_format and are only rewritten when
+their content changes. A changed shard is written under a new file name, so
+the files named by the current index stay intact until the new index has
+replaced it; only then are the old files deleted. A crash mid-save leaves
+the previous shards and index readable as a set.
+
+RegionLoader.load() returns a GameState whose entities and zones mappings are
+lazy. They start with the requested regions (plus neighbours) and materialize
+other regions the first time one of their IDs is looked up. Iterating them
+only covers what has been loaded so far; call load_all() (or ensure_loaded())
+when a whole-world pass is needed, e.g. before saving.
+"""
+
+import hashlib
+import json
+import logging
+from collections import deque
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Union
+
+from . import binary_format
+from .atomic_io import atomic_write
+from .game_state import GameState
+
+logger = logging.getLogger(__name__)
+
+
+REGION_INDEX_VERSION = 1
+REGIONS_DIRNAME = "regions"
+INDEX_FILENAME = "index.json"
+CORE_SHARD = "core"
+
+
+class RegionStoreError(Exception):
+    """Raised when a region index or shard is missing or corrupted."""
+
+    pass
+
+
+@dataclass
+class RegionInfo:
+    """Index entry for one region shard."""
+
+    file: str
+    sha256: str
+    zones: List[str] = field(default_factory=list)
+    entities: List[str] = field(default_factory=list)
+    neighbors: List[str] = field(default_factory=list)
+
+
+def region_of(zone_data: Dict[str, Any]) -> str:
+    """Region key of an exported zone: its region, or the zone itself."""
+    return zone_data.get("region") or zone_data["id"]
+
+
+# =============================================================================
+# Writing
+# =============================================================================
+
+
+def write_region_shards(
+    game_state_data: Dict[str, Any], directory: Union[str, Path]
+) -> Dict[str, Any]:
+    """
+    Write region shards for exported GM save data.
+
+    Args:
+        game_state_data: GameState.to_save_format(include_runtime_data=True)
+            (or the "gm" entry of export_views)
+        directory: Save directory; shards go in its regions/ subdirectory
+
+    Returns:
+        The index that was written
+    """
+    regions_dir = Path(directory) / REGIONS_DIRNAME
+    regions_dir.mkdir(parents=True, exist_ok=True)
+    try:
+        previous = _read_index(regions_dir) if (regions_dir / INDEX_FILENAME).exists() else None
+    except RegionStoreError as e:
+        logger.warning(f"Rewriting all region shards: {e}")
+        previous = None
+
+    zones = game_state_data.get("zones", {})
+    zone_regions = {zid: region_of(zone) for zid, zone in zones.items()}
+
+    shards: Dict[str, Dict[str, Any]] = {}
+    for zid, zone in zones.items():
+        shards.setdefault(zone_regions[zid], {"zones": {}, "entities": {}})["zones"][zid] = zone
+
+    core = {
+        "scene": game_state_data.get("scene", {}),
+        "clocks": game_state_data.get("clocks", {}),
+        "entities": {},
+    }
+    for eid, entity in game_state_data.get("entities", {}).items():
+        region = zone_regions.get(entity.get("current_zone"))
+        if region is None:
+            core["entities"][eid] = entity
+        else:
+            shards[region]["entities"][eid] = entity
+
+    neighbors: Dict[str, Set[str]] = {region: set() for region in shards}
+    for zid, zone in zones.items():
+        for exit_data in zone.get("exits", []):
+            target_region = zone_regions.get(exit_data.get("to"))
+            if target_region and target_region != zone_regions[zid]:
+                neighbors[zone_regions[zid]].add(target_region)
+                neighbors[target_region].add(zone_regions[zid])
+
+    old_regions = previous["regions"] if previous else {}
+    old_core = previous["core"] if previous else None
+    old_files = {info["file"] for info in old_regions.values()}
+    if old_core:
+        old_files.add(old_core["file"])
+    used_files: Set[str] = set()
+
+    def place(shard: Dict[str, Any], old: Optional[Dict[str, Any]], prefix: str) -> Dict[str, str]:
+        """Keep an unchanged shard's file; write a changed one under a fresh name."""
+        blob = binary_format.dumps(shard)
+        sha = hashlib.sha256(blob).hexdigest()
+        if old and old["sha256"] == sha and (regions_dir / old["file"]).exists():
+            file_name = old["file"]
+        else:
+            number = 0
+            while _shard_name(number, prefix) in old_files | used_files:
+                number += 1
+            file_name = _shard_name(number, prefix)
+            atomic_write(regions_dir / file_name, blob)
+        used_files.add(file_name)
+        return {"file": file_name, "sha256": sha}
+
+    regions: Dict[str, RegionInfo] = {}
+    for region in sorted(shards):
+        shard = shards[region]
+        regions[region] = RegionInfo(
+            **place(shard, old_regions.get(region), ""),
+            zones=list(shard["zones"]),
+            entities=list(shard["entities"]),
+            neighbors=sorted(neighbors[region]),
+        )
+
+    index = {
+        "version": REGION_INDEX_VERSION,
+        "core": {**place(core, old_core, f"{CORE_SHARD}-"), "entities": list(core["entities"])},
+        "regions": {region: asdict(info) for region, info in regions.items()},
+    }
+    # The new index only goes in once every shard it names is on disk
+    _write_index(regions_dir, index)
+
+    # Drop shards the new index no longer references (including leftovers of
+    # a save that crashed before writing its index)
+    for path in regions_dir.glob(f"*{binary_format.BINARY_SUFFIX}"):
+        if path.name not in used_files:
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+
+    return index
+
+
+def _shard_name(number: int, prefix: str = "") -> str:
+    return f"{prefix}{number:04d}{binary_format.BINARY_SUFFIX}"
+
+
+def _write_index(regions_dir: Path, index: Dict[str, Any]) -> None:
+    payload = json.dumps(index, separators=(",", ":"), ensure_ascii=False)
+    atomic_write(regions_dir / INDEX_FILENAME, payload.encode("utf-8"))
+
+
+def _read_index(regions_dir: Path) -> Dict[str, Any]:
+    try:
+        with open(regions_dir / INDEX_FILENAME, "r", encoding="utf-8") as f:
+            index = json.load(f)
+    except (OSError, ValueError) as e:
+        raise RegionStoreError(f"Cannot read region index in {regions_dir}: {e}") from e
+    if index.get("version", 0) > REGION_INDEX_VERSION:
+        raise RegionStoreError(
+            f"Region index v{index.get('version')} is newer than supported "
+            f"v{REGION_INDEX_VERSION}"
+        )
+    return index
+
+
+# =============================================================================
+# Lazy loading
+# =============================================================================
+
+
+class _LazySection(dict):
+    """
+    Dict of loaded zones or entities that pulls in a region on first lookup.
+
+    Indexing, get() and `in` consult the region index for IDs that are not
+    loaded yet. Iteration and len() only cover loaded items.
+    """
+
+    def __init__(self, loader: "RegionLoader", section: str):
+        super().__init__()
+        self._loader = loader
+        self._section = section
+
+    def __missing__(self, key: str) -> Any:
+        if self._loader._load_for(self._section, key):
+            return dict.__getitem__(self, key)
+        raise KeyError(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __contains__(self, key: object) -> bool:
+        if dict.__contains__(self, key):
+            return True
+        return isinstance(key, str) and self._loader._load_for(self._section, key)
+
+
+def ensure_loaded(state: GameState) -> GameState:
+    """
+    Materialize every region of a state returned by RegionLoader.load().
+
+    Exporting a partly loaded state would silently leave out the regions
+    that were never looked up. States that aren't lazy are returned as-is.
+    """
+    entities = state.entities
+    if isinstance(entities, _LazySection):
+        entities._loader.load_all()
+    return state
+
+
+class RegionLoader:
+    """Loads region shards on demand into a single lazily populated GameState."""
+
+    def __init__(self, directory: Union[str, Path]):
+        """
+        Open the region index of a save directory.
+
+        Args:
+            directory: Save directory containing a regions/ subdirectory
+
+        Raises:
+            RegionStoreError: If the index is missing or unreadable
+        """
+        self.regions_dir = Path(directory) / REGIONS_DIRNAME
+        self.index = _read_index(self.regions_dir)
+        self.regions: Dict[str, Dict[str, Any]] = self.index["regions"]
+
+        self._zone_regions = {
+            zid: region for region, info in self.regions.items() for zid in info["zones"]
+        }
+        self._entity_regions = {
+            eid: region
+            for region, info in self.regions.items()
+            for eid in info["entities"]
+        }
+        self.loaded_regions: Set[str] = set()
+        self.state: Optional[GameState] = None
+
+    def region_of_zone(self, zone_id: str) -> Optional[str]:
+        return self._zone_regions.get(zone_id)
+
+    def region_of_entity(self, entity_id: str) -> Optional[str]:
+        return self._entity_regions.get(entity_id)
+
+    def load(
+        self,
+        regions: Optional[Iterable[str]] = None,
+        zone_id: Optional[str] = None,
+        neighbors: int = 1,
+    ) -> GameState:
+        """
+        Build the lazy GameState and materialize the requested regions.
+
+        Args:
+            regions: Regions to load up front
+            zone_id: Alternatively, load the region containing this zone
+            neighbors: Also load regions within this many region hops
+
+        Returns:
+            GameState with scene, clocks and the requested regions loaded
+        """
+        if self.state is None:
+            self.state = self._load_core()
+
+        wanted = list(regions or [])
+        if zone_id is not None:
+            region = self.region_of_zone(zone_id)
+            if region is None:
+                raise RegionStoreError(f"Zone '{zone_id}' is not in the region index")
+            wanted.append(region)
+
+        for region in self._expand(wanted, neighbors):
+            self.load_region(region)
+        return self.state
+
+    def load_region(self, region: str) -> None:
+        """Materialize one region's zones and entities (no-op if loaded)."""
+        if region in self.loaded_regions:
+            return
+        info = self.regions.get(region)
+        if info is None:
+            raise RegionStoreError(f"Unknown region '{region}'")
+        if self.state is None:
+            self.state = self._load_core()
+
+        shard = self._read_shard(info)
+        built = binary_format.build_state(
+            {"zones": shard["zones"], "entities": shard["entities"], "scene": {}}
+        )
+        dict.update(self.state.zones, built.zones)
+        dict.update(self.state.entities, built.entities)
+        self.loaded_regions.add(region)
+
+    def load_all(self) -> GameState:
+        """Materialize every region."""
+        return self.load(regions=self.regions, neighbors=0)
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            "regions": len(self.regions),
+            "loaded_regions": len(self.loaded_regions),
+            "loaded_zones": dict.__len__(self.state.zones) if self.state else 0,
+            "loaded_entities": dict.__len__(self.state.entities) if self.state else 0,
+        }
+
+    def _expand(self, regions: List[str], depth: int) -> List[str]:
+        """Breadth-first expansion over the region neighbour graph."""
+        seen = set()
+        order = []
+        queue = deque((region, 0) for region in regions)
+        while queue:
+            region, distance = queue.popleft()
+            if region in seen:
+                continue
+            if region not in self.regions:
+                raise RegionStoreError(f"Unknown region '{region}'")
+            seen.add(region)
+            order.append(region)
+            if distance < depth:
+                for neighbor in self.regions[region]["neighbors"]:
+                    queue.append((neighbor, distance + 1))
+        return order
+
+    def _load_for(self, section: str, key: str) -> bool:
+        """Load the region holding a zone/entity ID; True if it now exists."""
+        region = (
+            self._zone_regions.get(key)
+            if section == "zones"
+            else self._entity_regions.get(key)
+        )
+        if region is None or region in self.loaded_regions:
+            return False
+        logger.debug(f"Lazy-loading region '{region}' for {section[:-1]} '{key}'")
+        self.load_region(region)
+        return dict.__contains__(getattr(self.state, section), key)
+
+    def _load_core(self) -> GameState:
+        shard = self._read_shard(self.index["core"])
+        built = binary_format.build_state(
+            {"scene": shard["scene"], "clocks": shard["clocks"], "entities": shard["entities"]}
+        )
+
+        entities = _LazySection(self, "entities")
+        dict.update(entities, built.entities)
+        zones = _LazySection(self, "zones")
+        return GameState.model_construct(
+            entities=entities, zones=zones, clocks=built.clocks, scene=built.scene
+        )
+
+    def _read_shard(self, info: Dict[str, Any]) -> Dict[str, Any]:
+        path = self.regions_dir / info["file"]
+        try:
+            blob = path.read_bytes()
+        except OSError as e:
+            raise RegionStoreError(f"Missing region shard {path}: {e}") from e
+        if hashlib.sha256(blob).hexdigest() != info["sha256"]:
+            raise RegionStoreError(f"Region shard {path} does not match the index")
+        try:
+            return binary_format.loads(blob)
+        except binary_format.BinaryFormatError as e:
+            raise RegionStoreError(f"Corrupted region shard {path}: {e}") from e
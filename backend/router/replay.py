@@ -0,0 +1,385 @@
+"""
+Replay Engine - Deterministic, headless re-execution of recorded sessions.
+
+A player turn in GameRouter.process_turn is more than one tool call: each
+planned step is validated and executed, its outcome resolved and its effects
+applied, and the turn order advances at the end. execute_step() and
+end_turn() are those state-changing parts, shared by the router and the
+replay engine so both run the same code.
+
+With a TurnRecorder attached to the router, every player turn is appended to
+a JSONL turn log: the text, the acting entity, each executed step's tool,
+args and seed, and a hash of the state after the turn. The replay engine
+takes the initial world and that log and re-runs each turn's steps with the
+recorded seeds. It never calls the planner or narrator LLMs. After each turn
+it compares the state hash with the recorded one and reports the first
+divergence and the throughput in turns per second.
+
+This works as a regression harness (behaviour changes show up as hash
+mismatches) and as a benchmark (python -m backend.router.replay).
+
+State hashes ignore wall-clock fields (created_at, last_changed_at,
+timestamp), so a replay hashes identically to the recorded run.
+"""
+
+import hashlib
+import json
+import logging
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union, TYPE_CHECKING
+
+from .effects import apply_effects
+from .game_state import GameState, Utterance
+from .rng import RNGContext
+
+if TYPE_CHECKING:
+    from .validator import ToolResult, Validator
+
+logger = logging.getLogger(__name__)
+
+
+# Wall-clock fields that legitimately differ between a run and its replay
+VOLATILE_KEYS = frozenset({"created_at", "last_changed_at", "timestamp", "ts"})
+
+
+class ReplayError(Exception):
+    """Raised for unreadable turn logs or initial states."""
+
+    pass
+
+
+def _strip_volatile(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {
+            k: _strip_volatile(v) for k, v in value.items() if k not in VOLATILE_KEYS
+        }
+    if isinstance(value, list):
+        return [_strip_volatile(v) for v in value]
+    return value
+
+
+def state_hash(state: GameState) -> str:
+    """Deterministic hash of a GameState's persistent content."""
+    data = state.to_save_format(include_runtime_data=True)
+    data["current_actor"] = state.current_actor
+    encoded = json.dumps(
+        _strip_volatile(data),
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=str,
+    ).encode("utf-8")
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+# =============================================================================
+# Turn steps
+# =============================================================================
+
+
+def execute_step(
+    validator: "Validator",
+    state: GameState,
+    utterance: Utterance,
+    tool_id: str,
+    args: Dict[str, Any],
+    seed: int,
+) -> "ToolResult":
+    """
+    Execute one planned step: validate and run the tool, then resolve its
+    outcome. Effects are left to the caller (see GameRouter.process_turn).
+
+    Outcome variants are picked from the seed's "outcome" stream, as in the
+    validator, so a replay with the same seed picks the same ones.
+    """
+    from .outcome_resolver import resolve_outcome
+
+    result = validator.validate_and_execute(tool_id, args, state, utterance, seed)
+    if result.ok:
+        result = resolve_outcome(result, state, rng=RNGContext(seed).stream("outcome"))
+    return result
+
+
+def end_turn(state: GameState) -> None:
+    """Pass the turn to the next actor after a player turn (no-op without a turn order)."""
+    if state.scene.turn_order:
+        # Increments the round after the last actor
+        state.scene.turn_scheduler.advance()
+
+
+# =============================================================================
+# Recording
+# =============================================================================
+
+
+class TurnRecorder:
+    """
+    Appends one replayable JSONL record per player turn.
+
+    Usage:
+        router.turn_recorder = TurnRecorder("turns.jsonl")
+    """
+
+    def __init__(self, path: Union[str, Path], hash_states: bool = True):
+        """
+        Args:
+            path: Turn log to append to
+            hash_states: Record a state hash per turn (costs a state dump)
+        """
+        self.path = Path(path)
+        self.hash_states = hash_states
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "a", encoding="utf-8")
+
+    def record_turn(
+        self,
+        utterance: Utterance,
+        steps: List[Dict[str, Any]],
+        state: GameState,
+        ended: bool = True,
+    ) -> None:
+        """
+        Append a player turn.
+
+        Args:
+            utterance: Player text and acting entity
+            steps: Executed steps as {"tool", "args", "seed", "ok"}
+            state: State after the turn
+            ended: Whether end_turn() ran (False if the turn was aborted)
+        """
+        record = {
+            "player_text": utterance.text,
+            "actor_id": utterance.actor_id,
+            "steps": steps,
+            "ended": ended,
+        }
+        if self.hash_states:
+            record["state_hash"] = state_hash(state)
+        self._file.write(json.dumps(record, default=str) + "\n")
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> "TurnRecorder":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+def read_turn_log(path: Union[str, Path]) -> Iterator[Dict[str, Any]]:
+    """
+    Yield replayable turns from a JSONL turn log.
+
+    Lines without steps (e.g. other log records) are skipped.
+
+    Raises:
+        ReplayError: If a line is not valid JSON
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ReplayError(f"{path}:{line_number}: invalid JSON ({e})") from e
+            if isinstance(record, dict) and "steps" in record:
+                yield record
+
+
+def load_initial_state(source: Union[GameState, str, Path]) -> GameState:
+    """A GameState, a binary save or a JSON world/save file."""
+    if isinstance(source, GameState):
+        return source
+
+    from . import binary_format
+
+    try:
+        if binary_format.is_binary_save(source):
+            return binary_format.load_state(source)
+        with open(source, "r", encoding="utf-8") as f:
+            return GameState.model_validate(json.load(f))
+    except (OSError, ValueError, binary_format.BinaryFormatError) as e:
+        raise ReplayError(f"Cannot load initial state from {source}: {e}") from e
+
+
+# =============================================================================
+# Replay
+# =============================================================================
+
+
+@dataclass
+class ReplayReport:
+    """Outcome of a replay run."""
+
+    turns: int = 0
+    verified: int = 0
+    mismatches: List[Dict[str, Any]] = field(default_factory=list)
+    failed_turns: List[str] = field(default_factory=list)
+    execution_seconds: float = 0.0
+    hashing_seconds: float = 0.0
+    final_state: Optional[GameState] = None
+    stopped_early: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return not self.mismatches
+
+    @property
+    def turns_per_second(self) -> float:
+        if self.execution_seconds <= 0:
+            return 0.0
+        return self.turns / self.execution_seconds
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "turns": self.turns,
+            "verified": self.verified,
+            "mismatches": len(self.mismatches),
+            "failed_turns": len(self.failed_turns),
+            "execution_seconds": round(self.execution_seconds, 4),
+            "hashing_seconds": round(self.hashing_seconds, 4),
+            "turns_per_second": round(self.turns_per_second, 1),
+            "ok": self.ok,
+        }
+
+
+class ReplayEngine:
+    """Re-executes turn logs against an initial state."""
+
+    def __init__(self, validator: Optional["Validator"] = None):
+        """
+        Args:
+            validator: Validator to replay with (default: a fresh one, so the
+                turn counter and any caches start clean)
+        """
+        if validator is None:
+            from .validator import Validator
+
+            validator = Validator()
+        self.validator = validator
+
+    def run(
+        self,
+        initial_state: Union[GameState, str, Path],
+        turns: Union[Iterable[Dict[str, Any]], str, Path],
+        verify: bool = True,
+        stop_on_mismatch: bool = False,
+    ) -> ReplayReport:
+        """
+        Replay turns against a state (which is mutated in place).
+
+        Args:
+            initial_state: GameState or path to the initial save
+            turns: Turn records or path to a JSONL turn log
+            verify: Compare recorded state hashes after each turn
+            stop_on_mismatch: Stop at the first divergence
+
+        Returns:
+            ReplayReport with mismatches and throughput
+        """
+        state = load_initial_state(initial_state)
+        if isinstance(turns, (str, Path)):
+            turns = read_turn_log(turns)
+
+        report = ReplayReport(final_state=state)
+        for index, record in enumerate(turns):
+            steps = record.get("steps", [])
+            utterance = Utterance(
+                text=record.get("player_text", ""),
+                actor_id=record.get("actor_id") or state.current_actor or "",
+            )
+
+            started = time.perf_counter()
+            ok = self._replay_turn(state, utterance, steps, record.get("ended", True))
+            report.execution_seconds += time.perf_counter() - started
+            report.turns += 1
+            if not ok:
+                report.failed_turns.append(str(index))
+
+            expected = record.get("state_hash")
+            if not verify or expected is None:
+                continue
+
+            started = time.perf_counter()
+            actual = state_hash(state)
+            report.hashing_seconds += time.perf_counter() - started
+            report.verified += 1
+            if actual != expected:
+                report.mismatches.append(
+                    {
+                        "index": index,
+                        "player_text": utterance.text,
+                        "tools": [step.get("tool") for step in steps],
+                        "expected": expected,
+                        "actual": actual,
+                    }
+                )
+                logger.warning(f"Replay diverged at turn {index} ({utterance.text!r})")
+                if stop_on_mismatch:
+                    report.stopped_early = True
+                    break
+
+        return report
+
+    def _replay_turn(
+        self,
+        state: GameState,
+        utterance: Utterance,
+        steps: List[Dict[str, Any]],
+        ended: bool,
+    ) -> bool:
+        """Re-run one turn's steps as GameRouter.process_turn ran them; True if all succeeded."""
+        ok = True
+        for step in steps:
+            result = execute_step(
+                self.validator,
+                state,
+                utterance,
+                step.get("tool", ""),
+                step.get("args", {}),
+                step.get("seed"),
+            )
+            if not result.ok:
+                ok = False
+            elif result.effects:
+                try:
+                    apply_effects(state, result.effects)
+                except Exception as e:
+                    logger.warning(f"Replayed effects failed: {e}")
+                    ok = False
+        if ended:
+            end_turn(state)
+        return ok
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Replay a recorded AID&D session")
+    parser.add_argument("initial_state", help="Initial world (JSON or .gsb)")
+    parser.add_argument("turn_log", help="JSONL turn log written by TurnRecorder")
+    parser.add_argument("--no-verify", action="store_true", help="Skip hash checks")
+    parser.add_argument(
+        "--stop-on-mismatch", action="store_true", help="Stop at the first divergence"
+    )
+    args = parser.parse_args(argv)
+
+    report = ReplayEngine().run(
+        args.initial_state,
+        args.turn_log,
+        verify=not args.no_verify,
+        stop_on_mismatch=args.stop_on_mismatch,
+    )
+    print(json.dumps(report.summary(), indent=2))
+    for mismatch in report.mismatches[:10]:
+        print(f"  mismatch: {json.dumps(mismatch)}")
+    return 0 if report.ok else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
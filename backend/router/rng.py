@@ -0,0 +1,59 @@
+"""
+RNG Context - Per-turn random source derived from the turn seed.
+
+Tool executors used to call random.seed(seed) on the global random module,
+so two turns running at once (e.g. two sessions in different threads)
+reseeded and drew from the same generator and their rolls interleaved. An
+RNGContext is a random.Random of its own, created once per turn from the
+turn seed and passed down to the executors, dice rolls and outcome
+selection.
+
+For a given seed it produces exactly the rolls random.seed(seed) used to, so
+seeded replays and recorded turns are unchanged.
+
+stream(name) derives an independent generator for one purpose (e.g.
+"outcome"), so that drawing more dice in one step does not shift the results
+of another.
+"""
+
+import hashlib
+import random
+import time
+from typing import Optional
+
+
+class RNGContext(random.Random):
+    """Random source for one turn."""
+
+    def __init__(self, turn_seed: Optional[int] = None):
+        """
+        Args:
+            turn_seed: Seed for the turn (None = seeded from the OS)
+        """
+        self.turn_seed = turn_seed
+        super().__init__(turn_seed)
+
+    def stream(self, name: str) -> random.Random:
+        """
+        Independent generator for one named purpose within the turn.
+
+        Derived from the turn seed and the name only, so it does not depend
+        on how much of the main sequence has been used.
+        """
+        if self.turn_seed is None:
+            return random.Random(self.getrandbits(64))
+        digest = hashlib.blake2b(
+            f"{self.turn_seed}:{name}".encode("utf-8"), digest_size=8
+        ).digest()
+        return random.Random(int.from_bytes(digest, "big"))
+
+    def __reduce__(self):
+        return self.__class__, (self.turn_seed,), self.getstate()
+
+    def __repr__(self) -> str:
+        return f"RNGContext(turn_seed={self.turn_seed!r})"
+
+
+def new_turn_seed() -> int:
+    """Seed for a turn that was not given one (derived from the clock)."""
+    return int(time.time() * 1000) % 10000
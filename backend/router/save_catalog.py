@@ -0,0 +1,434 @@
+"""
+Save Catalog - SQLite index of saves, backups and exports.
+
+PersistenceManager.list_saves used to walk the save directory and parse every
+manifest.json on each call, which slows down linearly with the number of saves
+and backups. The catalog keeps one row per save (metadata, file sizes,
+timestamps and world stats), one row per backup file (with the checksum of
+the version it preserved and the one that replaced it), and one row per
+export. The manager updates it in a transaction on every save, delete and
+export, so listings become indexed, paged queries.
+
+The catalog is derived data: rebuild() recreates it from the manifests on
+disk, which the manager does automatically the first time it opens an empty
+catalog next to existing saves.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+
+CATALOG_FILENAME = "catalog.sqlite"
+
+# list_saves sort keys -> SQL columns
+SORT_COLUMNS = {
+    "created": "created",
+    "first_saved": "first_saved",
+    "name": "name",
+    "size": "total_size",
+    "entities": "entity_count",
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS saves (
+    name TEXT PRIMARY KEY,
+    created TEXT,
+    first_saved TEXT,
+    files TEXT NOT NULL,
+    file_info TEXT NOT NULL,
+    metadata TEXT NOT NULL,
+    total_size INTEGER NOT NULL DEFAULT 0,
+    entity_count INTEGER,
+    zone_count INTEGER,
+    clock_count INTEGER
+);
+CREATE INDEX IF NOT EXISTS saves_created ON saves (created);
+CREATE INDEX IF NOT EXISTS saves_first_saved ON saves (first_saved);
+CREATE INDEX IF NOT EXISTS saves_size ON saves (total_size);
+
+CREATE TABLE IF NOT EXISTS backups (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    save_name TEXT NOT NULL,
+    file_type TEXT NOT NULL,
+    path TEXT NOT NULL UNIQUE,
+    created TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    source_sha256 TEXT,
+    replaced_by_sha256 TEXT
+);
+CREATE INDEX IF NOT EXISTS backups_lineage ON backups (save_name, file_type, created);
+
+CREATE TABLE IF NOT EXISTS exports (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    save_name TEXT NOT NULL,
+    path TEXT NOT NULL,
+    created TEXT NOT NULL,
+    file_types TEXT
+);
+
+CREATE TABLE IF NOT EXISTS catalog_info (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+class SaveCatalog:
+    """Transactional SQLite catalog of saves for a PersistenceManager."""
+
+    def __init__(self, db_path: Union[str, Path]):
+        """
+        Open (or create) a catalog database.
+
+        Args:
+            db_path: SQLite file path (":memory:" for a throwaway catalog)
+        """
+        self.db_path = str(db_path)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._conn:
+            self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+
+    def record_save(
+        self,
+        name: str,
+        manifest: Dict[str, Any],
+        file_info: Dict[str, Dict[str, Any]],
+        total_size: int,
+        stats: Optional[Dict[str, int]] = None,
+        backups: Iterable[Dict[str, Any]] = (),
+    ) -> None:
+        """
+        Insert or update a save and any backups it produced, atomically.
+
+        Args:
+            name: Save name
+            manifest: The manifest written for the save
+            file_info: Per file type {"size", "modified"}
+            total_size: Bytes used by the save's files (excluding backups)
+            stats: World stats ({"entities", "zones", "clocks"})
+            backups: Backup rows created by this save ({"file_type", "path",
+                "created", "size", "source_sha256", "replaced_by_sha256"})
+        """
+        stats = stats or {}
+        with self._lock, self._conn:
+            existing = self._conn.execute(
+                "SELECT first_saved FROM saves WHERE name = ?", (name,)
+            ).fetchone()
+            # "created" mirrors the manifest (time of the latest save), while
+            # "first_saved" keeps the time the save name was first written
+            first_saved = existing["first_saved"] if existing else manifest.get("created")
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO saves (
+                    name, created, first_saved, files, file_info, metadata,
+                    total_size, entity_count, zone_count, clock_count
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    name,
+                    manifest.get("created"),
+                    first_saved,
+                    json.dumps(manifest.get("files", [])),
+                    json.dumps(file_info),
+                    json.dumps(manifest.get("metadata", {})),
+                    total_size,
+                    stats.get("entities"),
+                    stats.get("zones"),
+                    stats.get("clocks"),
+                ),
+            )
+            self._conn.executemany(
+                """
+                INSERT OR REPLACE INTO backups (
+                    save_name, file_type, path, created, size,
+                    source_sha256, replaced_by_sha256
+                ) VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                [
+                    (
+                        name,
+                        backup["file_type"],
+                        str(backup["path"]),
+                        backup["created"],
+                        backup["size"],
+                        backup.get("source_sha256"),
+                        backup.get("replaced_by_sha256"),
+                    )
+                    for backup in backups
+                ],
+            )
+
+    def remove_save(self, name: str) -> None:
+        """Drop a save and everything recorded about it."""
+        with self._lock, self._conn:
+            for table, column in (
+                ("saves", "name"),
+                ("backups", "save_name"),
+                ("exports", "save_name"),
+            ):
+                self._conn.execute(f"DELETE FROM {table} WHERE {column} = ?", (name,))
+
+    def record_export(
+        self, name: str, path: Union[str, Path], file_types: Optional[List[str]]
+    ) -> None:
+        """Record that a save was exported."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO exports (save_name, path, created, file_types) VALUES (?, ?, ?, ?)",
+                (
+                    name,
+                    str(path),
+                    datetime.now(timezone.utc).isoformat(),
+                    json.dumps(file_types) if file_types is not None else None,
+                ),
+            )
+
+    def remove_backups(self, paths: Iterable[Union[str, Path]]) -> None:
+        """Forget backup rows (after their files were deleted)."""
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "DELETE FROM backups WHERE path = ?", [(str(p),) for p in paths]
+            )
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def list_saves(
+        self,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        sort_by: str = "created",
+        descending: bool = True,
+    ) -> List[Dict[str, Any]]:
+        """
+        Page through saves.
+
+        Args:
+            limit: Maximum rows to return (None = all)
+            offset: Rows to skip
+            sort_by: One of SORT_COLUMNS
+            descending: Sort direction
+
+        Returns:
+            Save info dictionaries in the list_saves format, plus
+            "first_saved", "total_size", "stats" and "backup_count"
+        """
+        column = SORT_COLUMNS.get(sort_by)
+        if column is None:
+            raise ValueError(f"Unknown sort key '{sort_by}'. Use one of {sorted(SORT_COLUMNS)}")
+        direction = "DESC" if descending else "ASC"
+
+        query = f"""
+            SELECT saves.*,
+                   (SELECT COUNT(*) FROM backups WHERE backups.save_name = saves.name)
+                       AS backup_count
+            FROM saves
+            ORDER BY {column} {direction}, name {direction}
+            LIMIT ? OFFSET ?
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                query, (limit if limit is not None else -1, offset)
+            ).fetchall()
+        return [self._row_to_info(row) for row in rows]
+
+    def count_saves(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM saves").fetchone()[0]
+
+    def get_save(self, name: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                """
+                SELECT saves.*,
+                       (SELECT COUNT(*) FROM backups WHERE backups.save_name = saves.name)
+                           AS backup_count
+                FROM saves WHERE name = ?
+                """,
+                (name,),
+            ).fetchone()
+        return self._row_to_info(row) if row else None
+
+    def list_backups(
+        self, save_name: str, file_type: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Backup lineage for a save, newest first."""
+        query = "SELECT * FROM backups WHERE save_name = ?"
+        params: Tuple[Any, ...] = (save_name,)
+        if file_type is not None:
+            query += " AND file_type = ?"
+            params += (file_type,)
+        query += " ORDER BY created DESC, id DESC"
+        with self._lock:
+            return [dict(row) for row in self._conn.execute(query, params).fetchall()]
+
+    def list_exports(self, save_name: str) -> List[Dict[str, Any]]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM exports WHERE save_name = ? ORDER BY id DESC", (save_name,)
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def backups_to_prune(
+        self,
+        keep: int,
+        save_name: Optional[str] = None,
+        older_than: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Backups outside the retention policy.
+
+        Args:
+            keep: Newest backups to keep per (save, file type)
+            save_name: Restrict to one save
+            older_than: Only prune backups created before this ISO timestamp
+
+        Returns:
+            Backup rows that can be deleted
+        """
+        query = """
+            SELECT * FROM (
+                SELECT backups.*,
+                       ROW_NUMBER() OVER (
+                           PARTITION BY save_name, file_type
+                           ORDER BY created DESC, id DESC
+                       ) AS rank
+                FROM backups
+                WHERE (? IS NULL OR save_name = ?)
+            )
+            WHERE rank > ? AND (? IS NULL OR created < ?)
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                query, (save_name, save_name, keep, older_than, older_than)
+            ).fetchall()
+        return [{k: row[k] for k in row.keys() if k != "rank"} for row in rows]
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def is_initialized(self) -> bool:
+        """Whether the catalog has been populated from disk at least once."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM catalog_info WHERE key = 'initialized'"
+            ).fetchone()
+        return row is not None
+
+    def mark_initialized(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO catalog_info (key, value) VALUES ('initialized', ?)",
+                (datetime.now(timezone.utc).isoformat(),),
+            )
+
+    def rebuild(self, base_path: Union[str, Path]) -> int:
+        """
+        Recreate the catalog from the manifests under base_path.
+
+        Backups are discovered by their file names (lineage checksums are
+        unknown for backups found this way).
+
+        Returns:
+            Number of saves indexed
+        """
+        base_path = Path(base_path)
+        with self._lock, self._conn:
+            for table in ("saves", "backups"):
+                self._conn.execute(f"DELETE FROM {table}")
+
+        indexed = 0
+        for save_dir in sorted(p for p in base_path.iterdir() if p.is_dir()):
+            manifest_path = save_dir / "manifest.json"
+            if not manifest_path.exists():
+                continue
+            try:
+                with open(manifest_path, "r", encoding="utf-8") as f:
+                    manifest = json.load(f)
+            except (OSError, ValueError):
+                # Skip corrupted manifest files
+                continue
+
+            name = manifest.get("save_name", save_dir.name)
+            file_info, total_size = describe_files(save_dir, manifest.get("files", []))
+            backups = [
+                {
+                    "file_type": backup.name.split(".")[0],
+                    "path": str(backup),
+                    "created": datetime.fromtimestamp(
+                        backup.stat().st_mtime, tz=timezone.utc
+                    ).isoformat(),
+                    "size": backup.stat().st_size,
+                }
+                for backup in sorted(save_dir.glob("*.bak.*.json"))
+            ]
+            self.record_save(name, manifest, file_info, total_size, backups=backups)
+            indexed += 1
+
+        self.mark_initialized()
+        return indexed
+
+    @staticmethod
+    def _row_to_info(row: sqlite3.Row) -> Dict[str, Any]:
+        return {
+            "name": row["name"],
+            "created": row["created"],
+            "first_saved": row["first_saved"],
+            "files": json.loads(row["files"]),
+            "file_info": json.loads(row["file_info"]),
+            "metadata": json.loads(row["metadata"]),
+            "total_size": row["total_size"],
+            "stats": {
+                "entities": row["entity_count"],
+                "zones": row["zone_count"],
+                "clocks": row["clock_count"],
+            },
+            "backup_count": row["backup_count"],
+        }
+
+
+def describe_files(
+    save_dir: Path, file_types: Iterable[str]
+) -> Tuple[Dict[str, Dict[str, Any]], int]:
+    """
+    Size/mtime of a save's files and the total bytes they use.
+
+    Returns:
+        (file_info keyed by file type, total size including delta logs)
+    """
+    file_info = {}
+    total_size = 0
+    for file_type in file_types:
+        for path in (save_dir / f"{file_type}.json", save_dir / f"{file_type}.delta.jsonl"):
+            if not path.exists():
+                continue
+            stat = path.stat()
+            total_size += stat.st_size
+            if path.suffix == ".json":
+                file_info[file_type] = {
+                    "size": stat.st_size,
+                    "modified": datetime.fromtimestamp(
+                        stat.st_mtime, tz=timezone.utc
+                    ).isoformat(),
+                }
+    return file_info, total_size
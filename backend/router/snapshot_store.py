@@ -0,0 +1,349 @@
+"""
+Snapshot Store - Content-addressed GameState history for time travel.
+
+Scene.last_effect_log records what changed, but undoing a turn or jumping back
+to an earlier one needs the whole state. Keeping a full GameState copy per
+turn costs O(world size) every turn. The snapshot store stores each entity,
+zone and clock dump (and the scene) as an immutable object keyed by its
+content hash, so unchanged objects are shared between turns.
+
+Each commit points to a tree of hashes:
+
+    commit -> {"tree": root, "parent": commit, "branch", "label", ...}
+    root   -> {"entities": section, "zones": section, "clocks": section,
+               "scene": object, "top": object}
+    section -> {bucket: bucket_hash}     (256 buckets keyed by id hash)
+    bucket  -> {object_id: object_hash}
+
+A turn that changes k objects writes at most k objects, k buckets, the changed
+sections, a root and a commit. Branches are named pointers to commits, so
+forking a session copies nothing. Diffing two commits skips every subtree
+whose hash matches.
+
+Objects live in memory or under a directory (objects/ab/cdef..., written
+once, atomically), with branch heads in refs.json.
+"""
+
+import hashlib
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union, TYPE_CHECKING
+
+from .atomic_io import atomic_write
+
+if TYPE_CHECKING:
+    from .game_state import GameState
+
+
+SECTIONS = ("entities", "zones", "clocks")
+# Top-level GameState fields kept alongside the save-format sections
+TOP_FIELDS = ("pending_action", "current_actor", "turn_flags")
+REFS_FILENAME = "refs.json"
+
+
+class SnapshotError(Exception):
+    """Raised for unknown refs, missing objects or branch conflicts."""
+
+    pass
+
+
+def _encode(value: Any) -> bytes:
+    return json.dumps(
+        value, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str
+    ).encode("utf-8")
+
+
+def _hash(payload: bytes) -> str:
+    return hashlib.blake2b(payload, digest_size=20).hexdigest()
+
+
+def _bucket(object_id: str) -> str:
+    return hashlib.blake2b(object_id.encode("utf-8"), digest_size=1).hexdigest()
+
+
+class SnapshotStore:
+    """Deduplicated, branchable history of GameState snapshots."""
+
+    def __init__(self, path: Optional[Union[str, Path]] = None):
+        """
+        Open a snapshot store.
+
+        Args:
+            path: Directory to persist objects and refs in (None = in memory)
+        """
+        self.path = Path(path) if path is not None else None
+        self._objects: Dict[str, bytes] = {}
+        self._cache: Dict[str, Any] = {}  # Decoded tree nodes
+        self.refs: Dict[str, str] = {}
+        self.stats = {"objects_written": 0, "bytes_written": 0, "objects_reused": 0}
+
+        if self.path is not None:
+            (self.path / "objects").mkdir(parents=True, exist_ok=True)
+            refs_path = self.path / REFS_FILENAME
+            if refs_path.exists():
+                self.refs = json.loads(refs_path.read_text(encoding="utf-8"))
+
+    # ------------------------------------------------------------------
+    # Objects
+    # ------------------------------------------------------------------
+
+    def put(self, value: Any) -> str:
+        """Store a JSON-safe value (if new) and return its hash."""
+        payload = _encode(value)
+        digest = _hash(payload)
+        if self._has(digest):
+            self.stats["objects_reused"] += 1
+            return digest
+
+        if self.path is None:
+            self._objects[digest] = payload
+        else:
+            self._write_object(digest, payload)
+        self.stats["objects_written"] += 1
+        self.stats["bytes_written"] += len(payload)
+        return digest
+
+    def get(self, digest: str) -> Any:
+        """Load a stored value by hash."""
+        if digest in self._cache:
+            return self._cache[digest]
+        if self.path is None:
+            payload = self._objects.get(digest)
+        else:
+            try:
+                payload = self._object_path(digest).read_bytes()
+            except FileNotFoundError:
+                payload = None
+        if payload is None:
+            raise SnapshotError(f"Missing snapshot object {digest}")
+        return json.loads(payload)
+
+    def _node(self, digest: str) -> Dict[str, Any]:
+        """Load a tree node, cached (nodes are shared across many commits)."""
+        node = self._cache.get(digest)
+        if node is None:
+            node = self.get(digest)
+            self._cache[digest] = node
+        return node
+
+    def _put_node(self, node: Dict[str, Any]) -> str:
+        digest = self.put(node)
+        self._cache[digest] = node
+        return digest
+
+    def _has(self, digest: str) -> bool:
+        if self.path is None:
+            return digest in self._objects
+        return digest in self._cache or self._object_path(digest).exists()
+
+    def _object_path(self, digest: str) -> Path:
+        return self.path / "objects" / digest[:2] / digest[2:]
+
+    def _write_object(self, digest: str, payload: bytes) -> None:
+        path = self._object_path(digest)
+        path.parent.mkdir(exist_ok=True)
+        atomic_write(path, payload)
+
+    # ------------------------------------------------------------------
+    # Commits
+    # ------------------------------------------------------------------
+
+    def commit(
+        self,
+        state: "GameState",
+        branch: str = "main",
+        label: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """
+        Snapshot a GameState as the new head of a branch.
+
+        Args:
+            state: Game state to snapshot
+            branch: Branch to advance (created if it doesn't exist)
+            label: Optional human-readable label (e.g. "turn 12")
+            metadata: Extra JSON-safe data stored with the commit
+
+        Returns:
+            Commit hash
+        """
+        data = state.to_save_format(include_runtime_data=True)
+        parent = self.refs.get(branch)
+
+        root = {
+            "scene": self.put(data["scene"]),
+            "top": self.put({name: getattr(state, name) for name in TOP_FIELDS}),
+        }
+        for section in SECTIONS:
+            root[section] = self._put_section(data.get(section, {}))
+
+        commit = {
+            "tree": self._put_node(root),
+            "parent": parent,
+            "branch": branch,
+            "label": label,
+            "round": state.scene.round,
+            "turn_index": state.scene.turn_index,
+            "created": datetime.now(timezone.utc).isoformat(),
+            "metadata": metadata or {},
+        }
+        commit_id = self._put_node(commit)
+        self._set_ref(branch, commit_id)
+        return commit_id
+
+    def _put_section(self, items: Dict[str, Any]) -> str:
+        """Store a section; unchanged buckets hash to nodes already stored."""
+        buckets: Dict[str, Dict[str, str]] = {}
+        for object_id, value in items.items():
+            buckets.setdefault(_bucket(object_id), {})[object_id] = self.put(value)
+        return self._put_node(
+            {key: self._put_node(bucket) for key, bucket in buckets.items()}
+        )
+
+    # ------------------------------------------------------------------
+    # Refs
+    # ------------------------------------------------------------------
+
+    @property
+    def branches(self) -> Dict[str, str]:
+        return dict(self.refs)
+
+    def branch(self, name: str, from_ref: str = "main") -> str:
+        """
+        Create a branch pointing at an existing commit.
+
+        Raises:
+            SnapshotError: If the branch already exists
+        """
+        if name in self.refs:
+            raise SnapshotError(f"Branch '{name}' already exists")
+        commit_id = self.resolve(from_ref)
+        self._set_ref(name, commit_id)
+        return commit_id
+
+    def delete_branch(self, name: str) -> None:
+        """Drop a branch pointer (its objects stay in the store)."""
+        if self.refs.pop(name, None) is None:
+            raise SnapshotError(f"Unknown branch '{name}'")
+        self._save_refs()
+
+    def reset(self, branch: str, ref: str) -> str:
+        """Move a branch head to another commit (e.g. to undo turns)."""
+        commit_id = self.resolve(ref)
+        self._set_ref(branch, commit_id)
+        return commit_id
+
+    def resolve(self, ref: str) -> str:
+        """
+        Turn a branch name, commit hash or "ref~N" (N parents back) into a
+        commit hash.
+        """
+        base, _, back = ref.partition("~")
+        commit_id = self.refs.get(base, base)
+        if not self._has(commit_id) or "tree" not in self._node(commit_id):
+            raise SnapshotError(f"Unknown snapshot ref '{ref}'")
+        for _ in range(int(back) if back else 0):
+            commit_id = self._node(commit_id)["parent"]
+            if commit_id is None:
+                raise SnapshotError(f"'{ref}' goes past the first snapshot")
+        return commit_id
+
+    def _set_ref(self, branch: str, commit_id: str) -> None:
+        self.refs[branch] = commit_id
+        self._save_refs()
+
+    def _save_refs(self) -> None:
+        if self.path is not None:
+            atomic_write(
+                self.path / REFS_FILENAME, json.dumps(self.refs, indent=2).encode("utf-8")
+            )
+
+    # ------------------------------------------------------------------
+    # Reading history
+    # ------------------------------------------------------------------
+
+    def log(self, ref: str = "main", limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Commits from ref back to the first snapshot, newest first."""
+        history = []
+        commit_id: Optional[str] = self.resolve(ref)
+        while commit_id is not None and (limit is None or len(history) < limit):
+            commit = self._node(commit_id)
+            history.append({"id": commit_id, **commit})
+            commit_id = commit["parent"]
+        return history
+
+    def load_data(self, ref: str) -> Dict[str, Any]:
+        """Save-format data (plus top-level fields) of a commit."""
+        root = self._node(self._node(self.resolve(ref))["tree"])
+        data: Dict[str, Any] = {"scene": self.get(root["scene"])}
+        for section in SECTIONS:
+            data[section] = {
+                object_id: self.get(object_hash)
+                for bucket_hash in self._node(root[section]).values()
+                for object_id, object_hash in self._node(bucket_hash).items()
+            }
+        data.update(self.get(root["top"]))
+        return data
+
+    def checkout(self, ref: str) -> "GameState":
+        """Rebuild the GameState stored at a commit."""
+        from .binary_format import build_state
+
+        data = self.load_data(ref)
+        state = build_state(data)
+        for name in TOP_FIELDS:
+            setattr(state, name, data.get(name))
+        return state
+
+    def diff(self, ref_a: str, ref_b: str) -> Dict[str, Any]:
+        """
+        Objects that differ between two commits.
+
+        Returns:
+            {"entities"/"zones"/"clocks": {"added", "removed", "changed"},
+             "scene": bool, "top": bool}
+        """
+        root_a = self._node(self._node(self.resolve(ref_a))["tree"])
+        root_b = self._node(self._node(self.resolve(ref_b))["tree"])
+        result: Dict[str, Any] = {
+            "scene": root_a["scene"] != root_b["scene"],
+            "top": root_a["top"] != root_b["top"],
+        }
+        for section in SECTIONS:
+            result[section] = self._diff_section(root_a[section], root_b[section])
+        return result
+
+    def _diff_section(self, hash_a: str, hash_b: str) -> Dict[str, List[str]]:
+        changes: Dict[str, List[str]] = {"added": [], "removed": [], "changed": []}
+        if hash_a == hash_b:
+            return changes
+
+        section_a, section_b = self._node(hash_a), self._node(hash_b)
+        for key in set(section_a) | set(section_b):
+            bucket_a, bucket_b = section_a.get(key), section_b.get(key)
+            if bucket_a == bucket_b:
+                continue
+            items_a = self._node(bucket_a) if bucket_a else {}
+            items_b = self._node(bucket_b) if bucket_b else {}
+            for object_id in items_b.keys() - items_a.keys():
+                changes["added"].append(object_id)
+            for object_id in items_a.keys() - items_b.keys():
+                changes["removed"].append(object_id)
+            for object_id in items_a.keys() & items_b.keys():
+                if items_a[object_id] != items_b[object_id]:
+                    changes["changed"].append(object_id)
+
+        for ids in changes.values():
+            ids.sort()
+        return changes
+
+    def get_stats(self) -> Dict[str, Any]:
+        if self.path is None:
+            count = len(self._objects)
+            size = sum(len(payload) for payload in self._objects.values())
+        else:
+            files = [p for p in (self.path / "objects").rglob("*") if p.is_file()]
+            count = len(files)
+            size = sum(p.stat().st_size for p in files)
+        return dict(self.stats, objects=count, bytes=size, branches=len(self.refs))
@@ -18,7 +18,7 @@ Benefits:
 import json
 import logging
 from typing import Dict, Any, List, Optional, Union, Literal, get_origin, get_args
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from openai import OpenAI
 import inspect
 from pydantic import BaseModel
@@ -26,6 +26,7 @@ from pydantic.fields import FieldInfo
 
 from .game_state import GameState, Utterance
 from .tool_catalog import TOOL_CATALOG
+from .intent_cache import IntentCache
 
 logger = logging.getLogger(__name__)
 
@@ -177,6 +178,9 @@ class WorldContext:
     visible_exits: List[str]
     actor_inventory: List[str]
     actor_id: str
+    # IDs the player text refers to, resolved through the state's name index
+    mentioned_targets: List[str] = field(default_factory=list)
+    mentioned_exits: List[str] = field(default_factory=list)
 
 
 @dataclass
@@ -209,8 +213,19 @@ class StagedPlanner:
         model: Optional[str] = None,
         max_tokens: Optional[int] = None,
         temperature: Optional[float] = None,
+        intent_cache: Optional[IntentCache] = None,
     ):
-        """Initialize the staged planner."""
+        """
+        Initialize the staged planner.
+
+        Args:
+            api_key: OpenAI API key
+            model: Planning model (defaults to config.PLANNING_MODEL)
+            max_tokens: Token limit for planner calls
+            temperature: Sampling temperature for planner calls
+            intent_cache: Cache for Stage 1 results. When omitted, one is
+                built from the INTENT_CACHE_* config settings.
+        """
         import config
 
         self.client = OpenAI(api_key=api_key)
@@ -218,6 +233,14 @@ class StagedPlanner:
         self.max_tokens = max_tokens or config.PLANNING_MAX_TOKENS
         self.temperature = temperature or config.PLANNING_TEMPERATURE
 
+        if intent_cache is None and getattr(config, "INTENT_CACHE_ENABLED", True):
+            intent_cache = IntentCache(
+                max_entries=getattr(config, "INTENT_CACHE_MAX_ENTRIES", 1024),
+                ttl_seconds=getattr(config, "INTENT_CACHE_TTL_SECONDS", 7 * 24 * 3600),
+                db_path=getattr(config, "INTENT_CACHE_PATH", None),
+            )
+        self.intent_cache = intent_cache
+
         # Stage 1: Intent Parser - pure linguistic classification
         self.intent_prompt = """You are an intent classifier for a text adventure game.
 
@@ -250,6 +273,7 @@ Input: "I look around"
 Output: {"tools": ["narrate_only"]}
 
 Return ONLY valid JSON with the "tools" field."""
+        self.intent_prompt_version = IntentCache.prompt_version(self.intent_prompt)
 
     def plan_staged(
         self, state: GameState, utterance: Utterance, debug: bool = False
@@ -346,12 +370,29 @@ Return ONLY valid JSON with the "tools" field."""
         # Get actor inventory
         actor_inventory = getattr(actor, "inventory", [])
 
+        # Resolve names in the utterance against what the actor can act on
+        name_index = state.get_name_index()
+        mentioned_targets = [
+            match.id
+            for match in name_index.find_mentions(
+                utterance.text, kind="entity", candidates=visible_actors
+            )
+        ]
+        mentioned_exits = [
+            match.id
+            for match in name_index.find_mentions(
+                utterance.text, kind="zone", candidates=visible_exits
+            )
+        ]
+
         context = WorldContext(
             current_zone=current_zone.name,
             visible_actors=visible_actors,
             visible_exits=visible_exits,
             actor_inventory=actor_inventory,
             actor_id=actor_id,
+            mentioned_targets=mentioned_targets,
+            mentioned_exits=mentioned_exits,
         )
 
         if debug:
@@ -366,6 +407,17 @@ Return ONLY valid JSON with the "tools" field."""
     def _parse_intent(self, utterance: Utterance, debug: bool = False) -> IntentResult:
         """Stage 1: Parse player intent to tool names (no world context)."""
 
+        # Intent parsing ignores world state, so results can be reused
+        # across turns and sessions for the same utterance
+        if self.intent_cache is not None:
+            cached_tools = self.intent_cache.get(
+                utterance.text, self.model, self.intent_prompt_version
+            )
+            if cached_tools:
+                if debug:
+                    logger.info(f"Intent cache hit: {utterance.text} -> {cached_tools}")
+                return IntentResult(tool_names=cached_tools, confidence=0.9)
+
         try:
             user_prompt = f'Player message: "{utterance.text}"'
 
@@ -388,6 +440,14 @@ Return ONLY valid JSON with the "tools" field."""
 
             confidence = 0.9 if valid_tools else 0.1
 
+            if valid_tools and self.intent_cache is not None:
+                self.intent_cache.put(
+                    utterance.text,
+                    self.model,
+                    self.intent_prompt_version,
+                    valid_tools,
+                )
+
             return IntentResult(
                 tool_names=valid_tools,
                 confidence=confidence,
@@ -439,6 +499,13 @@ Return ONLY valid JSON with the "tools" field."""
             valid_targets = json.dumps(context.visible_actors)
             valid_items = json.dumps(context.actor_inventory)
 
+            mention_hints = ""
+            if context.mentioned_targets or context.mentioned_exits:
+                mention_hints = (
+                    f"\nPlayer text refers to: targets={json.dumps(context.mentioned_targets)}, "
+                    f"exits={json.dumps(context.mentioned_exits)}"
+                )
+
             # Create dynamic prompt with real schema constraints
             filler_prompt = f"""You are the argument filler for an RPG system.
 
@@ -454,7 +521,7 @@ For each function, fill only its arguments using the constraints and valid value
 actor: "{context.actor_id}"
 to: {valid_exits} 
 target: {valid_targets}
-item_id: {valid_items}
+item_id: {valid_items}{mention_hints}
 
 === Important Notes ===
 - For literal fields, ONLY use values from the provided choices
@@ -558,10 +625,14 @@ Return ONLY a JSON object with "tool_calls" field:
 _staged_planner_instance: Optional[StagedPlanner] = None
 
 
-def initialize_staged_planner(api_key: str, model: Optional[str] = None) -> None:
+def initialize_staged_planner(
+    api_key: str,
+    model: Optional[str] = None,
+    intent_cache: Optional[IntentCache] = None,
+) -> None:
     """Initialize the global staged planner instance."""
     global _staged_planner_instance
-    _staged_planner_instance = StagedPlanner(api_key, model)
+    _staged_planner_instance = StagedPlanner(api_key, model, intent_cache=intent_cache)
     logger.info("Staged planner initialized")
 
 
@@ -575,3 +646,10 @@ def get_staged_plan(
         )
 
     return _staged_planner_instance.plan_staged(state, utterance, debug)
+
+
+def get_intent_cache_stats() -> Optional[Dict[str, float]]:
+    """Return intent cache metrics for the global planner, if caching is on."""
+    if _staged_planner_instance is None or _staged_planner_instance.intent_cache is None:
+        return None
+    return _staged_planner_instance.intent_cache.get_stats()
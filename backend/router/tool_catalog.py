@@ -641,6 +641,125 @@ def suggest_use_item_args(state, utterance) -> Dict[str, Any]:
     return args
 
 
+# Broader Intent Ontology - map arbitrary verbs to the 7 core social intents
+TALK_INTENT_VERBS: Dict[str, List[str]] = {
+    "intimidate": [
+        "threaten",
+        "intimidate",
+        "menace",
+        "scare",
+        "bully",
+        "frighten",
+        "terrorize",
+        "coerce",
+        "force",
+        "pressure",
+        "strong-arm",
+        "browbeat",
+    ],
+    "deceive": [
+        "lie",
+        "deceive",
+        "trick",
+        "bluff",
+        "mislead",
+        "fool",
+        "dupe",
+        "con",
+        "scam",
+        "bamboozle",
+        "hoodwink",
+        "fabricate",
+    ],
+    "charm": [
+        "charm",
+        "flirt",
+        "seduce",
+        "enchant",
+        "captivate",
+        "allure",
+        "entice",
+        "bewitch",
+        "dazzle",
+        "entrance",
+    ],
+    "comfort": [
+        "comfort",
+        "console",
+        "reassure",
+        "calm",
+        "soothe",
+        "pacify",
+        "support",
+        "encourage",
+        "nurture",
+        "ease",
+        "relieve",
+    ],
+    "distract": [
+        "distract",
+        "divert",
+        "misdirect",
+        "deflect",
+        "sidetrack",
+        "redirect",
+        "confuse",
+        "bewilder",
+    ],
+    "request": [
+        "ask",
+        "request",
+        "beg",
+        "plea",
+        "plead",
+        "implore",
+        "beseech",
+        "petition",
+        "appeal",
+        "solicit",
+        "entreat",
+        "supplicate",
+    ],
+    "persuade": [
+        "persuade",
+        "convince",
+        "argue",
+        "reason",
+        "debate",
+        "negotiate",
+        "influence",
+        "sway",
+        "urge",
+        "coax",
+        "cajole",
+        "wheedle",
+        "talk into",
+        "win over",
+        "bring around",
+    ],
+}
+
+
+def detect_talk_intent(text_lower: str) -> Optional[str]:
+    """
+    Map a lowercased utterance to a social intent via TALK_INTENT_VERBS.
+
+    Uses word boundary matching to avoid substring issues. Returns None when
+    no intent verb is present so callers can choose their own default.
+    """
+    padded = f" {text_lower} "
+    for intent, verbs in TALK_INTENT_VERBS.items():
+        if any(
+            f" {verb} " in padded
+            or text_lower.startswith(f"{verb} ")
+            or text_lower.endswith(f" {verb}")
+            or text_lower == verb
+            for verb in verbs
+        ):
+            return intent
+    return None
+
+
 def suggest_talk_args(state, utterance) -> Dict[str, Any]:
     """Suggest arguments for talk based on visible actors and utterance content."""
     args = {}
@@ -681,120 +800,9 @@ def suggest_talk_args(state, utterance) -> Dict[str, Any]:
                     elif hasattr(primary_target, "will"):
                         args["dc_hint"] = max(8, min(22, primary_target.will))
 
-        # Broader Intent Ontology - map arbitrary verbs to the 7 core intents
+        # Map arbitrary verbs to the core intents via the shared ontology
         text_lower = utterance.text.lower()
-
-        # Verb mapping for comprehensive intent detection
-        verb_mappings = {
-            "intimidate": [
-                "threaten",
-                "intimidate",
-                "menace",
-                "scare",
-                "bully",
-                "frighten",
-                "terrorize",
-                "coerce",
-                "force",
-                "pressure",
-                "strong-arm",
-                "browbeat",
-            ],
-            "deceive": [
-                "lie",
-                "deceive",
-                "trick",
-                "bluff",
-                "mislead",
-                "fool",
-                "dupe",
-                "con",
-                "scam",
-                "bamboozle",
-                "hoodwink",
-                "fabricate",
-            ],
-            "charm": [
-                "charm",
-                "flirt",
-                "seduce",
-                "enchant",
-                "captivate",
-                "allure",
-                "entice",
-                "bewitch",
-                "dazzle",
-                "entrance",
-            ],
-            "comfort": [
-                "comfort",
-                "console",
-                "reassure",
-                "calm",
-                "soothe",
-                "pacify",
-                "support",
-                "encourage",
-                "nurture",
-                "ease",
-                "relieve",
-            ],
-            "distract": [
-                "distract",
-                "divert",
-                "misdirect",
-                "deflect",
-                "sidetrack",
-                "redirect",
-                "confuse",
-                "bewilder",
-            ],
-            "request": [
-                "ask",
-                "request",
-                "beg",
-                "plea",
-                "plead",
-                "implore",
-                "beseech",
-                "petition",
-                "appeal",
-                "solicit",
-                "entreat",
-                "supplicate",
-            ],
-            "persuade": [
-                "persuade",
-                "convince",
-                "argue",
-                "reason",
-                "debate",
-                "negotiate",
-                "influence",
-                "sway",
-                "urge",
-                "coax",
-                "cajole",
-                "wheedle",
-                "talk into",
-                "win over",
-                "bring around",
-            ],
-        }
-
-        # Find best matching intent based on word boundary matching to avoid substring issues
-        detected_intent = "persuade"  # Default
-        for intent, verbs in verb_mappings.items():
-            if any(
-                f" {verb} " in f" {text_lower} "
-                or text_lower.startswith(f"{verb} ")
-                or text_lower.endswith(f" {verb}")
-                or text_lower == verb
-                for verb in verbs
-            ):
-                detected_intent = intent
-                break
-
+        detected_intent = detect_talk_intent(text_lower) or "persuade"  # Default
         args["intent"] = detected_intent
 
         about_match = re.search(r"\babout\s+([^.!?]+)", text_lower)
@@ -0,0 +1,246 @@
+"""
+Turn Scheduler - Initiative-ordered turn order for a Scene.
+
+Validator.advance_turn and GameRouter.process_turn both used to bump
+scene.turn_index modulo len(scene.turn_order) themselves, with no notion of
+initiative, so adding or removing a combatant mid-round meant patching the
+list and the index by hand. The scheduler owns that logic:
+
+- scene.turn_order is kept sorted by initiative (highest first, earlier
+  arrivals first among ties), with initiative values in scene.initiative
+- the next actor is an index step: advance() is O(1)
+- add() and remove() find the slot by binary search and keep turn_index on
+  the actor whose turn it is, whatever changes before or after it. The
+  search is O(log n) but the list insert/delete shifts the entries after
+  the slot, so each change is O(n) overall (cheap for combat-sized orders)
+- delay() takes the current actor out of the order until resume() puts them
+  back to act next, at their new initiative
+- ready() records a readied action, which lapses when the actor's next turn
+  comes round
+
+All state lives in Scene fields (turn_order, turn_index, turn_held,
+initiative, delayed_actors, readied_actions), so it survives saves and
+snapshots.
+Lists without initiative values keep their given order.
+"""
+
+import logging
+from bisect import bisect_left, bisect_right
+from typing import Dict, List, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .game_state import Scene
+
+logger = logging.getLogger(__name__)
+
+
+class TurnScheduler:
+    """Turn order and initiative for one Scene."""
+
+    def __init__(self, scene: "Scene"):
+        self.scene = scene
+        self.order: List[str] = scene.turn_order
+        self._known_length = -1
+        self._ensure_order()
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+    def __contains__(self, actor_id: str) -> bool:
+        return self._index_of(actor_id) is not None
+
+    def current(self) -> Optional[str]:
+        """Actor whose turn it is, or None if the order is empty."""
+        if not self.order:
+            return None
+        return self.order[self.scene.turn_index % len(self.order)]
+
+    def advance(self) -> Optional[str]:
+        """
+        Move to the next actor, starting a new round after the last one.
+
+        Returns:
+            The actor whose turn it now is (None if the order is empty)
+        """
+        self._ensure_order()
+        scene = self.scene
+        if not self.order:
+            scene.turn_held = False
+            return None
+
+        index = scene.turn_index if scene.turn_held else scene.turn_index + 1
+        scene.turn_held = False
+        if index >= len(self.order):
+            index = 0
+            scene.round += 1
+        scene.turn_index = index
+
+        actor_id = self.order[index]
+        if scene.readied_actions.pop(actor_id, None) is not None:
+            logger.debug(f"Readied action of {actor_id} lapsed")
+        return actor_id
+
+    def add(self, actor_id: str, initiative: int = 0) -> int:
+        """
+        Add an actor (or move an existing one) at the given initiative.
+
+        The current actor keeps the turn. An actor slotted in ahead of the
+        current position first acts next round.
+
+        Returns:
+            Position of the actor in the turn order
+        """
+        if actor_id in self:
+            self.remove(actor_id)
+        self._ensure_order()
+
+        initiative_of = self.scene.initiative
+        initiative_of[actor_id] = initiative
+        index = bisect_right(
+            self.order, -initiative, key=lambda a: -initiative_of.get(a, 0)
+        )
+        self._insert(index, actor_id)
+        return index
+
+    def remove(self, actor_id: str) -> bool:
+        """
+        Remove an actor from the turn order (e.g. when they die or flee).
+
+        If it was their turn, the next actor is up: the next advance() moves
+        to them rather than past them.
+
+        Returns:
+            True if the actor was in the order
+        """
+        self._ensure_order()
+        index = self._index_of(actor_id)
+        if index is None:
+            return False
+
+        scene = self.scene
+        del self.order[index]
+        self._known_length = len(self.order)
+        scene.initiative.pop(actor_id, None)
+        scene.readied_actions.pop(actor_id, None)
+
+        if index < scene.turn_index:
+            scene.turn_index -= 1
+        elif index == scene.turn_index:
+            # turn_index now points at the next actor (or one past the end,
+            # so the next advance() starts a new round)
+            scene.turn_held = True
+        if not self.order:
+            scene.turn_index = 0
+        return True
+
+    def delay(self, actor_id: Optional[str] = None) -> bool:
+        """
+        Hold an actor's turn (default: the current actor) until resume().
+
+        Returns:
+            True if the actor was in the order
+        """
+        actor_id = actor_id or self.current()
+        if actor_id is None:
+            return False
+        initiative = self.scene.initiative.get(actor_id, 0)
+        if not self.remove(actor_id):
+            return False
+        self.scene.delayed_actors[actor_id] = initiative
+        return True
+
+    def resume(self, actor_id: str) -> bool:
+        """
+        Bring a delayed actor back to act next.
+
+        They take the initiative of the actor whose turn it is, so they stay
+        just after them in later rounds too.
+
+        Returns:
+            True if the actor was delayed
+        """
+        scene = self.scene
+        if actor_id not in scene.delayed_actors:
+            return False
+        del scene.delayed_actors[actor_id]
+        self._ensure_order()
+
+        if not self.order:
+            scene.initiative[actor_id] = 0
+            self._insert(0, actor_id)
+            scene.turn_index = 0
+            scene.turn_held = True
+            return True
+
+        if scene.turn_held:
+            # The acting actor left: the resumed actor goes straight in front
+            index = scene.turn_index
+            anchor = self.order[index - 1] if index else self.order[0]
+        else:
+            index = scene.turn_index + 1
+            anchor = self.order[scene.turn_index]
+        scene.initiative[actor_id] = scene.initiative.get(anchor, 0)
+        self.order.insert(index, actor_id)
+        self._known_length = len(self.order)
+        return True
+
+    def ready(self, actor_id: str, trigger: str) -> None:
+        """Record a readied action; it lapses at the actor's next turn."""
+        self.scene.readied_actions[actor_id] = trigger
+
+    def trigger_ready(self, actor_id: str) -> Optional[str]:
+        """Use up a readied action. Returns its trigger, or None if none was set."""
+        return self.scene.readied_actions.pop(actor_id, None)
+
+    def set_initiatives(self, initiatives: Dict[str, int]) -> None:
+        """Replace the whole order (e.g. at the start of combat); round restarts at the top."""
+        scene = self.scene
+        scene.initiative.clear()
+        scene.initiative.update(initiatives)
+        scene.delayed_actors.clear()
+        scene.readied_actions.clear()
+        # Stable sort keeps the given order among ties
+        self.order[:] = sorted(initiatives, key=lambda a: -initiatives[a])
+        self._known_length = len(self.order)
+        scene.turn_index = 0
+        scene.turn_held = False
+
+    def _insert(self, index: int, actor_id: str) -> None:
+        # Keep turn_index on the same actor (current, or next up when held)
+        if self.order and index <= self.scene.turn_index:
+            self.scene.turn_index += 1
+        self.order.insert(index, actor_id)
+        self._known_length = len(self.order)
+
+    def _index_of(self, actor_id: str) -> Optional[int]:
+        """Position of an actor: binary search to its initiative band, then scan it."""
+        initiative_of = self.scene.initiative
+        key = lambda a: -initiative_of.get(a, 0)  # noqa: E731
+        value = key(actor_id)
+        start = bisect_left(self.order, value, key=key)
+        end = bisect_right(self.order, value, key=key, lo=start)
+        for index in range(start, end):
+            if self.order[index] == actor_id:
+                return index
+        # Lists edited behind the scheduler's back may be out of order
+        try:
+            return self.order.index(actor_id)
+        except ValueError:
+            return None
+
+    def _ensure_order(self) -> None:
+        """Re-sort if turn_order was changed directly, keeping the current actor's turn."""
+        length = len(self.order)
+        if length == self._known_length:
+            return
+        self._known_length = length
+        initiative_of = self.scene.initiative
+        if not initiative_of:
+            return
+        keys = [-initiative_of.get(a, 0) for a in self.order]
+        if all(a <= b for a, b in zip(keys, keys[1:])):
+            return
+        current = self.current()
+        self.order.sort(key=lambda a: -initiative_of.get(a, 0))
+        if current is not None:
+            self.scene.turn_index = self.order.index(current)
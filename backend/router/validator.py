@@ -11,14 +11,13 @@ Handles:
 import json
 import time
 import uuid
-import random
 import logging
 import os
 import hashlib
 import ast
 import operator
 from datetime import datetime, timezone
-from typing import Dict, Any, List, Optional, Union, cast, Callable
+from typing import Dict, Any, List, Optional, Tuple, Union, cast, Callable
 from pydantic import BaseModel, ValidationError
 from dataclasses import dataclass
 
@@ -43,6 +42,7 @@ from .zone_graph import (
 )
 from .tool_catalog import TOOL_CATALOG, get_tool_by_id, Effect
 from .effects import apply_effects
+from .rng import RNGContext, new_turn_seed
 
 
 # Set up logging
@@ -320,15 +320,8 @@ class Validator:
         """
         # Advance turn logic first (if needed for turn order)
         if state.scene.turn_order:
-            state.scene.turn_index = (state.scene.turn_index + 1) % len(
-                state.scene.turn_order
-            )
-
-            # Update current actor if turn order exists
-            if state.scene.turn_index == 0:
-                state.scene.round += 1
-
-            state.current_actor = state.scene.turn_order[state.scene.turn_index]
+            # Starts a new round after the last actor
+            state.current_actor = state.scene.turn_scheduler.advance()
 
         # Reset clarification counter for new turn
         state.scene.choice_count_this_turn = 0
@@ -497,61 +490,43 @@ class Validator:
         self.turn_counter += 1
         turn_id = f"t_{self.turn_counter:04d}"
         if seed is None:
-            seed = int(time.time() * 1000) % 10000
+            seed = new_turn_seed()
 
         # Start logging
         log_entry = {
             "ts": int(time.time()),
             "turn_id": turn_id,
             "player_text": utterance.text,
+            "actor_id": utterance.actor_id,
             "seed": seed,
             "planner": {"tool": tool_id, "args_raw": raw_args},
         }
 
-        try:
-            # Step 1: Get tool definition
-            tool = get_tool_by_id(tool_id)
-            if not tool:
-                return self._create_error_result(
-                    tool_id, raw_args, f"Unknown tool: {tool_id}", log_entry
-                )
-
-            # Step 2: Schema validation
-            schema_ok = False  # Initialize before try block
-            try:
-                validated_args = tool.args_schema(**raw_args)
-                schema_ok = True
-                sanitized_args = validated_args.model_dump()
-            except ValidationError as e:
-                return self._create_error_result(
-                    tool_id, raw_args, f"Schema validation failed: {e}", log_entry
-                )
-
-            # Step 3: Non-destructive sanitization
-            sanitized_args = self._sanitize_args(sanitized_args)
+        return self._run_pipeline(tool_id, raw_args, state, utterance, seed, log_entry)
 
-            # Step 4: Precondition check
-            try:
-                precond_ok = tool.precond(state, utterance)
-            except Exception as e:
-                precond_ok = False
-                return self._create_error_result(
-                    tool_id, raw_args, f"Precondition check failed: {e}", log_entry
-                )
-
-            if not precond_ok:
-                return self._create_error_result(
-                    tool_id, raw_args, "Preconditions not satisfied", log_entry
-                )
-
-            # Update log with validation results
-            log_entry["validation"] = {
-                "schema_ok": schema_ok,
-                "preconds_ok": precond_ok,
-            }
+    def _run_pipeline(
+        self,
+        tool_id: str,
+        raw_args: Dict[str, Any],
+        state: GameState,
+        utterance: Utterance,
+        seed: int,
+        log_entry: Dict[str, Any],
+    ) -> ToolResult:
+        """Steps 1-6 of validate_and_execute, filling in log_entry."""
+        try:
+            # Steps 1-4: Tool lookup, schema, sanitization, preconditions
+            sanitized_args, error = self.validate_call(
+                tool_id, raw_args, state, utterance, log_entry
+            )
+            if error is not None:
+                return error
 
-            # Step 5: Execute tool
-            result = self._execute_tool(tool_id, sanitized_args, state, utterance, seed)
+            # Step 5: Execute tool (with this turn's own random source)
+            rng = RNGContext(seed)
+            result = self._execute_tool(
+                tool_id, sanitized_args, state, utterance, seed, rng
+            )
 
             # Step 5.5: Apply outcome resolution to add consequences
             if result.ok:
@@ -559,7 +534,7 @@ class Validator:
                     resolve_outcome,
                 )  # Local import to avoid circular dependency
 
-                result = resolve_outcome(result, state)
+                result = resolve_outcome(result, state, rng=rng.stream("outcome"))
 
             # Step 6: Apply effects to state
             if result.ok and result.effects:
@@ -586,6 +561,67 @@ class Validator:
                 tool_id, raw_args, f"Unexpected error: {e}", log_entry
             )
 
+    def validate_call(
+        self,
+        tool_id: str,
+        raw_args: Dict[str, Any],
+        state: GameState,
+        utterance: Utterance,
+        log_entry: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[ToolResult]]:
+        """
+        Validate a tool call without executing it (pipeline steps 1-4).
+
+        Preconditions are checked for state.current_actor.
+
+        Returns:
+            (sanitized_args, None) if the call may run, else (None, error result)
+        """
+        if log_entry is None:
+            log_entry = {"planner": {"tool": tool_id, "args_raw": raw_args}}
+
+        # Step 1: Get tool definition
+        tool = get_tool_by_id(tool_id)
+        if not tool:
+            return None, self._create_error_result(
+                tool_id, raw_args, f"Unknown tool: {tool_id}", log_entry
+            )
+
+        # Step 2: Schema validation
+        schema_ok = False  # Initialize before try block
+        try:
+            validated_args = tool.args_schema(**raw_args)
+            schema_ok = True
+            sanitized_args = validated_args.model_dump()
+        except ValidationError as e:
+            return None, self._create_error_result(
+                tool_id, raw_args, f"Schema validation failed: {e}", log_entry
+            )
+
+        # Step 3: Non-destructive sanitization
+        sanitized_args = self._sanitize_args(sanitized_args)
+
+        # Step 4: Precondition check
+        try:
+            precond_ok = tool.precond(state, utterance)
+        except Exception as e:
+            precond_ok = False
+            return None, self._create_error_result(
+                tool_id, raw_args, f"Precondition check failed: {e}", log_entry
+            )
+
+        if not precond_ok:
+            return None, self._create_error_result(
+                tool_id, raw_args, "Preconditions not satisfied", log_entry
+            )
+
+        # Update log with validation results
+        log_entry["validation"] = {
+            "schema_ok": schema_ok,
+            "preconds_ok": precond_ok,
+        }
+        return sanitized_args, None
+
     def _sanitize_args(self, args: Dict[str, Any]) -> Dict[str, Any]:
         """Non-destructive sanitization without guessing intent."""
         sanitized = args.copy()
@@ -616,20 +652,26 @@ class Validator:
         state: GameState,
         utterance: Utterance,
         seed: int,
+        rng: Optional[RNGContext] = None,
     ) -> ToolResult:
-        """Execute the specified tool with validated arguments."""
+        """
+        Execute the specified tool with validated arguments.
+
+        Dice-rolling executors draw from rng (default: a new RNGContext from
+        seed), never from the global random module.
+        """
 
         # Route to appropriate executor
         if tool_id == "ask_roll":
-            return self._execute_ask_roll(args, state, utterance, seed)
+            return self._execute_ask_roll(args, state, utterance, seed, rng)
         elif tool_id == "move":
             return self._execute_move(args, state, utterance, seed)
         elif tool_id == "talk":
-            return self._execute_talk(args, state, utterance, seed)
+            return self._execute_talk(args, state, utterance, seed, rng)
         elif tool_id == "attack":
-            return self._execute_attack(args, state, utterance, seed)
+            return self._execute_attack(args, state, utterance, seed, rng)
         elif tool_id == "use_item":
-            return self._execute_use_item(args, state, utterance, seed)
+            return self._execute_use_item(args, state, utterance, seed, rng)
         elif tool_id == "get_info":
             return self._execute_get_info(args, state, utterance, seed)
         elif tool_id == "narrate_only":
@@ -650,10 +692,16 @@ class Validator:
             )
 
     def _execute_ask_roll(
-        self, args: Dict[str, Any], state: GameState, utterance: Utterance, seed: int
+        self,
+        args: Dict[str, Any],
+        state: GameState,
+        utterance: Utterance,
+        seed: int,
+        rng: Optional[RNGContext] = None,
     ) -> ToolResult:
         """Execute ask_roll tool - Style+Domain dice mechanics with enhanced roll progression."""
-        random.seed(seed)
+        if rng is None:
+            rng = RNGContext(seed)
 
         # Extract arguments
         actor = args.get("actor")
@@ -722,7 +770,7 @@ class Validator:
         }
 
         # Roll dice: d20 + sum(effective_style × domain dice)
-        d20_roll = random.randint(1, 20)
+        d20_roll = rng.randint(1, 20)
 
         # Parse domain die size with defensive error handling
         try:
@@ -745,7 +793,7 @@ class Validator:
                 },
                 error_message=f"Invalid domain format: {domain}",
             )
-        style_dice = [random.randint(1, domain_size) for _ in range(effective_style)]
+        style_dice = [rng.randint(1, domain_size) for _ in range(effective_style)]
         style_sum = sum(style_dice)
         total = d20_roll + style_sum
 
@@ -1237,12 +1285,16 @@ class Validator:
         )
 
     def _execute_talk(
-        self, args: Dict[str, Any], state: GameState, utterance: Utterance, seed: int
+        self,
+        args: Dict[str, Any],
+        state: GameState,
+        utterance: Utterance,
+        seed: int,
+        rng: Optional[RNGContext] = None,
     ) -> ToolResult:
         """Execute talk tool - social interactions with Style+Domain mechanics."""
-        import random
-
-        random.seed(seed)
+        if rng is None:
+            rng = RNGContext(seed)
 
         # Extract arguments - handle both single target and multiple targets
         actor = args.get("actor")
@@ -1507,8 +1559,8 @@ class Validator:
             )
 
         # Roll dice: d20 + sum(effective_style × domain dice)
-        d20_roll = random.randint(1, 20)
-        style_dice = [random.randint(1, domain_size) for _ in range(effective_style)]
+        d20_roll = rng.randint(1, 20)
+        style_dice = [rng.randint(1, domain_size) for _ in range(effective_style)]
         style_sum = sum(style_dice)
         total = d20_roll + style_sum
 
@@ -1712,12 +1764,16 @@ class Validator:
         return effects
 
     def _execute_attack(
-        self, args: Dict[str, Any], state: GameState, utterance: Utterance, seed: int
+        self,
+        args: Dict[str, Any],
+        state: GameState,
+        utterance: Utterance,
+        seed: int,
+        rng: Optional[RNGContext] = None,
     ) -> ToolResult:
         """Execute attack tool - combat mechanics with Style+Domain rolling."""
-        import random
-
-        random.seed(seed)
+        if rng is None:
+            rng = RNGContext(seed)
 
         # Extract arguments
         actor = args.get("actor")
@@ -1841,8 +1897,8 @@ class Validator:
             )
 
         # Roll attack: d20 + sum(effective_style × domain dice)
-        d20_roll = random.randint(1, 20)
-        style_dice = [random.randint(1, domain_size) for _ in range(effective_style)]
+        d20_roll = rng.randint(1, 20)
+        style_dice = [rng.randint(1, domain_size) for _ in range(effective_style)]
         style_sum = sum(style_dice)
         total = d20_roll + style_sum
 
@@ -1870,7 +1926,7 @@ class Validator:
         if outcome != "fail":
             # Parse damage expression and roll dice
             damage_dice, raw_damage = self._roll_damage(
-                damage_expr, outcome == "crit_success", random
+                damage_expr, outcome == "crit_success", rng
             )
 
             # Handle partial success (half damage)
@@ -2019,12 +2075,16 @@ class Validator:
             return f"{attacker_name}'s {weapon_text} misses completely"
 
     def _execute_use_item(
-        self, args: Dict[str, Any], state: GameState, utterance: Utterance, seed: int
+        self,
+        args: Dict[str, Any],
+        state: GameState,
+        utterance: Utterance,
+        seed: int,
+        rng: Optional[RNGContext] = None,
     ) -> ToolResult:
         """Execute use_item tool - comprehensive item usage system."""
-        import random
-
-        random.seed(seed)
+        if rng is None:
+            rng = RNGContext(seed)
 
         # Extract arguments
         actor = args.get("actor")
@@ -2413,7 +2473,7 @@ class Validator:
             # Apply item effects (if not delegated successfully) and remove from inventory
             if not (delegation_result and delegation_result.ok):
                 item_effects = self._resolve_item_effects_with_logging(
-                    item_definition, target, actor, random, dice_rolls_log
+                    item_definition, target, actor, rng, dice_rolls_log
                 )
                 effects.extend(item_effects)
 
@@ -2433,7 +2493,7 @@ class Validator:
             # Apply effects without consuming (if not delegated successfully)
             if not (delegation_result and delegation_result.ok):
                 item_effects = self._resolve_item_effects_with_logging(
-                    item_definition, target, actor, random, dice_rolls_log
+                    item_definition, target, actor, rng, dice_rolls_log
                 )
                 effects.extend(item_effects)
 
@@ -2465,7 +2525,7 @@ class Validator:
             # Apply passive effects from item (if not delegated successfully)
             if not (delegation_result and delegation_result.ok):
                 item_effects = self._resolve_item_effects_with_logging(
-                    item_definition, actor, actor, random, dice_rolls_log
+                    item_definition, actor, actor, rng, dice_rolls_log
                 )
                 effects.extend(item_effects)
 
@@ -2475,7 +2535,7 @@ class Validator:
             # Apply standard item effects first (if not delegated successfully)
             if not (delegation_result and delegation_result.ok):
                 item_effects = self._resolve_item_effects_with_logging(
-                    item_definition, target, actor, random, dice_rolls_log
+                    item_definition, target, actor, rng, dice_rolls_log
                 )
                 effects.extend(item_effects)
 
@@ -3351,6 +3411,10 @@ class Validator:
                 error_message="No valid actor or target provided",
             )
 
+        # Planners sometimes pass a name ("the guard") instead of an ID
+        if target and target not in state.entities and target not in state.zones:
+            target = state.resolve_name(target, min_score=0.75) or target
+
         # Validate target exists if specified
         if target and target not in state.entities and target not in state.zones:
             return ToolResult(
@@ -4985,8 +5049,6 @@ class Validator:
         seed: Optional[int] = None,
     ) -> Dict[str, Any]:
         """Apply HP effect and return enhanced log entry with dice expression support."""
-        import random
-
         entity = state.entities[effect.target]
         living_entity = cast(Union[PC, NPC], entity)
 
@@ -4999,10 +5061,9 @@ class Validator:
                 char in str(effect.delta) for char in "d+-"
             ):
                 # Delta contains dice expression - roll it
-                if seed is not None:
-                    random.seed(seed)
+                rng = RNGContext(seed)
                 delta = self._roll_dice_expression_with_details(
-                    str(effect.delta), random, dice_log
+                    str(effect.delta), rng, dice_log
                 )
             else:
                 # Delta is already a number
@@ -5039,8 +5100,6 @@ class Validator:
         seed: Optional[int] = None,
     ) -> Dict[str, Any]:
         """Apply guard effect and return enhanced log entry with dice expression support."""
-        import random
-
         entity = state.entities[effect.target]
         living_entity = cast(Union[PC, NPC], entity)
 
@@ -5053,10 +5112,9 @@ class Validator:
                 char in str(effect.delta) for char in "d+-"
             ):
                 # Delta contains dice expression - roll it
-                if seed is not None:
-                    random.seed(seed)
+                rng = RNGContext(seed)
                 delta = self._roll_dice_expression_with_details(
-                    str(effect.delta), random, dice_log
+                    str(effect.delta), rng, dice_log
                 )
             else:
                 # Delta is already a number
@@ -5165,8 +5223,6 @@ class Validator:
         seed: Optional[int] = None,
     ) -> Dict[str, Any]:
         """Apply inventory effect and return enhanced log entry with dice expression support."""
-        import random
-
         entity = state.entities[effect.target]
         living_entity = cast(Union[PC, NPC], entity)
 
@@ -5180,10 +5236,9 @@ class Validator:
                 char in str(effect.delta) for char in "d+-"
             ):
                 # Delta contains dice expression - roll it
-                if seed is not None:
-                    random.seed(seed)
+                rng = RNGContext(seed)
                 delta = self._roll_dice_expression_with_details(
-                    str(effect.delta), random, dice_log
+                    str(effect.delta), rng, dice_log
                 )
             else:
                 # Delta is already a number
@@ -5254,6 +5309,9 @@ class Validator:
                 state=state,
             )
 
+        if state.clock_engine is not None:
+            return self._apply_engine_clock_effect(effect, state, actor, seed)
+
         if clock_id not in state.clocks:
             # Create new clock
             state.clocks[clock_id] = {
@@ -5280,25 +5338,8 @@ class Validator:
             max_value = clock.get("max", clock.get("maximum", 10))
             min_value = clock.get("min", clock.get("minimum", 0))
 
-        # Handle dice expressions in delta field
-        dice_log = []
-        if effect.delta is not None:
-            if isinstance(effect.delta, str) and any(
-                char in str(effect.delta) for char in "d+-"
-            ):
-                # Delta contains dice expression - roll it
-                import random
-
-                if seed is not None:
-                    random.seed(seed)
-                delta = self._roll_dice_expression_with_details(
-                    str(effect.delta), random, dice_log
-                )
-            else:
-                # Delta is already a number
-                delta = int(effect.delta)
-        else:
-            delta = 0
+        dice_log: List[Dict[str, Any]] = []
+        delta = self._clock_effect_delta(effect, seed, dice_log)
 
         new_value = max(min_value, min(max_value, old_value + delta))
 
@@ -5325,6 +5366,47 @@ class Validator:
             dice_log=dice_log,
         )
 
+    def _clock_effect_delta(
+        self, effect: Effect, seed: Optional[int], dice_log: List[Dict[str, Any]]
+    ) -> int:
+        """A clock effect's delta, rolling dice expressions into dice_log."""
+        if effect.delta is None:
+            return 0
+        if isinstance(effect.delta, str) and any(
+            char in str(effect.delta) for char in "d+-"
+        ):
+            # Delta contains dice expression - roll it
+            rng = RNGContext(seed)
+            return self._roll_dice_expression_with_details(
+                str(effect.delta), rng, dice_log
+            )
+        # Delta is already a number
+        return int(effect.delta)
+
+    def _apply_engine_clock_effect(
+        self,
+        effect: Effect,
+        state: GameState,
+        actor: Optional[str] = None,
+        seed: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Apply a clock effect through the state's ClockEngine (fires triggers)."""
+        dice_log: List[Dict[str, Any]] = []
+        delta = self._clock_effect_delta(effect, seed, dice_log)
+        tick = state.clock_engine.advance(
+            effect.id, delta, source=effect.source or "unknown"
+        )
+        return self._create_enhanced_log_entry(
+            effect=effect,
+            before={"value": tick.old_value},
+            after={"value": tick.new_value},
+            ok=True,
+            actor=actor,
+            seed=seed,
+            state=state,
+            dice_log=dice_log,
+        )
+
     def _apply_tag_effect(
         self,
         effect: Effect,
@@ -5422,8 +5504,6 @@ class Validator:
         seed: Optional[int] = None,
     ) -> Dict[str, Any]:
         """Apply resource effect and return enhanced log entry with dice expression support."""
-        import random
-
         entity = state.entities[effect.target]
 
         resource_id = effect.id
@@ -5450,10 +5530,9 @@ class Validator:
                 char in str(effect.delta) for char in "d+-"
             ):
                 # Delta contains dice expression - roll it
-                if seed is not None:
-                    random.seed(seed)
+                rng = RNGContext(seed)
                 delta = self._roll_dice_expression_with_details(
-                    str(effect.delta), random, dice_log
+                    str(effect.delta), rng, dice_log
                 )
             else:
                 # Delta is already a number
@@ -6153,55 +6232,57 @@ class Validator:
             id=f"timed_{seed}_{len(state.scene.pending_effects) if hasattr(state.scene, 'pending_effects') else 0}",
         )
 
-        # Add to pending effects queue
-        if not hasattr(state.scene, "pending_effects"):
-            state.scene.pending_effects = []
-        state.scene.pending_effects.append(pending_effect)
+        # Add to the pending effects queue (ordered by trigger_round)
+        state.scene.add_pending_effect(pending_effect)
 
     def _process_pending_effects(self, state: GameState) -> List[Dict[str, Any]]:
         """Process any timed effects that should trigger this round."""
         if not hasattr(state.scene, "pending_effects"):
             return []
 
-        current_round = state.scene.round
-        triggered_logs = []
-        remaining_effects = []
+        # Only the due prefix of the queue is visited
+        due_effects = state.scene.process_pending_effects(
+            state.scene.round,
+            condition_check=lambda pending: self._pending_condition_met(pending, state),
+        )
 
-        for pending in state.scene.pending_effects:
-            if pending.trigger_round <= current_round:
-                # Effect should trigger now
-                try:
-                    effect_data = pending.effect
-                    effect = Effect(**effect_data)
-                    actor = pending.actor
-                    seed = pending.seed
-
-                    # Apply the timed effect
-                    log_entry = self._dispatch_effect(
-                        effect, state, f"{actor}_timed", seed
-                    )
-                    log_entry["timed_effect_id"] = pending.id
-                    triggered_logs.append(log_entry)
+        triggered_logs = []
+        for pending in due_effects:
+            effect_data = pending.effect
+            try:
+                effect = Effect(**effect_data)
+                actor = pending.actor
+                seed = pending.seed
 
-                except Exception as e:
-                    # Log timed effect failure
-                    error_log = {
-                        "effect": effect_data,
-                        "ok": False,
-                        "error": f"Timed effect failed: {str(e)}",
-                        "actor": f"{pending.actor}_timed",
-                        "timed_effect_id": pending.id,
-                    }
-                    triggered_logs.append(error_log)
-            else:
-                # Effect not ready yet, keep it in queue
-                remaining_effects.append(pending)
+                # Apply the timed effect
+                log_entry = self._dispatch_effect(
+                    effect, state, f"{actor}_timed", seed
+                )
+                log_entry["timed_effect_id"] = pending.id
+                triggered_logs.append(log_entry)
 
-        # Update pending effects queue
-        state.scene.pending_effects = remaining_effects
+            except Exception as e:
+                # Log timed effect failure
+                error_log = {
+                    "effect": effect_data,
+                    "ok": False,
+                    "error": f"Timed effect failed: {str(e)}",
+                    "actor": f"{pending.actor}_timed",
+                    "timed_effect_id": pending.id,
+                }
+                triggered_logs.append(error_log)
 
         return triggered_logs
 
+    def _pending_condition_met(self, pending: PendingEffect, state: GameState) -> bool:
+        """Evaluate a due PendingEffect's condition against its effect's target."""
+        try:
+            effect = Effect(**{**pending.effect, "condition": pending.condition})
+        except Exception:
+            # Malformed effects are not held back; applying them logs the error
+            return True
+        return self._evaluate_effect_condition(effect, state)
+
     def _execute_apply_effects(
         self, args: Dict[str, Any], state: GameState, utterance: Utterance, seed: int
     ) -> ToolResult:
@@ -6500,10 +6581,9 @@ class Validator:
                     else:
                         reactive_failed_count += 1
 
-                # Store effect logs in state for replay/undo
-                if not hasattr(state.scene, "last_effect_log"):
-                    state.scene.last_effect_log = []
-                state.scene.last_effect_log.extend(logs)
+                # Store effect logs in state for replay/undo (bounded, see
+                # effect_log.py)
+                state.scene.add_effect_logs(logs)
 
                 # Generate and store human-readable audit trail
                 audit_trail = self._generate_audit_trail(logs, actor, state)
@@ -119,7 +119,7 @@ def redact_entity(
                     "meta": {
                         "visibility": entity.meta.visibility,  # Narrator sees visibility state
                         "created_at": entity.meta.created_at,
-                        "last_changed_at": entity.meta.last_changed_at,
+                        "last_changed_at": entity.meta.last_changed_iso,
                         "source": entity.meta.source,
                         "notes": None,  # But not GM notes
                         "extra": entity.meta.extra,
@@ -2118,7 +2118,7 @@ def _export_json(
             zone_data["meta"] = {
                 "visibility": zone.meta.visibility,
                 "created_at": zone.meta.created_at,
-                "last_changed_at": zone.meta.last_changed_at,
+                "last_changed_at": zone.meta.last_changed_iso,
             }
 
         if include_discovery:
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Benchmark off-screen NPC simulation throughput.
+
+Builds a ring of zones with NPCs that patrol, chase goals, talk and fight
+the scouts (PCs in zones that are not being played), then times
+NPCSimulator.run_round() and reports NPC turns per second.
+
+Usage:
+    python benchmarks/npc_simulation.py [--npcs 1000] [--rounds 10] [--seed 0]
+"""
+
+import argparse
+import logging
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.router.game_state import GameState, PC, NPC, Zone, HP
+from backend.router.npc_simulation import NPCSimulator
+
+
+def build_world(npc_count: int) -> GameState:
+    """World with npc_count NPCs over npc_count // 10 zones in a ring."""
+    zone_count = max(npc_count // 10, 3)
+    zones = {}
+    for i in range(zone_count):
+        neighbours = [f"zone_{(i + 1) % zone_count}", f"zone_{(i - 1) % zone_count}"]
+        zones[f"zone_{i}"] = Zone(
+            id=f"zone_{i}", name=f"Zone {i}", adjacent_zones=neighbours
+        )
+
+    entities = {"pc.hero": PC(id="pc.hero", name="Hero", current_zone="zone_0")}
+    for i in range(1, zone_count):
+        entities[f"pc.scout_{i}"] = PC(
+            id=f"pc.scout_{i}",
+            name=f"Scout {i}",
+            current_zone=f"zone_{i}",
+            hp=HP(current=10**6, max=10**6),
+        )
+    for i in range(npc_count):
+        zone = i % zone_count
+        if i % 4 == 0:
+            tags = {"goal_zone": f"zone_{(zone + zone_count // 2) % zone_count}"}
+        elif i % 4 == 1:
+            tags = {"patrol": [f"zone_{zone}", f"zone_{(zone + 1) % zone_count}"]}
+        elif i % 4 == 2:
+            tags = {"hostile_to": "pc", "aggression": 0.8}
+        else:
+            tags = {"sociability": 0.6}
+        entities[f"npc.{i}"] = NPC(
+            id=f"npc.{i}",
+            name=f"NPC {i}",
+            current_zone=f"zone_{zone}",
+            hp=HP(current=1000, max=1000),
+            tags=tags,
+        )
+    return GameState(entities=entities, zones=zones)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--npcs", type=int, default=1000)
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    state = build_world(args.npcs)
+    simulator = NPCSimulator(state, seed=args.seed)
+
+    print(f"{'round':>5} {'npcs':>6} {'failed':>7} {'seconds':>8} {'turns/s':>9}  actions")
+    total_turns, total_seconds = 0, 0.0
+    for _ in range(args.rounds):
+        tick = simulator.run_round(on_screen_zones=["zone_0"])
+        total_turns += tick.npcs
+        total_seconds += tick.seconds
+        print(
+            f"{state.scene.round:>5} {tick.npcs:>6} {tick.failed:>7} "
+            f"{tick.seconds:>8.4f} {tick.npc_turns_per_second:>9.0f}  {dict(tick.actions)}"
+        )
+        state.scene.round += 1
+    print(f"\n{total_turns / total_seconds:.0f} NPC turns/s over {args.rounds} rounds")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Benchmark save export time against world size.
+
+Compares the three per-view exports (to_public_format, to_save_format,
+to_session_format) with the single-pass GameState.export_views(), and times a
+full PersistenceManager.save_game_state().
+
+Usage:
+    python benchmarks/save_export.py [--sizes 100 1000 5000] [--repeat 3]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.meta import Meta
+from backend.router.game_state import GameState, PC, NPC, Zone, Clock, HP
+from backend.router.persistence import PersistenceManager
+
+
+def build_world(entity_count: int) -> GameState:
+    """World with entity_count NPCs spread over entity_count // 10 zones."""
+    zone_count = max(entity_count // 10, 1)
+    zones = {}
+    for i in range(zone_count):
+        neighbours = [f"zone_{(i + 1) % zone_count}", f"zone_{(i - 1) % zone_count}"]
+        zones[f"zone_{i}"] = Zone(
+            id=f"zone_{i}",
+            name=f"Zone {i}",
+            description="Generated zone.",
+            adjacent_zones=neighbours,
+            meta=Meta(visibility="hidden" if i % 7 == 0 else "public"),
+        )
+
+    entities = {
+        "pc.hero": PC(id="pc.hero", name="Hero", current_zone="zone_0"),
+    }
+    for i in range(entity_count):
+        entities[f"npc.{i}"] = NPC(
+            id=f"npc.{i}",
+            name=f"NPC {i}",
+            current_zone=f"zone_{i % zone_count}",
+            hp=HP(current=10, max=10),
+            meta=Meta(
+                visibility="gm_only" if i % 11 == 0 else "public",
+                gm_only=i % 11 == 0,
+                known_by={"pc.hero"} if i % 3 == 0 else set(),
+                notes="generated",
+            ),
+        )
+
+    clocks = {
+        f"clock_{i}": Clock(id=f"clock_{i}", name=f"Clock {i}")
+        for i in range(max(entity_count // 50, 1))
+    }
+    return GameState(entities=entities, zones=zones, clocks=clocks)
+
+
+def best_of(repeat: int, fn) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 5000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'entities':>9} {'per-view (s)':>13} {'single-pass (s)':>16} {'speedup':>8} {'save (s)':>9}")
+    with tempfile.TemporaryDirectory() as tmp:
+        manager = PersistenceManager(base_path=tmp)
+        for size in args.sizes:
+            state = build_world(size)
+
+            def per_view():
+                state.to_public_format(role="player")
+                state.to_save_format(include_runtime_data=True)
+                state.to_session_format()
+
+            separate = best_of(args.repeat, per_view)
+            single = best_of(args.repeat, state.export_views)
+            save = best_of(
+                args.repeat,
+                lambda: manager.save_game_state(state, f"bench_{size}", create_backup=False),
+            )
+            print(
+                f"{size:>9} {separate:>13.4f} {single:>16.4f} "
+                f"{separate / single:>7.1f}x {save:>9.4f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -25,6 +25,13 @@ OPENAI_TEMPERATURE = float(
 LLM_TIMEOUT_SECONDS = int(os.getenv("LLM_TIMEOUT_SECONDS", "10"))
 FALLBACK_TOOL = os.getenv("FALLBACK_TOOL", "ask_clarifying")
 
+# Intent cache for the staged planner (Stage 1 results keyed on utterance,
+# model and prompt version). Set INTENT_CACHE_PATH to persist across sessions.
+INTENT_CACHE_ENABLED = os.getenv("INTENT_CACHE_ENABLED", "1") != "0"
+INTENT_CACHE_PATH = os.getenv("INTENT_CACHE_PATH")  # e.g. "saves/intent_cache.sqlite"
+INTENT_CACHE_MAX_ENTRIES = int(os.getenv("INTENT_CACHE_MAX_ENTRIES", "1024"))
+INTENT_CACHE_TTL_SECONDS = float(os.getenv("INTENT_CACHE_TTL_SECONDS", "604800"))
+
 # Example .env file content (create this file in project root):
 # OPENAI_API_KEY=your-actual-api-key-here
 # OPENAI_MODEL=gpt-4o-mini
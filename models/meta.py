@@ -1,11 +1,219 @@
-from pydantic import BaseModel, Field, model_validator
-from typing import Optional, Set, Dict, Any, Literal, TYPE_CHECKING
+import sys
+import threading
+import time
+from collections.abc import MutableSet
+from types import ModuleType
+from pydantic import BaseModel, Field, GetCoreSchemaHandler, field_serializer, model_validator
+from pydantic_core import core_schema
+from typing import (
+    Optional,
+    Set,
+    Dict,
+    Any,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Union,
+    TYPE_CHECKING,
+)
 from datetime import datetime, timezone
 
 if TYPE_CHECKING:
     from backend.router.game_state import GameState
 
 
+# Import paths of the event module in order of preference (tests use
+# router.events via path modification)
+EVENT_MODULE_PATHS = ("router.events", "backend.router.events")
+
+
+def loaded_events_module() -> Optional[ModuleType]:
+    """
+    The event module to publish on, without importing anything.
+
+    Nobody can have subscribed to a bus whose module was never imported, so
+    publishers only need the modules already in sys.modules. That avoids
+    running the import machinery (and failed path scans) on every publish.
+    """
+    for module_path in EVENT_MODULE_PATHS:
+        module = sys.modules.get(module_path)
+        if module is not None and hasattr(module, "event_bus"):
+            return module
+    return None
+
+
+# =============================================================================
+# Interned actor sets
+# =============================================================================
+
+# Process-wide actor ID <-> index table, shared by every GameState in the
+# process (KnownBy values are built before they belong to any state).
+# Indices are never reused, so a KnownBy bitmask stays valid for the life of
+# the process. The table is bounded: once MAX_INTERNED_ACTORS IDs are
+# interned, new IDs are kept as strings in KnownBy's overflow set instead, so
+# a long-running server that sees ever new actor IDs does not grow the table
+# (or its bitmasks) without limit.
+MAX_INTERNED_ACTORS = 4096
+
+_actor_index: Dict[str, int] = {}
+_actor_ids: List[str] = []
+_intern_lock = threading.Lock()
+
+
+def intern_actor(actor_id: str) -> Optional[int]:
+    """Index of an actor ID in the intern table, adding it if new (None if full)."""
+    index = _actor_index.get(actor_id)
+    if index is None:
+        with _intern_lock:
+            index = _actor_index.get(actor_id)
+            if index is None:
+                if len(_actor_ids) >= MAX_INTERNED_ACTORS:
+                    return None
+                index = len(_actor_ids)
+                _actor_ids.append(actor_id)
+                _actor_index[actor_id] = index
+    return index
+
+
+class KnownBy(MutableSet):
+    """
+    Set of actor IDs stored as a bitmask of interned actor indices.
+
+    Behaves like the set of strings Meta.known_by used to be (add, discard,
+    in, len, iteration, comparison with plain sets), but costs one int per
+    object instead of a hash table, and copies/unions are integer operations.
+    IDs that did not fit in the intern table go to a plain overflow set.
+    """
+
+    __slots__ = ("_mask", "_extra")
+    __hash__ = None  # mutable
+
+    def __init__(self, actor_ids: Iterable[str] = ()):
+        self._mask = 0
+        self._extra: Optional[Set[str]] = None
+        if isinstance(actor_ids, KnownBy):
+            self._mask = actor_ids._mask
+            if actor_ids._extra:
+                self._extra = set(actor_ids._extra)
+        else:
+            for actor_id in actor_ids:
+                if not isinstance(actor_id, str):
+                    raise TypeError(f"Actor IDs must be strings, got {actor_id!r}")
+                self.add(actor_id)
+
+    @classmethod
+    def _from_iterable(cls, iterable: Iterable[str]) -> "KnownBy":
+        return cls(iterable)
+
+    def __contains__(self, actor_id: object) -> bool:
+        index = _actor_index.get(actor_id)  # type: ignore[arg-type]
+        if index is None:
+            return bool(self._extra) and actor_id in self._extra  # type: ignore[operator]
+        return (self._mask >> index) & 1 == 1
+
+    def __iter__(self) -> Iterator[str]:
+        mask = self._mask
+        while mask:
+            low_bit = mask & -mask
+            yield _actor_ids[low_bit.bit_length() - 1]
+            mask ^= low_bit
+        if self._extra:
+            yield from self._extra
+
+    def __len__(self) -> int:
+        return bin(self._mask).count("1") + (len(self._extra) if self._extra else 0)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, KnownBy):
+            return self._mask == other._mask and (self._extra or set()) == (
+                other._extra or set()
+            )
+        return super().__eq__(other)
+
+    def __repr__(self) -> str:
+        return f"KnownBy({sorted(self)!r})"
+
+    def add(self, actor_id: str) -> None:
+        index = intern_actor(actor_id)
+        if index is not None:
+            self._mask |= 1 << index
+        elif self._extra is None:
+            self._extra = {actor_id}
+        else:
+            self._extra.add(actor_id)
+
+    def discard(self, actor_id: str) -> None:
+        index = _actor_index.get(actor_id)
+        if index is not None:
+            self._mask &= ~(1 << index)
+        elif self._extra:
+            self._extra.discard(actor_id)
+
+    def update(self, *others: Iterable[str]) -> None:
+        for other in others:
+            other = other if isinstance(other, KnownBy) else KnownBy(other)
+            self._mask |= other._mask
+            if other._extra:
+                if self._extra is None:
+                    self._extra = set()
+                self._extra |= other._extra
+
+    def copy(self) -> "KnownBy":
+        return KnownBy(self)
+
+    def union(self, *others: Iterable[str]) -> "KnownBy":
+        result = self.copy()
+        result.update(*others)
+        return result
+
+    def __copy__(self) -> "KnownBy":
+        return self.copy()
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "KnownBy":
+        return self.copy()
+
+    def __getstate__(self) -> List[str]:
+        # Indices are process-local, so pickles carry the IDs
+        return list(self)
+
+    def __setstate__(self, actor_ids: List[str]) -> None:
+        self.__init__(actor_ids)
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source: Any, handler: GetCoreSchemaHandler
+    ) -> core_schema.CoreSchema:
+        return core_schema.no_info_plain_validator_function(
+            cls._validate,
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                cls._serialize, info_arg=True
+            ),
+        )
+
+    @classmethod
+    def _validate(cls, value: Any) -> "KnownBy":
+        if isinstance(value, (str, bytes)) or not isinstance(value, Iterable):
+            raise ValueError("known_by must be a collection of actor IDs")
+        try:
+            return cls(value)
+        except TypeError as e:
+            raise ValueError(str(e)) from e
+
+    @staticmethod
+    def _serialize(value: Iterable[str], info: Any) -> Union[List[str], Set[str]]:
+        if info.mode_is_json():
+            return sorted(value)
+        return set(value)
+
+
+def format_timestamp(value: Union[str, float, None]) -> Optional[str]:
+    """ISO-8601 form of a stored timestamp (epoch seconds are formatted lazily)."""
+    if value is None or isinstance(value, str):
+        return value
+    return datetime.fromtimestamp(value, timezone.utc).isoformat()
+
+
 class Meta(BaseModel):
     """
     Metadata for every world object (entities, zones, scene, clocks, etc.).
@@ -17,9 +225,12 @@ class Meta(BaseModel):
 
     visibility: Literal["public", "hidden", "gm_only"] = "public"
     gm_only: bool = False  # redundant but convenient flag
-    known_by: Set[str] = Field(default_factory=set)
+    known_by: KnownBy = Field(default_factory=KnownBy)
     created_at: Optional[str] = None
-    last_changed_at: Optional[str] = None
+    # touch() stores epoch seconds; ISO strings are produced on export
+    last_changed_at: Optional[Union[str, float]] = None
+    # Bumped by every touch(); compare versions to validate cached views
+    version: int = 0
     source: Optional[str] = None  # "manual" | "generator" | "import"
     notes: Optional[str] = None
     extra: Dict[str, Any] = Field(default_factory=dict)
@@ -30,6 +241,15 @@ class Meta(BaseModel):
         if self.extra and "__from_export" in self.extra:
             del self.extra["__from_export"]
 
+    @field_serializer("last_changed_at")
+    def _serialize_last_changed_at(self, value: Union[str, float, None]) -> Optional[str]:
+        return format_timestamp(value)
+
+    @property
+    def last_changed_iso(self) -> Optional[str]:
+        """last_changed_at as an ISO-8601 string."""
+        return format_timestamp(self.last_changed_at)
+
     @model_validator(mode="after")
     def validate_gm_only_consistency(self) -> "Meta":
         """
@@ -77,56 +297,47 @@ class Meta(BaseModel):
         self, game_state: Optional["GameState"] = None, entity_id: Optional[str] = None
     ):
         """
-        Update last_changed_at whenever something mutates.
+        Bump the version and record the change time whenever something mutates.
 
         Args:
             game_state: Optional GameState to invalidate cache on
             entity_id: Optional entity ID to invalidate specific cache entries
         """
-        self.last_changed_at = datetime.now(timezone.utc).isoformat()
+        self.version += 1
+        self.last_changed_at = time.time()
 
         # Invalidate redaction cache if game_state provided
         if game_state:
             game_state.invalidate_cache(entity_id)
 
-        # Publish meta change event using deferred import to avoid circular dependencies
+        # Publish meta change event (the payload is only built if someone listens)
         try:
-            import importlib
-
-            # Try import paths in order of preference (tests use router.events via path modification)
-            events_module = None
-            for module_path in ["router.events", "backend.router.events"]:
-                try:
-                    events_module = importlib.import_module(module_path)
-                    break
-                except ImportError:
-                    continue
-
-            if (
-                events_module
-                and hasattr(events_module, "publish")
-                and hasattr(events_module, "EventTypes")
-            ):
-                events_module.publish(
-                    events_module.EventTypes.META_CHANGED,
-                    {
-                        "object_id": entity_id,
-                        "visibility": self.visibility,
-                        "gm_only": self.gm_only,
-                        "notes_present": self.notes is not None,
-                        "known_by_count": len(self.known_by),
-                    },
-                )
 
-        except (ImportError, AttributeError) as e:
-            # Event system not available or event missing, continue silently
-            # This is expected when event system isn't set up
+            def build_data() -> dict:
+                return {
+                    "object_id": entity_id,
+                    "visibility": self.visibility,
+                    "gm_only": self.gm_only,
+                    "notes_present": self.notes is not None,
+                    "known_by_count": len(self.known_by),
+                }
+
+            if game_state is not None:
+                # Reaches the state's own listeners and the global bus
+                game_state.publish("meta.changed", build_data)
+            else:
+                events_module = loaded_events_module()
+                if events_module is not None:
+                    events_module.event_bus.publish_lazy(
+                        events_module.EventTypes.META_CHANGED, build_data
+                    )
+
+        except AttributeError:
+            # Event system not fully set up, continue silently
             pass
         except Exception as e:
             # Unexpected error in event publishing - log and continue
             # TODO: Consider using proper logging when logger is available
-            import sys
-
             print(
                 f"Warning: Unexpected error in meta event publishing: {e}",
                 file=sys.stderr,
@@ -180,7 +391,7 @@ class Meta(BaseModel):
         if "created_at" in fields:
             result["created_at"] = self.created_at
         if "last_changed_at" in fields and self.last_changed_at:
-            result["last_changed_at"] = self.last_changed_at
+            result["last_changed_at"] = self.last_changed_iso
         if "source" in fields and self.source:
             result["source"] = self.source
         if "notes" in fields and self.notes:
@@ -5,6 +5,6 @@ This module provides LLM-based narration generation that takes the mechanical
 output from tools and transforms it into immersive, literary descriptions.
 """
 
-from .generator import generate_narration
+from .generator import generate_narration, stream_narration
 
-__all__ = ["generate_narration"]
+__all__ = ["generate_narration", "stream_narration"]
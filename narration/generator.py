@@ -9,7 +9,7 @@ templates used in tools.
 import json
 import logging
 import os
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Iterator
 from textwrap import dedent
 
 from openai import OpenAI
@@ -95,41 +95,11 @@ class NarrationGenerator:
             Rich narrative text generated by 4o-mini
         """
         try:
-            # Determine POV actor
-            pov_id = pov_actor_id or world.current_actor
-            if not pov_id:
-                return result.narration_hint.get("summary", "Something happens.")
-
-            # Get redacted world state for safety - disable cache to avoid stale visibility
-            redacted_state = world.get_state(
-                pov_id, redact=True, role="player", use_cache=False
+            user_prompt = self._prepare_prompt(
+                result, world, pov_actor_id, previous_narration
             )
-
-            # Build context for the LLM
-            context = self._build_context(result, redacted_state, pov_id, world)
-
-            # Create the prompt
-            user_prompt = self._create_prompt(result, context, previous_narration)
-
-            # DEBUG: Log the full prompt being sent to GPT-5
-            full_input = f"{self.system_prompt}\n\n{user_prompt}"
-
-            # Gate full prompt logging behind SHOW_PROMPTS to prevent content leaks
-            if os.getenv("SHOW_PROMPTS"):
-                logger.info("🎭 ===== FULL PROMPT DEBUG =====")
-                logger.info(
-                    f"🎭 SYSTEM PROMPT ({len(self.system_prompt)} chars): {self.system_prompt}"
-                )
-                logger.info(f"🎭 USER PROMPT ({len(user_prompt)} chars): {user_prompt}")
-                logger.info(
-                    f"🎭 FULL INPUT ({len(full_input)} chars): {full_input[:300]}..."
-                )
-                logger.info("🎭 ===== END PROMPT DEBUG =====")
-            else:
-                # Only log non-sensitive metadata
-                logger.debug(
-                    f"🎭 PROMPT DIGEST: system={len(self.system_prompt)} chars, user={len(user_prompt)} chars"
-                )
+            if user_prompt is None:
+                return result.narration_hint.get("summary", "Something happens.")
 
             # DEBUG: Log which model and settings are being used
             logger.debug(
@@ -193,6 +163,157 @@ class NarrationGenerator:
             # Fallback to original summary
             return result.narration_hint.get("summary", "Something happens.")
 
+    def _prepare_prompt(
+        self,
+        result: ToolResult,
+        world: GameState,
+        pov_actor_id: Optional[str],
+        previous_narration: str,
+    ) -> Optional[str]:
+        """
+        Build the user prompt shared by the blocking and streaming paths.
+
+        Returns None when there is no POV actor to narrate for, in which case
+        callers fall back to the narration hint summary.
+        """
+        # Determine POV actor
+        pov_id = pov_actor_id or world.current_actor
+        if not pov_id:
+            return None
+
+        # Get redacted world state for safety - disable cache to avoid stale visibility
+        redacted_state = world.get_state(
+            pov_id, redact=True, role="player", use_cache=False
+        )
+
+        # Build context for the LLM
+        context = self._build_context(result, redacted_state, pov_id, world)
+
+        # Create the prompt
+        user_prompt = self._create_prompt(result, context, previous_narration)
+
+        # DEBUG: Log the full prompt being sent to GPT-5
+        full_input = f"{self.system_prompt}\n\n{user_prompt}"
+
+        # Gate full prompt logging behind SHOW_PROMPTS to prevent content leaks
+        if os.getenv("SHOW_PROMPTS"):
+            logger.info("🎭 ===== FULL PROMPT DEBUG =====")
+            logger.info(
+                f"🎭 SYSTEM PROMPT ({len(self.system_prompt)} chars): {self.system_prompt}"
+            )
+            logger.info(f"🎭 USER PROMPT ({len(user_prompt)} chars): {user_prompt}")
+            logger.info(
+                f"🎭 FULL INPUT ({len(full_input)} chars): {full_input[:300]}..."
+            )
+            logger.info("🎭 ===== END PROMPT DEBUG =====")
+        else:
+            # Only log non-sensitive metadata
+            logger.debug(
+                f"🎭 PROMPT DIGEST: system={len(self.system_prompt)} chars, user={len(user_prompt)} chars"
+            )
+
+        return user_prompt
+
+    def stream_narration(
+        self,
+        result: ToolResult,
+        world: GameState,
+        pov_actor_id: Optional[str] = None,
+        previous_narration: str = "",
+    ) -> Iterator[str]:
+        """
+        Stream narration for a tool result as it is generated.
+
+        Yields text fragments as soon as the model produces them. Uses
+        ``stream=True`` on Chat Completions and the Responses API for GPT-5
+        models. If the request fails before any text arrives, or the stream
+        ends up empty, the narration hint summary is yielded instead so
+        callers always receive something to display.
+
+        Args:
+            result: The ToolResult from tool execution
+            world: Current game state for context
+            pov_actor_id: ID of the POV actor (defaults to current_actor)
+            previous_narration: Previous narration text for continuity
+
+        Yields:
+            Narration text fragments in order
+        """
+        summary = result.narration_hint.get("summary", "Something happens.")
+        emitted = False
+
+        try:
+            user_prompt = self._prepare_prompt(
+                result, world, pov_actor_id, previous_narration
+            )
+            if user_prompt is None:
+                yield summary
+                return
+
+            if self.model.startswith("gpt-5"):
+                logger.debug("🚀 Streaming GPT-5 Responses API narration")
+                stream = self.client.responses.create(
+                    model=self.model,
+                    input=f"{self.system_prompt}\n\n{user_prompt}",
+                    text={"verbosity": "medium"},
+                    stream=True,
+                )
+                fragments = self._iter_response_deltas(stream)
+            else:
+                logger.debug("⚙️ Streaming Chat Completions narration")
+                stream = self.client.chat.completions.create(
+                    model=self.model,
+                    messages=[
+                        {"role": "system", "content": self.system_prompt},
+                        {"role": "user", "content": user_prompt},
+                    ],
+                    max_completion_tokens=self.max_tokens,
+                    temperature=self.temperature,
+                    stream=True,
+                )
+                fragments = self._iter_chat_deltas(stream)
+
+            for fragment in fragments:
+                # Hold back leading whitespace so output matches the
+                # stripped text returned by generate_narration
+                if not emitted:
+                    fragment = fragment.lstrip()
+                    if not fragment:
+                        continue
+                emitted = True
+                yield fragment
+
+        except Exception:
+            logger.exception("Streaming narration failed")
+            if emitted:
+                # Text already reached the player; don't append the summary
+                return
+
+        if not emitted:
+            logger.warning(
+                f"🚨 Streamed narration empty/invalid, falling back to summary: '{summary}'"
+            )
+            yield summary
+
+    @staticmethod
+    def _iter_chat_deltas(stream: Any) -> Iterator[str]:
+        """Extract text deltas from a streamed Chat Completions response."""
+        for chunk in stream:
+            if not chunk.choices:
+                continue
+            content = chunk.choices[0].delta.content
+            if content:
+                yield content
+
+    @staticmethod
+    def _iter_response_deltas(stream: Any) -> Iterator[str]:
+        """Extract text deltas from a streamed Responses API event stream."""
+        for event in stream:
+            if getattr(event, "type", None) == "response.output_text.delta":
+                delta = getattr(event, "delta", "")
+                if delta:
+                    yield delta
+
     def _process_zone_entities(
         self, redacted_state: Dict[str, Any], zone_actors: List[str], pov_id: str
     ) -> List[Dict[str, Any]]:
@@ -452,3 +573,35 @@ def generate_narration(
     return _generator_instance.generate_narration(
         result, world, pov_actor_id, previous_narration
     )
+
+
+def stream_narration(
+    result: ToolResult,
+    world: GameState,
+    pov_actor_id: Optional[str] = None,
+    previous_narration: str = "",
+) -> Iterator[str]:
+    """
+    Convenience function to stream narration using the global generator.
+
+    Args:
+        result: ToolResult from tool execution
+        world: Current game state
+        pov_actor_id: Optional POV actor ID
+        previous_narration: Previous narration text for continuity
+
+    Yields:
+        Narration text fragments as they are generated
+    """
+    global _generator_instance
+    if _generator_instance is None:
+        initialize_generator()
+
+    if _generator_instance is None:
+        logger.error("Failed to initialize narration generator")
+        yield result.narration_hint.get("summary", "Something happens.")
+        return
+
+    yield from _generator_instance.stream_narration(
+        result, world, pov_actor_id, previous_narration
+    )
@@ -17,6 +17,12 @@ if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
 from backend.router.game_state import GameState
+from backend.router import binary_format
+from backend.router.atomic_io import atomic_write
+from backend.router.autosave import AutosaveService, SaveSnapshot
+from backend.router.clock_engine import ClockEngine
+from backend.router.effect_log import EffectLogArchive
+from backend.router.replay import TurnRecorder
 from runtime.router import process_turn, get_router
 import config
 
@@ -32,10 +38,15 @@ def setup_logging(debug: bool = False) -> None:
 
 
 def load_world(world_file: str = "demo_world.json") -> GameState:
-    """Load game world from JSON file."""
+    """Load game world from a JSON file or a binary save (detected by header)."""
     world_path = os.path.join(os.path.dirname(__file__), world_file)
 
     try:
+        if binary_format.is_binary_save(world_path):
+            world = binary_format.load_state(world_path)
+            logging.info(f"Loaded world from {world_file} (binary)")
+            return world
+
         with open(world_path, "r") as f:
             world_data = json.load(f)
 
@@ -55,23 +66,72 @@ def load_world(world_file: str = "demo_world.json") -> GameState:
         raise
 
 
-def save_world(world: GameState, save_file: str = "session_state.json") -> None:
-    """Save current game state to JSON file."""
+def snapshot_world(world: GameState, save_file: str = "session_state.json") -> dict:
+    """Detached save data for a world, in the format save_file calls for."""
+    if save_file.endswith(binary_format.BINARY_SUFFIX):
+        return world.to_save_format(include_runtime_data=True)
+    # Export world state with JSON-safe serialization
+    return world.export_state(mode="save")
+
+
+def write_world_data(world_data: dict, save_file: str = "session_state.json") -> None:
+    """Write save data produced by snapshot_world (binary for .gsb files)."""
     save_path = os.path.join(os.path.dirname(__file__), save_file)
 
-    try:
-        # Export world state with JSON-safe serialization
-        world_data = world.export_state(mode="save")
+    if save_file.endswith(binary_format.BINARY_SUFFIX):
+        binary_format.write_file(save_path, world_data)
+        logging.info(f"Saved world to {save_file} (binary)")
+        return
+
+    payload = json.dumps(world_data, indent=2).encode("utf-8")
+    atomic_write(save_path, payload)
 
-        with open(save_path, "w") as f:
-            json.dump(world_data, f, indent=2)
+    logging.info(f"Saved world to {save_file}")
 
-        logging.info(f"Saved world to {save_file}")
 
+def save_world(world: GameState, save_file: str = "session_state.json") -> None:
+    """Save current game state to JSON, or to the binary format for .gsb files."""
+    try:
+        write_world_data(snapshot_world(world, save_file), save_file)
     except Exception as e:
         logging.error(f"Failed to save world: {e}")
 
 
+def create_autosave(save_file: str = "session_state.json") -> AutosaveService:
+    """Background autosave that writes the session file off the turn loop."""
+
+    def write(snapshot: SaveSnapshot) -> None:
+        write_world_data(snapshot.data, snapshot.target)
+
+    return AutosaveService(
+        write,
+        snapshot_fn=lambda world: snapshot_world(world, save_file),
+        name="session-autosave",
+    )
+
+
+def create_turn_recorder(
+    world: GameState, continuing: bool, save_file: str = "session_state.json"
+) -> TurnRecorder:
+    """
+    Replay log for a session: the world it started from plus every turn since.
+
+    Replay with: python -m backend.router.replay <name>.initial.json <name>.jsonl
+    """
+    base = os.path.join(
+        os.path.dirname(__file__), "turn_log", os.path.splitext(save_file)[0]
+    )
+    initial_path = base + ".initial.json"
+    log_path = base + ".jsonl"
+    if not (continuing and os.path.exists(initial_path) and os.path.exists(log_path)):
+        # A new game (or a session without a usable log) starts a new log
+        os.makedirs(os.path.dirname(base), exist_ok=True)
+        initial = json.dumps(world.model_dump(mode="json")).encode("utf-8")
+        atomic_write(initial_path, initial)
+        atomic_write(log_path, b"")
+    return TurnRecorder(log_path)
+
+
 def run_prototype(
     world_file: str = "demo_world.json",
     debug: bool = False,
@@ -93,11 +153,13 @@ def run_prototype(
     try:
         # Load world - check for existing session unless forcing new game
         session_path = os.path.join(os.path.dirname(__file__), "session_state.json")
+        continuing = False
 
         if not force_new_game and os.path.exists(session_path):
             print("🔄 Found existing session, continuing...")
             try:
                 world = load_world("session_state.json")
+                continuing = True
                 print("📂 Loaded saved session state")
             except Exception as e:
                 print(f"⚠️  Failed to load session ({e}), starting fresh...")
@@ -109,9 +171,25 @@ def run_prototype(
                 print("🆕 Starting new game...")
             world = load_world(world_file)
 
+        # Effect log entries evicted from the scene are archived on disk, one
+        # archive per save file; a new game starts with an empty one
+        archive = EffectLogArchive(
+            os.path.join(os.path.dirname(__file__), "effect_log", "session_state")
+        )
+        if not continuing:
+            archive.clear()
+        world.scene.attach_effect_log_archive(archive)
+        # Global event observers see this world's events under its save name
+        world.set_session_id("session_state")
+
+        # Clock updates go through the engine (legacy dict clocks are migrated)
+        ClockEngine(world)
+
         # Initialize router
         router = get_router()
         router.initialize()
+        # Every turn goes to the session's replay log
+        router.turn_recorder = create_turn_recorder(world, continuing)
 
         # Reset narrative history for fresh sessions
         session_path = os.path.join(os.path.dirname(__file__), "session_state.json")
@@ -131,50 +209,77 @@ def run_prototype(
         print("Type 'quit' or 'exit' to stop playing.")
         print()
 
-        # Game loop
-        turn_count = 0
-        while True:
-            try:
-                # Get player input
-                print(f"[Round {world.scene.round}, Turn {turn_count + 1}]")
-                user_input = input("\n> ").strip()
-
-                if not user_input:
-                    continue
-
-                if user_input.lower() in ["quit", "exit", "q"]:
-                    print("\nThanks for playing! Goodbye!")
+        # Autosave runs on a background thread so turns don't wait on disk
+        autosave = create_autosave("session_state.json") if auto_save else None
+
+        try:
+            # Game loop
+            turn_count = 0
+            while True:
+                try:
+                    # Get player input
+                    print(f"[Round {world.scene.round}, Turn {turn_count + 1}]")
+                    user_input = input("\n> ").strip()
+
+                    if not user_input:
+                        continue
+
+                    if user_input.lower() in ["quit", "exit", "q"]:
+                        print("\nThanks for playing! Goodbye!")
+                        break
+
+                    # Process the turn
+                    print("\n" + "." * 40)
+                    streamed = []
+
+                    def show_fragment(fragment: str) -> None:
+                        # Print narration as it streams in rather than after the turn
+                        if not streamed:
+                            print()
+                        streamed.append(fragment)
+                        print(fragment, end="", flush=True)
+
+                    result = process_turn(
+                        world, user_input, debug=debug, narration_callback=show_fragment
+                    )
+
+                    # Display result (successful narration was already streamed)
+                    if result.success:
+                        if streamed:
+                            print()
+                        else:
+                            print(f"\n{result.narration}")
+                    elif streamed:
+                        print("\n❌ One or more actions failed.")
+                    else:
+                        print(f"\n❌ {result.narration}")
+                        if debug and result.error_message:
+                            print(f"Debug: {result.error_message}")
+
+                    # Auto-save if enabled
+                    if autosave is not None:
+                        autosave.request_save(world, "session_state.json")
+
+                    turn_count += 1
+                    print("\n" + "." * 40)
+
+                except KeyboardInterrupt:
+                    print("\n\nGame interrupted. Saving...")
+                    if auto_save:
+                        save_world(world, "interrupted_session.json")
                     break
-
-                # Process the turn
-                print("\n" + "." * 40)
-                result = process_turn(world, user_input, debug=debug)
-
-                # Display result
-                if result.success:
-                    print(f"\n{result.narration}")
-                else:
-                    print(f"\n❌ {result.narration}")
-                    if debug and result.error_message:
-                        print(f"Debug: {result.error_message}")
-
-                # Auto-save if enabled
-                if auto_save:
-                    save_world(world, "session_state.json")
-
-                turn_count += 1
-                print("\n" + "." * 40)
-
-            except KeyboardInterrupt:
-                print("\n\nGame interrupted. Saving...")
-                if auto_save:
-                    save_world(world, "interrupted_session.json")
-                break
-            except Exception as e:
-                logging.error(f"Error during game loop: {e}")
-                print(f"\n❌ An error occurred: {e}")
-                if debug:
-                    raise
+                except Exception as e:
+                    logging.error(f"Error during game loop: {e}")
+                    print(f"\n❌ An error occurred: {e}")
+                    if debug:
+                        raise
+        finally:
+            # Finish any queued autosave and close the turn log, even when
+            # the loop ends with an exception (debug mode re-raises)
+            if autosave is not None:
+                autosave.close()
+            router.turn_recorder.close()
+            router.turn_recorder = None
 
     except Exception as e:
         logging.error(f"Failed to start prototype: {e}")
@@ -13,15 +13,21 @@ Integrates all the existing AID&D systems into a cohesive game loop.
 """
 
 import logging
-from typing import Dict, Any, Optional, Tuple, List
+from typing import Dict, Any, Optional, Tuple, List, Callable
 
 from backend.router.game_state import GameState, Utterance
 from backend.router.planner import get_plan, get_action_sequence, initialize_planner
 from backend.router.staged_planner import get_staged_plan, initialize_staged_planner
+from backend.router.fast_path import FastPathPlanner
 from backend.router.validator import Validator, ToolResult
 from backend.router.effects import apply_effects
-from backend.router.outcome_resolver import resolve_outcome
-from narration.generator import generate_narration, initialize_generator
+from backend.router.replay import TurnRecorder, end_turn, execute_step
+from backend.router.rng import new_turn_seed
+from narration.generator import (
+    generate_narration,
+    initialize_generator,
+    stream_narration,
+)
 import config
 
 
@@ -52,12 +58,16 @@ class TurnResult:
 class GameRouter:
     """Coordinates the game execution pipeline."""
 
-    def __init__(self, use_staged_planner: bool = True):
+    def __init__(self, use_staged_planner: bool = True, use_fast_path: bool = True):
         """Initialize the router with necessary components."""
         self.validator = Validator()
         self.use_staged_planner = use_staged_planner
+        # Deterministic pre-planner tried before the staged planner's LLM calls
+        self.fast_path = FastPathPlanner() if use_fast_path else None
         self._initialized = False
         self.last_narration = ""  # Track previous narration for continuity
+        # Optional replay log of every player turn (see backend/router/replay.py)
+        self.turn_recorder: Optional[TurnRecorder] = None
 
     def initialize(self) -> None:
         """Initialize LLM-based components."""
@@ -95,6 +105,10 @@ class GameRouter:
             logger.error(f"Failed to initialize game router: {e}")
             raise RuntimeError(f"Router initialization failed: {e}")
 
+    def get_fast_path_stats(self) -> Optional[Dict[str, float]]:
+        """Return how many turns were planned without an LLM call."""
+        return self.fast_path.get_stats() if self.fast_path else None
+
     def reset_narrative_history(self) -> None:
         """Reset narrative history for new game sessions."""
         self.last_narration = ""
@@ -106,6 +120,7 @@ class GameRouter:
         player_input: str,
         actor_id: Optional[str] = None,
         debug: bool = False,
+        narration_callback: Optional[Callable[[str], None]] = None,
     ) -> TurnResult:
         """
         Process a complete game turn, supporting both single actions and action sequences.
@@ -115,6 +130,10 @@ class GameRouter:
             player_input: Raw player command text
             actor_id: Actor taking the action (defaults to current_actor)
             debug: Enable debug output
+            narration_callback: Optional callable receiving narration text
+                fragments as they are produced. When set, LLM narration is
+                streamed and the callback sees the same text that ends up in
+                TurnResult.narration, including the spaces between steps.
 
         Returns:
             TurnResult with narration and updated state
@@ -122,6 +141,8 @@ class GameRouter:
         if not self._initialized:
             self.initialize()
 
+        utterance = None
+        executed_steps: List[Dict[str, Any]] = []  # For the turn recorder
         try:
             # Determine acting character
             if not actor_id:
@@ -142,8 +163,21 @@ class GameRouter:
 
             # Step 1: Plan using appropriate planner
             if self.use_staged_planner:
-                # Use 3-stage architecture
-                staged_result = get_staged_plan(world, utterance, debug=debug)
+                # Try the deterministic fast path first; fall back to the
+                # 3-stage LLM architecture when it isn't confident
+                staged_result = (
+                    self.fast_path.plan(world, utterance) if self.fast_path else None
+                )
+                if self.fast_path:
+                    self.fast_path.record_turn(staged_result is not None)
+                if staged_result is not None:
+                    if debug:
+                        logger.info(
+                            f"Fast path: {staged_result.debug_info['fast_path_rule']} "
+                            f"(LLM-free ratio {self.fast_path.stats.fast_path_ratio:.0%})"
+                        )
+                else:
+                    staged_result = get_staged_plan(world, utterance, debug=debug)
 
                 if not staged_result.success:
                     return TurnResult(
@@ -217,14 +251,14 @@ class GameRouter:
                         f"Executing step {i+1}/{len(action_sequence_data)}: {tool_id}"
                     )
 
-                # Execute this action
-                tool_result = self.validator.validate_and_execute(
-                    tool_id, args, world, utterance
+                # Execute this action and resolve its outcome (adds consequences)
+                seed = new_turn_seed()
+                tool_result = execute_step(
+                    self.validator, world, utterance, tool_id, args, seed
+                )
+                executed_steps.append(
+                    {"tool": tool_id, "args": args, "seed": seed, "ok": tool_result.ok}
                 )
-
-                # Apply outcome resolution to add consequences
-                if tool_result.ok:
-                    tool_result = resolve_outcome(tool_result, world)
 
                 all_tool_results.append(tool_result)
 
@@ -286,12 +320,23 @@ class GameRouter:
                 ):
 
                     roll_narration = self._generate_roll_progression(tool_result)
+                    if narration_callback:
+                        if all_narrations:
+                            narration_callback(" ")
+                        narration_callback(roll_narration)
                     all_narrations.append(roll_narration)
                     previous_narration = roll_narration  # Update previous for next step
                 else:
                     # Step 3: Generate narration for this action
+                    if narration_callback and all_narrations:
+                        narration_callback(" ")
                     step_narration = self._generate_narration(
-                        tool_result, world, actor_id, previous_narration, debug
+                        tool_result,
+                        world,
+                        actor_id,
+                        previous_narration,
+                        debug,
+                        narration_callback,
                     )
                     all_narrations.append(step_narration)
                     previous_narration = step_narration  # Update previous for next step
@@ -321,7 +366,10 @@ class GameRouter:
                         logger.error(error_msg)
                         detailed_errors.append(error_msg)
                         overall_success = False
-                        all_narrations.append(f"Something went wrong with {tool_id}.")
+                        failure_narration = f"Something went wrong with {tool_id}."
+                        if narration_callback:
+                            narration_callback(" " + failure_narration)
+                        all_narrations.append(failure_narration)
                         break
 
             # Step 5: Combine narrations
@@ -336,21 +384,8 @@ class GameRouter:
                 self.last_narration = combined_narration
 
             # Step 6: Update turn counter
-            if hasattr(world.scene, "round"):
-                # Increment turn within round
-                if hasattr(world.scene, "turn_index") and hasattr(
-                    world.scene, "turn_order"
-                ):
-                    if world.scene.turn_order:
-                        world.scene.turn_index = (world.scene.turn_index + 1) % len(
-                            world.scene.turn_order
-                        )
-                        # If we've cycled through all actors, increment round
-                        if world.scene.turn_index == 0:
-                            world.scene.round += 1
-                else:
-                    # Simple round increment for single-player
-                    world.scene.round += 1
+            end_turn(world)
+            self._record_turn(utterance, executed_steps, world)
 
             return TurnResult(
                 success=overall_success,
@@ -373,12 +408,29 @@ class GameRouter:
 
         except Exception as e:
             logger.error(f"Turn processing failed: {e}")
+            if executed_steps:
+                self._record_turn(utterance, executed_steps, world, ended=False)
             return TurnResult(
                 success=False,
                 narration="Something went wrong. Please try again.",
                 error_message=str(e),
             )
 
+    def _record_turn(
+        self,
+        utterance: Utterance,
+        steps: List[Dict[str, Any]],
+        world: GameState,
+        ended: bool = True,
+    ) -> None:
+        """Append the turn to the replay log, if one is attached."""
+        if self.turn_recorder is None:
+            return
+        try:
+            self.turn_recorder.record_turn(utterance, steps, world, ended=ended)
+        except Exception as e:
+            logger.error(f"Turn recorder failed: {e}")
+
     def _generate_roll_progression(self, tool_result: ToolResult) -> str:
         """Generate dramatic roll progression narration with consequences."""
         # Defensive check for narration_hint type
@@ -446,8 +498,15 @@ class GameRouter:
         actor_id: str,
         previous_narration: str = "",
         debug: bool = False,
+        narration_callback: Optional[Callable[[str], None]] = None,
     ) -> str:
-        """Generate appropriate narration for the tool result."""
+        """
+        Generate appropriate narration for the tool result.
+
+        When narration_callback is given, LLM narration is streamed through it
+        fragment by fragment and the assembled text is returned; deterministic
+        summaries are passed to the callback in one piece.
+        """
 
         # Tools that should use LLM narration for rich prose
         llm_narration_tools = {
@@ -460,22 +519,38 @@ class GameRouter:
 
         # Use LLM narration for selected tools
         if tool_result.tool_id in llm_narration_tools:
+            fragments: List[str] = []
             try:
-                narration = generate_narration(
-                    tool_result, world, actor_id, previous_narration
-                )
+                if narration_callback:
+                    for fragment in stream_narration(
+                        tool_result, world, actor_id, previous_narration
+                    ):
+                        fragments.append(fragment)
+                        narration_callback(fragment)
+                    narration = "".join(fragments).strip()
+                else:
+                    narration = generate_narration(
+                        tool_result, world, actor_id, previous_narration
+                    )
                 if debug:
                     logger.info(f"Generated LLM narration for {tool_result.tool_id}")
                 return narration
             except Exception as e:
                 logger.error(f"LLM narration failed for {tool_result.tool_id}: {e}")
+                if fragments:
+                    # Partial text has already been shown; keep what we have
+                    return "".join(fragments).strip()
                 # Fallback to original summary
 
         # For other tools, use the original narration hint
         if tool_result.narration_hint and isinstance(tool_result.narration_hint, dict):
-            return tool_result.narration_hint.get("summary", "Something happens.")
+            narration = tool_result.narration_hint.get("summary", "Something happens.")
         else:
-            return "Something happens."
+            narration = "Something happens."
+
+        if narration_callback:
+            narration_callback(narration)
+        return narration
 
 
 # Global router instance
@@ -504,6 +579,7 @@ def process_turn(
     actor_id: Optional[str] = None,
     debug: bool = False,
     use_staged_planner: bool = True,
+    narration_callback: Optional[Callable[[str], None]] = None,
 ) -> TurnResult:
     """
     Convenience function to process a turn using the global router.
@@ -514,9 +590,13 @@ def process_turn(
         actor_id: Actor taking the action (defaults to current_actor)
         debug: Enable debug output
         use_staged_planner: Use 3-stage architecture (True) or legacy monolithic (False)
+        narration_callback: Optional callable receiving narration fragments
+            as they stream in
 
     Returns:
         TurnResult with narration and effects applied
     """
     router = get_router(use_staged_planner=use_staged_planner)
-    return router.process_turn(world, player_input, actor_id, debug)
+    return router.process_turn(
+        world, player_input, actor_id, debug, narration_callback=narration_callback
+    )
@@ -0,0 +1,100 @@
+"""
+Tests for the per-turn AffordanceContext and per-tool timing instrumentation.
+"""
+
+import pytest
+
+from backend.router.game_state import GameState, PC, NPC, Zone, Utterance
+from backend.router.affordances import AffordanceContext, AffordanceFilter
+from backend.router.tool_catalog import TOOL_CATALOG
+
+
+@pytest.fixture
+def state():
+    zones = {
+        "courtyard": Zone(
+            id="courtyard",
+            name="Courtyard",
+            description="A stone courtyard.",
+            adjacent_zones=["main_hall"],
+        ),
+        "main_hall": Zone(
+            id="main_hall",
+            name="Main Hall",
+            description="A grand hall.",
+            adjacent_zones=["courtyard"],
+        ),
+    }
+    entities = {
+        "pc.arin": PC(
+            id="pc.arin",
+            name="Arin",
+            current_zone="courtyard",
+            visible_actors=["npc.guard", "npc.missing"],
+            inventory=["rope"],
+        ),
+        "npc.guard": NPC(id="npc.guard", name="Sleepy Guard", current_zone="courtyard"),
+    }
+    return GameState(entities=entities, zones=zones, current_actor="pc.arin")
+
+
+class TestAffordanceContext:
+    def test_shared_facts(self, state):
+        ctx = AffordanceContext(
+            state, Utterance(text="I Attack the Guard!", actor_id="pc.arin")
+        )
+
+        assert ctx.actor is state.entities["pc.arin"]
+        assert ctx.zone is state.zones["courtyard"]
+        assert ctx.visible_actor_ids == ["npc.guard", "npc.missing"]
+        assert list(ctx.visible_actors) == ["npc.guard"]
+        assert ctx.text_lower == "i attack the guard!"
+        assert ctx.mentions_any("sword", "guard")
+        assert not ctx.mentions_any("sword")
+
+    def test_facts_are_computed_once(self, state):
+        ctx = AffordanceContext(state, Utterance(text="look", actor_id="pc.arin"))
+
+        assert ctx.visible_actors is ctx.visible_actors
+        assert ctx.zone is ctx.zone
+
+    def test_missing_actor(self, state):
+        state.current_actor = None
+        ctx = AffordanceContext(state, Utterance(text="look", actor_id="pc.arin"))
+
+        assert ctx.actor is None
+        assert ctx.zone is None
+        assert ctx.visible_actors == {}
+
+
+class TestToolTimings:
+    def test_every_tool_is_timed(self, state):
+        affordances = AffordanceFilter()
+        utterance = Utterance(text="attack the guard", actor_id="pc.arin")
+        affordances.get_candidates(state, utterance)
+        affordances.get_candidates(state, utterance)
+
+        stats = affordances.get_timing_stats()
+        assert set(stats) == {tool.id for tool in TOOL_CATALOG}
+        assert all(entry["calls"] == 2 for entry in stats.values())
+        assert all(entry["precond_ms_avg"] >= 0 for entry in stats.values())
+
+    def test_timings_can_be_disabled_and_reset(self, state):
+        affordances = AffordanceFilter(collect_timings=False)
+        affordances.get_candidates(state, Utterance(text="look", actor_id="pc.arin"))
+        assert affordances.get_timing_stats() == {}
+
+        affordances.collect_timings = True
+        affordances.get_candidates(state, Utterance(text="look", actor_id="pc.arin"))
+        assert affordances.get_timing_stats()
+        affordances.reset_timings()
+        assert affordances.get_timing_stats() == {}
+
+    def test_candidates_use_context(self, state):
+        candidates = AffordanceFilter().get_candidates(
+            state, Utterance(text="I attack the guard with my sword", actor_id="pc.arin")
+        )
+        attack = next(c for c in candidates if c.id == "attack")
+
+        assert attack.args_hint["weapon"] == "sword"
+        assert attack.args_hint["target_name"] == "Sleepy Guard"
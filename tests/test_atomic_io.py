@@ -0,0 +1,49 @@
+"""
+Tests for the shared atomic file writer.
+"""
+
+import os
+
+import pytest
+
+from backend.router.atomic_io import atomic_write
+
+
+def test_replaces_contents_without_leaving_temp_files(tmp_path):
+    path = tmp_path / "data.bin"
+    path.write_bytes(b"old")
+
+    atomic_write(path, b"new")
+
+    assert path.read_bytes() == b"new"
+    assert os.listdir(tmp_path) == ["data.bin"]
+
+
+def test_failed_replace_keeps_previous_file(tmp_path, monkeypatch):
+    path = tmp_path / "data.bin"
+    path.write_bytes(b"old")
+
+    def failing_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(os, "replace", failing_replace)
+    with pytest.raises(OSError):
+        atomic_write(path, b"new")
+
+    assert path.read_bytes() == b"old"
+    assert os.listdir(tmp_path) == ["data.bin"]
+
+
+def test_file_and_directory_are_fsynced(tmp_path, monkeypatch):
+    synced = []
+    real_fsync = os.fsync
+
+    def recording_fsync(fd):
+        synced.append(fd)
+        real_fsync(fd)
+
+    monkeypatch.setattr(os, "fsync", recording_fsync)
+    atomic_write(tmp_path / "data.bin", b"payload")
+
+    # The temp file, then the directory holding the rename
+    assert len(synced) == 2
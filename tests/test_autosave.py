@@ -0,0 +1,143 @@
+"""
+Tests for the background autosave service.
+"""
+
+import threading
+import time
+
+import pytest
+
+from backend.router.autosave import AutosaveService, SaveSnapshot
+from backend.router.events import EventBus, EventTypes
+from backend.router.game_state import GameState, PC, Zone, HP
+from backend.router.persistence import PersistenceManager
+
+
+def make_state():
+    return GameState(
+        entities={"pc.hero": PC(id="pc.hero", name="Hero", current_zone="square")},
+        zones={"square": Zone(id="square", name="Square")},
+    )
+
+
+@pytest.fixture
+def bus():
+    return EventBus()
+
+
+def collect(bus, event_type):
+    events = []
+    bus.subscribe(event_type, events.append)
+    return events
+
+
+class TestAutosaveService:
+    def test_snapshot_is_detached_from_live_state(self, bus):
+        written = []
+        state = make_state()
+        with AutosaveService(written.append, bus=bus, coalesce_window=0.05) as service:
+            service.request_save(state)
+            state.entities["pc.hero"].hp.current = 1
+            service.flush(timeout=5)
+
+        hp = written[0].data["entities"]["pc.hero"]["hp"]["current"]
+        assert hp == 20
+
+    def test_rapid_saves_coalesce(self, bus):
+        written = []
+        completed = collect(bus, EventTypes.AUTOSAVE_COMPLETED)
+        state = make_state()
+        service = AutosaveService(written.append, bus=bus, coalesce_window=10)
+        for hp in range(5):
+            state.entities["pc.hero"].hp = HP(current=hp, max=20)
+            service.request_save(state)
+        assert service.flush(timeout=5)
+        service.close()
+
+        assert len(written) == 1
+        assert written[0].data["entities"]["pc.hero"]["hp"]["current"] == 4
+        assert written[0].coalesced == 4
+        assert completed[0]["coalesced"] == 4
+        assert completed[0]["lag"] >= 0
+        assert service.get_stats()["coalesced"] == 4
+
+    def test_targets_are_saved_separately(self, bus):
+        written = []
+        with AutosaveService(written.append, bus=bus) as service:
+            service.request_save(make_state(), "a")
+            service.request_save(make_state(), "b")
+        assert sorted(s.target for s in written) == ["a", "b"]
+
+    def test_failures_are_reported(self, bus):
+        failed = collect(bus, EventTypes.AUTOSAVE_FAILED)
+
+        def broken(snapshot):
+            raise OSError("disk full")
+
+        with AutosaveService(broken, bus=bus) as service:
+            service.request_save(make_state())
+            service.flush(timeout=5)
+            stats = service.get_stats()
+
+        assert failed[0]["error"] == "disk full"
+        assert stats["failed"] == 1
+        assert stats["last_error"] == "disk full"
+
+    def test_backpressure_blocks_until_writer_catches_up(self, bus):
+        release = threading.Event()
+        started = threading.Event()
+        waits = collect(bus, EventTypes.AUTOSAVE_BACKPRESSURE)
+
+        def slow(snapshot):
+            started.set()
+            release.wait(5)
+
+        service = AutosaveService(slow, bus=bus, max_lag=0.01, block_timeout=5)
+        service.request_save(make_state())
+        assert started.wait(5)
+        service.request_save(make_state())  # waits behind the slow write
+        time.sleep(0.05)
+
+        threading.Timer(0.05, release.set).start()
+        service.request_save(make_state())  # exceeds max_lag -> blocks
+        assert waits and waits[0]["lag"] >= 0.01
+        service.close(timeout=5)
+        assert service.get_stats()["backpressure_waits"] == 1
+
+    def test_closed_service_rejects_requests(self, bus):
+        service = AutosaveService(lambda snapshot: None, bus=bus)
+        service.close()
+        with pytest.raises(RuntimeError):
+            service.request_save(make_state())
+
+
+def test_for_persistence_writes_save_slot(tmp_path, bus):
+    manager = PersistenceManager(base_path=tmp_path)
+    state = make_state()
+    with AutosaveService.for_persistence(manager, "auto", bus=bus) as service:
+        service.request_save(state)
+
+    loaded = manager.load_game_state("auto")
+    assert loaded.entities["pc.hero"].name == "Hero"
+
+
+def test_for_persistence_exports_once_on_the_caller_thread(tmp_path, bus, monkeypatch):
+    manager = PersistenceManager(base_path=tmp_path)
+    state = make_state()
+    exports = []
+    export_views = type(state).export_views
+
+    def counting_export(self, *args, **kwargs):
+        exports.append(threading.current_thread().name)
+        return export_views(self, *args, **kwargs)
+
+    monkeypatch.setattr(type(state), "export_views", counting_export)
+    monkeypatch.setattr(
+        SaveSnapshot, "to_game_state", lambda self: pytest.fail("state rebuilt")
+    )
+    with AutosaveService.for_persistence(manager, "auto", bus=bus, incremental=True) as service:
+        service.request_save(state)
+        state.entities["pc.hero"].name = "Changed"
+
+    assert exports == [threading.current_thread().name]
+    assert manager.load_game_state("auto").entities["pc.hero"].name == "Hero"
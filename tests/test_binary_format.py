@@ -0,0 +1,174 @@
+"""
+Tests for the binary GameState save format and its trusted fast loader.
+"""
+
+import json
+import warnings
+from pathlib import Path
+
+import pytest
+
+from models.meta import Meta
+from models.space import Exit
+from backend.router import binary_format
+from backend.router.binary_format import BinaryFormatError
+from backend.router.game_state import (
+    GameState,
+    PC,
+    NPC,
+    ItemEntity,
+    Zone,
+    Clock,
+    HP,
+)
+from backend.router.persistence import PersistenceManager
+from backend.router.replay import state_hash
+
+DEMO_WORLD = Path(__file__).resolve().parent.parent / "runtime" / "demo_world.json"
+
+
+@pytest.fixture
+def state():
+    zones = {
+        "tavern": Zone(
+            id="tavern",
+            name="Tavern",
+            exits=[Exit(to="street", meta=Meta(notes="front door"))],
+            tags={"noisy"},
+        ),
+        "street": Zone(id="street", name="Street", adjacent_zones=["tavern"]),
+    }
+    entities = {
+        "pc.alice": PC(
+            id="pc.alice",
+            name="Alice",
+            current_zone="tavern",
+            visible_actors=["npc.bob"],
+            meta=Meta(known_by={"npc.bob"}, notes="player"),
+        ),
+        "npc.bob": NPC(id="npc.bob", name="Bob", current_zone="tavern", hp=HP(current=4, max=10)),
+        "item.key": ItemEntity(id="item.key", type="item", name="Key", current_zone="tavern"),
+    }
+    clocks = {
+        "alarm": Clock(id="alarm", name="Alarm", value=2),
+        "legacy": {"value": 1, "max": 4},
+    }
+    return GameState(entities=entities, zones=zones, clocks=clocks)
+
+
+class TestBinaryFormat:
+    @pytest.mark.parametrize(
+        "codec",
+        [
+            binary_format.CODEC_JSON,
+            pytest.param(
+                binary_format.CODEC_MSGPACK,
+                marks=pytest.mark.skipif(
+                    binary_format.msgpack is None, reason="msgpack not installed"
+                ),
+            ),
+        ],
+    )
+    def test_round_trip(self, state, codec):
+        data = state.to_save_format(include_runtime_data=True)
+
+        loaded = binary_format.build_state(binary_format.loads(binary_format.dumps(data, codec)))
+
+        assert loaded.to_save_format(include_runtime_data=True) == data
+
+    def test_loader_builds_real_models(self, state):
+        blob = binary_format.dumps(state.to_save_format(include_runtime_data=True))
+        loaded = binary_format.build_state(binary_format.loads(blob))
+
+        assert isinstance(loaded.entities["pc.alice"], PC)
+        assert isinstance(loaded.entities["item.key"], ItemEntity)
+        assert isinstance(loaded.zones["tavern"].exits[0], Exit)
+        assert loaded.zones["tavern"].tags == {"noisy"}
+        assert loaded.entities["pc.alice"].meta.known_by == {"npc.bob"}
+        assert loaded.entities["npc.bob"].hp.current == 4
+        assert loaded.clocks["legacy"] == {"value": 1, "max": 4}
+        assert loaded.resolve_name("Bob") == "npc.bob"
+
+    def test_demo_world_round_trip(self, tmp_path):
+        state = GameState.model_validate(json.loads(DEMO_WORLD.read_text()))
+        path = tmp_path / "demo.gsb"
+        binary_format.save_state(state, path)
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")  # no serializer warnings
+            loaded = binary_format.load_state(path)
+            assert state_hash(loaded) == state_hash(state)
+        assert loaded.clocks["scene.tension"] == state.clocks["scene.tension"]
+
+    def test_missing_required_field_is_rejected(self):
+        with pytest.raises(BinaryFormatError, match="'name'"):
+            binary_format.construct(Clock, {"id": "alarm", "meta": {}})
+
+    def test_marshal_codec_is_never_written_or_read(self, state):
+        assert binary_format.available_codec() != binary_format.CODEC_MARSHAL
+        blob = bytearray(binary_format.dumps(state.to_save_format(), binary_format.CODEC_JSON))
+        blob[8] = binary_format.CODEC_MARSHAL
+
+        with pytest.raises(BinaryFormatError, match="marshal"):
+            binary_format.loads(bytes(blob))
+        with pytest.raises(BinaryFormatError, match="Unknown codec"):
+            binary_format.dumps(state.to_save_format(), binary_format.CODEC_MARSHAL)
+
+    def test_checksum_mismatch_is_rejected(self, state):
+        blob = bytearray(binary_format.dumps(state.to_save_format()))
+        blob[-1] ^= 0xFF
+
+        with pytest.raises(BinaryFormatError, match="checksum"):
+            binary_format.loads(bytes(blob))
+
+    def test_truncation_is_rejected(self, state):
+        blob = binary_format.dumps(state.to_save_format())
+
+        with pytest.raises(BinaryFormatError, match="truncated"):
+            binary_format.loads(blob[:-5])
+
+    def test_newer_schema_is_rejected(self, state, monkeypatch):
+        monkeypatch.setattr(binary_format, "BINARY_SCHEMA_VERSION", 99)
+        blob = binary_format.dumps(state.to_save_format())
+        monkeypatch.setattr(binary_format, "BINARY_SCHEMA_VERSION", 1)
+
+        with pytest.raises(BinaryFormatError, match="newer"):
+            binary_format.loads(blob)
+
+    def test_file_helpers(self, state, tmp_path):
+        path = tmp_path / "world.gsb"
+        binary_format.save_state(state, path)
+
+        assert binary_format.is_binary_save(path)
+        assert set(binary_format.load_state(path).entities) == set(state.entities)
+
+
+class TestPersistenceBinarySnapshots:
+    def test_gm_load_prefers_binary_snapshot(self, state, tmp_path, monkeypatch):
+        manager = PersistenceManager(base_path=tmp_path, binary_snapshots=True)
+        manager.save_game_state(state, "campaign")
+        assert (tmp_path / "campaign" / "gm.gsb").exists()
+
+        monkeypatch.setattr(
+            manager,
+            "_reconstruct_game_state",
+            lambda data: pytest.fail("JSON path should not be used"),
+        )
+        loaded = manager.load_game_state("campaign", file_type="gm")
+        assert loaded.entities["npc.bob"].hp.current == 4
+
+    def test_delta_save_drops_stale_binary(self, state, tmp_path):
+        manager = PersistenceManager(base_path=tmp_path, binary_snapshots=True)
+        manager.save_game_state(state, "campaign")
+        state.entities["npc.bob"].hp.current = 1
+        manager.save_game_state(state, "campaign", incremental=True)
+
+        assert not (tmp_path / "campaign" / "gm.gsb").exists()
+        assert manager.load_game_state("campaign", file_type="gm").entities["npc.bob"].hp.current == 1
+
+    def test_corrupt_binary_falls_back_to_json(self, state, tmp_path):
+        manager = PersistenceManager(base_path=tmp_path, binary_snapshots=True)
+        manager.save_game_state(state, "campaign")
+        (tmp_path / "campaign" / "gm.gsb").write_bytes(b"AIDDGS garbage")
+
+        assert set(manager.load_game_state("campaign").entities) == set(state.entities)
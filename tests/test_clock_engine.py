@@ -0,0 +1,128 @@
+"""
+Tests for the clock engine: migration, triggers, subscriptions and batching.
+"""
+
+from backend.router.clock_engine import ClockEngine, migrate_legacy_clock
+from backend.router.effects import apply_effects
+from backend.router.game_state import HP, PC, Clock, GameState
+from backend.router.tool_catalog import Effect
+from backend.router.validator import Validator
+
+
+def make_state():
+    state = GameState(
+        entities={
+            "pc.arin": PC(id="pc.arin", name="Arin", current_zone="hall", hp=HP(current=10, max=20))
+        },
+        zones={},
+    )
+    state.clocks["alarm"] = {"value": 1, "max": 4, "min": 0, "source": "pc.arin"}
+    state.clocks["storm"] = Clock(id="storm", name="Storm", value=0, maximum=6)
+    return state
+
+
+class TestClockEngine:
+    def test_attaching_migrates_legacy_clocks(self):
+        state = make_state()
+        engine = ClockEngine(state)
+
+        assert state.clock_engine is engine
+        alarm = state.clocks["alarm"]
+        assert isinstance(alarm, Clock)
+        assert (alarm.value, alarm.maximum, alarm.source) == (1, 4, "pc.arin")
+
+    def test_threshold_and_fill_triggers_fire_once(self):
+        state = make_state()
+        engine = ClockEngine(state)
+        engine.on_threshold("alarm", 3, [{"type": "hp", "target": "pc.arin", "delta": -2}])
+        engine.on_fill("alarm", [{"type": "tag", "target": "scene", "add": {"lockdown": "on"}}])
+
+        tick = engine.advance("alarm", 1, source="pc.arin")
+        assert tick.triggers == []
+        tick = engine.advance("alarm", 5, source="pc.arin")
+
+        assert (tick.old_value, tick.new_value, tick.filled) == (2, 4, True)
+        assert state.entities["pc.arin"].hp.current == 8
+        assert state.scene.tags["lockdown"] == "on"
+        assert state.clocks["alarm"].filled_by == "pc.arin"
+
+        engine.advance("alarm", -4)
+        engine.advance("alarm", 4)
+        assert state.entities["pc.arin"].hp.current == 8  # once=True
+
+    def test_repeating_trigger_and_subscriptions(self):
+        state = make_state()
+        engine = ClockEngine(state)
+        engine.on_threshold("storm", 2, [{"type": "hp", "target": "pc.arin", "delta": -1}], once=False)
+        seen, storm_only = [], []
+        engine.subscribe(seen.append)
+        engine.subscribe(storm_only.append, clock_id="storm")
+
+        engine.advance("storm", 3)
+        engine.advance("storm", -3)
+        engine.advance("storm", 2)
+        engine.advance("alarm", 1)
+
+        assert state.entities["pc.arin"].hp.current == 8
+        assert [t.clock_id for t in seen] == ["storm", "storm", "storm", "alarm"]
+        assert len(storm_only) == 3
+
+    def test_advance_many_batches_effects(self):
+        state = make_state()
+        engine = ClockEngine(state)
+        for n in range(50):
+            engine.create(f"c{n}", maximum=3)
+            engine.on_fill(f"c{n}", [{"type": "hp", "target": "pc.arin", "delta": 1}])
+
+        ticks = engine.advance_many({f"c{n}": 1 if n % 2 else 3 for n in range(50)})
+
+        assert sum(t.filled for t in ticks) == 25
+        assert state.entities["pc.arin"].hp.current == 20  # 10 + 25, capped at max
+
+    def test_clock_effects_go_through_the_engine(self):
+        state = make_state()
+        engine = ClockEngine(state)
+        fired = []
+        engine.subscribe(fired.append)
+
+        apply_effects(state, [{"type": "clock", "id": "new", "delta": 2, "max": 5}])
+        assert isinstance(state.clocks["new"], Clock)
+        assert state.clocks["new"].maximum == 5
+
+        log = Validator()._dispatch_effect(
+            Effect(type="clock", target="scene", id="storm", delta=2), state, "pc.arin", 1
+        )
+        assert log["ok"] and log["after"] == {"value": 2}
+        assert state.clocks["storm"].value == 2
+        assert [t.clock_id for t in fired] == ["new", "storm"]
+
+
+    def test_deep_copy_gets_an_engine_bound_to_the_copy(self):
+        state = make_state()
+        engine = ClockEngine(state)
+        engine.on_fill("alarm", [{"type": "hp", "target": "pc.arin", "delta": -5}])
+        seen = []
+        engine.subscribe(seen.append)
+
+        clone = state.model_copy(deep=True)
+        clone.clock_engine.advance("alarm", 3)
+
+        assert clone.clock_engine is not engine
+        assert clone.clock_engine.state is clone
+        assert clone.entities["pc.arin"].hp.current == 5
+        assert state.entities["pc.arin"].hp.current == 10
+        assert state.clocks["alarm"].value == 1
+        assert [t.clock_id for t in seen] == ["alarm"]  # callbacks are shared
+
+        engine.advance("alarm", 3)  # the original's trigger has not fired yet
+        assert state.entities["pc.arin"].hp.current == 5
+
+def test_migrate_legacy_clock_key_styles():
+    clock = migrate_legacy_clock("x", {"value": 2, "maximum": 8, "minimum": 1})
+    assert (clock.name, clock.value, clock.maximum, clock.minimum) == ("x", 2, 8, 1)
+
+
+def test_states_without_engine_keep_dict_clocks():
+    state = make_state()
+    apply_effects(state, [{"type": "clock", "id": "alarm", "delta": 1}])
+    assert state.clocks["alarm"]["value"] == 2
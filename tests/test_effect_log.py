@@ -0,0 +1,112 @@
+"""
+Tests for the bounded scene effect log and its on-disk archive.
+"""
+
+import json
+
+from backend.router.effect_log import EFFECT_LOG_CAPACITY, EffectLogArchive, entry_to_dict
+from backend.router.game_state import EffectLogEntry, Scene
+
+
+def make_entry(i, actor=None, effect_type="hp"):
+    return EffectLogEntry(
+        effect={"type": effect_type, "target": f"npc.{i % 3}"},
+        actor=actor or f"pc.{i % 2}",
+        round_applied=i // 10 + 1,
+    )
+
+
+class TestBoundedEffectLog:
+    def test_memory_log_is_bounded(self):
+        scene = Scene()
+        for i in range(5 * EFFECT_LOG_CAPACITY):
+            scene.add_effect_log(make_entry(i))
+
+        assert len(scene.last_effect_log) <= 2 * EFFECT_LOG_CAPACITY
+        last = 5 * EFFECT_LOG_CAPACITY - 1
+        assert scene.last_effect_log[-1].round_applied == last // 10 + 1
+        assert len(scene.model_dump()["last_effect_log"]) <= 2 * EFFECT_LOG_CAPACITY
+
+    def test_evicted_entries_are_archived_in_order(self, tmp_path):
+        scene = Scene()
+        archive = EffectLogArchive(tmp_path, segment_size=50)
+        scene.attach_effect_log_archive(archive)
+
+        total = 3 * EFFECT_LOG_CAPACITY
+        scene.add_effect_logs([make_entry(i) for i in range(total)])
+
+        assert archive.total_entries + len(scene.last_effect_log) == total
+        history = scene.query_effect_log()
+        assert [e["round_applied"] for e in history] == [i // 10 + 1 for i in range(total)]
+        assert len(list(tmp_path.glob("segment_*.jsonl"))) == len(archive.segments) > 1
+
+    def test_queries_by_round_actor_and_type(self, tmp_path):
+        scene = Scene()
+        scene.attach_effect_log_archive(EffectLogArchive(tmp_path, segment_size=25))
+        entries = [make_entry(i) for i in range(3 * EFFECT_LOG_CAPACITY)]
+        entries.append(make_entry(999, actor="npc.boss", effect_type="position"))
+        scene.add_effect_logs(entries)
+
+        assert len(scene.query_effect_log(round_applied=1)) == 10
+        assert len(scene.query_effect_log(actor="pc.0", round_applied=2)) == 5
+        assert [e["actor"] for e in scene.query_effect_log(effect_type="position")] == [
+            "npc.boss"
+        ]
+        ranged = scene.query_effect_log(since_round=3, until_round=4)
+        assert {e["round_applied"] for e in ranged} == {3, 4}
+        recent = scene.query_effect_log(round_applied=1, include_archived=False)
+        assert recent == []
+
+    def test_dict_entries_from_validator_are_supported(self):
+        scene = Scene()
+        scene.add_effect_logs([{"effect": {"type": "tag"}, "actor": "pc.a", "ok": True}])
+        assert scene.query_effect_log(effect_type="tag")[0]["actor"] == "pc.a"
+        assert scene.last_effect_log[-1]["ok"] is True
+
+
+def test_archive_reopens_with_index(tmp_path):
+    archive = EffectLogArchive(tmp_path, segment_size=10)
+    archive.append(make_entry(i) for i in range(25))
+
+    reopened = EffectLogArchive(tmp_path, segment_size=10)
+    assert reopened.total_entries == 25
+    assert len(reopened.segments) == 3
+    reopened.append([make_entry(99, actor="pc.late")])
+    assert [e["actor"] for e in reopened.query(actor="pc.late")] == ["pc.late"]
+    assert reopened.segments[-1]["count"] == 6
+
+
+def test_entries_written_before_a_crash_are_reindexed(tmp_path):
+    archive = EffectLogArchive(tmp_path, segment_size=10)
+    archive.append(make_entry(i) for i in range(5))
+    # Crash after the segment lines were written but before index.json
+    segment = tmp_path / archive.segments[-1]["file"]
+    with open(segment, "a") as f:
+        for i in range(5, 10):
+            f.write(json.dumps(entry_to_dict(make_entry(i, actor="pc.lost"))) + "\n")
+        f.write('{"effect": {"ty')
+    with open(tmp_path / "segment_000002.jsonl", "w") as f:
+        f.write(json.dumps(entry_to_dict(make_entry(10, actor="pc.lost"))) + "\n")
+
+    reopened = EffectLogArchive(tmp_path, segment_size=10)
+    assert reopened.total_entries == 11
+    assert len(list(reopened.query(actor="pc.lost"))) == 6
+    reopened.append([make_entry(11, actor="pc.late")])
+    assert [e["actor"] for e in reopened.query(actor="pc.late")] == ["pc.late"]
+
+
+def test_clear_empties_archive(tmp_path):
+    archive = EffectLogArchive(tmp_path)
+    archive.append(make_entry(i) for i in range(3))
+    archive.clear()
+
+    assert EffectLogArchive(tmp_path).total_entries == 0
+    assert list(tmp_path.glob("segment_*")) == []
+
+
+def test_eviction_without_archive_warns(caplog):
+    scene = Scene()
+    with caplog.at_level("WARNING"):
+        scene.add_effect_logs([make_entry(i) for i in range(2 * EFFECT_LOG_CAPACITY + 1)])
+
+    assert "no archive attached" in caplog.text
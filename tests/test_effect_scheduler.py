@@ -0,0 +1,115 @@
+"""
+Tests for the ordered pending-effect queue.
+"""
+
+from backend.router.effect_scheduler import MAX_CONDITION_WAIT, EffectScheduler
+from backend.router.game_state import PendingEffect, Scene
+
+
+def pending(effect_id, trigger_round, condition=None, expires_round=None):
+    return PendingEffect(
+        effect={"type": "hp", "target": "pc.arin", "delta": 1},
+        trigger_round=trigger_round,
+        scheduled_at=0,
+        id=effect_id,
+        condition=condition,
+        expires_round=expires_round,
+    )
+
+
+class TestEffectScheduler:
+    def test_pops_due_effects_in_round_then_fifo_order(self):
+        scene = Scene()
+        for effect_id, trigger_round in [("a", 5), ("b", 2), ("c", 5), ("d", 9), ("e", 2)]:
+            scene.add_pending_effect(pending(effect_id, trigger_round))
+
+        assert [p.id for p in scene.pending_effects] == ["b", "e", "a", "c", "d"]
+        assert scene.process_pending_effects(1) == []
+        assert [p.id for p in scene.process_pending_effects(5)] == ["b", "e", "a", "c"]
+        assert [p.id for p in scene.pending_effects] == ["d"]
+
+    def test_direct_appends_and_reassignment_are_reordered(self):
+        scene = Scene()
+        scene.add_pending_effect(pending("late", 10))
+        scene.pending_effects.append(pending("early", 3))
+        assert [p.id for p in scene.process_pending_effects(3)] == ["early"]
+
+        scene.pending_effects = [pending("x", 7), pending("y", 4)]
+        assert scene.effect_scheduler.next_round() == 4
+        assert [p.id for p in scene.pending_effects] == ["y", "x"]
+
+    def test_cancel_by_id(self):
+        scene = Scene()
+        scene.add_pending_effect(pending("a", 1))
+        scene.add_pending_effect(pending("b", 1))
+
+        assert scene.cancel_pending_effect("a") is True
+        assert scene.cancel_pending_effect("missing") is False
+        assert [p.id for p in scene.process_pending_effects(1)] == ["b"]
+
+    def test_failed_conditions_are_rechecked_later(self):
+        scene = Scene()
+        scene.add_pending_effect(pending("gated", 1, condition="round >= 3"))
+        scene.add_pending_effect(pending("plain", 1))
+        current = {"round": 1}
+
+        def check(effect):
+            return current["round"] >= 3
+
+        assert [p.id for p in scene.process_pending_effects(1, check)] == ["plain"]
+        assert [p.id for p in scene.pending_effects] == ["gated"]
+        current["round"] = 3
+        assert [p.id for p in scene.process_pending_effects(3, check)] == ["gated"]
+
+    def test_unmet_conditions_expire(self):
+        scene = Scene()
+        scene.add_pending_effect(pending("ttl", 1, condition="never", expires_round=3))
+        scene.add_pending_effect(pending("default", 1, condition="never"))
+        never = lambda effect: False  # noqa: E731
+
+        assert scene.process_pending_effects(3, never) == []
+        assert [p.id for p in scene.pending_effects] == ["ttl", "default"]
+        scene.process_pending_effects(4, never)
+        assert [p.id for p in scene.pending_effects] == ["default"]
+        scene.process_pending_effects(1 + MAX_CONDITION_WAIT, never)
+        assert [p.id for p in scene.pending_effects] == ["default"]
+        scene.process_pending_effects(2 + MAX_CONDITION_WAIT, never)
+        assert [p.id for p in scene.pending_effects] == []
+
+    def test_same_length_edits_are_reordered(self):
+        scene = Scene()
+        for effect_id, trigger_round in [("a", 1), ("b", 2), ("c", 3)]:
+            scene.add_pending_effect(pending(effect_id, trigger_round))
+
+        scene.pending_effects[0] = pending("z", 9)
+        assert scene.effect_scheduler.next_round() == 2
+        assert [p.id for p in scene.pending_effects] == ["b", "c", "z"]
+
+        scene.pending_effects[-1].trigger_round = 1
+        assert [p.id for p in scene.process_pending_effects(1)] == ["z"]
+
+        scene.pending_effects.append(pending("d", 5))
+        scene.pending_effects[0].trigger_round = 6  # in place, not at the ends
+        scene.effect_scheduler.reorder()
+        assert [p.id for p in scene.pending_effects] == ["c", "d", "b"]
+
+    def test_round_trips_through_list_format(self):
+        scheduler = EffectScheduler()
+        scheduler.schedule(pending("b", 4))
+        scheduler.schedule(pending("a", 2))
+
+        restored = EffectScheduler.from_list(scheduler.to_list())
+        assert [p.id for p in restored.effects] == ["a", "b"]
+        assert len(restored) == 2
+
+
+def test_large_queue_pops_only_the_due_prefix():
+    scene = Scene()
+    for n in range(5000):
+        scene.add_pending_effect(pending(f"e{n}", 100 + n % 50))
+
+    assert scene.process_pending_effects(99) == []
+    due = scene.process_pending_effects(100)
+    assert [p.id for p in due] == [f"e{n}" for n in range(0, 5000, 50)]
+    assert len(scene.pending_effects) == 4900
+    assert scene.effect_scheduler.next_round() == 101
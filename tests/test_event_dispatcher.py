@@ -0,0 +1,132 @@
+"""
+Tests for queued (thread/asyncio) and batched EventBus delivery.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from backend.router.events import EventBus
+
+
+@pytest.fixture
+def bus():
+    bus = EventBus()
+    yield bus
+    bus.stop_dispatcher(flush=False)
+
+
+class TestThreadDispatcher:
+    def test_slow_handler_does_not_block_publish(self, bus):
+        release = threading.Event()
+        received = []
+
+        def slow(event):
+            release.wait(5)
+            received.append(event["n"])
+
+        bus.subscribe("tick", slow)
+        bus.start_dispatcher()
+
+        started = time.perf_counter()
+        for n in range(5):
+            bus.publish("tick", {"n": n})
+        assert time.perf_counter() - started < 1.0
+
+        release.set()
+        bus.flush()
+        bus.stop_dispatcher()
+        assert received == [0, 1, 2, 3, 4]
+
+    def test_batch_handlers_receive_lists(self, bus):
+        batches = []
+        singles = []
+        bus.subscribe("tick", batches.append, batch=True)
+        bus.subscribe("tick", singles.append)
+        bus.start_dispatcher(max_batch=100)
+
+        # Hold delivery so everything lands in one drain pass
+        with bus._delivery_lock:
+            for n in range(10):
+                bus.publish("tick", {"n": n})
+        bus.flush()
+
+        assert [e["n"] for batch in batches for e in batch] == list(range(10))
+        assert len(singles) == 10
+        assert all(isinstance(batch, list) for batch in batches)
+
+    def test_drop_policies_and_metrics(self, bus):
+        gate = threading.Event()
+        seen = []
+
+        def blocked(event):
+            gate.wait(5)
+            seen.append(event["n"])
+
+        bus.subscribe("tick", blocked)
+        bus.start_dispatcher(max_queue=2, max_batch=1, overflow="drop_newest")
+        bus.publish("tick", {"n": 0})  # picked up by the worker, which blocks
+        time.sleep(0.05)
+        for n in range(1, 6):
+            bus.publish("tick", {"n": n})
+
+        metrics = bus.get_metrics()
+        assert metrics["mode"] == "thread"
+        assert metrics["queue_depth"] == 2
+        assert metrics["dropped"] == 3
+        assert metrics["max_queue_depth"] == 2
+
+        gate.set()
+        bus.stop_dispatcher()
+        assert seen == [0, 1, 2]
+        handler_stats = next(iter(bus.get_metrics()["handlers"].values()))
+        assert handler_stats["calls"] == 3
+        assert handler_stats["max_seconds"] > 0
+
+    def test_drop_oldest_keeps_newest(self, bus):
+        seen = []
+        bus.subscribe("tick", lambda event: seen.append(event["n"]))
+        bus.start_dispatcher(max_queue=3, overflow="drop_oldest")
+        with bus._delivery_lock:
+            # The worker can't deliver while the lock is held
+            for n in range(10):
+                bus.publish("tick", {"n": n})
+            time.sleep(0.05)
+        bus.stop_dispatcher()
+        assert seen[-3:] == [7, 8, 9]
+        assert bus.get_metrics()["dropped"] + len(seen) == 10
+
+    def test_handler_errors_are_counted(self, bus):
+        def broken(event):
+            raise ValueError("boom")
+
+        bus.subscribe("tick", broken)
+        bus.publish("tick", {})
+        assert bus.get_metrics()["handler_errors"] == 1
+
+    def test_sync_batch_handler_gets_single_event_list(self, bus):
+        batches = []
+        bus.subscribe("tick", batches.append, batch=True)
+        bus.publish("tick", {"n": 1})
+        assert [[e["n"] for e in batch] for batch in batches] == [[1]]
+
+
+def test_async_dispatcher_drains_on_loop():
+    bus = EventBus()
+    received = []
+
+    async def main():
+        bus.subscribe("tick", received.append, batch=True)
+        bus.start_async_dispatcher()
+        for n in range(5):
+            bus.publish("tick", {"n": n})
+        assert received == []  # queued, not delivered inline
+        for _ in range(10):
+            await asyncio.sleep(0)
+        bus.stop_dispatcher()
+
+    asyncio.run(main())
+    assert [e["n"] for batch in received for e in batch] == list(range(5))
+    assert bus.get_metrics()["mode"] == "sync"
@@ -0,0 +1,99 @@
+"""
+Tests for the single-pass multi-view export engine.
+
+The engine must produce exactly what the per-view GameState methods produce.
+"""
+
+import pytest
+
+from models.meta import Meta
+from models.space import Exit
+from backend.router.game_state import GameState, PC, NPC, Zone, Clock, HP
+from backend.router.export_engine import export_views
+
+
+@pytest.fixture
+def state():
+    zones = {
+        "tavern": Zone(
+            id="tavern",
+            name="Tavern",
+            description="Warm and loud.",
+            exits=[Exit(to="cellar", meta=Meta(notes="trapdoor")), Exit(to="street")],
+            tags={"noisy", "safe"},
+            meta=Meta(notes="GM note", known_by={"pc.alice"}),
+        ),
+        "street": Zone(id="street", name="Street", adjacent_zones=["tavern"]),
+        "cellar": Zone(
+            id="cellar",
+            name="Cellar",
+            adjacent_zones=["tavern"],
+            meta=Meta(visibility="hidden", known_by={"npc.bob"}),
+        ),
+        "vault": Zone(
+            id="vault",
+            name="Vault",
+            meta=Meta(visibility="gm_only", gm_only=True),
+        ),
+    }
+    entities = {
+        "pc.alice": PC(
+            id="pc.alice",
+            name="Alice",
+            current_zone="tavern",
+            meta=Meta(known_by={"npc.bob"}, notes="player"),
+        ),
+        "npc.bob": NPC(id="npc.bob", name="Bob", current_zone="tavern", hp=HP(current=5, max=10)),
+        "npc.spy": NPC(
+            id="npc.spy",
+            name="Spy",
+            current_zone="tavern",
+            meta=Meta(visibility="hidden", known_by={"npc.bob"}),
+        ),
+        "npc.far": NPC(id="npc.far", name="Far", current_zone="street"),
+        "npc.secret": NPC(
+            id="npc.secret",
+            name="Secret",
+            current_zone="vault",
+            meta=Meta(visibility="gm_only", gm_only=True, notes="boss"),
+        ),
+    }
+    clocks = {
+        "alarm": Clock(id="alarm", name="Alarm", value=2, meta=Meta(notes="x")),
+        "doom": Clock(id="doom", name="Doom", meta=Meta(visibility="gm_only", gm_only=True)),
+        "legacy": {"value": 1, "max": 4},
+    }
+    return GameState(entities=entities, zones=zones, clocks=clocks)
+
+
+class TestExportEngine:
+    def test_views_match_per_view_methods(self, state):
+        views = export_views(state)
+
+        assert views["public"] == state.to_public_format(role="player")
+        assert views["gm"] == state.to_save_format(include_runtime_data=True)
+        assert views["session"] == state.to_session_format()
+
+    def test_gm_view_without_runtime_data(self, state):
+        views = export_views(state, ["gm"], include_runtime_data=False)
+
+        assert list(views) == ["gm"]
+        assert views["gm"] == state.to_save_format(include_runtime_data=False)
+
+    @pytest.mark.parametrize("role", ["narrator", "gm"])
+    def test_public_roles(self, state, role):
+        views = export_views(state, ["public"], public_role=role)
+
+        assert views["public"] == state.to_public_format(role=role)
+
+    def test_public_pov(self, state):
+        views = export_views(state, ["public"], public_pov_id="npc.bob")
+
+        assert views["public"] == state.to_public_format(pov_id="npc.bob")
+
+    def test_game_state_wrapper(self, state):
+        assert state.export_views(["session"])["session"] == state.to_session_format()
+
+    def test_unknown_view(self, state):
+        with pytest.raises(ValueError):
+            export_views(state, ["debug"])
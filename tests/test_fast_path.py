@@ -0,0 +1,182 @@
+"""
+Tests for the deterministic fast path planner.
+
+Checks that unambiguous commands resolve to tool calls without an LLM,
+that anything ambiguous falls through, and that produced arguments pass
+the tool schemas.
+"""
+
+import pytest
+
+from backend.router.game_state import GameState, PC, NPC, Zone, HP, Utterance
+from backend.router.fast_path import FastPathPlanner
+from backend.router.tool_catalog import get_tool_by_id
+
+
+@pytest.fixture
+def state():
+    """Courtyard with two exits, one hostile guard and a friendly ally."""
+    zones = {
+        "courtyard": Zone(
+            id="courtyard",
+            name="Courtyard",
+            description="A stone courtyard.",
+            adjacent_zones=["hall", "armory"],
+        ),
+        "hall": Zone(
+            id="hall",
+            name="Great Hall",
+            description="A large hall.",
+            adjacent_zones=["courtyard"],
+        ),
+        "armory": Zone(
+            id="armory",
+            name="Armory",
+            description="Weapons storage.",
+            adjacent_zones=["courtyard"],
+        ),
+    }
+    entities = {
+        "pc.arin": PC(
+            id="pc.arin",
+            name="Arin",
+            current_zone="courtyard",
+            hp=HP(current=20, max=20),
+            visible_actors=["npc.guard", "pc.bryn"],
+        ),
+        "pc.bryn": PC(
+            id="pc.bryn",
+            name="Bryn",
+            current_zone="courtyard",
+            hp=HP(current=20, max=20),
+        ),
+        "npc.guard": NPC(
+            id="npc.guard",
+            name="Guard",
+            current_zone="courtyard",
+            hp=HP(current=15, max=20),
+        ),
+    }
+    return GameState(entities=entities, zones=zones, current_actor="pc.arin")
+
+
+@pytest.fixture
+def planner():
+    return FastPathPlanner()
+
+
+def _plan(planner, state, text):
+    return planner.plan(state, Utterance(text=text, actor_id="pc.arin"))
+
+
+def _assert_valid(call):
+    tool = get_tool_by_id(call["tool"])
+    tool.args_schema(**call["args"])
+
+
+class TestFastPathRules:
+    @pytest.mark.parametrize("text", ["look around", "I look around.", "Look"])
+    def test_look_around(self, planner, state, text):
+        result = _plan(planner, state, text)
+
+        assert result is not None
+        assert result.tool_calls == [
+            {"tool": "narrate_only", "args": {"actor": "pc.arin", "topic": "look around"}}
+        ]
+
+    def test_move_to_named_adjacent_zone(self, planner, state):
+        result = _plan(planner, state, "I walk to the great hall")
+
+        assert result is not None
+        call = result.tool_calls[0]
+        assert call["tool"] == "move"
+        assert call["args"]["to"] == "hall"
+        assert call["args"]["method"] == "walk"
+        _assert_valid(call)
+
+    def test_move_by_zone_id_with_run(self, planner, state):
+        result = _plan(planner, state, "run to armory!")
+
+        assert result.tool_calls[0]["args"] == {
+            "actor": "pc.arin",
+            "to": "armory",
+            "method": "run",
+            "cost": None,
+        }
+
+    def test_attack_only_visible_hostile(self, planner, state):
+        result = _plan(planner, state, "attack the guard")
+
+        assert result is not None
+        call = result.tool_calls[0]
+        assert call["tool"] == "attack"
+        assert call["args"]["target"] == "npc.guard"
+        _assert_valid(call)
+
+
+class TestFastPathFallback:
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "go somewhere",  # no zone named
+            "go to the hall and the armory",  # compound / two zones
+            "sneak into the armory",  # contested movement
+            "attack Bryn",  # names a non-hostile
+            "attack the dragon",  # names someone who isn't here
+            "hit the guard with my sword",  # extra detail for the LLM
+            "threaten the guard",  # social intent
+            "what's that smell?",  # no rule
+            "look at the guard then attack him",  # compound
+        ],
+    )
+    def test_ambiguous_commands_fall_through(self, planner, state, text):
+        assert _plan(planner, state, text) is None
+
+    @pytest.mark.parametrize("text", ["attack", "attack him", "attack the enemy", "strike the guard"])
+    def test_attack_naming_hostile_or_nobody(self, planner, state, text):
+        result = _plan(planner, state, text)
+
+        assert result is not None
+        assert result.tool_calls[0]["args"]["target"] == "npc.guard"
+
+    def test_attack_with_multiple_hostiles(self, planner, state):
+        state.entities["npc.thug"] = NPC(
+            id="npc.thug",
+            name="Thug",
+            current_zone="courtyard",
+            hp=HP(current=10, max=10),
+        )
+        state.entities["pc.arin"].visible_actors.append("npc.thug")
+
+        assert _plan(planner, state, "attack") is None
+
+    def test_dead_hostile_is_not_a_target(self, planner, state):
+        state.entities["npc.guard"].hp.current = 0
+
+        assert _plan(planner, state, "attack the guard") is None
+
+    def test_non_current_actor(self, planner, state):
+        utterance = Utterance(text="look around", actor_id="pc.bryn")
+
+        assert planner.plan(state, utterance) is None
+
+    def test_min_confidence_threshold(self, state):
+        strict = FastPathPlanner(min_confidence=0.99)
+
+        assert strict.plan(state, Utterance(text="go to armory", actor_id="pc.arin")) is None
+
+
+class TestFastPathStats:
+    def test_fast_path_ratio(self, planner):
+        planner.record_turn(True)
+        planner.record_turn(True)
+        planner.record_turn(False)
+
+        stats = planner.get_stats()
+        assert stats["turns"] == 3
+        assert stats["fast_path_turns"] == 2
+        assert stats["llm_turns"] == 1
+        assert stats["fast_path_ratio"] == pytest.approx(2 / 3)
+
+    def test_empty_stats(self, planner):
+        assert planner.get_stats()["fast_path_ratio"] == 0.0
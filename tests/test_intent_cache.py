@@ -0,0 +1,155 @@
+"""
+Tests for the Stage 1 intent cache.
+
+Covers key normalization, LRU/TTL behaviour, SQLite persistence and the
+StagedPlanner integration that skips the LLM on cache hits.
+"""
+
+import json
+import sys
+import types
+
+import pytest
+
+from backend.router.game_state import Utterance
+from backend.router.intent_cache import IntentCache
+
+
+class FakeClock:
+    """Manually advanced time source."""
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestIntentCache:
+    """Test IntentCache behaviour in isolation."""
+
+    def test_normalization_shares_keys(self):
+        cache = IntentCache()
+        cache.put("I look around.", "gpt-4o-mini", "v1", ["narrate_only"])
+
+        assert cache.get("  i LOOK   around ", "gpt-4o-mini", "v1") == ["narrate_only"]
+        assert cache.get('"I look around!"', "gpt-4o-mini", "v1") == ["narrate_only"]
+
+    def test_model_and_prompt_version_are_part_of_key(self):
+        cache = IntentCache()
+        cache.put("attack the goblin", "gpt-4o-mini", "v1", ["attack"])
+
+        assert cache.get("attack the goblin", "gpt-5-nano", "v1") is None
+        assert cache.get("attack the goblin", "gpt-4o-mini", "v2") is None
+        assert cache.get("attack the goblin", "gpt-4o-mini", "v1") == ["attack"]
+
+    def test_prompt_version_is_stable(self):
+        assert IntentCache.prompt_version("abc") == IntentCache.prompt_version("abc")
+        assert IntentCache.prompt_version("abc") != IntentCache.prompt_version("abd")
+
+    def test_lru_eviction(self):
+        cache = IntentCache(max_entries=2)
+        cache.put("a", "m", "v", ["move"])
+        cache.put("b", "m", "v", ["talk"])
+        cache.get("a", "m", "v")  # refresh a
+        cache.put("c", "m", "v", ["attack"])
+
+        assert cache.get("b", "m", "v") is None
+        assert cache.get("a", "m", "v") == ["move"]
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_ttl_expiry(self):
+        clock = FakeClock()
+        cache = IntentCache(ttl_seconds=60, clock=clock)
+        cache.put("go north", "m", "v", ["move"])
+
+        clock.now += 30
+        assert cache.get("go north", "m", "v") == ["move"]
+
+        clock.now += 31
+        assert cache.get("go north", "m", "v") is None
+        assert cache.get_stats()["expired"] == 1
+
+    def test_returned_lists_are_copies(self):
+        cache = IntentCache()
+        cache.put("go north", "m", "v", ["move"])
+        cache.get("go north", "m", "v").append("attack")
+
+        assert cache.get("go north", "m", "v") == ["move"]
+
+    def test_hit_rate_metrics(self):
+        cache = IntentCache()
+        cache.get("x", "m", "v")
+        cache.put("x", "m", "v", ["move"])
+        cache.get("x", "m", "v")
+        cache.get("x", "m", "v")
+
+        stats = cache.get_stats()
+        assert stats["hits"] == 2
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == pytest.approx(2 / 3)
+
+    def test_sqlite_persistence(self, tmp_path):
+        db_path = str(tmp_path / "intent_cache.sqlite")
+        cache = IntentCache(db_path=db_path)
+        cache.put("use the potion", "m", "v", ["use_item"])
+        cache.close()
+
+        reopened = IntentCache(db_path=db_path)
+        assert reopened.get("use the potion", "m", "v") == ["use_item"]
+        assert reopened.get_stats()["disk_hits"] == 1
+        reopened.close()
+
+    def test_sqlite_respects_ttl(self, tmp_path):
+        db_path = str(tmp_path / "intent_cache.sqlite")
+        clock = FakeClock()
+        cache = IntentCache(db_path=db_path, ttl_seconds=10, clock=clock)
+        cache.put("go north", "m", "v", ["move"])
+        cache.close()
+
+        clock.now += 20
+        reopened = IntentCache(db_path=db_path, ttl_seconds=10, clock=clock)
+        assert reopened.get("go north", "m", "v") is None
+        reopened.close()
+
+
+class TestStagedPlannerIntentCache:
+    """Test that the staged planner consults the cache before the LLM."""
+
+    @pytest.fixture
+    def planner(self, monkeypatch):
+        config = types.ModuleType("config")
+        config.PLANNING_MODEL = "gpt-4o-mini"
+        config.PLANNING_MAX_TOKENS = 200
+        config.PLANNING_TEMPERATURE = 0.1
+        monkeypatch.setitem(sys.modules, "config", config)
+
+        from backend.router.staged_planner import StagedPlanner
+
+        planner = StagedPlanner(api_key="test-key")
+        calls = []
+
+        def fake_call_llm(system_prompt, user_prompt, debug=False):
+            calls.append(user_prompt)
+            return json.dumps({"tools": ["move"]})
+
+        planner._call_llm = fake_call_llm
+        planner.llm_calls = calls
+        return planner
+
+    def test_repeat_utterance_skips_llm(self, planner):
+        first = planner._parse_intent(Utterance(text="Go north", actor_id="pc.arin"))
+        second = planner._parse_intent(Utterance(text="go north.", actor_id="pc.arin"))
+
+        assert first.tool_names == ["move"]
+        assert second.tool_names == ["move"]
+        assert second.success
+        assert len(planner.llm_calls) == 1
+        assert planner.intent_cache.get_stats()["hits"] == 1
+
+    def test_failed_parses_are_not_cached(self, planner):
+        planner._call_llm = lambda *args, **kwargs: json.dumps({"tools": ["fly"]})
+        result = planner._parse_intent(Utterance(text="fly away", actor_id="pc.arin"))
+
+        assert not result.success
+        assert len(planner.intent_cache) == 0
@@ -0,0 +1,107 @@
+"""
+Tests for batched mass-combat resolution.
+"""
+
+from backend.router.game_state import HP, NPC, GameState
+from backend.router.mass_combat import MassAttack, parse_damage_expr, resolve_mass_combat
+
+
+def make_state(size=10):
+    entities = {}
+    for side in ("red", "blue"):
+        for n in range(size):
+            entities[f"npc.{side}{n}"] = NPC(
+                id=f"npc.{side}{n}",
+                name=f"{side.title()} {n}",
+                current_zone="field",
+                hp=HP(current=20, max=20),
+            )
+    ids = list(entities)
+    for entity in entities.values():
+        entity.visible_actors = [other for other in ids if other != entity.id]
+    return GameState(entities=entities, zones={})
+
+
+def battle_line(size=10, **options):
+    return [
+        MassAttack(attacker=f"npc.red{n}", target=f"npc.blue{n}", **options)
+        for n in range(size)
+    ] + [
+        MassAttack(attacker=f"npc.blue{n}", target=f"npc.red{n}", **options)
+        for n in range(size)
+    ]
+
+
+class TestMassCombat:
+    def test_same_seed_same_result(self):
+        first = resolve_mass_combat(make_state(), battle_line(), seed=11, detail=True)
+        second = resolve_mass_combat(make_state(), battle_line(), seed=11, detail=True)
+
+        assert first.ok
+        assert first.facts == second.facts
+        assert first.effects == second.effects
+        assert first.facts["resolved"] == 20
+        assert sum(first.facts["outcomes"].values()) == 20
+
+    def test_each_attack_has_its_own_substream(self):
+        attacks = battle_line()
+        full = resolve_mass_combat(make_state(), attacks, seed=5, detail=True)
+        # Replacing earlier attacks with skipped ones leaves later rolls unchanged
+        broken = [MassAttack(attacker="npc.ghost", target="npc.red0")] * 10 + attacks[10:]
+        partial = resolve_mass_combat(make_state(), broken, seed=5, detail=True)
+
+        assert partial.facts["attacks"] == full.facts["attacks"][10:]
+        assert len(partial.facts["skipped"]) == 10
+
+    def test_damage_is_aggregated_per_target_and_applied_once(self):
+        state = make_state()
+        attacks = [
+            MassAttack(attacker=f"npc.red{n}", target="npc.blue0", dc=1, damage_expr="1d4+2")
+            for n in range(5)
+        ]
+        result = resolve_mass_combat(state, attacks, seed=3, apply=True)
+
+        assert len(result.effects) == 1
+        effect = result.effects[0]
+        assert effect["source"] == "mass_combat"
+        assert effect["delta"] <= -5 * 3  # every attack hits for at least 3
+        assert state.entities["npc.blue0"].hp.current == max(0, 20 + effect["delta"])
+        assert result.facts["downed"] == (["npc.blue0"] if effect["delta"] <= -20 else [])
+
+    def test_mark_consumed_by_first_attack_only(self):
+        state = make_state()
+        state.entities["npc.blue0"].style_bonus = 1
+        attacks = [
+            MassAttack(attacker="npc.red0", target="npc.blue0"),
+            MassAttack(attacker="npc.red1", target="npc.blue0"),
+        ]
+        result = resolve_mass_combat(state, attacks, seed=1, detail=True)
+
+        assert [row["mark_consumed"] for row in result.facts["attacks"]] == [True, False]
+        assert {"type": "mark", "target": "npc.blue0", "remove": True,
+                "source": "npc.red0", "cause": "attack"} in result.effects
+
+    def test_invalid_attacks_are_skipped(self):
+        state = make_state()
+        state.entities["npc.red1"].hp = HP(current=0, max=20)
+        state.entities["npc.red2"].visible_actors = []
+        attacks = [
+            MassAttack(attacker="npc.red1", target="npc.blue1"),
+            MassAttack(attacker="npc.red2", target="npc.blue2"),
+            MassAttack(attacker="npc.red3", target="npc.blue3", domain="x"),
+        ]
+        result = resolve_mass_combat(state, attacks, seed=1)
+
+        assert not result.ok
+        assert [s["reason"] for s in result.facts["skipped"]] == [
+            "attacker is down",
+            "target not visible",
+            "invalid domain x",
+        ]
+        assert result.effects == []
+
+
+def test_parse_damage_expr():
+    assert parse_damage_expr("2d8+3") == (2, 8, 3)
+    assert parse_damage_expr("1d4") == (1, 4, 0)
+    assert parse_damage_expr("nonsense") == (1, 6, 0)
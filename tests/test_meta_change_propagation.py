@@ -144,6 +144,45 @@ class TestEventBus:
         event_bus.clear_subscribers()
         assert event_bus.get_subscriber_count("event2") == 0
 
+    def test_publish_without_subscribers_skips_payload(self, event_bus):
+        """Test the no-subscriber fast path and lazy payloads."""
+        built = []
+
+        def build():
+            built.append(True)
+            return {"value": 1}
+
+        assert not event_bus.has_subscribers("lazy.event")
+        event_bus.publish_lazy("lazy.event", build)
+        assert built == []
+
+        received = []
+        event_bus.subscribe("lazy.event", received.append)
+        assert event_bus.has_subscribers("lazy.event")
+        event_bus.publish_lazy("lazy.event", build)
+        assert built == [True]
+        assert received[0]["value"] == 1
+        assert received[0]["event_type"] == "lazy.event"
+
+    def test_handlers_can_unsubscribe_during_publish(self, event_bus):
+        """Test that copy-on-write subscriber tuples tolerate mutation mid-publish."""
+        calls = []
+
+        def once(event_data):
+            calls.append("once")
+            event_bus.unsubscribe("test.event", once)
+
+        def always(event_data):
+            calls.append("always")
+
+        event_bus.subscribe("test.event", once)
+        event_bus.subscribe("test.event", always)
+        event_bus.publish("test.event", {})
+        event_bus.publish("test.event", {})
+
+        assert calls == ["once", "always", "always"]
+        assert event_bus.get_subscriber_count("test.event") == 1
+
 
 class TestMetaChangeEvents:
     """Test meta change event propagation."""
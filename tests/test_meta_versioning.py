@@ -0,0 +1,106 @@
+"""
+Tests for Meta version counters, lazy timestamps and interned known_by sets.
+"""
+
+import copy
+import json
+import pickle
+
+import pytest
+from pydantic import ValidationError
+
+from backend.router.game_state import GameState, NPC, PC, HP
+from backend.router.meta_utils import reveal_to
+from models import meta as meta_module
+from models.meta import KnownBy, Meta
+
+
+def make_state():
+    entities = {
+        "pc.arin": PC(id="pc.arin", name="Arin", current_zone="hall", hp=HP(current=10, max=10)),
+        "npc.spy": NPC(id="npc.spy", name="Spy", current_zone="hall", hp=HP(current=5, max=5)),
+    }
+    entities["npc.spy"].meta.visibility = "hidden"
+    return GameState(entities=entities, zones={})
+
+
+class TestVersionAndTimestamps:
+    def test_touch_bumps_version_and_defers_formatting(self):
+        meta = Meta()
+        assert meta.version == 0
+
+        meta.touch()
+        meta.touch()
+        assert meta.version == 2
+        assert isinstance(meta.last_changed_at, float)
+        assert meta.last_changed_iso.endswith("+00:00")
+
+    def test_exports_and_dumps_use_iso_strings(self):
+        meta = Meta()
+        meta.touch()
+        iso = meta.last_changed_iso
+
+        assert meta.export("save")["last_changed_at"] == iso
+        assert meta.model_dump()["last_changed_at"] == iso
+        assert json.loads(meta.model_dump_json())["last_changed_at"] == iso
+        assert Meta.model_validate(meta.model_dump()).last_changed_at == iso
+
+    def test_cached_view_is_rebuilt_after_touch_without_state(self):
+        state = make_state()
+        assert state.get_cached_view("pc.arin", "npc.spy")["is_visible"] is False
+
+        # reveal_to without a game_state used to leave the cached view stale
+        reveal_to(state.entities["npc.spy"], "pc.arin")
+        assert state.get_cached_view("pc.arin", "npc.spy")["is_visible"] is True
+
+
+class TestKnownBy:
+    def test_behaves_like_a_set_of_strings(self):
+        known = KnownBy(["pc.b", "pc.a"])
+        known.add("pc.c")
+        known.discard("pc.b")
+        known.discard("pc.never_seen")
+
+        assert "pc.a" in known and "pc.b" not in known
+        assert "pc.unknown" not in known
+        assert len(known) == 2
+        assert known == {"pc.a", "pc.c"} and {"pc.a", "pc.c"} == known
+        assert sorted(known | {"pc.d"}) == ["pc.a", "pc.c", "pc.d"]
+
+    def test_copies_are_independent(self):
+        meta = Meta(known_by={"pc.a"})
+        clone = copy.deepcopy(meta)
+        clone.known_by.add("pc.b")
+        restored = pickle.loads(pickle.dumps(meta))
+
+        assert meta.known_by == {"pc.a"}
+        assert clone.known_by == {"pc.a", "pc.b"}
+        assert restored.known_by == {"pc.a"}
+
+    def test_serialization(self):
+        meta = Meta(known_by=["pc.z", "pc.a"])
+        assert isinstance(meta.known_by, KnownBy)
+        assert meta.model_dump()["known_by"] == {"pc.a", "pc.z"}
+        assert meta.model_dump(mode="json")["known_by"] == ["pc.a", "pc.z"]
+        assert meta.export("save")["known_by"] == ["pc.a", "pc.z"]
+
+    def test_ids_past_the_intern_limit_overflow_to_a_set(self, monkeypatch):
+        known = KnownBy(["pc.a"])
+        monkeypatch.setattr(meta_module, "MAX_INTERNED_ACTORS", len(meta_module._actor_ids))
+        table_size = len(meta_module._actor_ids)
+
+        known.add("pc.overflow_only")
+        other = KnownBy(["pc.a", "pc.overflow_only"])
+
+        assert len(meta_module._actor_ids) == table_size
+        assert "pc.overflow_only" in known and len(known) == 2
+        assert known == other == {"pc.a", "pc.overflow_only"}
+        assert pickle.loads(pickle.dumps(known)) == known
+        known.discard("pc.overflow_only")
+        assert known == {"pc.a"}
+
+    def test_rejects_non_collections(self):
+        with pytest.raises(ValidationError):
+            Meta(known_by="pc.a")
+        with pytest.raises(ValidationError):
+            Meta(known_by=[1, 2])
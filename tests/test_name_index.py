@@ -0,0 +1,191 @@
+"""
+Tests for the name/alias index and its GameState resolver API.
+"""
+
+import pytest
+
+from backend.router.game_state import GameState, PC, NPC, Zone, HP, Utterance
+from backend.router.name_index import NameIndex, tokenize, trigrams
+from backend.router.validator import Validator
+
+
+@pytest.fixture
+def state():
+    zones = {
+        "courtyard": Zone(
+            id="courtyard",
+            name="Courtyard",
+            description="A stone courtyard.",
+            adjacent_zones=["main_hall", "hallway"],
+        ),
+        "main_hall": Zone(
+            id="main_hall",
+            name="Main Hall",
+            description="A vaulted hall.",
+            adjacent_zones=["courtyard"],
+        ),
+        "hallway": Zone(
+            id="hallway",
+            name="Servants' Hallway",
+            description="A narrow passage.",
+            adjacent_zones=["courtyard"],
+        ),
+    }
+    entities = {
+        "pc.arin": PC(
+            id="pc.arin",
+            name="Arin",
+            current_zone="courtyard",
+            visible_actors=["npc.guard", "npc.captain"],
+        ),
+        "npc.guard": NPC(id="npc.guard", name="Guard", current_zone="courtyard"),
+        "npc.captain": NPC(
+            id="npc.captain",
+            name="Guard Captain",
+            current_zone="courtyard",
+            tags={"aliases": ["Captain Vell", "the captain"]},
+        ),
+    }
+    return GameState(entities=entities, zones=zones, current_actor="pc.arin")
+
+
+class TestTokenization:
+    def test_tokenize_drops_stopwords(self):
+        assert tokenize("Talk to the Guard Captain!") == ["talk", "guard", "captain"]
+
+    def test_ids_tokenize_on_separators(self):
+        assert tokenize("npc.guard_2") == ["npc", "guard", "2"]
+
+    def test_trigrams_normalize_case(self):
+        assert trigrams("Hall") == trigrams("the hall")
+
+
+class TestNameIndex:
+    def test_find_mentions_prefers_specific_names(self, state):
+        index = state.get_name_index()
+        mentions = index.find_mentions("I salute the guard captain", kind="entity")
+
+        assert [m.id for m in mentions] == ["npc.captain", "npc.guard"]
+
+    def test_find_mentions_respects_candidates(self, state):
+        index = state.get_name_index()
+        mentions = index.find_mentions(
+            "go to the main hall", kind="zone", candidates=["hallway"]
+        )
+
+        assert mentions == []
+
+    def test_hall_does_not_match_hallway_by_substring(self, state):
+        mentions = state.get_name_index().find_mentions("walk to the hall", kind="zone")
+
+        # Matching is token based, so "hall" must not hit "Servants' Hallway"
+        assert "hallway" not in [m.id for m in mentions]
+
+    def test_alias_mentions(self, state):
+        mentions = state.get_name_index().find_mentions("Ask Captain Vell about it")
+
+        assert mentions[0].id == "npc.captain"
+        assert mentions[0].matched == "Captain Vell"
+
+    def test_lookup_fuzzy(self, state):
+        matches = state.get_name_index().lookup("main hal", kind="zone")
+
+        assert matches[0].id == "main_hall"
+        assert 0 < matches[0].score < 1
+
+    def test_resolve_exact_and_ambiguous(self, state):
+        assert state.resolve_name("Guard") == "npc.guard"
+        assert state.resolve_name("npc.captain") == "npc.captain"
+        assert state.resolve_name("courtyard", kind="entity") is None
+        assert state.resolve_name("dragon") is None
+
+    def test_embedder_blends_semantic_similarity(self):
+        vectors = {"Guard": (1.0, 0.0), "Cook": (0.0, 1.0), "sentry": (0.9, 0.1)}
+        index = NameIndex(embedder=lambda text: vectors.get(text, (0.0, 0.0)))
+        index.upsert("entity", "npc.guard", "Guard")
+        index.upsert("entity", "npc.cook", "Cook")
+
+        assert index.resolve("sentry") == "npc.guard"
+
+
+class TestIncrementalMaintenance:
+    def test_new_entity_is_indexed(self, state):
+        index = state.get_name_index()
+        state.entities["npc.cook"] = NPC(id="npc.cook", name="Cook", current_zone="courtyard")
+
+        assert state.get_name_index() is index
+        assert state.resolve_name("cook") == "npc.cook"
+
+    def test_rename_reindexes_only_changed_record(self, state):
+        index = state.get_name_index()
+        state.entities["npc.guard"].name = "Sentry"
+
+        assert index.sync(state) == 1
+        assert state.resolve_name("sentry") == "npc.guard"
+        assert index.find_mentions("the guard", kind="entity") == []
+
+    def test_removed_entity_is_dropped(self, state):
+        index = state.get_name_index()
+        del state.entities["npc.guard"]
+
+        assert index.sync(state) == 1
+        assert ("entity", "npc.guard") not in index
+
+    def test_unchanged_state_sync_is_noop(self, state):
+        index = state.get_name_index()
+
+        assert index.sync(state) == 0
+
+    def test_clean_reads_do_not_resync(self, state, monkeypatch):
+        index = state.get_name_index()
+        monkeypatch.setattr(index, "sync", lambda state: pytest.fail("resynced"))
+
+        state.add_entity(NPC(id="npc.cook", name="Cook", current_zone="courtyard"))
+        state.rename_entity("npc.guard", "Sentry", aliases=["watchman"])
+        state.add_zone(Zone(id="cellar", name="Wine Cellar", description="Damp."))
+        state.remove_zone("hallway")
+
+        assert state.get_name_index() is index
+        assert state.resolve_name("cook") == "npc.cook"
+        assert state.resolve_name("watchman") == "npc.guard"
+        assert state.resolve_name("wine cellar") == "cellar"
+        assert ("zone", "hallway") not in index
+        assert state.remove_entity("npc.cook") is not None
+        assert ("entity", "npc.cook") not in index
+
+    def test_full_invalidation_resyncs(self, state):
+        index = state.get_name_index()
+        state.entities["npc.guard"].name = "Sentry"
+        state.invalidate_cache()
+
+        assert state.resolve_name("sentry") == "npc.guard"
+
+    def test_alias_tag_effect_reindexes(self, state):
+        from backend.router.effects import apply_effects
+
+        state.get_name_index()
+        apply_effects(state, [{"type": "tag", "target": "npc.guard", "add": {"aliases": ["Bors"]}}])
+
+        assert state.resolve_name("bors") == "npc.guard"
+
+    def test_embedder_set_through_state(self, state):
+        vectors = {"Guard": (1.0, 0.0), "Guard Captain": (0.0, 1.0), "sentry": (0.9, 0.1)}
+        state.set_name_embedder(lambda text: vectors.get(text, (0.0, 0.0)))
+
+        assert state.get_name_index().embedder is not None
+        assert state.resolve_name("sentry", kind="entity") == "npc.guard"
+
+
+class TestResolverIntegration:
+    def test_get_info_accepts_names(self, state):
+        validator = Validator()
+        result = validator.validate_and_execute(
+            "get_info",
+            {"actor": "pc.arin", "target": "Guard Captain", "topic": "status"},
+            state,
+            Utterance(text="how is the captain?", actor_id="pc.arin"),
+            seed=1,
+        )
+
+        assert result.ok
+        assert result.facts.get("target", {}).get("id", "npc.captain") == "npc.captain"
@@ -0,0 +1,218 @@
+"""
+Tests for streamed narration.
+
+Covers NarrationGenerator.stream_narration against fake OpenAI clients that
+yield deltas (Chat Completions and Responses API), the fallbacks when the
+stream fails or is empty, and GameRouter's narration_callback ordering
+relative to the final TurnResult narration.
+"""
+
+import sys
+import types
+from types import SimpleNamespace
+
+import pytest
+
+from backend.router.game_state import PC, GameState, Utterance, Zone
+from backend.router.validator import ToolResult
+
+
+def chat_chunk(content):
+    return SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=content))])
+
+
+def response_event(delta, event_type="response.output_text.delta"):
+    return SimpleNamespace(type=event_type, delta=delta)
+
+
+class FakeStream:
+    """Iterable stream that yields items, optionally failing after them."""
+
+    def __init__(self, items, error=None):
+        self.items = items
+        self.error = error
+
+    def __iter__(self):
+        yield from self.items
+        if self.error is not None:
+            raise self.error
+
+
+class FakeClient:
+    """Stands in for OpenAI(); records the kwargs of every create() call."""
+
+    def __init__(self, stream):
+        self.calls = []
+
+        def create(**kwargs):
+            self.calls.append(kwargs)
+            if isinstance(stream, Exception):
+                raise stream
+            return stream
+
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=create))
+        self.responses = SimpleNamespace(create=create)
+
+
+@pytest.fixture
+def fake_config(monkeypatch):
+    config = types.ModuleType("config")
+    config.OPENAI_API_KEY = "test-key"
+    config.PLANNING_MODEL = "gpt-4o-mini"
+    config.PLANNING_MAX_TOKENS = 200
+    config.PLANNING_TEMPERATURE = 0.1
+    config.NARRATION_MODEL = "gpt-4o-mini"
+    config.NARRATION_MAX_TOKENS = 300
+    config.NARRATION_TEMPERATURE = 0.7
+    monkeypatch.setitem(sys.modules, "config", config)
+    return config
+
+
+def make_world():
+    return GameState(
+        entities={"pc.arin": PC(id="pc.arin", name="Arin", current_zone="hall")},
+        zones={"hall": Zone(id="hall", name="Hall", description="A quiet hall.")},
+        current_actor="pc.arin",
+    )
+
+
+def make_result(summary="Arin looks around."):
+    return ToolResult(
+        ok=True,
+        tool_id="narrate_only",
+        args={"actor": "pc.arin"},
+        facts={},
+        effects=[],
+        narration_hint={"summary": summary},
+    )
+
+
+def make_generator(stream, model="gpt-4o-mini"):
+    from narration.generator import NarrationGenerator
+
+    generator = NarrationGenerator(api_key="test-key", model=model)
+    generator.client = FakeClient(stream)
+    generator._prepare_prompt = lambda *args: "prompt"
+    return generator
+
+
+class TestStreamNarration:
+    def test_chat_deltas_are_yielded_in_order(self, fake_config):
+        generator = make_generator(
+            FakeStream([chat_chunk("  The"), chat_chunk(None), chat_chunk(" door"), chat_chunk(" creaks.")])
+        )
+
+        fragments = list(generator.stream_narration(make_result(), make_world()))
+
+        assert fragments == ["The", " door", " creaks."]
+        assert generator.client.calls[0]["stream"] is True
+
+    def test_responses_api_deltas_for_gpt5(self, fake_config):
+        generator = make_generator(
+            FakeStream(
+                [
+                    response_event("Rain"),
+                    response_event("", "response.created"),
+                    response_event(" falls."),
+                ]
+            ),
+            model="gpt-5",
+        )
+
+        assert list(generator.stream_narration(make_result(), make_world())) == ["Rain", " falls."]
+
+    def test_request_failure_falls_back_to_summary(self, fake_config):
+        generator = make_generator(RuntimeError("connection refused"))
+
+        assert list(generator.stream_narration(make_result("Fallback."), make_world())) == ["Fallback."]
+
+    def test_error_before_first_delta_falls_back_to_summary(self, fake_config):
+        generator = make_generator(FakeStream([chat_chunk("   ")], error=RuntimeError("reset")))
+
+        assert list(generator.stream_narration(make_result("Fallback."), make_world())) == ["Fallback."]
+
+    def test_error_mid_stream_keeps_partial_text(self, fake_config):
+        generator = make_generator(FakeStream([chat_chunk("The door")], error=RuntimeError("reset")))
+
+        assert list(generator.stream_narration(make_result("Fallback."), make_world())) == ["The door"]
+
+    def test_empty_stream_falls_back_to_summary(self, fake_config):
+        generator = make_generator(FakeStream([]))
+
+        assert list(generator.stream_narration(make_result("Fallback."), make_world())) == ["Fallback."]
+
+
+class TestRouterNarrationCallback:
+    @pytest.fixture
+    def router(self, fake_config, monkeypatch):
+        import runtime.router as router_module
+
+        router = router_module.GameRouter(use_fast_path=False)
+        router._initialized = True
+        return router, router_module
+
+    def test_callback_sees_same_text_as_turn_result(self, router, monkeypatch):
+        router, router_module = router
+        streams = iter([["The hall ", "is quiet."], ["Dust ", "drifts."]])
+        monkeypatch.setattr(router_module, "stream_narration", lambda *args: iter(next(streams)))
+        monkeypatch.setattr(
+            router_module,
+            "get_staged_plan",
+            lambda world, utterance, debug=False: SimpleNamespace(
+                success=True,
+                tool_calls=[
+                    {"tool": "narrate_only", "args": {"actor": "pc.arin", "topic": "look around"}},
+                    {"tool": "narrate_only", "args": {"actor": "pc.arin", "topic": "listen"}},
+                ],
+                error_message=None,
+            ),
+        )
+        received = []
+
+        result = router.process_turn(make_world(), "look and listen", narration_callback=received.append)
+
+        assert received == ["The hall ", "is quiet.", " ", "Dust ", "drifts."]
+        assert "".join(received) == result.narration == "The hall is quiet. Dust drifts."
+
+    def test_stream_error_keeps_text_already_shown(self, router, monkeypatch):
+        router, router_module = router
+
+        def failing_stream(*args):
+            yield "The blade"
+            raise RuntimeError("stream reset")
+
+        monkeypatch.setattr(router_module, "stream_narration", failing_stream)
+        received = []
+
+        narration = router._generate_narration(
+            make_result(), make_world(), "pc.arin", narration_callback=received.append
+        )
+
+        assert received == ["The blade"]
+        assert narration == "The blade"
+
+    def test_stream_error_before_text_uses_summary(self, router, monkeypatch):
+        router, router_module = router
+
+        def failing_stream(*args):
+            raise RuntimeError("stream reset")
+            yield  # pragma: no cover
+
+        monkeypatch.setattr(router_module, "stream_narration", failing_stream)
+        received = []
+
+        narration = router._generate_narration(
+            make_result("Arin waits."), make_world(), "pc.arin", narration_callback=received.append
+        )
+
+        assert received == ["Arin waits."]
+        assert narration == "Arin waits."
+
+    def test_without_callback_uses_blocking_narration(self, router, monkeypatch):
+        router, router_module = router
+        monkeypatch.setattr(router_module, "generate_narration", lambda *args: "Blocking text.")
+        monkeypatch.setattr(
+            router_module, "stream_narration", lambda *args: pytest.fail("should not stream")
+        )
+
+        assert router._generate_narration(make_result(), make_world(), "pc.arin") == "Blocking text."
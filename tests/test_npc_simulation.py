@@ -0,0 +1,141 @@
+"""
+Tests for the off-screen NPC simulator.
+"""
+
+from backend.router.game_state import HP, NPC, PC, GameState, Zone
+from backend.router.npc_simulation import NPCProfile, NPCSimulator
+
+
+def make_state(**npc_tags):
+    zones = {
+        zone_id: Zone(id=zone_id, name=zone_id.title(), adjacent_zones=adjacent)
+        for zone_id, adjacent in [
+            ("gate", ["yard"]),
+            ("yard", ["gate", "keep"]),
+            ("keep", ["yard"]),
+        ]
+    }
+    entities = {"pc.arin": PC(id="pc.arin", name="Arin", current_zone="gate")}
+    for npc_id, (zone, tags) in npc_tags.items():
+        entities[f"npc.{npc_id}"] = NPC(
+            id=f"npc.{npc_id}",
+            name=npc_id.title(),
+            current_zone=zone,
+            hp=HP(current=10, max=10),
+            tags=tags,
+        )
+    return GameState(entities=entities, zones=zones)
+
+
+class TestNPCSimulator:
+    def test_only_off_screen_npcs_act(self):
+        state = make_state(
+            near=("gate", {"goal_zone": "keep"}), far=("keep", {"goal_zone": "gate"})
+        )
+        simulator = NPCSimulator(state)
+
+        assert simulator.off_screen_npcs() == ["npc.far"]
+        tick = simulator.run_round()
+
+        assert tick.npcs == 1
+        assert state.entities["npc.near"].current_zone == "gate"
+        assert state.entities["npc.far"].current_zone == "yard"
+
+    def test_walks_towards_goal_one_zone_per_round(self):
+        state = make_state(runner=("keep", {"goal_zone": "gate"}))
+        simulator = NPCSimulator(state)
+
+        simulator.run_round(on_screen_zones=[])
+        assert state.entities["npc.runner"].current_zone == "yard"
+        simulator.run_round(on_screen_zones=[])
+        assert state.entities["npc.runner"].current_zone == "gate"
+        tick = simulator.run_round(on_screen_zones=[])
+        assert tick.actions["move"] == 0
+
+    def test_patrol_cycles_between_zones(self):
+        state = make_state(guard=("yard", {"patrol": ["yard", "keep"]}))
+        simulator = NPCSimulator(state)
+
+        zones = []
+        for _ in range(4):
+            simulator.run_round(on_screen_zones=[])
+            zones.append(state.entities["npc.guard"].current_zone)
+        assert zones == ["keep", "yard", "keep", "yard"]
+
+    def test_hostile_npc_attacks_through_validator(self):
+        state = make_state(orc=("keep", {"hostile_to": "pc", "aggression": 1.0}))
+        state.entities["pc.arin"].current_zone = "keep"
+        state.current_actor = "pc.arin"
+        simulator = NPCSimulator(state, seed=3)
+
+        for _ in range(10):
+            tick = simulator.run_round(on_screen_zones=[])
+            assert tick.failed == 0
+        assert state.entities["pc.arin"].hp.current < 20
+        assert "pc.arin" in state.entities["npc.orc"].visible_actors
+        assert state.current_actor == "pc.arin"
+
+    def test_actions_failing_preconditions_are_not_executed(self):
+        # attack's precondition wants a visible actor of the other type
+        state = make_state(
+            orc=("keep", {"hostile_to": "npc", "aggression": 1.0}),
+            guard=("keep", {"sociability": 0.0}),
+        )
+        simulator = NPCSimulator(state, seed=3)
+
+        tick = simulator.run_round()
+
+        assert tick.failed == 1
+        assert state.entities["npc.guard"].hp.current == 10
+
+    def test_no_talking_to_actors_who_left_this_round(self):
+        state = make_state(
+            aldo=("keep", {"goal_zone": "gate", "sociability": 0.0}),
+            zed=("keep", {"sociability": 0.9}),
+        )
+        simulator = NPCSimulator(state)
+
+        # Aldo acts first (ID order) and walks off before Zed's turn
+        tick = simulator.run_round(on_screen_zones=[])
+
+        assert (tick.actions["move"], tick.actions["talk"]) == (1, 0)
+        assert state.entities["npc.zed"].visible_actors == []
+
+    def test_arrival_in_an_on_screen_zone_is_revealed(self):
+        state = make_state(runner=("yard", {"goal_zone": "gate"}))
+        simulator = NPCSimulator(state)
+
+        simulator.run_round()
+
+        assert state.entities["npc.runner"].current_zone == "gate"
+        assert "pc.arin" in state.entities["npc.runner"].meta.known_by
+
+    def test_runs_are_deterministic_for_a_seed(self):
+        def run(seed):
+            state = make_state(
+                orc=("keep", {"hostile_to": ["npc.guard"]}),
+                guard=("keep", {"sociability": 0.0}),
+            )
+            simulator = NPCSimulator(state, seed=seed)
+            for _ in range(5):
+                simulator.run_round()
+            return state.entities["npc.guard"].hp.current
+
+        assert run(7) == run(7)
+
+    def test_path_cache_cleared_when_zone_graph_changes(self):
+        state = make_state(runner=("keep", {"goal_zone": "gate"}))
+        simulator = NPCSimulator(state)
+        assert simulator.next_step("keep", "gate") == "yard"
+        assert simulator._paths
+
+        state.emit("zone_graph.exit_blocked", zone_id="keep")
+        assert not simulator._paths
+
+
+def test_profile_from_tags_defaults():
+    profile = NPCProfile.from_tags({"hostile_to": "pc", "patrol": ("a", "b")})
+    assert profile.hostile_to == {"pc"}
+    assert profile.patrol == ["a", "b"]
+    assert profile.goal_zone is None
+    assert profile.aggression == 0.5
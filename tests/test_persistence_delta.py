@@ -0,0 +1,234 @@
+"""
+Tests for incremental (delta log) saves in the persistence layer.
+"""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from backend.router.game_state import GameState, PC, NPC, Zone, HP
+from backend.router.persistence import (
+    PersistenceManager,
+    PersistenceError,
+    SaveFileCorrupted,
+)
+
+
+@pytest.fixture
+def manager(tmp_path):
+    return PersistenceManager(base_path=tmp_path, compact_every=3)
+
+
+@pytest.fixture
+def state():
+    zones = {
+        "tavern": Zone(id="tavern", name="Tavern", description="Warm.", adjacent_zones=["street"]),
+        "street": Zone(id="street", name="Street", description="Busy.", adjacent_zones=["tavern"]),
+    }
+    entities = {
+        "pc.alice": PC(id="pc.alice", name="Alice", current_zone="tavern", hp=HP(current=20, max=20)),
+        "npc.bob": NPC(id="npc.bob", name="Bob", current_zone="tavern", hp=HP(current=10, max=10)),
+    }
+    return GameState(entities=entities, zones=zones)
+
+
+def _log_lines(tmp_path, file_type="gm"):
+    path = tmp_path / "campaign" / f"{file_type}.delta.jsonl"
+    if not path.exists():
+        return []
+    return [json.loads(line) for line in path.read_text().splitlines() if line]
+
+
+class TestIncrementalSaves:
+    def test_first_incremental_save_writes_full_snapshot(self, manager, state, tmp_path):
+        manager.save_game_state(state, "campaign", incremental=True)
+
+        assert (tmp_path / "campaign" / "gm.json").exists()
+        assert _log_lines(tmp_path) == []
+
+    def test_delta_contains_only_changed_objects(self, manager, state, tmp_path):
+        manager.save_game_state(state, "campaign")
+        state.entities["npc.bob"].hp.current = 4
+        manager.save_game_state(state, "campaign", incremental=True)
+
+        (delta,) = _log_lines(tmp_path)
+        assert list(delta["set"]["entities"]) == ["npc.bob"]
+        assert "zones" not in delta["set"]
+
+    def test_load_replays_deltas(self, manager, state):
+        manager.save_game_state(state, "campaign")
+        state.entities["npc.bob"].hp.current = 4
+        manager.save_game_state(state, "campaign", incremental=True)
+        del state.entities["pc.alice"]
+        state.scene.round = 3
+        manager.save_game_state(state, "campaign", incremental=True)
+
+        loaded = manager.load_game_state("campaign", file_type="gm")
+
+        assert loaded.entities["npc.bob"].hp.current == 4
+        assert "pc.alice" not in loaded.entities
+        assert loaded.scene.round == 3
+
+    def test_log_is_compacted(self, manager, state, tmp_path):
+        manager.save_game_state(state, "campaign")
+        for hp in range(5, 9):
+            state.entities["npc.bob"].hp.current = hp
+            manager.save_game_state(state, "campaign", incremental=True)
+
+        # Three deltas then a compaction snapshot that truncates the log
+        assert _log_lines(tmp_path) == []
+        assert manager.load_game_state("campaign", file_type="gm").entities["npc.bob"].hp.current == 8
+
+    def test_no_backups_for_delta_saves(self, manager, state, tmp_path):
+        manager.save_game_state(state, "campaign")
+        state.entities["npc.bob"].hp.current = 4
+        manager.save_game_state(state, "campaign", incremental=True)
+
+        assert list((tmp_path / "campaign").glob("*.bak.*.json")) == []
+
+    def test_resumes_after_restart(self, manager, state, tmp_path):
+        manager.save_game_state(state, "campaign")
+        state.entities["npc.bob"].hp.current = 4
+        manager.save_game_state(state, "campaign", incremental=True)
+
+        restarted = PersistenceManager(base_path=tmp_path, compact_every=3)
+        state.entities["pc.alice"].hp.current = 7
+        restarted.save_game_state(state, "campaign", incremental=True)
+
+        deltas = _log_lines(tmp_path)
+        assert [d["seq"] for d in deltas] == [1, 2]
+        assert list(deltas[1]["set"]["entities"]) == ["pc.alice"]
+
+    def test_torn_final_line_is_ignored(self, manager, state, tmp_path):
+        manager.save_game_state(state, "campaign")
+        state.entities["npc.bob"].hp.current = 4
+        manager.save_game_state(state, "campaign", incremental=True)
+        with open(tmp_path / "campaign" / "gm.delta.jsonl", "a") as f:
+            f.write('{"seq": 2, "set": {"entit')
+
+        loaded = manager.load_game_state("campaign", file_type="gm")
+        assert loaded.entities["npc.bob"].hp.current == 4
+
+    def test_append_after_torn_line_stays_loadable(self, manager, state, tmp_path):
+        manager.save_game_state(state, "campaign")
+        state.entities["npc.bob"].hp.current = 4
+        manager.save_game_state(state, "campaign", incremental=True)
+        with open(tmp_path / "campaign" / "gm.delta.jsonl", "a") as f:
+            f.write('{"seq": 2, "set": {"entit')
+
+        restarted = PersistenceManager(base_path=tmp_path, compact_every=3)
+        state.entities["npc.bob"].hp.current = 2
+        restarted.save_game_state(state, "campaign", incremental=True)
+
+        assert [delta["seq"] for delta in _log_lines(tmp_path)] == [1, 2]
+        loaded = restarted.load_game_state("campaign", file_type="gm")
+        assert loaded.entities["npc.bob"].hp.current == 2
+
+    def test_removed_scene_keys_are_recorded(self, manager, state, tmp_path, monkeypatch):
+        manager.save_game_state(state, "campaign")
+        export_views = GameState.export_views
+
+        def without_objective(self, views, **kwargs):
+            exported = export_views(self, views, **kwargs)
+            for view in exported.values():
+                view["scene"].pop("objective", None)
+            return exported
+
+        monkeypatch.setattr(GameState, "export_views", without_objective)
+        manager.save_game_state(state, "campaign", incremental=True)
+
+        (delta,) = _log_lines(tmp_path)
+        assert delta["scene_removed"] == ["objective"]
+        data = json.loads((tmp_path / "campaign" / "gm.json").read_text())
+        PersistenceManager._apply_delta(data, delta)
+        assert "objective" not in data["game_state"]["scene"]
+
+    def test_corrupt_middle_line_raises(self, manager, state, tmp_path):
+        manager.save_game_state(state, "campaign")
+        log_path = tmp_path / "campaign" / "gm.delta.jsonl"
+        log_path.write_text('not json\n{"seq": 2}\n')
+
+        with pytest.raises(SaveFileCorrupted):
+            manager.load_game_state("campaign", file_type="gm")
+
+    def test_export_includes_delta_logs(self, manager, state, tmp_path):
+        manager.save_game_state(state, "campaign")
+        state.entities["npc.bob"].hp.current = 4
+        manager.save_game_state(state, "campaign", incremental=True)
+
+        export_dir = manager.export_save(
+            "campaign", tmp_path / "out", file_types=["gm"], compress=False
+        )
+
+        names = sorted(p.name for p in Path(export_dir).iterdir())
+        assert names == ["gm.delta.jsonl", "gm.json"]
+
+
+class TestAtomicWriter:
+    def test_files_are_compact_and_checksummed(self, manager, state, tmp_path):
+        manager.save_game_state(state, "campaign")
+
+        save_dir = tmp_path / "campaign"
+        raw = (save_dir / "gm.json").read_bytes()
+        manifest = json.loads((save_dir / "manifest.json").read_text())
+
+        assert b"\n" not in raw
+        assert manifest["checksums"]["gm"]["size"] == len(raw)
+        assert not list(save_dir.glob("*.tmp"))
+
+    def test_truncated_file_is_rejected_before_parsing(self, manager, state, tmp_path):
+        manager.save_game_state(state, "campaign")
+        gm_path = tmp_path / "campaign" / "gm.json"
+        gm_path.write_bytes(gm_path.read_bytes()[:-10])
+
+        with pytest.raises(SaveFileCorrupted, match="truncated"):
+            manager.load_game_state("campaign", file_type="gm")
+
+    def test_crash_before_manifest_update_keeps_new_file(self, manager, state, tmp_path):
+        manager.save_game_state(state, "campaign")
+        manifest_path = tmp_path / "campaign" / "manifest.json"
+        old_manifest = manifest_path.read_bytes()
+        state.entities["npc.bob"].hp.current = 4
+        manager.save_game_state(state, "campaign", create_backup=False)
+        # Crash after gm.json was replaced but before the manifest was
+        gm_stat = (tmp_path / "campaign" / "gm.json").stat()
+        manifest_path.write_bytes(old_manifest)
+        os.utime(manifest_path, ns=(gm_stat.st_atime_ns, gm_stat.st_mtime_ns - 1))
+
+        loaded = manager.load_game_state("campaign", file_type="gm")
+        assert loaded.entities["npc.bob"].hp.current == 4
+
+    def test_damaged_file_older_than_manifest_is_rejected(self, manager, state, tmp_path):
+        manager.save_game_state(state, "campaign")
+        gm_path = tmp_path / "campaign" / "gm.json"
+        gm_path.write_bytes(gm_path.read_bytes().replace(b'"Bob"', b'"Rob"'))
+        manifest_stat = (tmp_path / "campaign" / "manifest.json").stat()
+        os.utime(gm_path, ns=(manifest_stat.st_atime_ns, manifest_stat.st_mtime_ns))
+
+        with pytest.raises(SaveFileCorrupted, match="checksum"):
+            manager.load_game_state("campaign", file_type="gm")
+
+    def test_gzip_round_trip(self, state, tmp_path):
+        manager = PersistenceManager(base_path=tmp_path, compression="gzip")
+        manager.save_game_state(state, "campaign")
+
+        assert (tmp_path / "campaign" / "gm.json").read_bytes()[:2] == b"\x1f\x8b"
+        loaded = manager.load_game_state("campaign", file_type="gm")
+        assert set(loaded.entities) == {"pc.alice", "npc.bob"}
+
+    def test_failed_write_keeps_previous_file(self, manager, state, tmp_path, monkeypatch):
+        manager.save_game_state(state, "campaign")
+        gm_path = tmp_path / "campaign" / "gm.json"
+        before = gm_path.read_bytes()
+
+        def failing_replace(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr("backend.router.persistence.os.replace", failing_replace)
+        with pytest.raises(PersistenceError):
+            manager.save_game_state(state, "campaign", create_backup=False)
+
+        assert gm_path.read_bytes() == before
+        assert not list(gm_path.parent.glob("*.tmp"))
@@ -0,0 +1,144 @@
+"""
+Tests for region-sharded saves and lazy partial loading.
+"""
+
+import pytest
+
+from backend.router.game_state import GameState, PC, NPC, Zone, Clock, HP
+from backend.router.persistence import PersistenceManager, SaveFileCorrupted, PersistenceError
+from backend.router.region_store import RegionLoader, RegionStoreError, write_region_shards
+
+
+@pytest.fixture
+def state():
+    """Three regions in a line: town <-> forest <-> mountains."""
+    zones = {
+        "square": Zone(id="square", name="Square", adjacent_zones=["inn", "path"], region="town"),
+        "inn": Zone(id="inn", name="Inn", adjacent_zones=["square"], region="town"),
+        "path": Zone(id="path", name="Path", adjacent_zones=["square", "pass"], region="forest"),
+        "pass": Zone(id="pass", name="Pass", adjacent_zones=["path", "peak"], region="mountains"),
+        "peak": Zone(id="peak", name="Peak", adjacent_zones=["pass"], region="mountains"),
+    }
+    entities = {
+        "pc.hero": PC(id="pc.hero", name="Hero", current_zone="square"),
+        "npc.keeper": NPC(id="npc.keeper", name="Keeper", current_zone="inn"),
+        "npc.wolf": NPC(id="npc.wolf", name="Wolf", current_zone="path", hp=HP(current=6, max=8)),
+        "npc.giant": NPC(id="npc.giant", name="Giant", current_zone="peak"),
+    }
+    clocks = {"storm": Clock(id="storm", name="Storm", value=1)}
+    return GameState(entities=entities, zones=zones, clocks=clocks, current_actor="pc.hero")
+
+
+@pytest.fixture
+def save_dir(state, tmp_path):
+    write_region_shards(state.to_save_format(include_runtime_data=True), tmp_path)
+    return tmp_path
+
+
+class TestRegionLoader:
+    def test_loads_region_and_neighbours_only(self, save_dir):
+        loader = RegionLoader(save_dir)
+        world = loader.load(zone_id="square", neighbors=1)
+
+        assert loader.loaded_regions == {"town", "forest"}
+        assert set(dict(world.zones)) == {"square", "inn", "path"}
+        assert "npc.giant" not in dict(world.entities)
+        assert world.clocks["storm"].value == 1
+
+    def test_lookup_materializes_other_regions(self, save_dir):
+        loader = RegionLoader(save_dir)
+        world = loader.load(regions=["town"], neighbors=0)
+
+        assert world.entities["npc.giant"].name == "Giant"
+        assert "mountains" in loader.loaded_regions
+        assert "peak" in world.zones
+        assert world.entities.get("npc.nobody") is None
+
+    def test_load_all_matches_original(self, state, save_dir):
+        world = RegionLoader(save_dir).load_all()
+
+        assert world.to_save_format(include_runtime_data=True) == state.to_save_format(
+            include_runtime_data=True
+        )
+
+    def test_unchanged_shards_are_not_rewritten(self, state, save_dir):
+        shard_files = {p.name: p.stat().st_mtime_ns for p in (save_dir / "regions").glob("*.gsb")}
+        old_mountains = RegionLoader(save_dir).regions["mountains"]["file"]
+        state.entities["npc.giant"].hp.current = 3
+        index = write_region_shards(state.to_save_format(include_runtime_data=True), save_dir)
+
+        files = {p.name: p.stat().st_mtime_ns for p in (save_dir / "regions").glob("*.gsb")}
+        assert set(files) - set(shard_files) == {index["regions"]["mountains"]["file"]}
+        assert set(shard_files) - set(files) == {old_mountains}
+        assert all(files[name] == shard_files[name] for name in set(files) & set(shard_files))
+
+    def test_crash_before_index_keeps_previous_save(self, state, save_dir, monkeypatch):
+        import backend.router.region_store as region_store
+
+        def crash(*args):
+            raise OSError("power loss")
+
+        state.entities["npc.giant"].hp.current = 3
+        state.clocks["storm"].value = 2
+        monkeypatch.setattr(region_store, "_write_index", crash)
+        with pytest.raises(OSError):
+            write_region_shards(state.to_save_format(include_runtime_data=True), save_dir)
+
+        world = RegionLoader(save_dir).load_all()
+        assert world.entities["npc.giant"].hp.current == world.entities["npc.giant"].hp.max
+        assert world.clocks["storm"].value == 1
+
+    def test_corrupted_shard_is_detected(self, save_dir):
+        loader = RegionLoader(save_dir)
+        shard = save_dir / "regions" / loader.regions["forest"]["file"]
+        shard.write_bytes(shard.read_bytes()[:-1])
+
+        with pytest.raises(RegionStoreError):
+            loader.load(regions=["forest"], neighbors=0)
+
+
+class TestPersistenceLazyLoad:
+    def test_save_with_region_shards_and_load_lazy(self, state, tmp_path):
+        manager = PersistenceManager(base_path=tmp_path)
+        manager.save_game_state(state, "campaign", region_shards=True)
+
+        world = manager.load_lazy("campaign", zone_id="peak", neighbors=0)
+        assert set(dict(world.zones)) == {"pass", "peak"}
+
+    def test_saving_partly_loaded_state_keeps_every_region(self, state, tmp_path):
+        manager = PersistenceManager(base_path=tmp_path)
+        manager.save_game_state(state, "campaign", region_shards=True)
+        world = manager.load_lazy("campaign", zone_id="square", neighbors=0)
+        world.entities["pc.hero"].hp.current = 5
+
+        manager.save_game_state(world, "campaign", region_shards=True)
+
+        reloaded = manager.load_game_state("campaign")
+        assert set(reloaded.zones) == set(state.zones)
+        assert set(reloaded.entities) == set(state.entities)
+        assert reloaded.entities["pc.hero"].hp.current == 5
+        assert set(dict(manager.load_lazy("campaign", regions=["mountains"]).zones)) >= {"peak"}
+
+    def test_plain_save_removes_stale_shards(self, state, tmp_path):
+        manager = PersistenceManager(base_path=tmp_path)
+        manager.save_game_state(state, "campaign", region_shards=True)
+        manager.save_game_state(state, "campaign")
+
+        with pytest.raises(PersistenceError, match="no region shards"):
+            manager.load_lazy("campaign", zone_id="square")
+
+    def test_unknown_zone(self, state, tmp_path):
+        manager = PersistenceManager(base_path=tmp_path)
+        manager.save_game_state(state, "campaign", region_shards=True)
+
+        with pytest.raises(PersistenceError, match="atlantis"):
+            manager.load_lazy("campaign", zone_id="atlantis")
+
+    def test_damaged_shard_raises_corrupted(self, state, tmp_path):
+        manager = PersistenceManager(base_path=tmp_path)
+        manager.save_game_state(state, "campaign", region_shards=True)
+        core_file = RegionLoader(tmp_path / "campaign").index["core"]["file"]
+        (tmp_path / "campaign" / "regions" / core_file).write_bytes(b"")
+
+        with pytest.raises(SaveFileCorrupted):
+            manager.load_lazy("campaign", zone_id="square")
@@ -0,0 +1,196 @@
+"""
+Tests for turn recording and deterministic replay.
+"""
+
+import json
+import sys
+import types
+from types import SimpleNamespace
+
+import pytest
+
+from backend.router.effects import apply_effects
+from backend.router.game_state import GameState, PC, NPC, Zone, HP, Utterance
+from backend.router.replay import (
+    ReplayEngine,
+    ReplayError,
+    TurnRecorder,
+    end_turn,
+    execute_step,
+    read_turn_log,
+    state_hash,
+)
+from backend.router.validator import Validator
+
+
+def make_state():
+    zones = {
+        "courtyard": Zone(id="courtyard", name="Courtyard", adjacent_zones=["hall"]),
+        "hall": Zone(id="hall", name="Hall", adjacent_zones=["courtyard"]),
+    }
+    entities = {
+        "pc.arin": PC(
+            id="pc.arin",
+            name="Arin",
+            current_zone="courtyard",
+            hp=HP(current=20, max=20),
+            visible_actors=["npc.guard"],
+        ),
+        "npc.guard": NPC(
+            id="npc.guard",
+            name="Guard",
+            current_zone="courtyard",
+            hp=HP(current=15, max=20),
+            visible_actors=["pc.arin"],
+        ),
+    }
+    state = GameState(entities=entities, zones=zones, current_actor="pc.arin")
+    state.scene.turn_order = ["pc.arin", "npc.guard"]
+    return state
+
+
+SNEAK = {"actor": "pc.arin", "action": "sneak", "style": 1, "domain": "d6", "dc_hint": 12}
+TALK = {
+    "actor": "pc.arin",
+    "target": "npc.guard",
+    "intent": "persuade",
+    "style": 1,
+    "domain": "d6",
+}
+TURNS = [
+    ("ask_roll", SNEAK, "I sneak along the wall", 7),
+    ("talk", TALK, "I try to persuade the guard", 13),
+    ("move", {"actor": "pc.arin", "to": "hall"}, "I walk to the hall", 3),
+    ("move", {"actor": "pc.arin", "to": "nowhere"}, "I go nowhere", 5),
+]
+
+
+@pytest.fixture
+def recorded(tmp_path):
+    """Initial world file, turn log and final state of a recorded session."""
+    state = make_state()
+    world_path = tmp_path / "world.json"
+    world_path.write_text(json.dumps(state.model_dump(mode="json")))
+
+    log_path = tmp_path / "turns.jsonl"
+    validator = Validator()
+    with TurnRecorder(log_path) as recorder:
+        for tool_id, args, text, seed in TURNS:
+            utterance = Utterance(text=text, actor_id="pc.arin")
+            result = execute_step(validator, state, utterance, tool_id, args, seed)
+            if result.ok and result.effects:
+                apply_effects(state, result.effects)
+            end_turn(state)
+            step = {"tool": tool_id, "args": args, "seed": seed, "ok": result.ok}
+            recorder.record_turn(utterance, [step], state)
+    return world_path, log_path, state
+
+
+class TestReplay:
+    def test_recorder_writes_one_record_per_turn(self, recorded):
+        _, log_path, _ = recorded
+        records = list(read_turn_log(log_path))
+
+        tools = [step["tool"] for r in records for step in r["steps"]]
+        assert tools == ["ask_roll", "talk", "move", "move"]
+        assert records[0]["steps"][0]["seed"] == 7
+        assert records[0]["actor_id"] == "pc.arin"
+        assert records[3]["steps"][0]["ok"] is False
+        assert all("state_hash" in r and r["ended"] for r in records)
+
+    def test_replay_reproduces_recorded_states(self, recorded):
+        world_path, log_path, final_state = recorded
+        report = ReplayEngine().run(world_path, log_path)
+
+        assert report.ok, report.mismatches
+        assert report.turns == report.verified == 4
+        assert len(report.failed_turns) == 1
+        assert report.turns_per_second > 0
+        assert state_hash(report.final_state) == state_hash(final_state)
+        assert (report.final_state.scene.round, report.final_state.scene.turn_index) == (3, 0)
+
+    def test_divergence_is_reported(self, recorded, tmp_path):
+        world_path, log_path, _ = recorded
+        records = list(read_turn_log(log_path))
+        records[1]["steps"][0]["seed"] += 1000  # different dice
+
+        # Tamper with a hash so a mismatch is guaranteed
+        records[2]["state_hash"] = "0" * 32
+        report = ReplayEngine().run(world_path, records, stop_on_mismatch=True)
+
+        assert not report.ok
+        assert report.stopped_early
+        assert report.mismatches[0]["index"] in (1, 2)
+
+    def test_hash_ignores_wall_clock_fields(self):
+        a, b = make_state(), make_state()
+        a.entities["npc.guard"].meta.last_changed_at = "2020-01-01T00:00:00+00:00"
+        assert state_hash(a) == state_hash(b)
+        b.entities["npc.guard"].hp.current = 1
+        assert state_hash(a) != state_hash(b)
+
+    def test_invalid_log_line(self, tmp_path):
+        log_path = tmp_path / "bad.jsonl"
+        log_path.write_text('{"steps": []}\nnot json\n')
+        with pytest.raises(ReplayError):
+            list(read_turn_log(log_path))
+
+
+class TestRouterRecording:
+    @pytest.fixture
+    def router_module(self, monkeypatch):
+        config = types.ModuleType("config")
+        config.OPENAI_API_KEY = "test-key"
+        config.PLANNING_MODEL = "gpt-4o-mini"
+        config.PLANNING_MAX_TOKENS = 200
+        config.PLANNING_TEMPERATURE = 0.1
+        config.NARRATION_MODEL = "gpt-4o-mini"
+        config.NARRATION_MAX_TOKENS = 300
+        config.NARRATION_TEMPERATURE = 0.7
+        monkeypatch.setitem(sys.modules, "config", config)
+        import runtime.router as router_module
+
+        monkeypatch.setattr(router_module, "generate_narration", lambda *args: "Narrated.")
+        return router_module
+
+    def test_router_turns_replay_to_the_same_state(self, router_module, monkeypatch, tmp_path):
+        plans = iter(
+            [
+                [("ask_roll", SNEAK), ("talk", TALK)],
+                [("move", {"actor": "pc.arin", "to": "hall"})],
+                [("move", {"actor": "pc.arin", "to": "nowhere"}), ("ask_roll", SNEAK)],
+            ]
+        )
+        monkeypatch.setattr(
+            router_module,
+            "get_staged_plan",
+            lambda world, utterance, debug=False: SimpleNamespace(
+                success=True,
+                tool_calls=[{"tool": tool, "args": args} for tool, args in next(plans)],
+                error_message=None,
+            ),
+        )
+        state = make_state()
+        initial = state.model_copy(deep=True)
+        router = router_module.GameRouter(use_fast_path=False)
+        router._initialized = True
+        log_path = tmp_path / "turns.jsonl"
+        router.turn_recorder = TurnRecorder(log_path)
+
+        for text in ("sneak and talk", "go to the hall", "go nowhere then sneak"):
+            router.process_turn(state, text)
+        router.turn_recorder.close()
+
+        records = list(read_turn_log(log_path))
+        # The failed move stops the third turn; the turn order still advanced
+        assert [[s["tool"] for s in r["steps"]] for r in records] == [
+            ["ask_roll", "talk"],
+            ["move"],
+            ["move"],
+        ]
+        assert (state.scene.round, state.scene.turn_index) == (2, 1)
+
+        report = ReplayEngine().run(initial, log_path)
+        assert report.ok, report.mismatches
+        assert report.verified == 3
+        assert state_hash(report.final_state) == state_hash(state)
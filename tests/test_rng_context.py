@@ -0,0 +1,115 @@
+"""
+Tests for per-turn RNG contexts replacing global random reseeding.
+"""
+
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+from backend.router.game_state import HP, NPC, PC, GameState, Utterance
+from backend.router.outcome_resolver import OutcomeResolver
+from backend.router.rng import RNGContext
+from backend.router.validator import ToolResult, Validator
+
+
+def make_state():
+    state = GameState(
+        entities={
+            "pc.arin": PC(id="pc.arin", name="Arin", current_zone="hall", hp=HP(current=20, max=20)),
+            "npc.guard": NPC(id="npc.guard", name="Guard", current_zone="hall", hp=HP(current=20, max=20)),
+        },
+        zones={},
+    )
+    state.entities["pc.arin"].visible_actors = ["npc.guard"]
+    return state
+
+
+def attack(validator, seed):
+    result = validator._execute_tool(
+        "attack",
+        {"actor": "pc.arin", "target": "npc.guard", "style": 2},
+        make_state(),
+        Utterance(text="I attack", actor_id="pc.arin"),
+        seed,
+    )
+    return result.facts["total"], result.effects
+
+
+class TestRNGContext:
+    def test_matches_global_reseeding(self):
+        random.seed(1234)
+        expected = [random.randint(1, 20) for _ in range(10)]
+        rng = RNGContext(1234)
+        assert [rng.randint(1, 20) for _ in range(10)] == expected
+
+    def test_streams_are_independent_of_main_sequence(self):
+        first = RNGContext(9)
+        second = RNGContext(9)
+        second.random()
+        assert first.stream("outcome").random() == second.stream("outcome").random()
+        assert first.stream("outcome").random() != first.stream("loot").random()
+
+    def test_executors_leave_global_random_alone(self):
+        validator = Validator()
+        random.seed(77)
+        expected = random.random()
+        random.seed(77)
+        attack(validator, 5)
+        assert random.random() == expected
+
+    def test_parallel_turns_are_deterministic(self):
+        validator = Validator()
+        seeds = list(range(200))
+        serial = [attack(validator, seed) for seed in seeds]
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            parallel = list(pool.map(lambda seed: attack(validator, seed), seeds))
+        assert parallel == serial
+
+
+def make_resolver():
+    resolver = OutcomeResolver()
+    resolver.outcome_tables = {
+        "combat_outcomes": {
+            "combat": {
+                "success": [
+                    {"description": f"variant {n}", "effects": [], "tone_tags": []}
+                    for n in range(10)
+                ]
+            }
+        }
+    }
+    return resolver
+
+
+def make_success():
+    return ToolResult(
+        ok=True,
+        tool_id="attack",
+        args={"actor": "pc.arin", "target": "npc.guard"},
+        facts={},
+        effects=[],
+        narration_hint={"outcome": "success", "tone_tags": []},
+    )
+
+
+def test_outcome_variant_uses_given_rng():
+    resolver = make_resolver()
+
+    def resolve(seed):
+        result = make_success()
+        resolver.resolve_outcome(result, make_state(), rng=RNGContext(seed).stream("outcome"))
+        return result.narration_hint["consequence"]
+
+    assert [resolve(3) for _ in range(5)] == [resolve(3)] * 5
+    assert len({resolve(seed) for seed in range(20)}) > 1
+
+
+def test_outcome_without_rng_leaves_global_random_alone():
+    resolver = make_resolver()
+    random.seed(77)
+    expected = random.random()
+    random.seed(77)
+
+    result = resolver.resolve_outcome(make_success(), make_state())
+
+    assert result.narration_hint["consequence"].startswith("variant")
+    assert random.random() == expected
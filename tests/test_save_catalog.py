@@ -0,0 +1,172 @@
+"""
+Tests for the SQLite save catalog behind PersistenceManager.list_saves.
+"""
+
+import json
+import shutil
+
+import pytest
+
+from backend.router.game_state import GameState, PC, NPC, Zone
+from backend.router.persistence import PersistenceManager, PersistenceError
+from backend.router.save_catalog import SaveCatalog, CATALOG_FILENAME
+
+
+def make_state(n_npcs=1):
+    entities = {"pc.hero": PC(id="pc.hero", name="Hero", current_zone="square")}
+    for i in range(n_npcs):
+        entities[f"npc.{i}"] = NPC(id=f"npc.{i}", name=f"NPC {i}", current_zone="square")
+    zones = {"square": Zone(id="square", name="Square")}
+    return GameState(entities=entities, zones=zones)
+
+
+@pytest.fixture
+def manager(tmp_path):
+    return PersistenceManager(base_path=tmp_path)
+
+
+class TestCatalogListing:
+    def test_save_is_indexed_with_stats(self, manager):
+        manager.save_game_state(make_state(3), "campaign", metadata={"note": "x"})
+
+        saves = manager.list_saves()
+        assert len(saves) == 1
+        info = saves[0]
+        assert info["name"] == "campaign"
+        assert info["metadata"]["note"] == "x"
+        assert info["stats"] == {"entities": 4, "zones": 1, "clocks": 0}
+        assert info["total_size"] == sum(f["size"] for f in info["file_info"].values())
+        assert set(info["file_info"]) == {"public", "gm"}
+
+    def test_paging_and_sorting(self, manager):
+        for i, name in enumerate(["b", "a", "c"]):
+            manager.save_game_state(make_state(i), name)
+
+        names = [s["name"] for s in manager.list_saves()]
+        assert names == ["c", "a", "b"]  # newest first
+        assert [s["name"] for s in manager.list_saves(sort_by="name", descending=False)] == [
+            "a",
+            "b",
+            "c",
+        ]
+        assert [s["name"] for s in manager.list_saves(limit=1, offset=1)] == ["a"]
+        assert [s["name"] for s in manager.list_saves(sort_by="entities")][0] == "c"
+
+        with pytest.raises(ValueError):
+            manager.list_saves(sort_by="bogus")
+
+    def test_delete_removes_catalog_entry(self, manager):
+        manager.save_game_state(make_state(), "doomed")
+        manager.delete_save("doomed", confirm=True)
+
+        assert manager.list_saves() == []
+        assert manager.catalog.get_save("doomed") is None
+
+    def test_resave_keeps_first_saved(self, manager):
+        manager.save_game_state(make_state(), "slot")
+        first = manager.catalog.get_save("slot")
+        manager.save_game_state(make_state(2), "slot")
+        second = manager.catalog.get_save("slot")
+
+        assert second["first_saved"] == first["first_saved"]
+        assert second["created"] >= first["created"]
+        assert second["stats"]["entities"] == 3
+
+    def test_export_is_recorded(self, manager, tmp_path):
+        manager.save_game_state(make_state(), "slot")
+        path = manager.export_save("slot", tmp_path / "out" / "slot", compress=False)
+
+        exports = manager.catalog.list_exports("slot")
+        assert [e["path"] for e in exports] == [path]
+
+
+class TestCatalogRebuild:
+    def test_existing_saves_are_indexed_on_first_open(self, tmp_path):
+        manager = PersistenceManager(base_path=tmp_path, use_catalog=False)
+        manager.save_game_state(make_state(), "legacy")
+        assert not (tmp_path / CATALOG_FILENAME).exists()
+
+        indexed = PersistenceManager(base_path=tmp_path)
+        assert [s["name"] for s in indexed.list_saves()] == ["legacy"]
+
+    def test_rebuild_picks_up_copied_saves(self, manager, tmp_path):
+        manager.save_game_state(make_state(), "original")
+        shutil.copytree(tmp_path / "original", tmp_path / "copy")
+        manifest_path = tmp_path / "copy" / "manifest.json"
+        manifest = json.loads(manifest_path.read_text())
+        manifest["save_name"] = "copy"
+        manifest_path.write_text(json.dumps(manifest))
+
+        assert len(manager.list_saves()) == 1
+        assert manager.rebuild_catalog() == 2
+        assert {s["name"] for s in manager.list_saves()} == {"original", "copy"}
+
+    def test_directory_scan_fallback(self, tmp_path):
+        manager = PersistenceManager(base_path=tmp_path, use_catalog=False)
+        manager.save_game_state(make_state(), "one")
+        manager.save_game_state(make_state(), "two")
+
+        assert [s["name"] for s in manager.list_saves()] == ["two", "one"]
+        assert [s["name"] for s in manager.list_saves(limit=1)] == ["two"]
+        with pytest.raises(PersistenceError):
+            manager.prune_backups()
+
+
+class TestBackupRetention:
+    def _save_with_backups(self, manager, count):
+        """A save plus `count` gm backups created one second apart."""
+        manager.save_game_state(make_state(), "slot", save_public=False)
+        save_dir = manager.base_path / "slot"
+        backups = []
+        for i in range(count):
+            path = save_dir / f"gm.bak.2026010100000{i}.json"
+            path.write_text("{}")
+            backups.append(
+                {
+                    "file_type": "gm",
+                    "path": str(path),
+                    "created": f"2026-01-01T00:00:{i:02d}+00:00",
+                    "size": 2,
+                }
+            )
+        manifest = json.loads((save_dir / "manifest.json").read_text())
+        manager.catalog.record_save("slot", manifest, {}, 0, backups=backups)
+
+    def test_backup_lineage_is_recorded(self, manager):
+        manager.save_game_state(make_state(), "slot")
+        before = manager._file_digest(manager.base_path / "slot" / "gm.json")
+        manager.save_game_state(make_state(2), "slot")
+        after = manager._file_digest(manager.base_path / "slot" / "gm.json")
+
+        backups = manager.catalog.list_backups("slot", "gm")
+        assert len(backups) == 1
+        assert backups[0]["source_sha256"] == before["sha256"]
+        assert backups[0]["replaced_by_sha256"] == after["sha256"]
+        assert backups[0]["size"] == before["size"]
+
+    def test_prune_keeps_newest(self, manager):
+        self._save_with_backups(manager, 4)
+        assert len(manager.catalog.list_backups("slot", "gm")) == 4
+
+        assert manager.prune_backups(keep=1) == 3
+        remaining = manager.catalog.list_backups("slot", "gm")
+        assert [b["created"] for b in remaining] == ["2026-01-01T00:00:03+00:00"]
+        assert sorted(p.name for p in (manager.base_path / "slot").glob("gm.bak.*")) == [
+            "gm.bak.20260101000003.json"
+        ]
+
+    def test_prune_older_than(self, manager):
+        self._save_with_backups(manager, 3)
+
+        assert manager.prune_backups(keep=0, older_than="2026-01-01T00:00:01+00:00") == 1
+        assert len(manager.catalog.list_backups("slot")) == 2
+
+
+def test_catalog_standalone_memory():
+    catalog = SaveCatalog(":memory:")
+    catalog.record_save(
+        "x", {"created": "2026-01-01T00:00:00+00:00", "files": ["gm"]}, {}, 10
+    )
+    assert catalog.count_saves() == 1
+    assert catalog.list_saves()[0]["total_size"] == 10
+    catalog.close()
@@ -0,0 +1,108 @@
+"""
+Tests for the content-addressed snapshot store.
+"""
+
+import pytest
+
+from backend.router.game_state import GameState, PC, NPC, Zone, Clock, HP
+from backend.router.snapshot_store import SnapshotStore, SnapshotError
+
+
+def make_state(n_npcs=20):
+    entities = {"pc.hero": PC(id="pc.hero", name="Hero", current_zone="square")}
+    for i in range(n_npcs):
+        entities[f"npc.{i}"] = NPC(id=f"npc.{i}", name=f"NPC {i}", current_zone="square")
+    return GameState(
+        entities=entities,
+        zones={"square": Zone(id="square", name="Square")},
+        clocks={"storm": Clock(id="storm", name="Storm", value=1)},
+        current_actor="pc.hero",
+    )
+
+
+@pytest.fixture(params=["memory", "disk"])
+def store(request, tmp_path):
+    return SnapshotStore(None if request.param == "memory" else tmp_path / "snapshots")
+
+
+class TestSnapshotStore:
+    def test_checkout_round_trips(self, store):
+        state = make_state()
+        commit_id = store.commit(state, label="turn 1")
+        restored = store.checkout(commit_id)
+
+        assert restored.to_save_format(include_runtime_data=True) == state.to_save_format(
+            include_runtime_data=True
+        )
+        assert restored.current_actor == "pc.hero"
+
+    def test_unchanged_objects_are_shared(self, store):
+        state = make_state()
+        store.commit(state)
+        written = store.stats["objects_written"]
+
+        state.entities["npc.3"].hp = HP(current=1, max=20)
+        store.commit(state)
+
+        # npc.3, its bucket, the entity section, the root and the commit
+        assert store.stats["objects_written"] - written == 5
+
+    def test_time_travel_and_diff(self, store):
+        state = make_state()
+        first = store.commit(state)
+        state.entities["npc.0"].hp = HP(current=5, max=20)
+        del state.entities["npc.1"]
+        state.entities["npc.new"] = NPC(id="npc.new", name="New", current_zone="square")
+        store.commit(state)
+
+        assert store.resolve("main~1") == first
+        assert store.checkout("main~1").entities["npc.0"].hp.current == 20
+        assert store.checkout("main").entities["npc.0"].hp.current == 5
+
+        diff = store.diff("main~1", "main")
+        assert diff["entities"] == {
+            "added": ["npc.new"],
+            "removed": ["npc.1"],
+            "changed": ["npc.0"],
+        }
+        assert diff["zones"] == {"added": [], "removed": [], "changed": []}
+        assert diff["scene"] is False
+
+    def test_branching(self, store):
+        state = make_state()
+        base = store.commit(state)
+        store.branch("what-if", "main")
+
+        state.clocks["storm"].value = 4
+        store.commit(state, branch="what-if")
+
+        assert store.resolve("main") == base
+        assert store.checkout("what-if").clocks["storm"].value == 4
+        assert [c["id"] for c in store.log("what-if")][1] == base
+        with pytest.raises(SnapshotError):
+            store.branch("what-if")
+
+    def test_reset_undoes_turns(self, store):
+        state = make_state()
+        first = store.commit(state)
+        store.commit(state, label="later")
+        store.reset("main", "main~1")
+        assert store.resolve("main") == first
+        assert len(store.log()) == 1
+
+    def test_unknown_refs(self, store):
+        store.commit(make_state())
+        with pytest.raises(SnapshotError):
+            store.resolve("nope")
+        with pytest.raises(SnapshotError):
+            store.resolve("main~5")
+
+
+def test_disk_store_reopens(tmp_path):
+    state = make_state()
+    commit_id = SnapshotStore(tmp_path).commit(state, label="saved")
+
+    reopened = SnapshotStore(tmp_path)
+    assert reopened.resolve("main") == commit_id
+    assert reopened.log()[0]["label"] == "saved"
+    assert reopened.checkout("main").entities["pc.hero"].name == "Hero"
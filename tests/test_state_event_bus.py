@@ -0,0 +1,98 @@
+"""
+Tests for per-GameState event routing.
+"""
+
+import copy
+
+from backend.router.game_state import GameState
+from models.meta import loaded_events_module
+
+
+def make_state():
+    return GameState(entities={}, zones={})
+
+
+def test_states_do_not_share_listeners():
+    first, second = make_state(), make_state()
+    seen = []
+    first.register_event_listener("zone.changed", lambda **event: seen.append(event))
+
+    second.emit("zone.changed", zone="b")
+    first.emit("zone.changed", zone="a")
+
+    assert [event["zone"] for event in seen] == ["a"]
+    assert seen[0]["world"] is first
+    assert seen[0]["event_type"] == "zone.changed"
+    assert second.get_event_listeners("zone.changed") == []
+
+
+def test_emit_without_listeners_never_builds_a_bus():
+    state = make_state()
+    state.emit("zone.changed", zone="a")
+    state.invalidate_cache()
+    assert state._event_bus is None
+    assert state.unregister_event_listener("zone.changed", print) is False
+
+
+def test_listener_errors_do_not_stop_delivery():
+    state = make_state()
+    seen = []
+
+    def broken(**event):
+        raise RuntimeError("boom")
+
+    state.register_event_listener("tick", broken)
+    state.register_event_listener("tick", lambda **event: seen.append(event["n"]))
+    state.emit("tick", n=1)
+
+    assert seen == [1]
+    assert state.event_bus.get_metrics()["handler_errors"] == 1
+
+
+def test_publish_reaches_state_and_global_subscribers():
+    state, other = make_state(), make_state()
+    local, others, global_seen = [], [], []
+    state.event_bus.subscribe("cache.invalidated", local.append)
+    other.event_bus.subscribe("cache.invalidated", others.append)
+    events = loaded_events_module()  # whichever copy of the module is live
+    events.subscribe("cache.invalidated", global_seen.append)
+    try:
+        state.invalidate_cache("npc.a")
+    finally:
+        events.unsubscribe("cache.invalidated", global_seen.append)
+
+    assert local[0]["entity_id"] == "npc.a" and local[0]["world"] is state
+    assert global_seen[0]["entity_id"] == "npc.a" and "world" not in global_seen[0]
+    assert global_seen[0]["session_id"] == state.session_id != other.session_id
+    assert others == []
+
+
+def test_global_fan_out_can_be_turned_off():
+    state = make_state()
+    state.set_session_id("campaign-1")
+    local, global_seen = [], []
+    state.event_bus.subscribe("cache.invalidated", local.append)
+    events = loaded_events_module()
+    events.subscribe("cache.invalidated", global_seen.append)
+    try:
+        state.invalidate_cache()
+        state.set_global_events(False)
+        state.invalidate_cache()
+    finally:
+        events.unsubscribe("cache.invalidated", global_seen.append)
+
+    assert [event["session_id"] for event in global_seen] == ["campaign-1"]
+    assert len(local) == 2
+
+
+def test_deep_copy_keeps_listeners_on_a_separate_bus():
+    state = make_state()
+    seen = []
+    state.register_event_listener("tick", lambda **event: seen.append(event["world"]))
+
+    clone = copy.deepcopy(state)
+    clone.emit("tick")
+    state.emit("tick")
+
+    assert seen == [clone, state]
+    assert clone.event_bus is not state.event_bus
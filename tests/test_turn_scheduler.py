@@ -0,0 +1,139 @@
+"""
+Tests for initiative-ordered turn scheduling.
+"""
+
+import copy
+
+from backend.router.game_state import HP, PC, GameState, Scene
+from backend.router.validator import Validator
+
+
+def make_scene():
+    scene = Scene()
+    scene.turn_scheduler.set_initiatives({"pc.arin": 15, "npc.guard": 12, "npc.rat": 4})
+    return scene
+
+
+class TestTurnScheduler:
+    def test_orders_by_initiative_and_wraps_rounds(self):
+        scene = make_scene()
+        scheduler = scene.turn_scheduler
+
+        assert scene.turn_order == ["pc.arin", "npc.guard", "npc.rat"]
+        assert scheduler.current() == "pc.arin"
+        assert [scheduler.advance() for _ in range(4)] == [
+            "npc.guard",
+            "npc.rat",
+            "pc.arin",
+            "npc.guard",
+        ]
+        assert scene.round == 2
+
+    def test_adding_keeps_the_current_turn(self):
+        scene = make_scene()
+        scheduler = scene.turn_scheduler
+        scheduler.advance()  # npc.guard
+
+        scheduler.add("npc.ogre", 20)
+        scheduler.add("npc.bat", 12)
+
+        assert scene.turn_order == ["npc.ogre", "pc.arin", "npc.guard", "npc.bat", "npc.rat"]
+        assert scheduler.current() == "npc.guard"
+        assert [scheduler.advance() for _ in range(3)] == ["npc.bat", "npc.rat", "npc.ogre"]
+
+    def test_removing_the_current_actor_hands_the_turn_on(self):
+        scene = make_scene()
+        scheduler = scene.turn_scheduler
+        scheduler.advance()  # npc.guard
+
+        assert scheduler.remove("npc.guard")
+        assert scheduler.current() == "npc.rat"
+        assert scheduler.advance() == "npc.rat"
+
+        assert scheduler.remove("pc.arin")
+        assert scheduler.remove("missing") is False
+        assert scene.turn_order == ["npc.rat"]
+        assert scheduler.advance() == "npc.rat"
+        assert scene.round == 2
+
+    def test_removing_the_last_actor_in_the_round(self):
+        scene = make_scene()
+        scheduler = scene.turn_scheduler
+        scheduler.advance()
+        scheduler.advance()  # npc.rat
+
+        scheduler.remove("npc.rat")
+        assert scheduler.advance() == "pc.arin"
+        assert scene.round == 2
+
+    def test_delay_and_resume(self):
+        scene = make_scene()
+        scheduler = scene.turn_scheduler
+
+        assert scheduler.delay()  # pc.arin holds
+        assert scene.delayed_actors == {"pc.arin": 15}
+        assert scheduler.advance() == "npc.guard"
+
+        assert scheduler.resume("pc.arin")
+        assert scheduler.advance() == "pc.arin"
+        assert scene.initiative["pc.arin"] == 12
+        assert scheduler.advance() == "npc.rat"
+        assert scheduler.advance() == "npc.guard"
+        assert scheduler.advance() == "pc.arin"
+
+    def test_readied_action_lapses_at_next_turn(self):
+        scene = make_scene()
+        scheduler = scene.turn_scheduler
+        scheduler.ready("pc.arin", "when the door opens")
+        scheduler.ready("npc.rat", "when someone approaches")
+
+        assert scheduler.trigger_ready("npc.rat") == "when someone approaches"
+        assert scheduler.trigger_ready("npc.rat") is None
+        for _ in range(3):
+            scheduler.advance()
+        assert "pc.arin" not in scene.readied_actions
+
+    def test_legacy_turn_order_without_initiative(self):
+        scene = Scene(turn_order=["b", "a", "c"])
+        assert [scene.turn_scheduler.advance() for _ in range(3)] == ["a", "c", "b"]
+        assert scene.turn_order == ["b", "a", "c"]
+
+    def test_state_round_trip_and_copy(self):
+        scene = make_scene()
+        scene.turn_scheduler.advance()
+
+        restored = Scene.model_validate(scene.model_dump())
+        assert restored.turn_scheduler.current() == "npc.guard"
+        assert restored.initiative == scene.initiative
+
+        copied = copy.deepcopy(scene)
+        copied.turn_scheduler.add("npc.ogre", 30)
+        assert "npc.ogre" not in scene.turn_order
+        assert copied.turn_scheduler.current() == "npc.guard"
+
+
+    def test_held_turn_survives_save_and_load(self):
+        scene = Scene()
+        scene.turn_scheduler.set_initiatives({"a": 20, "b": 15, "c": 10})
+        scene.turn_scheduler.remove("a")
+
+        restored = Scene.model_validate(scene.model_dump(mode="json"))
+
+        assert restored.turn_held
+        assert restored.turn_scheduler.advance() == "b"
+        assert not restored.turn_held
+        assert restored.turn_scheduler.advance() == "c"
+
+def test_validator_advance_turn_uses_scheduler():
+    state = GameState(
+        entities={"pc.arin": PC(id="pc.arin", name="Arin", current_zone="hall", hp=HP(current=10, max=10))},
+        zones={},
+    )
+    state.scene.turn_scheduler.set_initiatives({"pc.arin": 10, "npc.guard": 14})
+    validator = Validator()
+
+    validator.advance_turn(state)
+    assert state.current_actor == "pc.arin"
+    validator.advance_turn(state)
+    assert state.current_actor == "npc.guard"
+    assert state.scene.round == 2